@@ -0,0 +1,3 @@
+-- Drop duplicate draws (keeping one row each) so the unique index can be built
+DELETE FROM "result" a USING "result" b WHERE a."lotteryId" = b."lotteryId" AND a."drawDate" = b."drawDate" AND a.ctid > b.ctid;--> statement-breakpoint
+CREATE UNIQUE INDEX "result_lottery_draw_unique" ON "result" USING btree ("lotteryId","drawDate");
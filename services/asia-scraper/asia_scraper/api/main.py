@@ -0,0 +1,375 @@
+from datetime import datetime, timedelta
+import asyncio
+from typing import Optional
+from fastapi import FastAPI, Depends, HTTPException, Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from asia_scraper.database.session import engine, get_db_session
+from asia_scraper.database.models import ScraperConfig, ScraperJob, Lottery, Result
+from asia_scraper.database.lottery_cache import lottery_cache
+from asia_scraper.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor, keyset_page
+from asia_scraper.services.scheduler import scheduler, get_scheduled_jobs, start_scheduler, stop_scheduler
+from asia_scraper.services.executor import executor, ExecutorBusy, PRIORITY_MANUAL
+from asia_scraper.scrapers.base.selenium_scraper import driver_pool
+from asia_scraper.utils import metrics, offload
+from asia_scraper.utils.api_cache import LOTTERIES, SCHEDULE, Expiring, cached_response, seconds_until
+from asia_scraper.utils.http_client import http_client
+from asia_scraper.utils.logger import get_logger
+from asia_scraper.utils.timing import stage_percentiles
+
+
+logger = get_logger(__name__)
+
+app = FastAPI(
+    title="Asia Lottery Scraper API",
+    description="REST API for managing Asian lottery scrapers",
+    version="1.0.0"
+)
+
+
+metrics.CallbackGauge(
+    "scraper_queue_depth", "Scrapes waiting in each executor lane", ("lane",),
+    lambda: [((name,), lane["queued"]) for name, lane in executor.stats()["lanes"].items()],
+)
+metrics.CallbackGauge(
+    "scraper_lane_running", "Scrapes running in each executor lane", ("lane",),
+    lambda: [((name,), lane["running"]) for name, lane in executor.stats()["lanes"].items()],
+)
+metrics.CallbackGauge(
+    "worker_pool_queue_depth", "Calls waiting for a Selenium or DB worker thread", ("pool",),
+    lambda: [((name,), pool["queued"]) for name, pool in offload.stats().items()],
+)
+metrics.CallbackGauge(
+    "db_pool_checked_out", "Database connections checked out of the pool", (),
+    lambda: [((), engine.pool.checkedout())],
+)
+metrics.CallbackGauge(
+    "chrome_driver_pool", "Pooled Chrome drivers by state", ("state",),
+    lambda: [((state,), driver_pool.stats()[state]) for state in ("in_use", "idle", "max_size")],
+)
+
+_loop_lag_task = None
+
+
+@app.on_event("startup")
+async def start_loop_lag_probe():
+    """Sample event-loop lag for /metrics"""
+    global _loop_lag_task
+    _loop_lag_task = asyncio.create_task(metrics.sample_loop_lag())
+
+
+@app.on_event("shutdown")
+async def stop_loop_lag_probe():
+    """Stop the event-loop lag probe"""
+    if _loop_lag_task is not None:
+        _loop_lag_task.cancel()
+
+
+@app.on_event("startup")
+async def start_http_client():
+    """Open the shared HTTP connection pool"""
+    await http_client.start()
+
+
+@app.on_event("startup")
+async def start_executor():
+    """Start the scrape executor and scheduler on the server's event loop"""
+    await executor.start()
+    start_scheduler()
+
+
+@app.on_event("shutdown")
+async def stop_executor():
+    """Stop scheduling new scrapes and cancel queued ones"""
+    stop_scheduler()
+    await executor.stop()
+
+
+@app.on_event("shutdown")
+async def close_pools():
+    """Close pooled HTTP connections, quit pooled Chrome drivers and stop worker threads"""
+    await http_client.close()
+    await offload.run_selenium(driver_pool.close)
+    offload.shutdown()
+
+
+@app.get("/")
+async def root():
+    """Root endpoint"""
+    return {
+        "service": "Asia Lottery Scraper",
+        "version": "1.0.0",
+        "status": "running"
+    }
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint"""
+    return {
+        "status": "healthy",
+        "scheduler_running": scheduler.running,
+        "scheduled_jobs": len(get_scheduled_jobs()),
+        "driver_pool": driver_pool.stats(),
+        "worker_pools": offload.stats()
+    }
+
+
+@app.get("/executor")
+async def get_executor_stats():
+    """Scrape queue depth, lane concurrency and queue wait times"""
+    return executor.stats()
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics"""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/config")
+def get_config(db: Session = Depends(get_db_session)):
+    """Get scheduler configuration"""
+    config = db.query(ScraperConfig).filter_by(key='scheduler').first()
+    if not config:
+        raise HTTPException(status_code=404, detail="Config not found")
+    return config.value
+
+
+@app.put("/config")
+def update_config(config_data: dict, db: Session = Depends(get_db_session)):
+    """Update scheduler configuration"""
+    config = db.query(ScraperConfig).filter_by(key='scheduler').first()
+    if not config:
+        config = ScraperConfig(key='scheduler', value=config_data)
+        db.add(config)
+    else:
+        config.value = config_data
+    
+    db.commit()
+    return {"success": True, "config": config.value}
+
+
+@app.post("/scrape/{slug}")
+async def trigger_scrape(slug: str):
+    """Manually trigger a scraper"""
+    if not await offload.run_db(lottery_cache.get, slug):
+        raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+    
+    try:
+        # Manual runs jump ahead of scheduled ones in their lane
+        queued = await executor.submit(slug, priority=PRIORITY_MANUAL, wait=False)
+    except ExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if not queued:
+        return {"success": True, "message": f"Scraper already queued: {slug}"}
+    return {"success": True, "message": f"Scraper queued: {slug}"}
+
+
+@app.get("/jobs")
+def get_jobs(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    slug: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    db: Session = Depends(get_db_session)
+):
+    """Get scraper jobs newest first, keyset-paginated on (createdAt, id); pass next_cursor back as cursor"""
+    query = db.query(ScraperJob)
+    if slug:
+        lottery = lottery_cache.get(slug)
+        if not lottery:
+            raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+        query = query.filter(ScraperJob.lotteryId == lottery.id)
+    if status:
+        query = query.filter(ScraperJob.status == status)
+    if since:
+        query = query.filter(ScraperJob.createdAt >= since)
+    if until:
+        query = query.filter(ScraperJob.createdAt < until)
+    
+    try:
+        jobs, next_cursor = keyset_page(query, (ScraperJob.createdAt, ScraperJob.id), cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "jobs": [
+            {
+                "id": job.id,
+                "lottery_id": str(job.lotteryId),
+                "status": job.status,
+                "created_at": job.createdAt,
+                "started_at": job.startedAt,
+                "completed_at": job.completedAt,
+                "results_count": job.resultsCount,
+                "execution_time_ms": job.executionTimeMs,
+                "error_message": job.errorMessage
+            }
+            for job in jobs
+        ],
+        "next_cursor": next_cursor
+    }
+
+
+@app.get("/results")
+def get_results(
+    slug: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    db: Session = Depends(get_db_session)
+):
+    """Get a lottery's draws newest first, keyset-paginated on drawDate; pass next_cursor back as cursor"""
+    lottery = lottery_cache.get(slug)
+    if not lottery:
+        raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+    
+    # Served by the result (lotteryId, drawDate) unique index
+    query = db.query(Result).filter(Result.lotteryId == lottery.id)
+    if since:
+        query = query.filter(Result.drawDate >= since)
+    if until:
+        query = query.filter(Result.drawDate < until)
+    
+    try:
+        results, next_cursor = keyset_page(query, (Result.drawDate,), cursor, limit)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "slug": slug,
+        "results": [
+            {
+                "id": str(result.id),
+                "draw_date": result.drawDate,
+                "numbers": result.numbers,
+                "jackpot": result.jackpot,
+                "currency": result.currency,
+                "winners": result.winners
+            }
+            for result in results
+        ],
+        "next_cursor": next_cursor
+    }
+
+
+@app.get("/jobs/stats")
+def get_job_stats(
+    hours: int = 24,
+    db: Session = Depends(get_db_session)
+):
+    """Get per-lottery job counts and the share of runs skipped as unchanged"""
+    since = datetime.utcnow() - timedelta(hours=hours)
+    rows = db.query(
+        Lottery.slug, ScraperJob.status, func.count(ScraperJob.id)
+    ).join(
+        Lottery, Lottery.id == ScraperJob.lotteryId
+    ).filter(
+        ScraperJob.createdAt >= since
+    ).group_by(Lottery.slug, ScraperJob.status).all()
+    
+    stats = {}
+    for slug, status, count in rows:
+        entry = stats.setdefault(slug, {"total": 0, "by_status": {}})
+        entry["by_status"][status] = count
+        entry["total"] += count
+    
+    for entry in stats.values():
+        entry["skip_ratio"] = round(entry["by_status"].get("unchanged", 0) / entry["total"], 3)
+    
+    total = sum(entry["total"] for entry in stats.values())
+    unchanged = sum(entry["by_status"].get("unchanged", 0) for entry in stats.values())
+    
+    return {
+        "since": since.isoformat(),
+        "total": total,
+        "skip_ratio": round(unchanged / total, 3) if total else 0.0,
+        "lotteries": stats
+    }
+
+
+@app.get("/jobs/{job_id}")
+def get_job(
+    job_id: int,
+    window: int = 200,
+    db: Session = Depends(get_db_session)
+):
+    """Get one job with its stage breakdown and stage percentiles over the lottery's recent jobs"""
+    row = db.query(ScraperJob, Lottery.slug).join(
+        Lottery, Lottery.id == ScraperJob.lotteryId
+    ).filter(ScraperJob.id == job_id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    job, slug = row
+    
+    # Clamped like /jobs page sizes, so one request cannot read every job's timings
+    window = max(1, min(window, MAX_PAGE_SIZE))
+    recent = db.query(ScraperJob.stageTimings).filter(
+        ScraperJob.lotteryId == job.lotteryId,
+        ScraperJob.stageTimings.isnot(None)
+    ).order_by(ScraperJob.createdAt.desc(), ScraperJob.id.desc()).limit(window).all()
+    
+    return {
+        "id": job.id,
+        "lottery_id": str(job.lotteryId),
+        "slug": slug,
+        "status": job.status,
+        "started_at": job.startedAt,
+        "completed_at": job.completedAt,
+        "results_count": job.resultsCount,
+        "execution_time_ms": job.executionTimeMs,
+        "bytes_fetched": job.bytesFetched,
+        "stage_timings": job.stageTimings,
+        "error_message": job.errorMessage,
+        "slug_percentiles": stage_percentiles(timings for (timings,) in recent),
+    }
+
+
+@app.get("/lotteries")
+def get_lotteries(request: Request, db: Session = Depends(get_db_session)):
+    """Get all lotteries"""
+    def build():
+        lotteries = db.query(Lottery).all()
+        
+        return {"lotteries": [
+            {
+                "id": str(lot.id),
+                "name": lot.name,
+                "slug": lot.slug,
+                "country": lot.country,
+                "isActive": lot.isActive,
+            }
+            for lot in lotteries
+        ]}
+    
+    return cached_response(request, [LOTTERIES], build)
+
+
+@app.get("/scheduler/jobs")
+def get_scheduler_jobs(request: Request):
+    """Get all scheduled jobs"""
+    def build():
+        jobs = get_scheduled_jobs()
+        return Expiring(
+            {
+                "jobs": [
+                    {
+                        "id": job.id,
+                        "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
+                        "trigger": str(job.trigger)
+                    }
+                    for job in jobs
+                ]
+            },
+            # The listing changes when the first of these jobs fires
+            max_age=seconds_until(job.next_run_time for job in jobs),
+        )
+    
+    return cached_response(request, [SCHEDULE], build)
@@ -185,6 +185,15 @@ def get_country_by_code(code: str) -> CountryConfig | None:
     return None
 
 
+def get_lottery_config(slug: str) -> Dict | None:
+    """Get lottery configuration by slug"""
+    for country in ASIAN_COUNTRIES:
+        for lottery in country.lotteries:
+            if lottery["slug"] == slug:
+                return lottery
+    return None
+
+
 def get_all_lottery_slugs() -> List[str]:
     """Get all lottery slugs"""
     slugs = []
@@ -192,3 +201,11 @@ def get_all_lottery_slugs() -> List[str]:
         for lottery in country.lotteries:
             slugs.append(lottery["slug"])
     return slugs
+
+
+def select_countries(countries: List[CountryConfig], codes: str) -> List[CountryConfig]:
+    """Restrict countries to a comma-separated list of codes; empty keeps all"""
+    wanted = {code.strip().upper() for code in codes.split(",") if code.strip()}
+    if not wanted:
+        return list(countries)
+    return [country for country in countries if country.code in wanted]
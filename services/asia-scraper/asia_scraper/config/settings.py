@@ -0,0 +1,72 @@
+from pydantic_settings import BaseSettings
+from typing import Optional
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment"""
+    
+    # Database
+    DATABASE_URL: str
+    DB_POOL_SIZE: int = 10  # shared by sessions and the scheduler job store
+    DB_MAX_OVERFLOW: int = 20
+    
+    # Redis
+    REDIS_URL: str = "redis://localhost:6379/0"
+    
+    # Application
+    ENV: str = "development"
+    LOG_LEVEL: str = "INFO"
+    SCRAPER_COUNTRIES: str = ""  # comma-separated country codes to schedule; empty = all
+    MAX_CONCURRENT_SCRAPERS: int = 3  # Selenium lane width (one Chrome each)
+    HTTP_SCRAPE_CONCURRENCY: int = 16  # BS4/httpx lane width
+    SCRAPE_QUEUE_SIZE: int = 100  # per-lane queue bound before submitters wait
+    SELENIUM_WORKERS: Optional[int] = None  # threads for blocking WebDriver calls; defaults to MAX_CONCURRENT_SCRAPERS
+    DB_WORKERS: int = 8  # threads for blocking SQLAlchemy calls; keep below the engine pool size
+    PIPELINE_QUEUE_SIZE: int = 1000  # parsed rows buffered ahead of the writer before parsing pauses
+    PIPELINE_BATCH_SIZE: int = 500  # rows per writer transaction
+    
+    # Monitoring
+    SENTRY_DSN: Optional[str] = None
+    
+    # API
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+    API_SECRET_KEY: str
+    
+    # Scraper
+    DEFAULT_TIMEOUT: int = 30
+    DEFAULT_RETRIES: int = 3
+    SCRAPER_USER_AGENT: str = "Mozilla/5.0 (compatible; AsiaLotteryBot/1.0)"
+    LOTTERY_CACHE_TTL: int = 300  # seconds between lottery id/slug reloads
+    LOTTERY_CACHE_MISS_REFRESH: int = 30  # min seconds between reloads for unknown slugs
+    
+    # HTTP client (shared by all BS4 scrapers)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 6
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+    HTTP_CACHE_BACKEND: str = "redis"  # redis, disk or none
+    HTTP_CACHE_DIR: str = ".http_cache"
+    HTTP_CASSETTE_MODE: str = "off"  # off, record or replay (see asia_scraper/utils/cassette.py)
+    HTTP_CASSETTE_DIR: str = "cassettes"
+    HTTP_REPLAY_LATENCY_MS: float = 0.0  # mean injected delay per replayed request
+    HTTP_REPLAY_ERROR_RATE: float = 0.0  # share of replayed requests that fail
+    HTTP_REPLAY_SEED: Optional[int] = None  # fixes the jitter/failure sequence
+    HTTP_REPLAY_SERVER: str = "http://127.0.0.1:8765"  # stand-in Selenium loads in replay mode
+    
+    # API response cache (see asia_scraper/utils/api_cache.py)
+    API_CACHE_BACKEND: str = "memory"  # memory, or redis to share invalidations across processes
+    API_CACHE_MAX_ENTRIES: int = 1024
+    API_CACHE_TTL_SECONDS: float = 60.0
+    
+    # Selenium
+    CHROME_DRIVER_PATH: str = "/usr/bin/chromedriver"
+    HEADLESS_MODE: bool = True
+    DRIVER_MAX_USES: int = 50  # pages served before a pooled driver is replaced
+    
+    class Config:
+        env_file = ".env"
+        case_sensitive = True
+
+
+settings = Settings()
@@ -0,0 +1,56 @@
+"""
+Last-successful page fingerprints per lottery slug
+
+Stored in scraper_config under ``fingerprint:<slug>`` and mirrored in
+memory, so the common "page unchanged" check needs no database read
+after the first run.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Dict
+from sqlalchemy.dialects.postgresql import insert
+from asia_scraper.database.models import ScraperConfig
+from asia_scraper.database.session import get_db
+
+_fingerprints: Dict[str, str] = {}
+
+
+def fingerprint(content: str) -> str:
+    """Stable hash of the page content a parser depends on"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _key(slug: str) -> str:
+    return f"fingerprint:{slug}"
+
+
+def load_fingerprint(slug: str) -> str | None:
+    """Get the fingerprint of the last successfully saved page for a slug"""
+    if slug in _fingerprints:
+        return _fingerprints[slug]
+
+    with get_db() as db:
+        row = db.query(ScraperConfig.value).filter_by(key=_key(slug)).first()
+
+    value = row.value.get("hash") if row else None
+    if value:
+        _fingerprints[slug] = value
+    return value
+
+
+def store_fingerprint(slug: str, value: str) -> None:
+    """Record the fingerprint of a page whose results were saved"""
+    stmt = insert(ScraperConfig).values(
+        key=_key(slug),
+        value={"hash": value, "updatedAt": datetime.utcnow().isoformat()},
+        description=f"Content fingerprint of last saved {slug} page",
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ScraperConfig.key],
+        set_={"value": stmt.excluded.value, "updatedAt": datetime.utcnow()},
+    )
+    with get_db() as db:
+        db.execute(stmt)
+
+    _fingerprints[slug] = value
@@ -0,0 +1,95 @@
+"""
+In-memory lottery lookup cache
+
+Scrapers, the orchestrator and API handlers only need a lottery's id and
+active flag to do their work. Loading those columns once and serving them
+from a dict saves a SELECT on every scrape.
+"""
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List
+from asia_scraper.config.settings import settings
+from asia_scraper.database.models import Lottery
+from asia_scraper.database.session import get_db
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedLottery:
+    """Slim, immutable view of a lottery row"""
+    id: uuid.UUID
+    slug: str
+    isActive: bool
+
+
+class LotteryCache:
+    """
+    Slug -> lottery map refreshed on a TTL or on demand
+
+    A slug missing from the map triggers one reload, at most every
+    miss_refresh_seconds, so lotteries added after startup are found
+    without waiting out the TTL.
+    """
+
+    def __init__(self, ttl_seconds: int, miss_refresh_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._by_slug: Dict[str, CachedLottery] = {}
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        """Reload id/slug/isActive for every lottery from the database"""
+        with get_db() as db:
+            rows = db.query(Lottery.id, Lottery.slug, Lottery.isActive).all()
+
+        # Swap the whole dict so readers never see a half-built map
+        self._by_slug = {
+            row.slug: CachedLottery(id=row.id, slug=row.slug, isActive=bool(row.isActive))
+            for row in rows
+        }
+        self._loaded_at = time.monotonic()
+        logger.info("Lottery cache refreshed", count=len(self._by_slug))
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup"""
+        self._loaded_at = None
+
+    def _ensure_fresh(self, max_age: float | None = None) -> None:
+        loaded_at = self._loaded_at
+        max_age = self.ttl_seconds if max_age is None else max_age
+        if loaded_at is not None and time.monotonic() - loaded_at < max_age:
+            return
+
+        with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._loaded_at == loaded_at:
+                self.refresh()
+
+    def get(self, slug: str) -> CachedLottery | None:
+        """Get a lottery by slug, or None if it is not in the database"""
+        self._ensure_fresh()
+        lottery = self._by_slug.get(slug)
+        if lottery is None:
+            self._ensure_fresh(self.miss_refresh_seconds)
+            lottery = self._by_slug.get(slug)
+        return lottery
+
+    def all(self) -> List[CachedLottery]:
+        """Get every cached lottery"""
+        self._ensure_fresh()
+        return list(self._by_slug.values())
+
+    def __len__(self) -> int:
+        return len(self._by_slug)
+
+
+lottery_cache = LotteryCache(
+    ttl_seconds=settings.LOTTERY_CACHE_TTL,
+    miss_refresh_seconds=settings.LOTTERY_CACHE_MISS_REFRESH,
+)
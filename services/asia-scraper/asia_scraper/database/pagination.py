@@ -0,0 +1,107 @@
+"""
+Keyset pagination
+
+List endpoints page newest first by seeking past the last row of the
+previous page, e.g. WHERE ("createdAt", id) < (:createdAt, :id), rather
+than with OFFSET. With an index on the sort key every page is an index
+range scan, however deep the client pages. The cursor handed back to the
+client is that last row's sort key, base64-encoded.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursor(ValueError):
+    """Cursor was not produced by encode_cursor for this sort key"""
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _load(value: Any, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for a row's sort key values"""
+    raw = json.dumps([_dump(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple:
+    """
+    Sort key values from a cursor
+
+    Raises:
+        InvalidCursor: The cursor is malformed or has the wrong shape
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+    try:
+        return tuple(_load(value, python_type) for value, python_type in zip(values, types))
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_page(
+    query: Query,
+    keys: Sequence,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    row_key: Optional[Callable[[Any], Tuple]] = None,
+) -> Tuple[List, Optional[str]]:
+    """
+    One page of query, newest first by keys
+
+    Args:
+        query: Filtered query to page through
+        keys: Sort key columns, unique together (e.g. createdAt, id)
+        cursor: next_cursor of the previous page, None for the first page
+        limit: Page size, clamped to 1..MAX_PAGE_SIZE
+        row_key: Sort key values of a result row; defaults to the key attributes
+
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        InvalidCursor: The cursor does not decode for these keys
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if row_key is None:
+        row_key = lambda row: tuple(getattr(row, key.key) for key in keys)
+
+    if cursor:
+        after = decode_cursor(cursor, [key.type.python_type for key in keys])
+        query = query.filter(tuple_(*keys) < tuple_(*after))
+
+    # One extra row tells us whether another page follows
+    rows = query.order_by(*(key.desc() for key in keys)).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*row_key(rows[-1]))
@@ -6,10 +6,13 @@ making them accessible to both the Python scraper and Next.js frontend.
 """
 
 import uuid
-from src.config.countries import ASIAN_COUNTRIES
-from src.database.models import Lottery
-from src.database.session import get_db
-from src.utils.logger import get_logger
+from sqlalchemy.sql import func
+from asia_scraper.config.countries import ASIAN_COUNTRIES
+from asia_scraper.database.models import Lottery
+from asia_scraper.database.lottery_cache import lottery_cache
+from asia_scraper.utils.api_cache import LOTTERIES, api_cache
+from asia_scraper.database.session import get_db
+from asia_scraper.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -95,6 +98,10 @@ def populate_asian_lotteries():
             
             db.commit()
         
+        # Scrapers in this process should see new or re-activated lotteries
+        lottery_cache.refresh()
+        api_cache.invalidate(LOTTERIES)
+        
         logger.info(
             f"Population complete",
             added=added_count,
@@ -113,7 +120,7 @@ def populate_asian_lotteries():
 
 # Run if called directly
 if __name__ == "__main__":
-    from src.database.session import init_db
+    from asia_scraper.database.session import init_db
     
     print("Initializing database...")
     init_db()
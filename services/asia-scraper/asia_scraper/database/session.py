@@ -0,0 +1,75 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker, Session
+from contextlib import contextmanager
+from typing import Generator
+from asia_scraper.config.settings import settings
+from asia_scraper.config import runtime
+from asia_scraper.database.models import Base
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Create engine, unless a multi-region runner shares one
+engine = runtime.engine or create_engine(
+    settings.DATABASE_URL,
+    echo=settings.ENV == "development",
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+# Create session factory
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def init_db() -> None:
+    """Initialize database - create all tables"""
+    Base.metadata.create_all(bind=engine)
+    add_missing_columns()
+    add_missing_indexes()
+
+
+def add_missing_columns() -> None:
+    """Add nullable model columns missing from existing scraper tables (create_all only creates tables)"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            # lottery and result columns belong to the drizzle migrations
+            if not table.name.startswith("scraper_") or not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
+                logger.info("Added column", table=table.name, column=column.name)
+
+
+def add_missing_indexes() -> None:
+    """Create scraper table indexes missing from existing tables (create_all skips tables that exist)"""
+    for table in Base.metadata.sorted_tables:
+        # lottery and result indexes belong to the drizzle migrations
+        if not table.name.startswith("scraper_"):
+            continue
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+@contextmanager
+def get_db() -> Generator[Session, None, None]:
+    """Database session context manager"""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def get_db_session() -> Session:
+    """Get database session for dependency injection"""
+    return SessionLocal()
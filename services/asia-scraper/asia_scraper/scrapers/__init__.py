@@ -0,0 +1,72 @@
+"""Scraper registry for all Asian countries"""
+
+from asia_scraper.config.countries import get_lottery_config
+from asia_scraper.scrapers.base.api_scraper import api_scraper_for
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper, IndiaSikkimLotteryScraper
+from asia_scraper.scrapers.countries.singapore import SingaporeTOTOScraper, Singapore4DScraper
+from asia_scraper.scrapers.countries.malaysia import MalaysiaMagnum4DScraper, MalaysiaSportsTOTOScraper
+from asia_scraper.scrapers.countries.thailand import ThailandGovernmentLotteryScraper
+from asia_scraper.scrapers.countries.philippines import PhilippinesPCSOLottoScraper
+from asia_scraper.scrapers.countries.japan import JapanTakarakujiScraper
+from asia_scraper.scrapers.countries.south_korea import SouthKoreaLotto645Scraper
+from asia_scraper.scrapers.countries.taiwan import TaiwanWelfareLotteryScraper
+from asia_scraper.scrapers.countries.hong_kong import HongKongMarkSixScraper
+from asia_scraper.scrapers.countries.vietnam import VietnamVietlottScraper
+
+# Scraper registry mapping slug -> scraper class
+SCRAPER_REGISTRY = {
+    # India
+    "in-kerala-lottery": IndiaKeralaLotteryScraper,
+    "in-sikkim-lottery": IndiaSikkimLotteryScraper,
+    
+    # Singapore
+    "sg-toto": SingaporeTOTOScraper,
+    "sg-4d": Singapore4DScraper,
+    
+    # Malaysia
+    "my-magnum-4d": MalaysiaMagnum4DScraper,
+    "my-sports-toto": MalaysiaSportsTOTOScraper,
+    
+    # Thailand
+    "th-government-lottery": ThailandGovernmentLotteryScraper,
+    
+    # Philippines
+    "ph-pcso-lotto": PhilippinesPCSOLottoScraper,
+    
+    # Japan
+    "jp-takarakuji": JapanTakarakujiScraper,
+    
+    # South Korea
+    "kr-lotto-645": SouthKoreaLotto645Scraper,
+    
+    # Taiwan
+    "tw-welfare-lottery": TaiwanWelfareLotteryScraper,
+    
+    # Hong Kong
+    "hk-mark-six": HongKongMarkSixScraper,
+    
+    # Vietnam
+    "vn-vietlott": VietnamVietlottScraper,
+}
+
+
+def uses_api(slug: str) -> bool:
+    """Whether the lottery is fetched from its recorded JSON API ("type": "api")"""
+    return (get_lottery_config(slug) or {}).get("type") == "api"
+
+
+def get_scraper_by_slug(slug: str):
+    """Get scraper instance by slug"""
+    scraper_class = SCRAPER_REGISTRY.get(slug)
+    if scraper_class:
+        scraper = scraper_class()
+        scraper.slug = slug
+        if uses_api(slug):
+            return api_scraper_for(scraper)
+        return scraper
+    return None
+
+
+def get_all_scraper_slugs():
+    """Get all registered scraper slugs"""
+    return list(SCRAPER_REGISTRY.keys())
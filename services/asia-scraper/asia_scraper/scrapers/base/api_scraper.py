@@ -0,0 +1,108 @@
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from asia_scraper.database.fingerprints import fingerprint
+from asia_scraper.scrapers.base.api_source import ApiSource, load_api_source, parse_iso, read_draws
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, ScrapedResult
+from asia_scraper.utils.http_client import http_client
+from asia_scraper.utils.offload import run_db
+from asia_scraper.utils.timing import FETCH, FINGERPRINT
+
+
+def _numbers(value: Any) -> List[int]:
+    values = value if isinstance(value, list) else [value] if value else []
+    return [int(item) for item in values]
+
+
+class ApiScraper(BaseScraper):
+    """
+    Scraper reading a lottery's draws from its JSON API instead of its page
+
+    Takes the place of the lottery's own scraper when its config says
+    "type": "api". The ApiSource (see api_discovery) names the fields
+    date, main, and optionally bonus and draw_number.
+    """
+
+    def __init__(self, config: Dict[str, Any], source: ApiSource):
+        super().__init__(config)
+        self.api_source = source
+
+    async def fetch_json(self) -> Any:
+        """Send the API request over the shared connection pool"""
+        source = self.api_source
+        with self.timings.stage(FETCH):
+            response = await http_client.request(
+                source.method, source.url, headers=source.headers, content=source.body
+            )
+        self.timings.fetched(len(response.content))
+        response.raise_for_status()
+        return response.json()
+
+    def page_fingerprint(self, draws: List[Dict[str, Any]]) -> str:
+        """Fingerprint the draws themselves; responses may carry timestamps"""
+        return fingerprint(json.dumps(draws, sort_keys=True))
+
+    def draw_date(self, text: Optional[str]) -> Optional[date]:
+        """Draw date from its field text, rendered with the field's date_format if any"""
+        if not text:
+            return None
+        date_format = self.api_source.fields["date"].date_format
+        if date_format:
+            return datetime.strptime(text, date_format).date()
+        parsed = parse_iso(text)
+        return parsed.date() if parsed else None
+
+    def to_result(self, draw: Dict[str, Any]) -> Optional[ScrapedResult]:
+        """A draw row as a result, None when it has no date or numbers"""
+        try:
+            draw_date = self.draw_date(draw.get("date"))
+            winning_numbers = _numbers(draw.get("main"))
+            bonus_numbers = _numbers(draw.get("bonus")) or None
+        except (TypeError, ValueError) as e:
+            self.logger.warning("Unreadable API draw", draw=draw, error=str(e))
+            return None
+        if draw_date is None or not winning_numbers:
+            return None
+        return ScrapedResult(
+            draw_date=draw_date,
+            draw_number=draw.get("draw_number"),
+            winning_numbers=winning_numbers,
+            bonus_numbers=bonus_numbers,
+            raw_data={"source": "api"},
+        )
+
+    def parse_draws(self, draws: List[Dict[str, Any]]) -> List[ScrapedResult]:
+        """Every readable draw row, in order"""
+        results = (self.to_result(draw) for draw in draws)
+        return [result for result in results if result is not None]
+
+    def parse_payload(self, payload: Any) -> List[ScrapedResult]:
+        """Every readable draw in a decoded response, newest first"""
+        return self.parse_draws(read_draws(payload, self.api_source))
+
+    async def iter_results(self) -> AsyncIterator[ScrapedResult]:
+        """Fetch the API response and yield its draws"""
+        payload = await self.fetch_json()
+        # Read once: the same rows are fingerprinted and parsed
+        draws = read_draws(payload, self.api_source)
+        with self.timings.stage(FINGERPRINT):
+            await run_db(self.check_fingerprint, draws)
+        for result in self.parse_draws(draws):
+            yield result
+
+    async def scrape(self) -> List[ScrapedResult]:
+        """Fetch and parse the API response"""
+        return [result async for result in self.iter_results()]
+
+
+def api_scraper_for(scraper: BaseScraper) -> ApiScraper:
+    """
+    The API scraper standing in for a lottery's own scraper
+
+    Raises:
+        ValueError: No API source was generated for the slug
+    """
+    source = load_api_source(scraper.slug)
+    if source is None:
+        raise ValueError(f"No API source found for lottery slug: {scraper.slug}")
+    return ApiScraper({**scraper.config, "slug": scraper.slug}, source)
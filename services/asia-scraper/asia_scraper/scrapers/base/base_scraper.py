@@ -0,0 +1,186 @@
+import inspect
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Sequence
+from pydantic import BaseModel, Field
+from datetime import date
+from bs4 import BeautifulSoup
+from asia_scraper.database.fingerprints import fingerprint, load_fingerprint, store_fingerprint
+from asia_scraper.scrapers.base.parse_backends import BS4, ParseTarget, page_html, parse_document
+from asia_scraper.utils.logger import get_logger
+from asia_scraper.utils.offload import run_db
+from asia_scraper.utils.timing import PARSE, VALIDATE, StageTimer
+
+
+class ScrapedResult(BaseModel):
+    """Pydantic model for scraped lottery results"""
+    draw_date: date
+    draw_number: str | None = None
+    winning_numbers: List[int] = Field(min_length=1)
+    bonus_numbers: List[int] | None = None
+    jackpot: Dict[str, Any] | None = None
+    winners_count: int | None = None
+    raw_data: Dict[str, Any] = Field(default_factory=dict)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "draw_date": "2026-01-19",
+                "draw_number": "1234",
+                "winning_numbers": [1, 5, 12, 23, 34, 45],
+                "bonus_numbers": [7],
+                "jackpot": {"amount": 1000000, "currency": "SGD"},
+                "winners_count": 3,
+                "raw_data": {}
+            }
+        }
+
+
+class PageUnchanged(Exception):
+    """Source page is identical to the last successful scrape"""
+
+
+async def iterate_parsed(parsed: Any) -> AsyncIterator["ScrapedResult"]:
+    """Iterate parser output, whether an async generator, a list or a coroutine returning one"""
+    if inspect.isawaitable(parsed):
+        parsed = await parsed
+    if hasattr(parsed, "__aiter__"):
+        async for result in parsed:
+            yield result
+    else:
+        for result in parsed or []:
+            yield result
+
+
+class BaseScraper(ABC):
+    """Abstract base class for all scrapers"""
+    
+    # CSS selector for the part of the page the parser reads; None hashes the whole page
+    fingerprint_selector: str | None = None
+    
+    # Parse backend (see parse_backends) and the elements non-bs4 backends extract
+    parse_backend: str = BS4
+    parse_targets: Sequence[ParseTarget] = ()
+    
+    # Scrapers of one type with the same key are fetched together when due at
+    # the same time (see batch); None keys on the page URL
+    batch_key: str | None = None
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.logger = get_logger(self.__class__.__name__)
+        self.name = config.get("name", "Unknown")
+        self.url = config.get("url", "")
+        self.slug: str | None = config.get("slug")
+        self._pending_fingerprint: str | None = None
+        self.timings = StageTimer()
+        self.batch = None
+    
+    @abstractmethod
+    async def scrape(self) -> List[ScrapedResult]:
+        """Main scraping method - must be implemented by subclasses"""
+        pass
+    
+    async def fetch_markup(self) -> str:
+        """Fetch this scraper's page markup; implemented by the page scrapers"""
+        raise NotImplementedError("Subclasses must implement fetch_markup")
+    
+    async def fetch_batch(self, scrapers: Sequence["BaseScraper"]) -> Dict[str, Any]:
+        """
+        Markup (or the exception fetching it) by slug for the batch members
+        this scraper's fetch serves; the default serves only itself
+        """
+        return {self.slug: await self.fetch_markup()}
+    
+    async def page_markup(self) -> str:
+        """This run's markup: the batch's share when batched, else fetch_markup()"""
+        if self.batch:
+            return await self.batch.fetch(self)
+        return await self.fetch_markup()
+    
+    def parse_page(self, markup: str):
+        """Parse fetched markup with this scraper's backend"""
+        return parse_document(markup, self.parse_backend, self.parse_targets)
+    
+    def page_fingerprint(self, soup) -> str:
+        """Fingerprint the page fragment the parser depends on"""
+        if not isinstance(soup, BeautifulSoup):
+            # Fast backends already hold only the target elements
+            return fingerprint(page_html(soup))
+        if self.fingerprint_selector:
+            content = "".join(str(el) for el in soup.select(self.fingerprint_selector))
+        else:
+            content = str(soup)
+        return fingerprint(content)
+    
+    def check_fingerprint(self, soup) -> None:
+        """Raise PageUnchanged if the page matches the last saved scrape"""
+        if not self.slug:
+            return
+        
+        value = self.page_fingerprint(soup)
+        if value == load_fingerprint(self.slug):
+            self.logger.info("Page fingerprint unchanged", slug=self.slug)
+            raise PageUnchanged(self.slug)
+        self._pending_fingerprint = value
+    
+    async def mark_success(self) -> None:
+        """Hook called once results are saved; subclasses persist fetch state here"""
+        if self.slug and self._pending_fingerprint:
+            await run_db(store_fingerprint, self.slug, self._pending_fingerprint)
+            self._pending_fingerprint = None
+    
+    def validate(self, result: ScrapedResult) -> bool:
+        """Validate a scraped result"""
+        try:
+            # Basic validation
+            if not result.winning_numbers:
+                self.logger.warning("No winning numbers found", result=result.dict())
+                return False
+            
+            if result.draw_date > date.today():
+                self.logger.warning("Draw date is in the future", date=result.draw_date)
+                return False
+            
+            # Check for duplicate numbers
+            if len(result.winning_numbers) != len(set(result.winning_numbers)):
+                self.logger.warning("Duplicate winning numbers found", numbers=result.winning_numbers)
+                return False
+            
+            return True
+        except Exception as e:
+            self.logger.error("Validation error", error=str(e))
+            return False
+    
+    async def iter_results(self) -> AsyncIterator[ScrapedResult]:
+        """Yield results as they are parsed; defaults to iterating scrape()"""
+        for result in await self.scrape():
+            yield result
+    
+    async def stream(self) -> AsyncIterator[ScrapedResult]:
+        """Yield valid results one at a time with error handling"""
+        self.logger.info("Starting scraper", scraper=self.name, url=self.url)
+        total = valid = 0
+        
+        try:
+            # Fetch and fingerprint time inside iter_results is booked to those stages
+            async for result in self.timings.timed_aiter(self.iter_results(), PARSE):
+                total += 1
+                with self.timings.stage(VALIDATE):
+                    ok = self.validate(result)
+                if ok:
+                    valid += 1
+                    yield result
+        except PageUnchanged:
+            self.logger.info("Source unchanged, skipping parse", scraper=self.name)
+            raise
+        except Exception as e:
+            self.logger.error("Scraper failed", scraper=self.name, error=str(e), exc_info=True)
+            raise
+        finally:
+            self.timings.rows.update(parsed=total, valid=valid)
+        
+        self.logger.info("Scraper completed", scraper=self.name, total=total, valid=valid)
+    
+    async def execute(self) -> List[ScrapedResult]:
+        """Execute scraper with error handling"""
+        return [result async for result in self.stream()]
@@ -0,0 +1,78 @@
+"""
+Same-source batching: one fetch serving several lottery scrapers
+
+Some operators publish several games on one site (Singapore Pools' TOTO
+and 4D pages are read in one browser session). Scrapers of the same type
+whose batch_key (by default the page URL) matches are scheduled as one
+job and, when due together, run as a FetchBatch: the first member's
+fetch loads every member's page once and the rest parse what it read.
+Parsing, fingerprints, saves, job records and metrics stay per slug.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from asia_scraper.scrapers.base.base_scraper import BaseScraper
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def source_key(lottery: Dict[str, Any], scraper_class: type | None) -> Optional[Tuple[str, str]]:
+    """(scraper type, batch_key or URL) for a lottery, None without a scraper"""
+    if scraper_class is None:
+        return None
+    return lottery.get("type", ""), scraper_class.batch_key or lottery["url"]
+
+
+def batch_groups(lotteries: Iterable[Dict[str, Any]], registry: Dict[str, type]) -> List[List[Dict[str, Any]]]:
+    """Lottery configs grouped by source_key, in order; unshared lotteries are groups of one"""
+    groups: Dict[Any, List[Dict[str, Any]]] = {}
+    for lottery in lotteries:
+        key = source_key(lottery, registry.get(lottery["slug"])) or lottery["slug"]
+        groups.setdefault(key, []).append(lottery)
+    return list(groups.values())
+
+
+class FetchBatch:
+    """
+    Scrapers due together on one source, fetched once
+
+    Members run one after another through run(). The first to fetch calls
+    its fetch_batch() for everyone, so that job carries the fetch time and
+    bytes; the others are handed their share. A fetch error handed out
+    fails only the members it applies to.
+    """
+
+    def __init__(self, scrapers: Sequence[BaseScraper]):
+        self.scrapers = list(scrapers)
+        self._fetched: Dict[str, Any] | None = None
+        for scraper in self.scrapers:
+            scraper.batch = self
+
+    async def fetch(self, scraper: BaseScraper) -> str:
+        """A member's markup, fetching for all members on the first call"""
+        if self._fetched is None:
+            self._fetched = await scraper.fetch_batch(self.scrapers)
+        elif scraper.slug in self._fetched:
+            scraper.logger.info("Using batch fetch", batch=[member.slug for member in self.scrapers])
+
+        if scraper.slug not in self._fetched:
+            return await scraper.fetch_markup()
+        fetched = self._fetched.pop(scraper.slug)
+        if isinstance(fetched, Exception):
+            raise fetched
+        return fetched
+
+    async def run(self, run_member: Callable[[BaseScraper], Awaitable[Any]]) -> List[Any]:
+        """Await run_member for each member in order; returns each result, or the exception it raised"""
+        logger.info("Running batch", slugs=[scraper.slug for scraper in self.scrapers])
+        results = []
+        try:
+            for scraper in self.scrapers:
+                try:
+                    results.append(await run_member(scraper))
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            for scraper in self.scrapers:
+                scraper.batch = None
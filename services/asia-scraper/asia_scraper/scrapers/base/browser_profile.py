@@ -0,0 +1,203 @@
+"""
+Lean Chrome profile for scraping
+
+Result pages need their HTML and scripts. The images, fonts,
+stylesheets, media, ads and analytics around them only cost bandwidth
+and load time. lean_options() starts Chrome without extensions,
+background networking or image decoding, and with the eager page-load
+strategy, so driver.get() returns at DOMContentLoaded instead of waiting
+for every subresource. block_resources() then drops unwanted requests at
+the network layer with DevTools Network.setBlockedURLs. Scrapers tune the
+list per site: block_urls adds patterns, allow_urls lifts defaults the
+site needs (e.g. "*.css*" when results are laid out by a stylesheet).
+
+page_weight() reads what a load cost from the Resource Timing API, and
+scrapes report it in their stage timings and metrics. What the profile
+saves on a given page is measured by loading it with and without:
+
+    python -m asia_scraper.scrapers.base.browser_profile https://www.powerball.com/ --allow '*.css*'
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+
+IMAGES = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*", "*.bmp*")
+FONTS = ("*.woff*", "*.ttf*", "*.otf*", "*.eot*")
+MEDIA = ("*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*")
+STYLESHEETS = ("*.css*",)
+TRACKERS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*criteo.com*",
+    "*criteo.net*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*adnxs.com*",
+    "*nr-data.net*",
+    "*newrelic.com*",
+)
+
+DEFAULT_BLOCKED_URLS = IMAGES + FONTS + MEDIA + STYLESHEETS + TRACKERS
+
+LEAN_ARGUMENTS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+)
+
+# Bytes and requests of the current document and its subresources so far
+PAGE_WEIGHT_SCRIPT = """
+const size = entry => entry.transferSize || entry.encodedBodySize || 0;
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {bytes: entries.reduce((sum, entry) => sum + size(entry), 0), requests: entries.length};
+"""
+
+
+def lean_options(options: Options) -> Options:
+    """Add the lean profile to Chrome options"""
+    for argument in LEAN_ARGUMENTS:
+        options.add_argument(argument)
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return options
+
+
+def blocked_patterns(block: Sequence[str] = (), allow: Sequence[str] = ()) -> List[str]:
+    """
+    URL patterns to block for one site
+
+    Args:
+        block: Patterns blocked on top of DEFAULT_BLOCKED_URLS
+        allow: Default patterns the site needs loaded
+
+    Returns:
+        Patterns for Network.setBlockedURLs
+    """
+    patterns = [pattern for pattern in DEFAULT_BLOCKED_URLS if pattern not in allow]
+    return patterns + [pattern for pattern in block if pattern not in patterns]
+
+
+def block_resources(driver: webdriver.Chrome, patterns: Sequence[str]) -> bool:
+    """
+    Block requests matching patterns for the driver's next page loads
+
+    Pooled drivers serve many sites, so this is set again before each load.
+
+    Returns:
+        False when the driver does not speak DevTools
+    """
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return False
+    execute_cdp_cmd("Network.enable", {})
+    execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    return True
+
+
+def page_weight(driver: webdriver.Chrome) -> Optional[Dict[str, int]]:
+    """Bytes transferred and requests made by the loaded page, None if unavailable"""
+    try:
+        weight = driver.execute_script(PAGE_WEIGHT_SCRIPT)
+    except WebDriverException:
+        return None
+    if not isinstance(weight, dict):
+        return None
+    return {"bytes": int(weight.get("bytes") or 0), "requests": int(weight.get("requests") or 0)}
+
+
+def timed_get(driver: webdriver.Chrome, url: str) -> float:
+    """driver.get(url), returning how long it blocked in milliseconds"""
+    started = time.perf_counter()
+    driver.get(url)
+    return (time.perf_counter() - started) * 1000
+
+
+def _measure(url: str, lean: bool, patterns: Sequence[str], headless: bool) -> Dict[str, float]:
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if lean:
+        lean_options(options)
+
+    driver = webdriver.Chrome(options=options)
+    try:
+        if lean:
+            block_resources(driver, patterns)
+        load_ms = timed_get(driver, url)
+        # Let the lean load finish too, so bytes compare like for like
+        started = time.perf_counter()
+        WebDriverWait(driver, 60).until(lambda d: d.execute_script("return document.readyState") == "complete")
+        complete_ms = load_ms + (time.perf_counter() - started) * 1000
+        weight = page_weight(driver) or {"bytes": 0, "requests": 0}
+        return {**weight, "load_ms": load_ms, "complete_ms": complete_ms}
+    finally:
+        driver.quit()
+
+
+def compare(url: str, patterns: Sequence[str], rounds: int = 3, headless: bool = True) -> Dict[str, Dict[str, float]]:
+    """
+    Load url with the default and the lean profile
+
+    Returns:
+        Median bytes, requests, load_ms (driver.get) and complete_ms (readyState
+        complete) per profile, plus what the lean profile saved
+    """
+    runs = {"full": [], "lean": []}
+    for _ in range(rounds):
+        runs["full"].append(_measure(url, False, patterns, headless))
+        runs["lean"].append(_measure(url, True, patterns, headless))
+
+    report = {
+        profile: {key: sorted(run[key] for run in samples)[len(samples) // 2] for key in samples[0]}
+        for profile, samples in runs.items()
+    }
+    report["saved"] = {key: report["full"][key] - report["lean"][key] for key in report["full"]}
+    return report
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure what the lean Chrome profile saves on a page")
+    parser.add_argument("url")
+    parser.add_argument("--block", action="append", default=[], help="Extra pattern to block")
+    parser.add_argument("--allow", action="append", default=[], help="Default pattern to let through")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    report = compare(args.url, blocked_patterns(args.block, args.allow), args.rounds, not args.headed)
+    print(f"{'profile':<8} {'KiB':>10} {'requests':>9} {'load ms':>9} {'complete ms':>12}")
+    for profile, row in report.items():
+        print(
+            f"{profile:<8} {row['bytes'] / 1024:>10.1f} {row['requests']:>9.0f} "
+            f"{row['load_ms']:>9.0f} {row['complete_ms']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
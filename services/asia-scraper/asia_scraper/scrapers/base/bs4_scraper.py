@@ -0,0 +1,136 @@
+import httpx
+from bs4 import BeautifulSoup
+from typing import Any, AsyncIterator, Dict, List, Sequence
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, PageUnchanged, ScrapedResult, iterate_parsed
+from asia_scraper.utils.http_client import http_client
+from asia_scraper.utils.offload import run_db
+from asia_scraper.utils.response_cache import CacheEntry, content_hash, response_cache
+from asia_scraper.utils.timing import FETCH, FINGERPRINT
+
+
+class BS4Scraper(BaseScraper):
+    """Scraper for static HTML using BeautifulSoup"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Validators from this run, persisted only after results are saved
+        self._pending_cache: Dict[str, CacheEntry] = {}
+    
+    async def fetch_html(self, url: str) -> BeautifulSoup:
+        """Fetch a page and parse it into a full BeautifulSoup tree"""
+        return BeautifulSoup(await self.fetch_page(url), 'lxml')
+    
+    def cache_key(self, url: str) -> str:
+        """
+        Conditional cache key for a URL
+        
+        Batch members share a page but save separately, so each keeps its
+        own validators: one member's successful save must not turn the
+        next fetch into a 304 for a member whose save failed.
+        """
+        return f"{self.slug}:{url}" if self.slug else url
+    
+    async def fetch_page(self, url: str) -> str:
+        """
+        Fetch page markup over the shared connection pool
+        
+        Sends the validators from the last successful fetch and raises
+        PageUnchanged on 304 Not Modified or an identical body.
+        """
+        cached = await response_cache.get(self.cache_key(url))
+        response = await self._request(url, cached)
+        return await self._accept(url, response, cached)
+    
+    async def _request(self, url: str, cached: CacheEntry | None) -> httpx.Response:
+        """GET url, conditional on cached validators; PageUnchanged on 304"""
+        with self.timings.stage(FETCH):
+            headers = cached.conditional_headers() if cached else {}
+            response = await http_client.get(url, headers=headers)
+        self.timings.fetched(len(response.content))
+        
+        if response.status_code == 304:
+            self.logger.info("Page not modified", url=url)
+            raise PageUnchanged(url)
+        response.raise_for_status()
+        
+        self.logger.debug(
+            "Fetched HTML",
+            url=url,
+            status=response.status_code,
+            http_version=response.http_version
+        )
+        return response
+    
+    async def _accept(self, url: str, response: httpx.Response, cached: CacheEntry | None) -> str:
+        """Markup of a 200 response, or PageUnchanged if its body matches what this scraper saved"""
+        entry = CacheEntry(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash(response.content),
+        )
+        if cached and cached.content_hash == entry.content_hash:
+            # Server ignored the validators but the body is the same
+            await response_cache.set(self.cache_key(url), entry)
+            self.logger.info("Page content unchanged", url=url)
+            raise PageUnchanged(url)
+        
+        self._pending_cache[self.cache_key(url)] = entry
+        return response.text
+    
+    async def mark_success(self) -> None:
+        """Remember validators for pages whose results were saved"""
+        await super().mark_success()
+        for key, entry in self._pending_cache.items():
+            await response_cache.set(key, entry)
+        self._pending_cache.clear()
+    
+    async def fetch_markup(self) -> str:
+        """Fetch this scraper's URL"""
+        return await self.fetch_page(self.url)
+    
+    async def fetch_batch(self, scrapers: Sequence[BaseScraper]) -> Dict[str, Any]:
+        """
+        Fetch this URL once for every member on it
+        
+        The request is conditional only when every member saved the same
+        version; a 304 or fetch error then applies to all alike. Each
+        member checks the body against its own saved hash and keeps its
+        own validators.
+        """
+        members = [scraper for scraper in scrapers if isinstance(scraper, BS4Scraper) and scraper.url == self.url]
+        cached = {member.slug: await response_cache.get(member.cache_key(member.url)) for member in members}
+        versions = list(cached.values())
+        shared = versions[0] if all(version == versions[0] for version in versions) else None
+        try:
+            response = await self._request(self.url, shared)
+        except Exception as e:
+            return {member.slug: e for member in members}
+        
+        markup = {}
+        for member in members:
+            try:
+                markup[member.slug] = await member._accept(member.url, response, cached[member.slug])
+            except PageUnchanged as e:
+                markup[member.slug] = e
+        return markup
+    
+    async def iter_results(self) -> AsyncIterator[ScrapedResult]:
+        """Fetch the page and yield draws as parse_html produces them"""
+        page = self.parse_page(await self.page_markup())
+        with self.timings.stage(FINGERPRINT):
+            await run_db(self.check_fingerprint, page)
+        async for result in iterate_parsed(self.parse_html(page)):
+            yield result
+    
+    async def scrape(self) -> List[ScrapedResult]:
+        """Default scrape implementation"""
+        return [result async for result in self.iter_results()]
+    
+    async def parse_html(self, soup: BeautifulSoup) -> AsyncIterator[ScrapedResult]:
+        """
+        Parse HTML - must be implemented by subclasses, preferably as an async generator
+        
+        Receives a BeautifulSoup, or a Page of target elements when
+        parse_backend is not bs4.
+        """
+        raise NotImplementedError("Subclasses must implement parse_html")
@@ -0,0 +1,147 @@
+"""
+Bounded pool of warm Chrome drivers
+
+Starting Chrome costs seconds of CPU and a few hundred MB per scrape.
+The pool keeps up to ``max_size`` drivers alive, wipes cookies and
+storage between scrapes, and replaces a driver after ``max_uses`` pages
+or as soon as it stops responding.
+"""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List
+from selenium import webdriver
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PooledDriver:
+    driver: webdriver.Chrome
+    uses: int = 0
+
+
+class DriverPool:
+    """Hands out Chrome drivers, at most ``max_size`` at a time"""
+
+    def __init__(
+        self,
+        factory: Callable[[], webdriver.Chrome],
+        max_size: int,
+        max_uses: int,
+    ):
+        self.factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: List[_PooledDriver] = []
+        self._in_use: Dict[int, _PooledDriver] = {}
+        self._closed = False
+        self._counters = {"hits": 0, "misses": 0, "recycled": 0, "crashed": 0}
+
+    def checkout(self, timeout: float | None = None) -> webdriver.Chrome:
+        """
+        Take a driver from the pool, starting one if none is idle
+
+        Blocks while ``max_size`` drivers are checked out.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No Chrome driver available")
+
+        with self._lock:
+            entry = self._idle.pop() if self._idle else None
+            self._counters["hits" if entry else "misses"] += 1
+
+        if entry is None:
+            try:
+                entry = _PooledDriver(driver=self.factory())
+            except Exception:
+                self._slots.release()
+                raise
+            logger.debug("Started pooled Chrome driver")
+
+        with self._lock:
+            self._in_use[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver: webdriver.Chrome, discard: bool = False) -> None:
+        """Return a driver; it is reset for reuse or quit if worn out or broken"""
+        with self._lock:
+            entry = self._in_use.pop(id(driver), None)
+        if entry is None:
+            return
+
+        try:
+            entry.uses += 1
+            if self._closed:
+                self._quit(entry)
+            elif discard:
+                self._retire(entry, "crashed")
+            elif entry.uses >= self.max_uses:
+                self._retire(entry, "recycled")
+            else:
+                try:
+                    self._reset(entry.driver)
+                except Exception as e:
+                    logger.warning("Pooled driver failed reset", error=str(e))
+                    self._retire(entry, "crashed")
+                else:
+                    with self._lock:
+                        self._idle.append(entry)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def acquire(self, timeout: float | None = None) -> Iterator[webdriver.Chrome]:
+        """Context manager around checkout()/release()"""
+        driver = self.checkout(timeout=timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def _reset(self, driver: webdriver.Chrome) -> None:
+        """Clear per-site state so the next scrape starts clean"""
+        try:
+            driver.execute_script(
+                "window.localStorage && localStorage.clear();"
+                "window.sessionStorage && sessionStorage.clear();"
+            )
+        except Exception:
+            # Pages such as about:blank or error pages deny storage access
+            pass
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.get("about:blank")
+
+    def _retire(self, entry: _PooledDriver, reason: str) -> None:
+        with self._lock:
+            self._counters[reason] += 1
+        self._quit(entry)
+        logger.info("Retired pooled driver", reason=reason, uses=entry.uses)
+
+    def _quit(self, entry: _PooledDriver) -> None:
+        try:
+            entry.driver.quit()
+        except Exception as e:
+            logger.warning("Error quitting pooled driver", error=str(e))
+
+    def close(self) -> None:
+        """Quit every idle driver; checked-out drivers are quit on release"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool counters for health and monitoring endpoints"""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                **self._counters,
+            }
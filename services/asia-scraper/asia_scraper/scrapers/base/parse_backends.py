@@ -0,0 +1,155 @@
+"""
+Parse backends for fetched pages
+
+BeautifulSoup builds a Python object for every node in the document,
+which dominates scrape CPU and memory when a parser only reads one
+table. The other backends find the target elements in C and hand the
+parser just those subtrees:
+
+- ``bs4``: full BeautifulSoup tree (default; what older parsers expect)
+- ``lxml``: libxml2 HTML tree, targets located by XPath
+- ``iterparse``: incremental libxml2 parse; non-matching elements of
+  the target tags are cleared as soon as they close
+- ``selectolax``: Lexbor CSS match, each hit re-parsed as a small lxml
+  fragment (needs the optional ``selectolax`` package)
+
+Non-bs4 backends return a ``Page``: a dict from each ParseTarget to the
+matching lxml elements in document order. Parsers should stick to
+``xpath()``, ``get()`` and ``text()`` so they work with every backend.
+"""
+
+import io
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+
+BS4 = "bs4"
+
+
+@dataclass(frozen=True)
+class ParseTarget:
+    """Element a parser reads: a tag, optionally narrowed by one class"""
+    tag: str
+    class_name: str | None = None
+
+    @property
+    def css(self) -> str:
+        return f"{self.tag}.{self.class_name}" if self.class_name else self.tag
+
+    @property
+    def xpath(self) -> str:
+        if not self.class_name:
+            return f"//{self.tag}"
+        return f"//{self.tag}[contains(concat(' ', normalize-space(@class), ' '), ' {self.class_name} ')]"
+
+    def find_all(self, element) -> list:
+        """Descendants of element that are this target"""
+        return element.xpath("." + self.xpath)
+
+    def find(self, element):
+        """First descendant of element that is this target, or None"""
+        found = self.find_all(element)
+        return found[0] if found else None
+
+    def matches(self, element) -> bool:
+        """Whether an lxml element is this target"""
+        if element.tag != self.tag:
+            return False
+        return not self.class_name or self.class_name in (element.get("class") or "").split()
+
+
+Page = Dict[ParseTarget, List[etree._Element]]
+
+
+def parse_bs4(markup: str, targets: Sequence[ParseTarget]) -> BeautifulSoup:
+    """Whole-document BeautifulSoup tree; targets are ignored"""
+    return BeautifulSoup(markup, "lxml")
+
+
+def parse_lxml(markup: str, targets: Sequence[ParseTarget]) -> Page:
+    """Build the libxml2 tree once and pick targets by XPath"""
+    root = lxml.html.fromstring(markup)
+    return {target: root.xpath(target.xpath) for target in targets}
+
+
+def parse_iterparse(markup: str, targets: Sequence[ParseTarget]) -> Page:
+    """Stream the document and keep only target subtrees"""
+    page: Page = {target: [] for target in targets}
+    tags = {target.tag for target in targets}
+    events = etree.iterparse(
+        io.BytesIO(markup.encode("utf-8")),
+        events=("end",),
+        tag=tags,
+        html=True,
+        recover=True,
+        encoding="utf-8",
+    )
+
+    for _, element in events:
+        hits = [target for target in targets if target.matches(element)]
+        for target in hits:
+            page[target].append(element)
+        # Keep targets and anything inside one; drop the rest as it closes
+        if not hits and not any(
+            target.matches(ancestor) for ancestor in element.iterancestors() for target in targets
+        ):
+            element.clear()
+
+    return page
+
+
+def parse_selectolax(markup: str, targets: Sequence[ParseTarget]) -> Page:
+    """Match targets with selectolax and re-parse only the hits"""
+    from selectolax.parser import HTMLParser
+
+    tree = HTMLParser(markup)
+    return {
+        target: [lxml.html.fragment_fromstring(node.html) for node in tree.css(target.css)]
+        for target in targets
+    }
+
+
+PARSE_BACKENDS: Dict[str, Callable] = {
+    BS4: parse_bs4,
+    "lxml": parse_lxml,
+    "iterparse": parse_iterparse,
+    "selectolax": parse_selectolax,
+}
+
+
+def parse_document(markup: str, backend: str = BS4, targets: Sequence[ParseTarget] = ()):
+    """
+    Parse markup with the named backend
+
+    Returns a BeautifulSoup for ``bs4`` and a Page for every other backend;
+    those need at least one target.
+    """
+    try:
+        parse = PARSE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown parse backend: {backend}")
+    if backend != BS4 and not targets:
+        raise ValueError(f"Parse backend {backend} needs parse_targets")
+    return parse(markup, targets)
+
+
+def page_html(page: Page) -> str:
+    """Serialized target elements, for fingerprinting"""
+    return "".join(
+        etree.tostring(element, encoding="unicode", with_tail=False)
+        for elements in page.values()
+        for element in elements
+    )
+
+
+def first(page: Page, target: ParseTarget):
+    """First element matching target, or None"""
+    elements = page.get(target)
+    return elements[0] if elements else None
+
+
+def text(element) -> str:
+    """Stripped text content of an lxml element"""
+    return "".join(element.itertext()).strip()
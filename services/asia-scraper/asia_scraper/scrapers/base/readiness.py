@@ -0,0 +1,132 @@
+"""
+Readiness waits for rendered pages
+
+A scrape needs the browser only until its results are in the DOM.
+Rather than an implicit wait on every lookup or polling readyState, each
+Selenium scraper declares what marks its results as ready: elements
+that must be present (e.g. the balls of the latest draw), a network-idle
+period with no DOM mutation or finished request, or both.
+
+wait_until_ready() hands the condition to the page in a single
+execute_async_script call. A MutationObserver re-checks it on every DOM
+change and answers the moment it holds, so there is no polling interval
+to overshoot and the driver can be released straight away. Only a page
+whose results never appear waits out the timeout.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# (By strategy, value), e.g. (By.CLASS_NAME, "draw-date")
+Locator = Tuple[str, str]
+
+# locate(node, by, value) and follow(roots, path) for page scripts: a
+# locator path is applied in turn, each step searching inside the last
+LOCATE_JS = """
+const locate = (node, by, value) => {
+  switch (by) {
+    case 'css selector': return Array.from(node.querySelectorAll(value));
+    case 'class name': return Array.from(node.getElementsByClassName(value));
+    case 'id': return Array.from(node.querySelectorAll('#' + CSS.escape(value)));
+    case 'tag name': return Array.from(node.getElementsByTagName(value));
+    case 'xpath': {
+      const found = document.evaluate(value, node, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+    }
+  }
+  throw new Error('Unsupported locator: ' + by);
+};
+const follow = (roots, path) => path.reduce(
+  (nodes, [by, value]) => nodes.flatMap(node => locate(node, by, value)), roots);
+"""
+
+# Arguments: condition spec, timeout in ms; answers {ready, waited_ms}
+WAIT_READY_SCRIPT = LOCATE_JS + """
+const [condition, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+let lastActivity = started, observer = null, idleTimer = null, deadline = null, settled = false;
+
+const lastResponse = () => performance.getEntriesByType('resource')
+  .reduce((latest, entry) => Math.max(latest, entry.responseEnd), 0);
+const quietFor = () => performance.now() - Math.max(lastActivity, lastResponse());
+const present = () => !condition.path.length
+  || follow([document], condition.path).length >= condition.count;
+const ready = () => present() && (!condition.quiet_ms || quietFor() >= condition.quiet_ms);
+
+const settle = ok => {
+  if (settled) return;
+  settled = true;
+  if (observer) observer.disconnect();
+  clearTimeout(idleTimer);
+  clearTimeout(deadline);
+  done({ready: ok, waited_ms: Math.round(performance.now() - started)});
+};
+const check = () => {
+  if (ready()) return settle(true);
+  if (condition.quiet_ms && present()) {
+    // Nothing may mutate once the page is idle, so re-check when the quiet period would end
+    clearTimeout(idleTimer);
+    idleTimer = setTimeout(check, Math.max(10, condition.quiet_ms - quietFor()));
+  }
+};
+
+observer = new MutationObserver(() => { lastActivity = performance.now(); check(); });
+observer.observe(document, {childList: true, subtree: true, characterData: true});
+deadline = setTimeout(() => settle(ready()), timeoutMs);
+check();
+"""
+
+
+@dataclass(frozen=True)
+class ReadyWhen:
+    """
+    Condition marking a page's results as ready
+
+    Attributes:
+        path: Locators that must match, applied in turn from the document (none: no element condition)
+        count: Elements the path must match
+        quiet_ms: Also require this long without DOM mutations or finished requests (0: no idle condition)
+    """
+    path: Tuple[Locator, ...] = ()
+    count: int = 1
+    quiet_ms: int = 0
+
+    def spec(self) -> Dict:
+        """Argument form for WAIT_READY_SCRIPT"""
+        return {"path": [list(locator) for locator in self.path], "count": self.count, "quiet_ms": self.quiet_ms}
+
+
+def element_ready(*path: Locator, count: int = 1) -> ReadyWhen:
+    """Ready once path matches count elements, e.g. the last ball of the first draw"""
+    return ReadyWhen(path=path, count=count)
+
+
+def network_idle(quiet_ms: int = 500) -> ReadyWhen:
+    """Ready once the page has gone quiet_ms without DOM mutations or finished requests"""
+    return ReadyWhen(quiet_ms=quiet_ms)
+
+
+def wait_until_ready(driver: WebDriver, condition: ReadyWhen, timeout: float) -> float:
+    """
+    Block until condition holds on the loaded page
+
+    Args:
+        driver: WebDriver with the page loaded
+        condition: What marks the results as ready
+        timeout: Seconds to wait at most
+
+    Returns:
+        Milliseconds waited
+
+    Raises:
+        TimeoutException: The condition did not hold within timeout
+    """
+    # The script answers by itself at the deadline; the driver-side timeout is a backstop
+    driver.set_script_timeout(timeout + 5)
+    outcome = driver.execute_async_script(WAIT_READY_SCRIPT, condition.spec(), int(timeout * 1000))
+    if not outcome or not outcome.get("ready"):
+        raise TimeoutException(f"Results not ready after {timeout}s: {condition}")
+    return outcome["waited_ms"]
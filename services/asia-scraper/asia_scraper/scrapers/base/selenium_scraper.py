@@ -0,0 +1,177 @@
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from bs4 import BeautifulSoup
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, ScrapedResult, iterate_parsed
+from asia_scraper.scrapers.base.browser_profile import (
+    block_resources, blocked_patterns, lean_options, page_weight, timed_get,
+)
+from asia_scraper.scrapers.base.driver_pool import DriverPool
+from asia_scraper.scrapers.base.readiness import ReadyWhen, network_idle, wait_until_ready
+from asia_scraper.config.settings import settings
+from asia_scraper.config import runtime
+from asia_scraper.utils.cassette import page_url, record_page
+from asia_scraper.utils.offload import run_db, run_selenium
+from asia_scraper.utils.timing import FETCH, FINGERPRINT
+
+
+def create_driver() -> webdriver.Chrome:
+    """Create and configure Chrome driver"""
+    chrome_options = Options()
+    
+    if settings.HEADLESS_MODE:
+        chrome_options.add_argument('--headless')
+    
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument(f'user-agent={settings.SCRAPER_USER_AGENT}')
+    # No images, extensions or background traffic; get() returns at DOMContentLoaded
+    lean_options(chrome_options)
+    
+    service = Service(executable_path=settings.CHROME_DRIVER_PATH)
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(settings.DEFAULT_TIMEOUT)
+    
+    return driver
+
+
+# Warm drivers shared by every Selenium scraper in the process
+driver_pool = runtime.driver_pool or DriverPool(
+    create_driver,
+    max_size=settings.MAX_CONCURRENT_SCRAPERS,
+    max_uses=settings.DRIVER_MAX_USES,
+)
+
+
+class SeleniumScraper(BaseScraper):
+    """Scraper for dynamic JavaScript-rendered sites using Selenium"""
+    
+    # What marks the results as rendered (see readiness); network idle when not declared
+    ready_when: Optional[ReadyWhen] = None
+    
+    # Network.setBlockedURLs tuning on top of DEFAULT_BLOCKED_URLS (see browser_profile)
+    block_urls: Tuple[str, ...] = ()
+    allow_urls: Tuple[str, ...] = ()
+    
+    def get_driver(self) -> webdriver.Chrome:
+        """Create a standalone Chrome driver (not pooled)"""
+        return create_driver()
+    
+    def open_page(self, driver: webdriver.Chrome, blocked: Sequence[str] | None = None) -> float:
+        """Load the page with this site's resource blocking, or blocked instead; returns the load time (blocking)"""
+        if blocked is None:
+            blocked = blocked_patterns(self.block_urls, self.allow_urls)
+        block_resources(driver, blocked)
+        load_ms = timed_get(driver, page_url(self.url))
+        self.logger.debug("Page loaded", title=driver.title, load_ms=round(load_ms))
+        return load_ms
+    
+    def read_page(self, driver: webdriver.Chrome) -> str:
+        """Return the loaded page's source once this scraper's results are ready (blocking)"""
+        waited_ms = wait_until_ready(driver, self.ready_when or network_idle(), settings.DEFAULT_TIMEOUT)
+        self.logger.debug("Results ready", waited_ms=waited_ms)
+        return driver.page_source
+    
+    def load_page(self, driver: webdriver.Chrome) -> str:
+        """Load the page and return its source as soon as the results are ready (blocking)"""
+        load_ms = self.open_page(driver)
+        page_source = self.read_page(driver)
+        self.timings.loaded_page(load_ms, page_weight(driver))
+        record_page(self.url, driver)
+        return page_source
+    
+    def render_batch(self, driver: webdriver.Chrome, members: Sequence["SeleniumScraper"]) -> Dict[str, Any]:
+        """
+        Load each member URL once and read every member's page from it (blocking)
+        
+        Only what all members on a URL block is blocked. A page that fails
+        to load fails the members on it, results that never render only
+        the member waiting for them.
+        """
+        pages: Dict[str, Any] = {}
+        for url in dict.fromkeys(member.url for member in members):
+            on_page = [member for member in members if member.url == url]
+            patterns = [blocked_patterns(member.block_urls, member.allow_urls) for member in on_page]
+            blocked = [pattern for pattern in patterns[0] if all(pattern in other for other in patterns)]
+            try:
+                load_ms = on_page[0].open_page(driver, blocked)
+            except Exception as e:
+                self.logger.error("Failed to load page", url=url, error=str(e))
+                pages.update((member.slug, e) for member in on_page)
+                continue
+            
+            for member in on_page:
+                try:
+                    pages[member.slug] = member.read_page(driver)
+                except Exception as e:
+                    member.logger.error("Failed to read page", url=url, error=str(e))
+                    pages[member.slug] = e
+            read = [pages[member.slug] for member in on_page if isinstance(pages[member.slug], str)]
+            self.timings.loaded_page(load_ms, page_weight(driver))
+            self.timings.fetched(len(read[0].encode("utf-8")) if read else 0)
+            record_page(url, driver)
+        return pages
+    
+    async def fetch_markup(self) -> str:
+        """Load the page on a pooled driver and return its source"""
+        # Checkout, page load and release all block, so they run on the Selenium pool
+        with self.timings.stage(FETCH):
+            driver = await run_selenium(driver_pool.checkout)
+            broken = False
+            try:
+                self.logger.debug("Selenium driver acquired", url=self.url)
+                page_source = await run_selenium(self.load_page, driver)
+            except WebDriverException:
+                # A driver that crashed or timed out is not trusted with the next page
+                broken = True
+                raise
+            finally:
+                # The results are in page_source; the next scrape can have the driver
+                await run_selenium(driver_pool.release, driver, broken)
+        self.timings.fetched(len(page_source.encode("utf-8")))
+        return page_source
+    
+    async def fetch_batch(self, scrapers: Sequence[BaseScraper]) -> Dict[str, Any]:
+        """Read every Selenium member's page on one driver checkout (see render_batch)"""
+        members = [scraper for scraper in scrapers if isinstance(scraper, SeleniumScraper)]
+        with self.timings.stage(FETCH):
+            driver = await run_selenium(driver_pool.checkout)
+            pages: Dict[str, Any] = {}
+            try:
+                self.logger.debug("Selenium driver acquired", batch=[member.slug for member in members])
+                pages = await run_selenium(self.render_batch, driver, members)
+                return pages
+            finally:
+                broken = any(isinstance(page, WebDriverException) for page in pages.values())
+                await run_selenium(driver_pool.release, driver, broken)
+    
+    async def iter_results(self) -> AsyncIterator[ScrapedResult]:
+        """Load the page and yield draws as parse_dynamic_content produces them"""
+        page_source = await self.page_markup()
+        
+        # Get page source and parse
+        soup = self.parse_page(page_source)
+        with self.timings.stage(FINGERPRINT):
+            await run_db(self.check_fingerprint, soup)
+        async for result in iterate_parsed(self.parse_dynamic_content(soup, None)):
+            yield result
+    
+    async def scrape(self) -> List[ScrapedResult]:
+        """Default scrape implementation using Selenium"""
+        return [result async for result in self.iter_results()]
+    
+    async def parse_dynamic_content(
+        self, 
+        soup: BeautifulSoup, 
+        driver: Optional[webdriver.Chrome]
+    ) -> AsyncIterator[ScrapedResult]:
+        """
+        Parse dynamic content - must be implemented by subclasses, preferably as an async generator
+        
+        soup is a Page of target elements when parse_backend is not bs4. The
+        driver was released once the page was read, so driver is None.
+        """
+        raise NotImplementedError("Subclasses must implement parse_dynamic_content")
@@ -0,0 +1,86 @@
+from typing import AsyncIterator
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.parse_backends import Page, ParseTarget, first, text
+
+RESULT = ParseTarget("div", "marksix_search_result")
+DRAW_NO = ParseTarget("div", "draw_no")
+DRAW_DATE = ParseTarget("div", "date")
+BALL_HOLDER = ParseTarget("div", "ball_holder")
+BALL = ParseTarget("div", "ball")
+EXTRA_BALL = ParseTarget("div", "extra_ball")
+
+
+class HongKongMarkSixScraper(SeleniumScraper):
+    """Hong Kong Mark Six lottery scraper"""
+    
+    fingerprint_selector = "div.marksix_search_result, div.draw_no, div.date"
+    parse_backend = "lxml"
+    parse_targets = (RESULT, DRAW_NO, DRAW_DATE)
+    ready_when = element_ready((By.CSS_SELECTOR, "div.marksix_search_result div.ball_holder div.ball"), count=6)
+    
+    def __init__(self):
+        super().__init__({
+            "name": "Mark Six",
+            "url": "https://bet.hkjc.com/marksix/",
+            "schedule": "0 21 * * 2,4,6",  # Tue, Thu, Sat 9 PM HKT
+        })
+    
+    async def parse_dynamic_content(
+        self,
+        page: Page,
+        driver: webdriver.Chrome
+    ) -> AsyncIterator[ScrapedResult]:
+        """Parse Mark Six results"""
+        try:
+            # HKJC Mark Six draws 6 numbers + 1 extra number
+            result_section = first(page, RESULT)
+
+            if result_section is not None:
+                # Main 6 numbers
+                main_numbers = BALL_HOLDER.find_all(result_section)[:6]
+                winning_numbers = [
+                    int(text(BALL.find(holder)))
+                    for holder in main_numbers
+                    if BALL.find(holder) is not None
+                ]
+                
+                # Extra number (bonus)
+                extra_ball = EXTRA_BALL.find(result_section)
+                bonus_numbers = None
+                if extra_ball is not None:
+                    extra_text = BALL.find(extra_ball)
+                    if extra_text is not None and text(extra_text).isdigit():
+                        bonus_numbers = [int(text(extra_text))]
+                
+                # Get draw number
+                draw_no = first(page, DRAW_NO)
+                draw_number = text(draw_no) if draw_no is not None else None
+                
+                # Get date
+                draw_date_elem = first(page, DRAW_DATE)
+                from datetime import date, datetime
+                draw_date = date.today()
+                
+                if draw_date_elem is not None:
+                    try:
+                        date_text = text(draw_date_elem)
+                        draw_date = datetime.strptime(date_text, '%d/%m/%Y').date()
+                    except:
+                        pass
+                
+                if winning_numbers:
+                    result = ScrapedResult(
+                        draw_date=draw_date,
+                        draw_number=draw_number,
+                        winning_numbers=winning_numbers,
+                        bonus_numbers=bonus_numbers,
+                        raw_data={"source": "hkjc"}
+                    )
+                    yield result
+            
+        except Exception as e:
+            self.logger.error("Error parsing Mark Six", error=str(e))
@@ -1,13 +1,20 @@
-from typing import List
+from typing import AsyncIterator, List
 from bs4 import BeautifulSoup
 from datetime import datetime
-from src.scrapers.base.bs4_scraper import BS4Scraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.bs4_scraper import BS4Scraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.parse_backends import Page, ParseTarget, first, text
+
+RESULT_TABLE = ParseTarget("table", "lottery-results")
 
 
 class IndiaKeralaLotteryScraper(BS4Scraper):
     """Kerala State Lottery scraper"""
     
+    fingerprint_selector = "table.lottery-results"
+    parse_backend = "lxml"
+    parse_targets = (RESULT_TABLE,)
+    
     def __init__(self):
         super().__init__({
             "name": "Kerala State Lottery",
@@ -15,38 +22,33 @@ class IndiaKeralaLotteryScraper(BS4Scraper):
             "schedule": "0 16 * * *",  # 4 PM IST daily
         })
     
-    async def parse_html(self, soup: BeautifulSoup) -> List[ScrapedResult]:
+    async def parse_html(self, page: Page) -> AsyncIterator[ScrapedResult]:
         """Parse Kerala lottery results"""
-        results = []
-        
         try:
             # Example parsing (adjust based on actual HTML structure)
-            result_table = soup.find('table', class_='lottery-results')
+            result_table = first(page, RESULT_TABLE)
             
-            if result_table:
-                for row in result_table.find_all('tr')[1:]:  # Skip header
-                    cols = row.find_all('td')
+            if result_table is not None:
+                for row in result_table.xpath('.//tr')[1:]:  # Skip header
+                    cols = row.xpath('./td')
                     if len(cols) >= 3:
                         # Parse date
-                        date_str = cols[0].text.strip()
+                        date_str = text(cols[0])
                         draw_date = datetime.strptime(date_str, '%d-%m-%Y').date()
                         
                         # Parse numbers
-                        numbers_text = cols[1].text.strip()
+                        numbers_text = text(cols[1])
                         winning_numbers = [int(n) for n in numbers_text.split()]
                         
                         result = ScrapedResult(
                             draw_date=draw_date,
                             winning_numbers=winning_numbers,
-                            raw_data={"html_row": str(row)}
+                            raw_data={"source": "kerala"}
                         )
-                        results.append(result)
-            
-            return results
+                        yield result
             
         except Exception as e:
             self.logger.error("Error parsing Kerala lottery", error=str(e))
-            return []
 
 
 class IndiaSikkimLotteryScraper(BS4Scraper):
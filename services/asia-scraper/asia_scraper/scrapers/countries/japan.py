@@ -1,13 +1,18 @@
-from typing import List
+from typing import AsyncIterator
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class JapanTakarakujiScraper(SeleniumScraper):
     """Japan Takarakuji lottery scraper"""
     
+    fingerprint_selector = "div.result-numbers"
+    ready_when = element_ready((By.CSS_SELECTOR, "div.result-numbers span.number"))
+    
     def __init__(self):
         super().__init__({
             "name": "Takarakuji",
@@ -19,10 +24,8 @@ class JapanTakarakujiScraper(SeleniumScraper):
         self, 
         soup: BeautifulSoup, 
         driver: webdriver.Chrome
-    ) -> List[ScrapedResult]:
+    ) -> AsyncIterator[ScrapedResult]:
         """Parse Takarakuji results"""
-        results = []
-        
         try:
             # Japanese lottery structure varies
             # This is a placeholder - actual implementation needs Japanese text parsing
@@ -44,9 +47,7 @@ class JapanTakarakujiScraper(SeleniumScraper):
                         winning_numbers=winning_numbers,
                         raw_data={"country": "japan"}
                     )
-                    results.append(result)
+                    yield result
             
         except Exception as e:
             self.logger.error("Error parsing Takarakuji", error=str(e))
-        
-        return results
@@ -1,14 +1,17 @@
-from typing import List
+from typing import AsyncIterator, List
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.bs4_scraper import BS4Scraper
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.bs4_scraper import BS4Scraper
+from asia_scraper.scrapers.base.readiness import network_idle
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class MalaysiaMagnum4DScraper(BS4Scraper):
     """Malaysia Magnum 4D scraper"""
     
+    fingerprint_selector = "div.result-item"
+    
     def __init__(self):
         super().__init__({
             "name": "Magnum 4D",
@@ -16,10 +19,8 @@ class MalaysiaMagnum4DScraper(BS4Scraper):
             "schedule": "0 19 * * 3,6,0",  # Wed, Sat, Sun 7 PM MYT
         })
     
-    async def parse_html(self, soup: BeautifulSoup) -> List[ScrapedResult]:
+    async def parse_html(self, soup: BeautifulSoup) -> AsyncIterator[ScrapedResult]:
         """Parse Magnum 4D results"""
-        results = []
-        
         try:
             # Example parsing - adjust based on actual structure
             result_divs = soup.find_all('div', class_='result-item')
@@ -43,17 +44,18 @@ class MalaysiaMagnum4DScraper(BS4Scraper):
                             winning_numbers=winning_numbers,
                             raw_data={"source": "magnum4d"}
                         )
-                        results.append(result)
+                        yield result
             
         except Exception as e:
             self.logger.error("Error parsing Magnum 4D", error=str(e))
-        
-        return results
 
 
 class MalaysiaSportsTOTOScraper(SeleniumScraper):
     """Malaysia Sports TOTO scraper"""
     
+    # No stable results marker known yet
+    ready_when = network_idle()
+    
     def __init__(self):
         super().__init__({
             "name": "Sports TOTO",
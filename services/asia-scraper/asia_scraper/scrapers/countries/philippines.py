@@ -1,13 +1,18 @@
-from typing import List
+from typing import AsyncIterator
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class PhilippinesPCSOLottoScraper(SeleniumScraper):
     """Philippines PCSO Lotto scraper"""
     
+    fingerprint_selector = "table#GridView1"
+    ready_when = element_ready((By.CSS_SELECTOR, "table#GridView1 tr td"))
+    
     def __init__(self):
         super().__init__({
             "name": "PCSO Lotto",
@@ -19,10 +24,8 @@ class PhilippinesPCSOLottoScraper(SeleniumScraper):
         self, 
         soup: BeautifulSoup, 
         driver: webdriver.Chrome
-    ) -> List[ScrapedResult]:
+    ) -> AsyncIterator[ScrapedResult]:
         """Parse PCSO Lotto results"""
-        results = []
-        
         try:
             # PCSO has multiple lotto games: 6/42, 6/45, 6/49, 6/55, 6/58
             result_table = soup.find('table', id='GridView1')
@@ -65,9 +68,7 @@ class PhilippinesPCSOLottoScraper(SeleniumScraper):
                             jackpot=jackpot,
                             raw_data={"game_type": game_type}
                         )
-                        results.append(result)
+                        yield result
             
         except Exception as e:
             self.logger.error("Error parsing PCSO Lotto", error=str(e))
-        
-        return results
@@ -1,13 +1,20 @@
 from typing import List
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.readiness import network_idle
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class SingaporeTOTOScraper(SeleniumScraper):
     """Singapore TOTO scraper"""
     
+    # No stable results marker known yet
+    ready_when = network_idle()
+    
+    # TOTO and 4D pages are read in one Singapore Pools browser session
+    batch_key = "www.singaporepools.com.sg"
+    
     def __init__(self):
         super().__init__({
             "name": "Singapore TOTO",
@@ -44,6 +51,12 @@ class SingaporeTOTOScraper(SeleniumScraper):
 class Singapore4DScraper(SeleniumScraper):
     """Singapore 4D scraper"""
     
+    # No stable results marker known yet
+    ready_when = network_idle()
+    
+    # TOTO and 4D pages are read in one Singapore Pools browser session
+    batch_key = "www.singaporepools.com.sg"
+    
     def __init__(self):
         super().__init__({
             "name": "Singapore 4D",
@@ -1,13 +1,18 @@
-from typing import List
+from typing import AsyncIterator
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class SouthKoreaLotto645Scraper(SeleniumScraper):
     """South Korea Lotto 6/45 scraper"""
     
+    fingerprint_selector = "div.ball_645, div.win_result"
+    ready_when = element_ready((By.CSS_SELECTOR, "div.ball_645"), count=6)
+    
     def __init__(self):
         super().__init__({
             "name": "Lotto 6/45",
@@ -19,10 +24,8 @@ class SouthKoreaLotto645Scraper(SeleniumScraper):
         self, 
         soup: BeautifulSoup, 
         driver: webdriver.Chrome
-    ) -> List[ScrapedResult]:
+    ) -> AsyncIterator[ScrapedResult]:
         """Parse Lotto 6/45 results"""
-        results = []
-        
         try:
             # Korean lottery site structure
             # Look for main winning numbers (6 numbers)
@@ -58,9 +61,7 @@ class SouthKoreaLotto645Scraper(SeleniumScraper):
                     bonus_numbers=bonus_number,
                     raw_data={"lottery_type": "lotto645"}
                 )
-                results.append(result)
+                yield result
             
         except Exception as e:
             self.logger.error("Error parsing Lotto 6/45", error=str(e))
-        
-        return results
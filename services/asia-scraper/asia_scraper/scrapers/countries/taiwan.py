@@ -1,13 +1,18 @@
-from typing import List
+from typing import AsyncIterator
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class TaiwanWelfareLotteryScraper(SeleniumScraper):
     """Taiwan Public Welfare Lottery scraper"""
     
+    fingerprint_selector = "div.lottery-result, div.draw-date"
+    ready_when = element_ready((By.CSS_SELECTOR, "div.lottery-result span.ball"))
+    
     def __init__(self):
         super().__init__({
             "name": "Taiwan Public Welfare Lottery",
@@ -19,10 +24,8 @@ class TaiwanWelfareLotteryScraper(SeleniumScraper):
         self, 
         soup: BeautifulSoup, 
         driver: webdriver.Chrome
-    ) -> List[ScrapedResult]:
+    ) -> AsyncIterator[ScrapedResult]:
         """Parse Taiwan lottery results"""
-        results = []
-        
         try:
             # Taiwan lottery typically uses traditional Chinese characters
             # Look for results section
@@ -56,9 +59,7 @@ class TaiwanWelfareLotteryScraper(SeleniumScraper):
                         winning_numbers=winning_numbers,
                         raw_data={"country": "taiwan"}
                     )
-                    results.append(result)
+                    yield result
             
         except Exception as e:
             self.logger.error("Error parsing Taiwan lottery", error=str(e))
-        
-        return results
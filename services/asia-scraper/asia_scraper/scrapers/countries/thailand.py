@@ -1,12 +1,20 @@
-from typing import List
-from bs4 import BeautifulSoup
-from src.scrapers.base.bs4_scraper import BS4Scraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from typing import AsyncIterator
+from asia_scraper.scrapers.base.bs4_scraper import BS4Scraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.parse_backends import Page, ParseTarget, first, text
+
+PRIZE = ParseTarget("div", "lotto-check__result")
+DRAW_DATE = ParseTarget("span", "lotto-check__date")
+FIRST_PRIZE = ParseTarget("strong", "lotto-check__number")
 
 
 class ThailandGovernmentLotteryScraper(BS4Scraper):
     """Thailand Government Lottery scraper"""
     
+    fingerprint_selector = "div.lotto-check__result, span.lotto-check__date"
+    parse_backend = "lxml"
+    parse_targets = (PRIZE, DRAW_DATE)
+    
     def __init__(self):
         super().__init__({
             "name": "Thailand Government Lottery",
@@ -14,24 +22,22 @@ class ThailandGovernmentLotteryScraper(BS4Scraper):
             "schedule": "0 15 1,16 * *",  # 1st and 16th of month at 3 PM
         })
     
-    async def parse_html(self, soup: BeautifulSoup) -> List[ScrapedResult]:
+    async def parse_html(self, page: Page) -> AsyncIterator[ScrapedResult]:
         """Parse Thailand lottery results"""
-        results = []
-        
         try:
             # Thai lottery has 6-digit winning numbers
-            prize_div = soup.find('div', class_='lotto-check__result')
+            prize_div = first(page, PRIZE)
             
-            if prize_div:
+            if prize_div is not None:
                 # First prize (6 digits)
-                first_prize = prize_div.find('strong', class_='lotto-check__number')
-                if first_prize:
-                    number_str = first_prize.text.strip()
+                first_prize = FIRST_PRIZE.find(prize_div)
+                if first_prize is not None:
+                    number_str = text(first_prize)
                     winning_numbers = [int(d) for d in number_str if d.isdigit()]
                     
                     # Get draw date
-                    date_elem = soup.find('span', class_='lotto-check__date')
-                    if date_elem:
+                    date_elem = first(page, DRAW_DATE)
+                    if date_elem is not None:
                         # Parse Thai date format
                         # Example: "1 มกราคม 2569" -> need to convert from Thai calendar
                         # Simplified: use current date for now
@@ -43,9 +49,7 @@ class ThailandGovernmentLotteryScraper(BS4Scraper):
                             winning_numbers=winning_numbers,
                             raw_data={"lottery_type": "government"}
                         )
-                        results.append(result)
+                        yield result
             
         except Exception as e:
             self.logger.error("Error parsing Thailand lottery", error=str(e))
-        
-        return results
@@ -1,13 +1,18 @@
-from typing import List
+from typing import AsyncIterator
 from bs4 import BeautifulSoup
 from selenium import webdriver
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.scrapers.base.base_scraper import ScrapedResult
+from selenium.webdriver.common.by import By
+from asia_scraper.scrapers.base.readiness import element_ready
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
 
 
 class VietnamVietlottScraper(SeleniumScraper):
     """Vietnam Vietlott scraper"""
     
+    fingerprint_selector = "div.result-container, div.game-name, span.draw-date"
+    ready_when = element_ready((By.CSS_SELECTOR, "div.result-container .number, div.result-container .ball"))
+    
     def __init__(self):
         super().__init__({
             "name": "Vietlott",
@@ -19,10 +24,8 @@ class VietnamVietlottScraper(SeleniumScraper):
         self, 
         soup: BeautifulSoup, 
         driver: webdriver.Chrome
-    ) -> List[ScrapedResult]:
+    ) -> AsyncIterator[ScrapedResult]:
         """Parse Vietlott results"""
-        results = []
-        
         try:
             # Vietlott has multiple games: Mega 6/45, Power 6/55, Max 3D, Max 4D
             result_container = soup.find('div', class_='result-container')
@@ -63,9 +66,7 @@ class VietnamVietlottScraper(SeleniumScraper):
                             "country": "vietnam"
                         }
                     )
-                    results.append(result)
+                    yield result
             
         except Exception as e:
             self.logger.error("Error parsing Vietlott", error=str(e))
-        
-        return results
@@ -0,0 +1,238 @@
+"""
+Bounded-concurrency scrape executor
+
+Scheduled and manual scrapes are queued here instead of running the
+moment they fire. Each lane (Selenium, HTTP) has its own priority queue
+and a semaphore capping how many scrapes run at once, so a cron minute
+shared by several lotteries cannot spawn more Chrome processes than the
+driver pool holds.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Sequence, Set, Tuple
+from asia_scraper.config.settings import settings
+from asia_scraper.scrapers import SCRAPER_REGISTRY, uses_api
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+from asia_scraper.services.orchestrator import run_batch, run_scraper
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Lower runs first
+PRIORITY_MANUAL = 0
+PRIORITY_SCHEDULED = 10
+
+SELENIUM_LANE = "selenium"
+HTTP_LANE = "http"
+
+
+class ExecutorBusy(Exception):
+    """Lane queue is full and the caller asked not to wait"""
+
+
+@dataclass(order=True)
+class QueuedScrape:
+    """Queue entry ordered by priority, then submission order"""
+    priority: int
+    seq: int
+    slug: str = field(compare=False)
+    # Every member when the entry is a batch (see submit_batch)
+    batch: Tuple[str, ...] = field(compare=False, default=())
+    enqueued_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+class Lane:
+    """Priority queue plus a concurrency cap for one kind of scraper"""
+
+    def __init__(self, name: str, concurrency: int, max_queue: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue: asyncio.PriorityQueue | None = None
+        self.semaphore: asyncio.Semaphore | None = None
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.waits_ms: Deque[float] = deque(maxlen=200)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, in-flight count and recent queue wait times"""
+        waits = sorted(self.waits_ms)
+        return {
+            "concurrency": self.concurrency,
+            "queued": self.queue.qsize() if self.queue else 0,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait_ms": {
+                "avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+                "p95": round(waits[int(len(waits) * 0.95) - 1], 1) if waits else 0.0,
+                "max": round(waits[-1], 1) if waits else 0.0,
+            },
+        }
+
+
+class ScrapeExecutor:
+    """Runs queued scrapes per lane, bounded by each lane's semaphore"""
+
+    def __init__(self, lanes: Dict[str, int], max_queue: int, runner=run_scraper, batch_runner=run_batch):
+        self.lanes = {
+            name: Lane(name, concurrency, max_queue)
+            for name, concurrency in lanes.items()
+        }
+        self.runner = runner
+        self.batch_runner = batch_runner
+        self._seq = itertools.count()
+        self._pending: Set[str] = set()
+        self._dispatchers: list[asyncio.Task] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def started(self) -> bool:
+        return bool(self._dispatchers)
+
+    def lane_for(self, slug: str) -> str:
+        """Selenium scrapers share the narrow lane; everything else, API fetches included, is HTTP"""
+        scraper_class = SCRAPER_REGISTRY.get(slug)
+        if scraper_class and issubclass(scraper_class, SeleniumScraper) and not uses_api(slug):
+            return SELENIUM_LANE
+        return HTTP_LANE
+
+    async def start(self) -> None:
+        """Create queues and lane dispatchers on the running event loop"""
+        if self.started:
+            return
+
+        for lane in self.lanes.values():
+            lane.queue = asyncio.PriorityQueue(maxsize=lane.max_queue)
+            lane.semaphore = asyncio.Semaphore(lane.concurrency)
+            self._dispatchers.append(asyncio.create_task(self._dispatch(lane)))
+
+        logger.info(
+            "Scrape executor started",
+            lanes={name: lane.concurrency for name, lane in self.lanes.items()}
+        )
+
+    async def stop(self) -> None:
+        """Cancel dispatchers and in-flight scrapes; queued scrapes are dropped"""
+        tasks = self._dispatchers + list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatchers.clear()
+        self._pending.clear()
+        logger.info("Scrape executor stopped")
+
+    async def submit(self, slug: str, priority: int = PRIORITY_SCHEDULED, wait: bool = True) -> bool:
+        """
+        Queue a scrape; returns False if the slug is already queued or running
+
+        With wait=True a full lane blocks the caller until there is room
+        (backpressure); otherwise ExecutorBusy is raised.
+        """
+        if not self.started:
+            await self.start()
+
+        if slug in self._pending:
+            logger.info("Scrape already pending", slug=slug)
+            return False
+
+        return await self._enqueue(QueuedScrape(priority, next(self._seq), slug), wait)
+
+    async def submit_batch(self, slugs: Sequence[str], priority: int = PRIORITY_SCHEDULED, wait: bool = True) -> bool:
+        """
+        Queue scrapers sharing a source as one scrape (see batch)
+
+        The batch takes one slot on its first member's lane. Members
+        already queued or running are left out; a lone remaining member is
+        queued as a plain scrape.
+        """
+        if not self.started:
+            await self.start()
+
+        batch = tuple(slug for slug in slugs if slug not in self._pending)
+        if len(batch) < 2:
+            return await self.submit(batch[0], priority, wait) if batch else False
+        return await self._enqueue(QueuedScrape(priority, next(self._seq), batch[0], batch), wait)
+
+    async def _enqueue(self, item: QueuedScrape, wait: bool) -> bool:
+        """Put an entry on its lane and mark its slugs pending"""
+        slugs = item.batch or (item.slug,)
+        lane = self.lanes[self.lane_for(item.slug)]
+
+        if wait:
+            self._pending.update(slugs)
+            try:
+                await lane.queue.put(item)
+            except BaseException:
+                self._pending.difference_update(slugs)
+                raise
+        else:
+            try:
+                lane.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                raise ExecutorBusy(f"{lane.name} lane queue is full")
+            self._pending.update(slugs)
+
+        logger.debug("Scrape queued", slugs=slugs, lane=lane.name, priority=item.priority)
+        return True
+
+    async def _dispatch(self, lane: Lane) -> None:
+        """Start the highest-priority queued scrape whenever a lane slot frees up"""
+        while True:
+            # Take the slot first so queued items keep their priority order
+            await lane.semaphore.acquire()
+            item = await lane.queue.get()
+            lane.waits_ms.append((time.monotonic() - item.enqueued_at) * 1000)
+            task = asyncio.create_task(self._run(lane, item))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, lane: Lane, item: QueuedScrape) -> None:
+        """Run one scrape and free its lane slot"""
+        lane.running += 1
+        try:
+            if item.batch:
+                await self.batch_runner(list(item.batch))
+            else:
+                await self.runner(item.slug)
+            lane.completed += 1
+        except Exception as e:
+            lane.failed += 1
+            logger.error("Queued scrape failed", slug=item.slug, lane=lane.name, error=str(e))
+        finally:
+            lane.running -= 1
+            self._pending.difference_update(item.batch or (item.slug,))
+            lane.queue.task_done()
+            lane.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-lane queue depth, concurrency and wait times"""
+        return {
+            "running": self.started,
+            "lanes": {name: lane.stats() for name, lane in self.lanes.items()},
+        }
+
+
+executor = ScrapeExecutor(
+    lanes={
+        SELENIUM_LANE: settings.MAX_CONCURRENT_SCRAPERS,
+        HTTP_LANE: settings.HTTP_SCRAPE_CONCURRENCY,
+    },
+    max_queue=settings.SCRAPE_QUEUE_SIZE,
+)
+
+
+async def submit_scrape(slug: str) -> None:
+    """Scheduler entry point: queue a scheduled scrape on the executor"""
+    await executor.submit(slug, priority=PRIORITY_SCHEDULED)
+
+
+async def submit_batch(slugs: Sequence[str]) -> None:
+    """Scheduler entry point for a batch: queue its due members as one scrape"""
+    await executor.submit_batch(slugs, priority=PRIORITY_SCHEDULED)
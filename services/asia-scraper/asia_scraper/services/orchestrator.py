@@ -0,0 +1,262 @@
+import time
+from datetime import datetime
+from functools import partial
+from typing import List
+from asia_scraper.scrapers import get_scraper_by_slug
+from asia_scraper.scrapers.base.batch import FetchBatch
+from asia_scraper.scrapers.base.base_scraper import PageUnchanged
+from asia_scraper.database.session import get_db
+from asia_scraper.database.models import ScraperJob
+from asia_scraper.database.lottery_cache import lottery_cache
+from asia_scraper.database.writer import WriteSummary, bulk_insert_results
+from asia_scraper.services.pipeline import write_stream
+from asia_scraper.utils import metrics
+from asia_scraper.utils.logger import get_logger
+from asia_scraper.utils.offload import run_db
+from asia_scraper.utils.timing import SAVE, StageTimer
+
+logger = get_logger(__name__)
+
+
+def transform_to_result_format(scraped_result):
+    """
+    Transform ScrapedResult to match existing database schema
+    
+    Converts:
+    - winning_numbers (list) + bonus_numbers (list) -> numbers (JSON)
+    - jackpot (dict) -> jackpot (text) + currency (text)
+    """
+    # Transform numbers to JSONB format
+    numbers_data = {
+        "main": scraped_result.winning_numbers,
+        "bonus": scraped_result.bonus_numbers or []
+    }
+    
+    # Format jackpot as text (e.g., "$100M", "€50M")
+    jackpot_text = None
+    currency = "USD"
+    
+    if scraped_result.jackpot:
+        amount = scraped_result.jackpot.get('amount', 0)
+        currency = scraped_result.jackpot.get('currency', 'USD')
+        
+        # Format large numbers with M/B suffix
+        if amount >= 1_000_000:
+            formatted_amount = f"{amount / 1_000_000:.1f}M"
+        elif amount >= 1_000:
+            formatted_amount = f"{amount / 1_000:.1f}K"
+        else:
+            formatted_amount = f"{amount:.0f}"
+        
+        # Add currency symbol
+        currency_symbols = {
+            'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥',
+            'SGD': 'S$', 'HKD': 'HK$', 'INR': '₹', 'KRW': '₩',
+            'THB': '฿', 'PHP': '₱', 'MYR': 'RM', 'VND': '₫'
+        }
+        symbol = currency_symbols.get(currency, currency + ' ')
+        jackpot_text = f"{symbol}{formatted_amount}"
+    
+    # Transform winners data if available
+    winners_data = None
+    if scraped_result.winners_count:
+        winners_data = [
+            {
+                "tier": 1,
+                "count": scraped_result.winners_count,
+                "prize": scraped_result.jackpot.get('amount') if scraped_result.jackpot else None
+            }
+        ]
+    
+    return {
+        "numbers": numbers_data,
+        "jackpot": jackpot_text,
+        "currency": currency,
+        "winners": winners_data
+    }
+
+
+def create_job(lottery_id, started_at: datetime) -> int:
+    """Insert a running job row and return its id"""
+    with get_db() as db:
+        job = ScraperJob(
+            lotteryId=lottery_id,
+            status='running',
+            startedAt=started_at
+        )
+        db.add(job)
+        db.commit()
+        return job.id
+
+
+def finish_job(job_id: int, status: str, **fields) -> None:
+    """Mark a job finished with the given status and column values"""
+    with get_db() as db:
+        job = db.query(ScraperJob).get(job_id)
+        job.status = status
+        job.completedAt = datetime.now()
+        for column, value in fields.items():
+            setattr(job, column, value)
+        db.commit()
+
+
+def result_row(lottery_id, scraped_result) -> dict:
+    """Build a result table row from a ScrapedResult"""
+    return {
+        "lotteryId": lottery_id,
+        "drawDate": scraped_result.draw_date,
+        **transform_to_result_format(scraped_result),
+    }
+
+
+def write_rows(rows) -> WriteSummary:
+    """Insert one batch of rows and commit it; existing draws are skipped"""
+    with get_db() as db:
+        return bulk_insert_results(db, rows)
+
+
+def timed_write(timings: StageTimer, rows) -> WriteSummary:
+    """write_rows, booking its time to the save stage (runs on a DB thread)"""
+    started = time.perf_counter()
+    try:
+        return write_rows(rows)
+    finally:
+        timings.add(SAVE, (time.perf_counter() - started) * 1000)
+
+
+def timing_fields(scraper, summary: WriteSummary | None = None) -> dict:
+    """Job row columns for a scraper's stage breakdown"""
+    if scraper is None:
+        return {}
+    if summary is not None:
+        scraper.timings.rows.update(inserted=summary.inserted, skipped=summary.skipped)
+    return {
+        "stageTimings": scraper.timings.breakdown(),
+        "bytesFetched": scraper.timings.bytes_fetched,
+    }
+
+
+async def run_scraper(slug: str, scraper=None):
+    """Execute a scraper by slug and save to database; scraper is a batch member built for it"""
+    start_time = datetime.now()
+    logger.info(f"Starting scraper", slug=slug)
+    
+    # Resolve lottery from the in-memory cache (reloads from the DB when stale)
+    lottery = await run_db(lottery_cache.get, slug)
+    if not lottery:
+        logger.error(f"Lottery not found", slug=slug)
+        return
+    
+    if not lottery.isActive:
+        logger.info(f"Lottery is inactive", slug=slug)
+        return
+    
+    lottery_id = lottery.id
+    
+    # Create job record
+    job_id = await run_db(create_job, lottery_id, start_time)
+    metrics.JOBS_RUNNING.inc()
+    
+    try:
+        # Get scraper instance
+        scraper = scraper or get_scraper_by_slug(slug)
+        if not scraper:
+            raise Exception(f"No scraper found for slug: {slug}")
+        
+        # Stream parsed draws into batched writes as they are produced;
+        # parsing and writing overlap, so stage times can add up to more
+        # than the job's wall time
+        summary = await write_stream(
+            scraper.stream(),
+            partial(result_row, lottery_id),
+            partial(timed_write, scraper.timings),
+        )
+        saved_count = summary.inserted
+        await scraper.mark_success()
+        
+        # Update job as successful
+        execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        await run_db(
+            finish_job, job_id, 'success',
+            resultsCount=saved_count,
+            executionTimeMs=execution_time,
+            **timing_fields(scraper, summary)
+        )
+        metrics.record_job(
+            slug, 'success', execution_time / 1000, scraper.timings.breakdown(),
+            inserted=summary.inserted, skipped=summary.skipped
+        )
+        
+        logger.info(
+            f"Scraper completed successfully",
+            slug=slug,
+            saved=saved_count,
+            skipped=summary.skipped,
+            execution_ms=execution_time,
+            stages_ms=scraper.timings.breakdown()["stages"]
+        )
+        
+    except PageUnchanged:
+        # Nothing new at the source: no parse, no DB writes
+        execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        await run_db(
+            finish_job, job_id, 'unchanged',
+            resultsCount=0,
+            executionTimeMs=execution_time,
+            **timing_fields(scraper)
+        )
+        metrics.record_job(slug, 'unchanged', execution_time / 1000, scraper.timings.breakdown())
+        
+        logger.info("Source unchanged", slug=slug, execution_ms=execution_time)
+    
+    except Exception as e:
+        logger.error(f"Scraper failed", slug=slug, error=str(e), exc_info=True)
+        
+        # Update job as failed
+        execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        await run_db(
+            finish_job, job_id, 'failed',
+            errorMessage=str(e),
+            executionTimeMs=execution_time,
+            **timing_fields(scraper)
+        )
+        metrics.record_job(
+            slug, 'failed', execution_time / 1000,
+            scraper.timings.breakdown() if scraper else None, error=e
+        )
+        
+        raise
+    
+    finally:
+        metrics.JOBS_RUNNING.dec()
+
+
+async def run_batch(slugs: List[str]):
+    """
+    Execute scrapers sharing a source one after another, fetching it once
+    
+    Each slug still gets its own job record; raises after the last member
+    if any of them failed.
+    """
+    scrapers, unbuilt = [], []
+    for slug in slugs:
+        try:
+            scraper = get_scraper_by_slug(slug)
+        except Exception:
+            scraper = None
+        if scraper:
+            scrapers.append(scraper)
+        else:
+            unbuilt.append(slug)
+    
+    batch = FetchBatch(scrapers)
+    results = await batch.run(lambda scraper: run_scraper(scraper.slug, scraper))
+    failed = [scraper.slug for scraper, result in zip(scrapers, results) if isinstance(result, Exception)]
+    # run_scraper builds these again and records the failure
+    for slug in unbuilt:
+        try:
+            await run_scraper(slug)
+        except Exception:
+            failed.append(slug)
+    if failed:
+        raise Exception(f"Batch members failed: {', '.join(failed)}")
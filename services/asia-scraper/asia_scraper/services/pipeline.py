@@ -0,0 +1,76 @@
+"""
+Streaming parse-to-write pipeline
+
+Parsers yield draws one at a time; a bounded queue sits between the
+parse side and a writer that commits fixed-size batches. Memory stays
+flat on archive-sized pages, the first rows reach the database while
+the rest of the page is still being parsed, and a slow database pauses
+parsing instead of letting rows pile up.
+"""
+
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Dict, List
+from asia_scraper.config.settings import settings
+from asia_scraper.database.writer import WriteSummary
+from asia_scraper.utils.offload import run_db
+
+Row = Dict[str, Any]
+
+_DONE = object()
+
+
+async def write_stream(
+    results: AsyncIterator[Any],
+    to_row: Callable[[Any], Row],
+    write_batch: Callable[[List[Row]], WriteSummary],
+    batch_size: int | None = None,
+    queue_size: int | None = None,
+) -> WriteSummary:
+    """
+    Consume results into batched writes through a bounded queue
+
+    to_row runs on the event loop as each result arrives; write_batch is
+    blocking and runs on the DB pool once per batch. An error on either
+    side cancels the other and propagates; batches already written stay
+    committed.
+    """
+    batch_size = batch_size or settings.PIPELINE_BATCH_SIZE
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or settings.PIPELINE_QUEUE_SIZE)
+    summary = WriteSummary()
+
+    async def produce() -> None:
+        async with aclosing(results) as stream:
+            async for result in stream:
+                await queue.put(to_row(result))
+        await queue.put(_DONE)
+
+    async def flush(batch: List[Row]) -> None:
+        written = await run_db(write_batch, batch)
+        summary.inserted += written.inserted
+        summary.skipped += written.skipped
+
+    async def consume() -> None:
+        batch: List[Row] = []
+        while True:
+            row = await queue.get()
+            if row is _DONE:
+                break
+            batch.append(row)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+
+    producer = asyncio.create_task(produce())
+    consumer = asyncio.create_task(consume())
+    try:
+        await asyncio.gather(producer, consumer)
+    except BaseException:
+        producer.cancel()
+        consumer.cancel()
+        await asyncio.gather(producer, consumer, return_exceptions=True)
+        raise
+
+    return summary
@@ -0,0 +1,98 @@
+"""
+Shared HTTP client for BS4 scrapers
+
+One pooled httpx.AsyncClient serves every fetch in the process, so pages
+on the same host reuse keep-alive (and HTTP/2) connections instead of
+paying a TCP+TLS handshake per request. A per-host semaphore keeps us
+polite to any single lottery site.
+"""
+
+import asyncio
+import time
+from typing import Dict
+import httpx
+from asia_scraper.config.settings import settings
+from asia_scraper.config import runtime
+from asia_scraper.utils import metrics
+from asia_scraper.utils.cassette import cassette_transport
+from asia_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpClientManager:
+    """Owns the process-wide AsyncClient and its per-host limits"""
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_per_host: int,
+        keepalive_expiry: float,
+        timeout: float,
+        http2: bool,
+    ):
+        self.max_per_host = max_per_host
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = timeout
+        self._http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def start(self) -> None:
+        """Create the client (called on FastAPI startup)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+                follow_redirects=True,
+                headers={"User-Agent": settings.SCRAPER_USER_AGENT},
+                transport=cassette_transport(self._http2, self._limits, asynchronous=True),
+            )
+            logger.info("HTTP client started", http2=self._http2, cassette=settings.HTTP_CASSETTE_MODE)
+
+    async def close(self) -> None:
+        """Close pooled connections (called on FastAPI shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("HTTP client closed")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("HTTP client not started")
+        return self._client
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL through the shared pool, at most max_per_host at a time per host"""
+        return await self.request("GET", url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request (e.g. a POST to a JSON API) through the shared pool, under the same per-host limit"""
+        # Scrapers triggered outside the API (CLI, tests) start it lazily
+        await self.start()
+        host = httpx.URL(url).host
+        async with self._slot(host):
+            started = time.perf_counter()
+            response = await self.client.request(method, url, **kwargs)
+        metrics.record_fetch(host, time.perf_counter() - started, len(response.content))
+        return response
+
+http_client = runtime.http_client or HttpClientManager(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    timeout=settings.DEFAULT_TIMEOUT,
+    http2=settings.HTTP2_ENABLED,
+)
@@ -1,6 +1,6 @@
 import logging
 import structlog
-from src.config.settings import settings
+from asia_scraper.config.settings import settings
 
 # Configure structlog
 structlog.configure(
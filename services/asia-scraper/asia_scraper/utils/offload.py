@@ -0,0 +1,63 @@
+"""
+Thread pools for blocking work
+
+Selenium calls and sync SQLAlchemy I/O block; running them on the event
+loop stalls the scheduler, the API and every other scrape. Coroutines
+hand that work to a dedicated pool here and await the result, so the
+loop only coordinates.
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+from asia_scraper.config.settings import settings
+
+T = TypeVar("T")
+
+# Selenium threads mostly wait on Chrome, one per pooled driver
+selenium_pool = ThreadPoolExecutor(
+    max_workers=settings.SELENIUM_WORKERS or settings.MAX_CONCURRENT_SCRAPERS,
+    thread_name_prefix="selenium",
+)
+
+db_pool = ThreadPoolExecutor(
+    max_workers=settings.DB_WORKERS,
+    thread_name_prefix="db",
+)
+
+
+async def _run_in(pool: ThreadPoolExecutor, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run fn in pool, carrying over context variables like asyncio.to_thread"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(pool, call)
+
+
+async def run_selenium(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking WebDriver call on the Selenium pool"""
+    return await _run_in(selenium_pool, fn, *args, **kwargs)
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking database call on the DB pool"""
+    return await _run_in(db_pool, fn, *args, **kwargs)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """Worker counts and backlog for each pool"""
+    return {
+        name: {
+            "workers": pool._max_workers,
+            "queued": pool._work_queue.qsize(),
+        }
+        for name, pool in (("selenium", selenium_pool), ("db", db_pool))
+    }
+
+
+def shutdown() -> None:
+    """Stop accepting work and wait for running calls to finish"""
+    selenium_pool.shutdown(wait=True, cancel_futures=True)
+    db_pool.shutdown(wait=True, cancel_futures=True)
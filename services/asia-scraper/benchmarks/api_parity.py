@@ -0,0 +1,99 @@
+"""
+Check a lottery's JSON API path against its page parser, offline
+
+api_discovery keeps the rendered page and the JSON response it picked as
+a fixture pair (``benchmarks/fixtures/api/<slug>.html`` and ``.json``).
+The page goes through the lottery's own parse_page() backend and parser,
+the response through ApiScraper with the slug's ApiSource. Draws are
+compared by date, winning and bonus numbers; any difference is listed
+and the run exits 1, so a lottery is switched to "type": "api" only once
+this passes.
+
+Usage:
+    python -m benchmarks.api_parity                 # every slug with a fixture pair
+    python -m benchmarks.api_parity sg-toto
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+from benchmarks.harness import FIXTURES
+from asia_scraper.scrapers import SCRAPER_REGISTRY
+from asia_scraper.scrapers.base.api_scraper import ApiScraper
+from asia_scraper.scrapers.base.api_source import ApiSource, load_api_source
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult, iterate_parsed
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+
+API_FIXTURES = FIXTURES / "api"
+
+
+def _draw(result: ScrapedResult) -> Tuple:
+    return str(result.draw_date), result.winning_numbers, result.bonus_numbers
+
+
+def differences(page_results: Sequence[ScrapedResult], api_results: Sequence[ScrapedResult]) -> List[str]:
+    """One line per draw only one path produced, empty when both agree"""
+    page_draws, api_draws = [_draw(r) for r in page_results], [_draw(r) for r in api_results]
+    problems = [f"page only: {draw}" for draw in page_draws if draw not in api_draws]
+    problems += [f"api only: {draw}" for draw in api_draws if draw not in page_draws]
+    return problems
+
+
+async def _page_results(scraper, markup: str) -> List[ScrapedResult]:
+    page = scraper.parse_page(markup)
+    if isinstance(scraper, SeleniumScraper):
+        parsed = scraper.parse_dynamic_content(page, None)
+    else:
+        parsed = scraper.parse_html(page)
+    return [result async for result in iterate_parsed(parsed)]
+
+
+def parity(scraper, markup: str, payload: Any, source: ApiSource) -> List[str]:
+    """Parse one fixture pair both ways and compare the draws"""
+    page_results = asyncio.run(_page_results(scraper, markup))
+    api_results = ApiScraper({**scraper.config, "slug": scraper.slug}, source).parse_payload(payload)
+    return differences(page_results, api_results)
+
+
+def check(slug: str, fixtures: Path = API_FIXTURES, source: Optional[ApiSource] = None) -> List[str]:
+    """Compare both paths for slug on its fixture pair"""
+    source = source or load_api_source(slug)
+    if source is None:
+        return [f"no API source; run python -m asia_scraper.scrapers.base.api_discovery {slug}"]
+    page_path, payload_path = fixtures / f"{slug}.html", fixtures / f"{slug}.json"
+    if not page_path.exists() or not payload_path.exists():
+        return [f"no fixture pair in {fixtures}"]
+    # The registry class, even when the lottery is already switched over
+    scraper = SCRAPER_REGISTRY[slug]()
+    scraper.slug = slug
+    payload = json.loads(payload_path.read_text(encoding="utf-8"))
+    return parity(scraper, page_path.read_text(encoding="utf-8"), payload, source)
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compare API and page parses on recorded fixture pairs")
+    parser.add_argument("slugs", nargs="*", help="Lottery slugs (default: every fixture pair)")
+    parser.add_argument("--fixtures", type=Path, default=API_FIXTURES)
+    args = parser.parse_args()
+
+    slugs = args.slugs or sorted(
+        path.stem for path in args.fixtures.glob("*.json") if path.stem in SCRAPER_REGISTRY
+    )
+    if not slugs:
+        sys.exit(f"No fixture pairs in {args.fixtures}")
+    failed = False
+    for slug in slugs:
+        problems = check(slug, args.fixtures)
+        print(f"{slug}: {'differs' if problems else 'identical'}")
+        for problem in problems:
+            print(f"  {problem}")
+        failed = failed or bool(problems)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Offline scraper benchmark harness
+
+Replays recorded fixture pages through scraper parsers and reports
+parse time, Python allocations, peak RSS and rows per second. Each
+scraper runs in a fresh worker process, so peak RSS belongs to that
+scraper alone. Results can be saved as baselines; a compare run lists
+every scraper that got slower, allocates more, or parses a different
+number of rows, and exits non-zero.
+
+Baselines are machine specific and are not committed: run --save on
+the host (or CI job) before any --compare there.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BASELINES = Path(__file__).parent / "baselines.json"
+
+# Regressions smaller than these are timer and allocator noise
+NOISE_FLOOR = {
+    "parse_ms": 0.5,
+    "alloc_kib": 64.0,
+    "peak_rss_mib": 8.0,
+}
+
+
+@dataclass
+class Measurement:
+    """Benchmark numbers for one scraper"""
+    slug: str
+    fixture: str
+    rows: int
+    parse_ms: float  # median per fixture parse
+    alloc_kib: float  # peak traced Python allocations during one parse
+    peak_rss_mib: float  # worker process high-water mark
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / (self.parse_ms / 1000) if self.parse_ms else 0.0
+
+
+def fixture_for(slug: str) -> Optional[Path]:
+    """Recorded fixture for a slug (``<slug>.html`` or ``<slug>.json``)"""
+    for suffix in (".html", ".json"):
+        path = FIXTURES / f"{slug}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def peak_rss_mib() -> float:
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(slug: str, fixture: Path, parse: Callable[[], int], rounds: int) -> Measurement:
+    """
+    Time parse() over rounds, then trace the allocations of one more call
+
+    parse() replays the fixture through the scraper and returns the number
+    of rows it produced.
+    """
+    rows = parse()  # warm-up: lazy imports, regex and XPath caches
+
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        parse()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Measurement(
+        slug=slug,
+        fixture=fixture.name,
+        rows=rows,
+        parse_ms=round(statistics.median(timings), 3),
+        alloc_kib=round(peak / 1024, 1),
+        peak_rss_mib=round(peak_rss_mib(), 1),
+    )
+
+
+def _quiet() -> None:
+    """Worker initializer: parser log lines are not part of the benchmark"""
+    logging.disable(logging.CRITICAL)
+
+
+def run_isolated(worker: Callable[[str, int], Measurement], slugs: Iterable[str], rounds: int) -> List[Measurement]:
+    """Run worker(slug, rounds) for each slug, one at a time, each in a new process"""
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=get_context("spawn"),
+        initializer=_quiet,
+        max_tasks_per_child=1,
+    ) as pool:
+        return [pool.submit(worker, slug, rounds).result() for slug in slugs]
+
+
+def report(measurements: List[Measurement]) -> str:
+    """Fixed-width results table"""
+    lines = [f"{'slug':<24}{'rows':>6}{'ms/parse':>10}{'rows/s':>10}{'alloc KiB':>11}{'RSS MiB':>9}"]
+    for m in measurements:
+        lines.append(
+            f"{m.slug:<24}{m.rows:>6}{m.parse_ms:>10.2f}{m.rows_per_sec:>10.0f}"
+            f"{m.alloc_kib:>11.0f}{m.peak_rss_mib:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def load_baselines(path: Path = BASELINES) -> Dict[str, Dict]:
+    """Saved measurements by slug; empty if no baseline exists"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["scrapers"]
+
+
+def save_baselines(measurements: List[Measurement], path: Path = BASELINES) -> None:
+    """Write measurements as baselines, keeping saved slugs that were not re-run"""
+    scrapers = load_baselines(path)
+    scrapers.update({m.slug: asdict(m) for m in measurements})
+    path.write_text(json.dumps({
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "scrapers": dict(sorted(scrapers.items())),
+    }, indent=2) + "\n")
+
+
+def compare(measurements: List[Measurement], baselines: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    Regressions against baselines
+
+    Row counts must match exactly. Time, allocations and RSS may grow by
+    tolerance (0.25 = 25%) plus the noise floor before they count.
+    """
+    problems = []
+    for m in measurements:
+        base = baselines.get(m.slug)
+        if not base:
+            continue
+
+        if m.rows != base["rows"]:
+            problems.append(f"{m.slug}: rows {base['rows']} -> {m.rows}")
+
+        for field, floor in NOISE_FLOOR.items():
+            old, new = base[field], getattr(m, field)
+            if new > old * (1 + tolerance) and new - old > floor:
+                problems.append(f"{m.slug}: {field} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return problems
+
+
+def main(registry: Iterable[str], worker: Callable[[str, int], Measurement]) -> None:
+    """Command line entry point shared by the service benchmark modules"""
+    parser = argparse.ArgumentParser(description="Benchmark scraper parsers on recorded fixtures")
+    parser.add_argument("slugs", nargs="*", help="Slugs to run (default: every implemented scraper)")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed parses per scraper")
+    parser.add_argument("--save", action="store_true", help="Store results as baselines")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 if any scraper regressed")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed growth before a regression")
+    parser.add_argument("--baselines", type=Path, default=BASELINES, help="Baseline file")
+    args = parser.parse_args()
+
+    slugs = args.slugs or sorted(registry)
+    missing = [slug for slug in slugs if not fixture_for(slug)]
+    for slug in missing:
+        print(f"warning: no fixture for {slug}, skipped", file=sys.stderr)
+
+    measurements = run_isolated(worker, [slug for slug in slugs if slug not in missing], args.rounds)
+    print(report(measurements))
+
+    if args.save:
+        save_baselines(measurements, args.baselines)
+        print(f"\nSaved {len(measurements)} baselines to {args.baselines}")
+
+    if args.compare:
+        if not args.baselines.exists():
+            print(f"No baselines at {args.baselines}; run --save on this host first", file=sys.stderr)
+            sys.exit(2)
+        problems = compare(measurements, load_baselines(args.baselines), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print("\nNo regressions")
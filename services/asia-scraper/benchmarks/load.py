@@ -0,0 +1,390 @@
+"""
+Synthetic load test of the scheduler, executor, orchestrator and writer
+
+Usage:
+    python -m benchmarks.load --lotteries 2000 --draws 20
+    python -m benchmarks.load --lotteries 500 --latency-ms 300 --error-rate 0.02 --ramp 30
+
+Creates N fake lotteries (slugs ``load-00001`` ...) in the configured
+database and registers an in-process stub scraper for each. Every stub
+is fired once through the real APScheduler job store, the ScrapeExecutor
+and run_scraper, inside a ramp window (0 = all in the same second, like
+a shared cron minute). The stubs replace only the fetch and the parse:
+job rows, fingerprints and result writes all hit the database as in
+production. Point DATABASE_URL at a scratch database. The fake rows are
+deleted afterwards unless --keep is given.
+
+Reports throughput, job latency (scheduled fire time to finished job
+row), DB statements per job, scheduler misfires and event-loop lag.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+from apscheduler.events import EVENT_JOB_MISSED
+from apscheduler.triggers.date import DateTrigger
+from sqlalchemy import delete, event, select
+from asia_scraper.database.fingerprints import fingerprint
+from asia_scraper.database.lottery_cache import lottery_cache
+from asia_scraper.database.models import Lottery, Result, ScraperConfig, ScraperJob
+from asia_scraper.database.session import engine, get_db, init_db
+from asia_scraper.scrapers import SCRAPER_REGISTRY
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, ScrapedResult
+from asia_scraper.services import executor as executor_module
+from asia_scraper.services.executor import HTTP_LANE, submit_scrape
+from asia_scraper.services.orchestrator import run_scraper
+from asia_scraper.services.scheduler import scheduler, start_scheduler, stop_scheduler
+from asia_scraper.utils.offload import run_db
+from asia_scraper.utils.timing import percentile
+
+SLUG_PREFIX = "load-"
+
+# Slug of the scrape running in the current task; run_db carries it to DB threads
+current_slug: ContextVar[Optional[str]] = ContextVar("current_slug", default=None)
+
+
+class StubFailure(Exception):
+    """Injected scrape failure"""
+
+
+class StubScraper(BaseScraper):
+    """Stands in for a real scraper: simulated fetch latency, then synthetic draws"""
+
+    draws = 10
+    latency_ms = 50.0
+    error_rate = 0.0
+    _random = random.Random()
+
+    def __init__(self):
+        super().__init__({"name": "Load stub", "url": "stub://load"})
+
+    async def scrape(self) -> List[ScrapedResult]:
+        return [result async for result in self.iter_results()]
+
+    def page_fingerprint(self, page: str) -> str:
+        return fingerprint(page)
+
+    async def iter_results(self) -> AsyncIterator[ScrapedResult]:
+        await asyncio.sleep(self.latency_ms / 1000 * self._random.uniform(0.5, 1.5))
+        if self._random.random() < self.error_rate:
+            raise StubFailure(f"Injected failure for {self.slug}")
+
+        # A new page every run, so the fingerprint check passes and is stored
+        await run_db(self.check_fingerprint, f"{self.slug}:{time.time_ns()}")
+
+        today = date.today()
+        for i in range(self.draws):
+            yield ScrapedResult(
+                draw_date=today - timedelta(days=i),
+                draw_number=str(10_000 - i),
+                winning_numbers=[(i * 7 + k * 5) % 49 + 1 for k in range(6)],
+                jackpot={"amount": 1_000_000 + i, "currency": "USD"},
+            )
+
+
+def fake_lotteries(count: int) -> List[Dict[str, str]]:
+    """Lottery configs in the shape of config/countries.py entries"""
+    return [
+        {
+            "name": f"Load Test Lottery {i}",
+            "slug": f"{SLUG_PREFIX}{i:05d}",
+            "schedule": "0 12 * * *",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def distribution(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p99/max summary, rounded for reporting"""
+    return {
+        "p50": round(percentile(values, 50), 1),
+        "p99": round(percentile(values, 99), 1),
+        "max": round(max(values), 1) if values else 0.0,
+    }
+
+
+class QueryCounter:
+    """Counts SQL statements on an engine, per scrape and by verb"""
+
+    def __init__(self):
+        self.per_job: Counter = Counter()
+        self.by_verb: Counter = Counter()
+        self.unattributed = 0  # scheduler job store and setup queries
+        self._lock = threading.Lock()
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        slug = current_slug.get()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "?"
+        with self._lock:
+            if slug is None:
+                self.unattributed += 1
+            else:
+                self.per_job[slug] += 1
+                self.by_verb[verb] += 1
+
+    def install(self, target) -> None:
+        event.listen(target, "before_cursor_execute", self)
+
+    def remove(self, target) -> None:
+        event.remove(target, "before_cursor_execute", self)
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes a sleeping task"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples_ms: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.samples_ms.append(max(0.0, (time.monotonic() - started - self.interval) * 1000))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class TimedRunner:
+    """Executor runner that wraps run_scraper and records when each job finished"""
+
+    def __init__(self, runner=run_scraper):
+        self.runner = runner
+        self.run_ms: Dict[str, float] = {}
+        self.started_at: Dict[str, float] = {}
+        self.finished_at: Dict[str, float] = {}
+        self.failed: set = set()
+
+    async def __call__(self, slug: str) -> None:
+        current_slug.set(slug)
+        self.started_at[slug] = time.time()
+        started = time.monotonic()
+        try:
+            await self.runner(slug)
+        except Exception:
+            self.failed.add(slug)
+            raise
+        finally:
+            self.run_ms[slug] = (time.monotonic() - started) * 1000
+            self.finished_at[slug] = time.time()
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one load run"""
+    lotteries: int
+    draws_per_lottery: int
+    completed: int = 0
+    failed: int = 0
+    missed: int = 0
+    timed_out: int = 0
+    wall_s: float = 0.0
+    jobs_per_sec: float = 0.0
+    draws_per_sec: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    run_ms: Dict[str, float] = field(default_factory=dict)
+    start_delay_ms: Dict[str, float] = field(default_factory=dict)  # fire time to run start
+    statements_per_job: float = 0.0
+    statements_by_verb: Dict[str, float] = field(default_factory=dict)
+    scheduler_statements: int = 0
+    loop_lag_ms: Dict[str, float] = field(default_factory=dict)
+
+    def render(self) -> str:
+        def dist(d: Dict[str, float]) -> str:
+            return f"p50 {d['p50']:>8.1f}  p99 {d['p99']:>8.1f}  max {d['max']:>8.1f}"
+
+        verbs = ", ".join(f"{verb} {count:.1f}" for verb, count in self.statements_by_verb.items())
+        return "\n".join([
+            f"{'lotteries':<22}{self.lotteries} x {self.draws_per_lottery} draws",
+            f"{'jobs':<22}{self.completed} ok, {self.failed} failed, {self.missed} missed, {self.timed_out} timed out",
+            f"{'wall time':<22}{self.wall_s:.2f} s",
+            f"{'throughput':<22}{self.jobs_per_sec:.1f} jobs/s, {self.draws_per_sec:.0f} draws/s",
+            f"{'job latency ms':<22}{dist(self.latency_ms)}",
+            f"{'run time ms':<22}{dist(self.run_ms)}",
+            f"{'start delay ms':<22}{dist(self.start_delay_ms)}",
+            f"{'DB statements/job':<22}{self.statements_per_job:.1f} ({verbs})",
+            f"{'scheduler statements':<22}{self.scheduler_statements}",
+            f"{'event-loop lag ms':<22}{dist(self.loop_lag_ms)}",
+        ])
+
+
+def create_lotteries(configs: List[Dict[str, str]]) -> None:
+    """Insert the fake lottery rows and warm the lottery cache"""
+    with get_db() as db:
+        db.add_all([
+            Lottery(name=c["name"], slug=c["slug"], country="Load Test", isActive=True)
+            for c in configs
+        ])
+    lottery_cache.refresh()
+
+
+def delete_lotteries() -> None:
+    """Remove every row a load run created"""
+    fake_ids = select(Lottery.id).where(Lottery.slug.startswith(SLUG_PREFIX))
+    with get_db() as db:
+        db.execute(delete(Result).where(Result.lotteryId.in_(fake_ids)))
+        db.execute(delete(ScraperJob).where(ScraperJob.lotteryId.in_(fake_ids)))
+        db.execute(delete(ScraperConfig).where(ScraperConfig.key.startswith(f"fingerprint:{SLUG_PREFIX}")))
+        db.execute(delete(Lottery).where(Lottery.slug.startswith(SLUG_PREFIX)))
+    lottery_cache.invalidate()
+
+
+async def run_load(
+    lotteries: int,
+    draws: int,
+    latency_ms: float,
+    error_rate: float,
+    ramp: float,
+    concurrency: Optional[int],
+    timeout: float,
+    seed: Optional[int],
+) -> LoadReport:
+    """Fire every fake lottery once through the scheduler and collect the numbers"""
+    configs = fake_lotteries(lotteries)
+    slugs = [c["slug"] for c in configs]
+
+    StubScraper.draws = draws
+    StubScraper.latency_ms = latency_ms
+    StubScraper.error_rate = error_rate
+    StubScraper._random = random.Random(seed)
+
+    await run_db(init_db)
+    await run_db(delete_lotteries)  # leftovers of an interrupted run
+    await run_db(create_lotteries, configs)
+    SCRAPER_REGISTRY.update({slug: StubScraper for slug in slugs})
+
+    executor = executor_module.executor
+    timer = TimedRunner()
+    original_runner = executor.runner
+    executor.runner = timer
+    if concurrency:
+        executor.lanes[HTTP_LANE].concurrency = concurrency
+
+    # Firings the scheduler skipped because it was too busy to start them in time
+    missed: set = set()
+
+    def on_missed(scheduler_event) -> None:
+        missed.add(scheduler_event.job_id[len("scraper_"):])
+
+    queries = QueryCounter()
+    queries.install(engine)
+    lag = LoopLagMonitor()
+    lag.start()
+
+    fire_at = {}
+    first_fire = datetime.now(scheduler.timezone) + timedelta(seconds=2)
+    rng = random.Random(seed)
+    for slug in slugs:
+        run_date = first_fire + timedelta(seconds=rng.uniform(0, ramp))
+        fire_at[slug] = run_date.timestamp()
+        # Same job shape as schedule_scraper(), on a one-shot trigger
+        scheduler.add_job(
+            submit_scrape,
+            trigger=DateTrigger(run_date=run_date),
+            args=[slug],
+            id=f"scraper_{slug}",
+            replace_existing=True,
+            max_instances=1,
+        )
+
+    await executor.start()
+    scheduler.add_listener(on_missed, EVENT_JOB_MISSED)
+    start_scheduler()
+
+    deadline = time.monotonic() + timeout + ramp + 2
+    while len(timer.run_ms) + len(missed) < lotteries and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+
+    await lag.stop()
+    queries.remove(engine)
+    scheduler.remove_listener(on_missed)
+    stop_scheduler()
+    await executor.stop()
+    executor.runner = original_runner
+
+    finished = [slug for slug in slugs if slug in timer.finished_at]
+    last = max((timer.finished_at[s] for s in finished), default=first_fire.timestamp())
+    wall_s = max(last - first_fire.timestamp(), 0.0)
+    completed = len(finished) - len(timer.failed)
+    statements = sum(queries.per_job.values())
+
+    return LoadReport(
+        lotteries=lotteries,
+        draws_per_lottery=draws,
+        completed=completed,
+        failed=len(timer.failed),
+        missed=len(missed),
+        timed_out=lotteries - len(finished) - len(missed),
+        wall_s=round(wall_s, 2),
+        jobs_per_sec=round(len(finished) / wall_s, 1) if wall_s else 0.0,
+        draws_per_sec=round(completed * draws / wall_s, 1) if wall_s else 0.0,
+        latency_ms=distribution([(timer.finished_at[s] - fire_at[s]) * 1000 for s in finished]),
+        run_ms=distribution([timer.run_ms[s] for s in finished]),
+        start_delay_ms=distribution([(timer.started_at[s] - fire_at[s]) * 1000 for s in finished]),
+        statements_per_job=round(statements / len(finished), 1) if finished else 0.0,
+        statements_by_verb={
+            verb: round(count / len(finished), 1) for verb, count in queries.by_verb.most_common()
+        } if finished else {},
+        scheduler_statements=queries.unattributed,
+        loop_lag_ms=distribution(lag.samples_ms),
+    )
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Drive fake lotteries through the scheduler and orchestrator")
+    parser.add_argument("--lotteries", type=int, default=1000, help="Fake lotteries to create and fire")
+    parser.add_argument("--draws", type=int, default=10, help="Draws each stub scrape returns")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mean simulated fetch time (+/-50%%)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of stub scrapes that fail")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds over which firings are spread")
+    parser.add_argument("--concurrency", type=int, help="HTTP lane width (default HTTP_SCRAPE_CONCURRENCY)")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Give up on unfinished jobs after this")
+    parser.add_argument("--seed", type=int, help="Seed for latency, failures and ramp offsets")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--keep", action="store_true", help="Keep the fake rows afterwards")
+    parser.add_argument("--verbose", action="store_true", help="Keep scraper and SQL logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    try:
+        report = asyncio.run(run_load(
+            args.lotteries,
+            args.draws,
+            args.latency_ms,
+            args.error_rate,
+            args.ramp,
+            args.concurrency,
+            args.timeout,
+            args.seed,
+        ))
+    finally:
+        if not args.keep:
+            delete_lotteries()
+
+    print(json.dumps(asdict(report), indent=2) if args.json else report.render())
+    if report.timed_out:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Compare parse backends on saved fixture pages
+
+Usage:
+    python -m benchmarks.parse_backends [--rounds 20]
+
+For every fixture, each backend parses the page and extracts the
+scraper's parse_targets. The bs4 row is the old path (whole-document
+BeautifulSoup, targets found with select()). Time is the median per
+page; memory is the tracemalloc peak of one parse, which counts Python
+objects only (libxml2's C allocations are not traced). Each fast backend's
+rows are checked against the lxml backend so a speedup cannot hide a
+parsing difference.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from asia_scraper.scrapers.base.parse_backends import BS4, PARSE_BACKENDS, ParseTarget, parse_document
+from asia_scraper.scrapers.countries.hong_kong import HongKongMarkSixScraper
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper
+from asia_scraper.scrapers.countries.thailand import ThailandGovernmentLotteryScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+CASES = [
+    ("in-kerala-lottery.html", IndiaKeralaLotteryScraper),
+    ("th-government-lottery.html", ThailandGovernmentLotteryScraper),
+    ("hk-mark-six.html", HongKongMarkSixScraper),
+]
+
+
+def available_backends():
+    """Backends whose optional dependencies are installed"""
+    backends = []
+    for name in PARSE_BACKENDS:
+        try:
+            parse_document("<p></p>", name, (ParseTarget("p"),))
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+def parse_once(markup: str, backend: str, scraper):
+    """Parse with a backend and locate the scraper's targets"""
+    if backend == BS4:
+        soup = parse_document(markup, BS4)
+        return [soup.select(target.css) for target in scraper.parse_targets]
+    return parse_document(markup, backend, scraper.parse_targets)
+
+
+async def drain(scraper, page):
+    """Run the scraper's parser over a Page"""
+    if hasattr(scraper, "parse_html"):
+        parsed = scraper.parse_html(page)
+    else:
+        parsed = scraper.parse_dynamic_content(page, None)
+    return [result.model_dump() async for result in parsed]
+
+
+def measure(markup: str, backend: str, scraper, rounds: int):
+    """Median milliseconds per parse and peak Python-heap KiB"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        parse_once(markup, backend, scraper)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    parse_once(markup, backend, scraper)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark parse backends on fixture pages")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed parses per backend and page")
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"{'fixture':<26}{'backend':<12}{'ms/page':>10}{'py KiB':>12}{'speedup':>10}")
+
+    for fixture, scraper_class in CASES:
+        scraper = scraper_class()
+        markup = (FIXTURES / fixture).read_text(encoding="utf-8")
+        expected = asyncio.run(drain(scraper, parse_document(markup, "lxml", scraper.parse_targets)))
+
+        baseline = None
+        for backend in backends:
+            if backend != BS4:
+                rows = asyncio.run(drain(scraper, parse_document(markup, backend, scraper.parse_targets)))
+                assert rows == expected, f"{backend} parsed {fixture} differently"
+
+            ms, peak = measure(markup, backend, scraper, args.rounds)
+            baseline = baseline or ms
+            print(f"{fixture:<26}{backend:<12}{ms:>10.2f}{peak:>12.0f}{baseline / ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
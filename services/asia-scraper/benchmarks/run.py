@@ -0,0 +1,52 @@
+"""
+Offline benchmark of every implemented scraper in SCRAPER_REGISTRY
+
+Usage:
+    python -m benchmarks.run                  # report
+    python -m benchmarks.run --save           # write benchmarks/baselines.json
+    python -m benchmarks.run --compare        # exit 1 on regressions
+    python -m benchmarks.run in-kerala-lottery --rounds 50
+
+Each fixture goes through the scraper's own parse_page() backend and
+parser, exactly as after a fetch; nothing touches the network or the
+database.
+"""
+
+import asyncio
+from benchmarks.harness import Measurement, fixture_for, main, measure
+from asia_scraper.scrapers import SCRAPER_REGISTRY, get_scraper_by_slug
+from asia_scraper.scrapers.base.base_scraper import iterate_parsed
+from asia_scraper.scrapers.base.selenium_scraper import SeleniumScraper
+
+# Placeholder parsers that return no draws yet; they rejoin the default
+# run (and get baselines) once they parse something
+STUB_SCRAPERS = {"in-sikkim-lottery", "my-sports-toto", "sg-4d", "sg-toto"}
+
+
+async def _count(parsed) -> int:
+    return sum([1 async for _ in iterate_parsed(parsed)])
+
+
+def bench_scraper(slug: str, rounds: int) -> Measurement:
+    """Benchmark one scraper on its fixture (runs in a worker process)"""
+    scraper = get_scraper_by_slug(slug)
+    fixture = fixture_for(slug)
+    markup = fixture.read_text(encoding="utf-8")
+    loop = asyncio.new_event_loop()
+
+    def parse() -> int:
+        page = scraper.parse_page(markup)
+        if isinstance(scraper, SeleniumScraper):
+            parsed = scraper.parse_dynamic_content(page, None)
+        else:
+            parsed = scraper.parse_html(page)
+        return loop.run_until_complete(_count(parsed))
+
+    try:
+        return measure(slug, fixture, parse, rounds)
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main([slug for slug in SCRAPER_REGISTRY if slug not in STUB_SCRAPERS], bench_scraper)
@@ -1,42 +0,0 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from typing import Generator
-from src.config.settings import settings
-from src.database.models import Base
-
-# Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.ENV == "development",
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def init_db() -> None:
-    """Initialize database - create all tables"""
-    Base.metadata.create_all(bind=engine)
-
-
-@contextmanager
-def get_db() -> Generator[Session, None, None]:
-    """Database session context manager"""
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
-
-
-def get_db_session() -> Session:
-    """Get database session for dependency injection"""
-    return SessionLocal()
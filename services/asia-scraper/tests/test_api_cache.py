@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from asia_scraper.utils import api_cache as api_cache_module
+from asia_scraper.utils.api_cache import LOTTERIES, SCHEDULE, ApiCache, cached_response, seconds_until
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ApiCache(max_entries=2, ttl_seconds=60)
+    monkeypatch.setattr(api_cache_module, "api_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def client(cache):
+    app = FastAPI()
+    calls = []
+
+    @app.get("/lotteries")
+    def lotteries(request: Request):
+        def build():
+            calls.append(1)
+            return {"lotteries": ["toto"], "built": len(calls)}
+
+        return cached_response(request, [LOTTERIES], build)
+
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+
+def test_repeat_reads_are_served_from_memory_with_etag(client):
+    """Test the second read skips build and If-None-Match gets a 304"""
+    first = client.get("/lotteries")
+    second = client.get("/lotteries")
+    revalidated = client.get("/lotteries", headers={"If-None-Match": first.headers["etag"]})
+
+    assert len(client.calls) == 1
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("miss", "hit")
+    assert second.json() == first.json()
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_invalidate_retires_tagged_entries(client, cache):
+    """Test a lottery write makes the next read rebuild with a new ETag"""
+    first = client.get("/lotteries")
+    cache.invalidate(LOTTERIES)
+    second = client.get("/lotteries")
+
+    assert len(client.calls) == 2
+    assert second.headers["etag"] != first.headers["etag"]
+    assert client.get("/lotteries", headers={"If-None-Match": first.headers["etag"]}).status_code == 200
+
+
+def test_invalidation_while_building_is_not_lost(cache):
+    """Test a body built across an invalidation is not served afterwards"""
+    generations = cache.snapshot([LOTTERIES])
+    cache.invalidate(LOTTERIES)
+    cache.put("/lotteries", generations, b"stale")
+
+    assert cache.get("/lotteries") is None
+
+
+def test_lru_evicts_least_recently_used(cache):
+    """Test the oldest untouched entry goes first once max_entries is reached"""
+    for key in ("a", "b"):
+        cache.put(key, cache.snapshot([LOTTERIES]), key.encode())
+    cache.get("a")
+    cache.put("c", cache.snapshot([LOTTERIES]), b"c")
+
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"a"
+
+
+def test_expiring_content_caps_the_ttl(cache):
+    """Test a schedule listing expires when its first job is due"""
+    soon = datetime.now(timezone.utc) + timedelta(seconds=5)
+    max_age = seconds_until([None, soon, soon + timedelta(hours=1)])
+    entry = cache.put("/schedule", cache.snapshot([SCHEDULE]), b"[]", max_age)
+
+    assert 4 < max_age <= 5
+    assert seconds_until([None]) is None
+    assert cache.get("/schedule") is entry
+
+    cache.put("/due", cache.snapshot([SCHEDULE]), b"[]", max_age=-1.0)
+    assert cache.get("/due") is None
@@ -0,0 +1,79 @@
+from datetime import date
+import httpx
+import pytest
+from asia_scraper.config.countries import get_lottery_config
+from asia_scraper.scrapers import get_scraper_by_slug
+from asia_scraper.scrapers.base import api_scraper
+from asia_scraper.scrapers.base.api_discovery import Exchange, candidates
+from asia_scraper.services.executor import HTTP_LANE, SELENIUM_LANE, ScrapeExecutor
+
+PAYLOAD = {
+    "result": {
+        "games": [
+            {"drawNo": "01234", "drawDate": "2024-01-06", "winning": [4, 8, 15, 16, 23, 42], "jackpotVnd": 1000},
+            {"drawNo": "01233", "drawDate": "2024-01-04", "winning": [1, 9, 17, 25, 33, 41], "jackpotVnd": 900},
+        ]
+    }
+}
+
+
+def discovered_source():
+    exchange = Exchange("https://vietlott.vn/api/results", "POST", {}, '{"game":"mega"}', 200, PAYLOAD, 300)
+    return candidates([exchange])[0].source("vn-vietlott", "https://vietlott.vn/")
+
+
+def test_discovery_guesses_date_and_numbers():
+    """Test a response is mapped without page draws to match against"""
+    source = discovered_source()
+    assert source.draws == "result.games"
+    assert {name: field.path for name, field in source.fields.items()} == {
+        "draw_number": "drawNo", "date": "drawDate", "main": "winning",
+    }
+
+
+@pytest.mark.asyncio
+async def test_api_lottery_is_fetched_over_http(monkeypatch):
+    """Test "type": "api" swaps in the API scraper and the HTTP lane"""
+    monkeypatch.setitem(get_lottery_config("vn-vietlott"), "type", "api")
+    monkeypatch.setattr(api_scraper, "load_api_source", lambda slug: discovered_source())
+
+    async def request(method, url, **kwargs):
+        return httpx.Response(200, json=PAYLOAD, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(api_scraper.http_client, "request", request)
+    monkeypatch.setattr(api_scraper.BaseScraper, "check_fingerprint", lambda self, draws: None)
+
+    scraper = get_scraper_by_slug("vn-vietlott")
+    results = await scraper.scrape()
+
+    assert [(r.draw_date, r.draw_number, r.winning_numbers) for r in results] == [
+        (date(2024, 1, 6), "01234", [4, 8, 15, 16, 23, 42]),
+        (date(2024, 1, 4), "01233", [1, 9, 17, 25, 33, 41]),
+    ]
+    executor = ScrapeExecutor({SELENIUM_LANE: 1, HTTP_LANE: 1}, max_queue=1)
+    assert executor.lane_for("vn-vietlott") == HTTP_LANE
+    assert executor.lane_for("sg-toto") == SELENIUM_LANE
+
+
+@pytest.mark.asyncio
+async def test_api_draws_are_read_once_for_fingerprint_and_parse(monkeypatch):
+    """Test the fingerprinted rows are the ones parsed, without walking the response twice"""
+    reads, fingerprinted = [], []
+    original = api_scraper.read_draws
+
+    def read_draws(*args):
+        reads.append(args)
+        return original(*args)
+
+    async def request(method, url, **kwargs):
+        return httpx.Response(200, json=PAYLOAD, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(api_scraper.http_client, "request", request)
+    monkeypatch.setattr(api_scraper.BaseScraper, "check_fingerprint", lambda self, draws: fingerprinted.append(draws))
+    monkeypatch.setattr(api_scraper, "read_draws", read_draws)
+
+    scraper = api_scraper.ApiScraper({**get_lottery_config("vn-vietlott"), "slug": "vn-vietlott"}, discovered_source())
+    results = await scraper.scrape()
+
+    assert len(reads) == 1
+    assert [row["draw_number"] for row in fingerprinted[0]] == [r.draw_number for r in results] == ["01234", "01233"]
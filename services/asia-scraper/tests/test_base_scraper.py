@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from src.scrapers.base.base_scraper import BaseScraper, ScrapedResult
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, ScrapedResult
 
 
 class MockScraper(BaseScraper):
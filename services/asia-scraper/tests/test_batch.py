@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timezone
+import pytest
+from asia_scraper.config.countries import ASIAN_COUNTRIES
+from asia_scraper.scrapers import SCRAPER_REGISTRY, get_scraper_by_slug
+from asia_scraper.scrapers.base import selenium_scraper
+from asia_scraper.scrapers.base.batch import FetchBatch, batch_groups
+from asia_scraper.services.executor import HTTP_LANE, SELENIUM_LANE, ScrapeExecutor
+from asia_scraper.services.scheduler import is_due
+
+
+class SessionDriver:
+    """Serves each URL's own markup and records page loads"""
+
+    def __init__(self):
+        self.loads = []
+        self.title = "Results"
+
+    def execute_cdp_cmd(self, cmd, params):
+        pass
+
+    def get(self, url):
+        self.loads.append(url)
+
+    @property
+    def page_source(self):
+        return f"<html>{self.loads[-1]}</html>"
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, condition, timeout_ms):
+        return {"ready": True, "waited_ms": 0}
+
+    def execute_script(self, script, *args):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_batch_reads_every_page_on_one_checkout(monkeypatch):
+    """Test TOTO and 4D share a driver session and each gets its own page"""
+    driver, checkouts = SessionDriver(), []
+    monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: checkouts.append(driver) or driver)
+    monkeypatch.setattr(selenium_scraper.driver_pool, "release", lambda driver, discard=False: None)
+    toto, four_d = get_scraper_by_slug("sg-toto"), get_scraper_by_slug("sg-4d")
+
+    batch = FetchBatch([toto, four_d])
+    pages = [await batch.fetch(toto), await batch.fetch(four_d)]
+
+    assert len(checkouts) == 1 and driver.loads == [toto.url, four_d.url]
+    assert pages == [f"<html>{toto.url}</html>", f"<html>{four_d.url}</html>"]
+    assert toto.timings.breakdown()["pages"]["pages"] == 2
+
+
+@pytest.mark.asyncio
+async def test_due_members_run_as_one_scrape():
+    """Test Singapore Pools lotteries are grouped and queued as a single lane slot"""
+    lotteries = [lottery for country in ASIAN_COUNTRIES for lottery in country.lotteries]
+    groups = [[lottery["slug"] for lottery in group] for group in batch_groups(lotteries, SCRAPER_REGISTRY)]
+    assert ["sg-toto", "sg-4d"] in groups and ["my-magnum-4d"] in groups
+
+    fired = datetime(2024, 1, 2, 19, 0, 0, 500, tzinfo=timezone.utc)
+    assert is_due("0 19 * * *", fired) and not is_due("0 19 * * 2", fired)
+
+    batches = []
+
+    async def batch_runner(slugs):
+        batches.append(slugs)
+
+    async def runner(slug):
+        pytest.fail("batch member run on its own")
+
+    executor = ScrapeExecutor({SELENIUM_LANE: 1, HTTP_LANE: 1}, max_queue=1, runner=runner, batch_runner=batch_runner)
+    assert await executor.submit_batch(["sg-toto", "sg-4d"])
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert batches == [["sg-toto", "sg-4d"]]
+    assert executor.stats()["lanes"][SELENIUM_LANE]["completed"] == 1
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_run_awaits_each_member_and_detaches_the_batch():
+    """Test a failing member is reported in place and later members still run"""
+    toto, four_d = get_scraper_by_slug("sg-toto"), get_scraper_by_slug("sg-4d")
+    ran = []
+
+    async def run_member(scraper):
+        ran.append(scraper.slug)
+        if scraper is toto:
+            raise RuntimeError("site down")
+        return "saved"
+
+    batch = FetchBatch([toto, four_d])
+    results = await batch.run(run_member)
+
+    assert ran == ["sg-toto", "sg-4d"]
+    assert isinstance(results[0], RuntimeError) and results[1] == "saved"
+    assert toto.batch is None and four_d.batch is None
@@ -0,0 +1,49 @@
+from benchmarks.harness import Measurement, compare, fixture_for, measure
+from benchmarks.run import STUB_SCRAPERS, bench_scraper
+from asia_scraper.scrapers import SCRAPER_REGISTRY
+
+
+def measurement(**overrides):
+    values = dict(slug="in-kerala-lottery", fixture="in-kerala-lottery.html", rows=28,
+                  parse_ms=10.0, alloc_kib=100.0, peak_rss_mib=80.0)
+    values.update(overrides)
+    return Measurement(**values)
+
+
+def test_every_registered_scraper_has_a_fixture():
+    """Test the benchmark suite covers the whole registry"""
+    assert [slug for slug in SCRAPER_REGISTRY if not fixture_for(slug)] == []
+
+
+def test_bench_scraper_replays_fixture_offline():
+    """Test a scraper's fixture parses in-process with rows and timings"""
+    result = bench_scraper("in-kerala-lottery", rounds=2)
+
+    assert result.rows == 28
+    assert result.parse_ms > 0
+    assert result.rows_per_sec > 0
+
+
+def test_stub_scrapers_still_parse_nothing():
+    """Test only placeholder parsers are left out of the default run"""
+    assert [slug for slug in sorted(STUB_SCRAPERS) if bench_scraper(slug, rounds=1).rows] == []
+
+
+def test_measure_returns_parse_row_count():
+    """Test measure() reports the rows parse() produced"""
+    result = measure("x", fixture_for("in-kerala-lottery"), lambda: 3, rounds=3)
+    assert result.rows == 3 and result.fixture == "in-kerala-lottery.html"
+
+
+def test_compare_flags_regressions_above_tolerance_and_noise():
+    """Test slower, hungrier or row-changing runs fail; noise does not"""
+    baselines = {"in-kerala-lottery": vars(measurement())}
+
+    assert compare([measurement(parse_ms=10.4, alloc_kib=130.0)], baselines, 0.25) == []
+
+    problems = compare([measurement(rows=27, parse_ms=20.0)], baselines, 0.25)
+    assert any("rows 28 -> 27" in p for p in problems)
+    assert any("parse_ms" in p for p in problems)
+
+    # 60% growth but under the 64 KiB noise floor
+    assert compare([measurement(alloc_kib=160.0)], baselines, 0.25) == []
@@ -0,0 +1,63 @@
+from selenium.webdriver.chrome.options import Options
+from asia_scraper.scrapers.base.browser_profile import (
+    DEFAULT_BLOCKED_URLS, block_resources, blocked_patterns, lean_options, page_weight,
+)
+from asia_scraper.utils import metrics
+from asia_scraper.utils.timing import StageTimer
+
+
+class CdpDriver:
+    """Records DevTools commands and serves a fixed page weight"""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        return {}
+
+    def execute_script(self, script, *args):
+        return {"bytes": 48_000, "requests": 3}
+
+
+def test_lean_options_load_eagerly_without_extensions():
+    """Test the lean profile returns at DOMContentLoaded and disables background work"""
+    options = lean_options(Options())
+
+    assert options.page_load_strategy == "eager"
+    assert "--disable-extensions" in options.arguments
+    assert "--disable-background-networking" in options.arguments
+
+
+def test_site_allow_and_block_lists_adjust_defaults():
+    """Test allow_urls lifts a default pattern and block_urls adds one"""
+    patterns = blocked_patterns(block=["*/live-chat/*"], allow=["*.css*"])
+
+    assert "*.css*" not in patterns
+    assert "*.png*" in patterns
+    assert patterns[-1] == "*/live-chat/*"
+    assert len(patterns) == len(DEFAULT_BLOCKED_URLS)
+
+
+def test_blocking_goes_through_devtools():
+    """Test patterns are handed to Network.setBlockedURLs after enabling the domain"""
+    driver = CdpDriver()
+
+    assert block_resources(driver, ["*.png*"])
+    assert driver.commands == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": ["*.png*"]})]
+    assert not block_resources(object(), ["*.png*"])
+
+
+def test_page_weight_is_reported_per_scrape():
+    """Test page loads add up in the breakdown and feed the page metrics"""
+    timer = StageTimer()
+    timer.loaded_page(400.0, page_weight(CdpDriver()))
+    timer.loaded_page(200.0, None)
+    before = metrics.sample("scraper_page_bytes_total", slug="sg-toto")
+
+    breakdown = timer.breakdown()
+    metrics.record_job("sg-toto", "success", 1.0, breakdown)
+
+    assert breakdown["pages"] == {"pages": 2, "load_ms": 600.0, "bytes": 48_000, "requests": 3}
+    assert metrics.sample("scraper_page_bytes_total", slug="sg-toto") - before == 48_000
+    assert metrics.sample("scraper_page_load_seconds_count", slug="sg-toto") >= 1
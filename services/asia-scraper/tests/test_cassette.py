@@ -0,0 +1,95 @@
+import threading
+from http.server import ThreadingHTTPServer
+import httpx
+import pytest
+from asia_scraper.utils import cassette
+from asia_scraper.utils.cassette import (
+    RECORD,
+    REPLAY,
+    CassetteMiss,
+    CassetteStore,
+    CassetteTransport,
+    Faults,
+    InjectedFault,
+)
+
+URL = "https://www.keralalotteryresult.net/"
+
+
+def origin(request):
+    return httpx.Response(200, headers={"ETag": '"v1"'}, text="<table class='result'></table>")
+
+
+async def record(store):
+    transport = CassetteTransport(RECORD, store, Faults(), httpx.MockTransport(origin))
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.get(URL)
+
+
+@pytest.mark.asyncio
+async def test_recorded_responses_replay_without_network(tmp_path):
+    """Test a recorded page is served from a fresh store in replay mode"""
+    response = await record(CassetteStore(tmp_path))
+    assert response.text == "<table class='result'></table>"
+
+    transport = CassetteTransport(REPLAY, CassetteStore(tmp_path), Faults())
+    async with httpx.AsyncClient(transport=transport) as client:
+        replayed = await client.get(URL)
+        unchanged = await client.get(URL, headers={"If-None-Match": '"v1"'})
+
+    assert replayed.status_code == 200
+    assert replayed.text == response.text
+    assert unchanged.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_and_injected_errors_are_transport_errors(tmp_path):
+    """Test unrecorded URLs and injected failures surface like network failures"""
+    await record(CassetteStore(tmp_path))
+
+    always_fail = CassetteTransport(REPLAY, CassetteStore(tmp_path), Faults(error_rate=1.0))
+    async with httpx.AsyncClient(transport=always_fail) as client:
+        with pytest.raises(InjectedFault):
+            await client.get(URL)
+
+    transport = CassetteTransport(REPLAY, CassetteStore(tmp_path), Faults())
+    async with httpx.AsyncClient(transport=transport) as client:
+        with pytest.raises(CassetteMiss):
+            await client.get(URL + "archive")
+
+
+def test_faults_are_reproducible_with_a_seed():
+    """Test the same seed gives the same jitter and failure sequence"""
+    first = Faults(latency_ms=20, error_rate=0.3, seed=7)
+    second = Faults(latency_ms=20, error_rate=0.3, seed=7)
+
+    delays = [first.delay() for _ in range(20)]
+    assert delays == [second.delay() for _ in range(20)]
+    assert all(0.01 <= delay <= 0.03 for delay in delays)
+    assert [first.fail() for _ in range(50)] == [second.fail() for _ in range(50)]
+
+
+def test_stand_in_serves_recorded_selenium_pages(tmp_path, monkeypatch):
+    """Test Selenium page URLs are rewritten to the stand-in, which serves the recording"""
+    class Driver:
+        page_source = "<div class='rendered'>12 34</div>"
+
+    monkeypatch.setattr(cassette, "store", CassetteStore(tmp_path))
+    monkeypatch.setattr(cassette, "faults", Faults())
+    monkeypatch.setattr(cassette.settings, "HTTP_CASSETTE_MODE", RECORD)
+    cassette.record_page(URL, Driver())
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), cassette.ReplayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        monkeypatch.setattr(cassette.settings, "HTTP_CASSETTE_MODE", REPLAY)
+        monkeypatch.setattr(cassette.settings, "HTTP_REPLAY_SERVER", f"http://127.0.0.1:{server.server_port}")
+
+        page = httpx.get(cassette.page_url(URL))
+        missing = httpx.get(cassette.page_url(URL + "archive"))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert page.text == Driver.page_source
+    assert missing.status_code == 404
@@ -0,0 +1,90 @@
+import pytest
+from asia_scraper.scrapers.base.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Stands in for webdriver.Chrome"""
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.quit_called = False
+        self.cookies_cleared = 0
+
+    def execute_script(self, script):
+        return None
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.broken:
+            raise RuntimeError("chrome not reachable")
+        self.cookies_cleared += 1
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_reuses_warm_driver():
+    """Test a released driver is reset and handed out again"""
+    created = []
+    pool = DriverPool(lambda: created.append(FakeDriver()) or created[-1], max_size=2, max_uses=10)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert first.cookies_cleared == 2
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["idle"] == 1
+
+
+def test_pool_recycles_after_max_uses():
+    """Test a driver is quit after serving max_uses pages"""
+    pool = DriverPool(FakeDriver, max_size=1, max_uses=2)
+
+    first = pool.checkout()
+    pool.release(first)
+    pool.release(pool.checkout())
+
+    assert first.quit_called
+    assert pool.stats()["recycled"] == 1
+    assert pool.checkout() is not first
+
+
+def test_pool_discards_crashed_driver():
+    """Test a driver that fails its reset is dropped"""
+    pool = DriverPool(lambda: FakeDriver(broken=True), max_size=1, max_uses=10)
+
+    with pool.acquire() as driver:
+        pass
+
+    assert driver.quit_called
+    assert pool.stats()["crashed"] == 1
+    assert pool.stats()["idle"] == 0
+
+
+def test_pool_quits_discarded_driver():
+    """Test a driver released as broken is quit and never handed out again"""
+    pool = DriverPool(FakeDriver, max_size=1, max_uses=10)
+
+    first = pool.checkout()
+    pool.release(first, discard=True)
+
+    assert first.quit_called and first.cookies_cleared == 0
+    assert pool.stats()["crashed"] == 1
+    assert pool.checkout() is not first
+
+
+def test_pool_is_bounded():
+    """Test checkout blocks once max_size drivers are out"""
+    pool = DriverPool(FakeDriver, max_size=1, max_uses=10)
+    pool.checkout()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.01)
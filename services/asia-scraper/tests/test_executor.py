@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from asia_scraper.services.executor import (
+    ExecutorBusy,
+    HTTP_LANE,
+    PRIORITY_MANUAL,
+    SELENIUM_LANE,
+    ScrapeExecutor,
+)
+
+
+class FakeRunner:
+    """Records run order and peak concurrency; each run waits for release"""
+
+    def __init__(self):
+        self.order = []
+        self.active = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, slug):
+        self.order.append(slug)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await self.release.wait()
+        self.active -= 1
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_lane_for_scraper_type():
+    """Test Selenium scrapers go to the narrow lane"""
+    executor = ScrapeExecutor({SELENIUM_LANE: 1, HTTP_LANE: 1}, max_queue=1)
+    assert executor.lane_for("sg-toto") == SELENIUM_LANE
+    assert executor.lane_for("in-kerala-lottery") == HTTP_LANE
+
+
+@pytest.mark.asyncio
+async def test_lane_concurrency_is_bounded():
+    """Test a lane never runs more scrapes than its width"""
+    runner = FakeRunner()
+    executor = ScrapeExecutor({SELENIUM_LANE: 2, HTTP_LANE: 4}, max_queue=10, runner=runner)
+
+    for slug in ["sg-toto", "sg-4d", "jp-takarakuji", "hk-mark-six"]:
+        assert await executor.submit(slug)
+    await settle()
+
+    stats = executor.stats()["lanes"][SELENIUM_LANE]
+    assert runner.peak == 2
+    assert stats["running"] == 2
+    assert stats["queued"] == 2
+
+    runner.release.set()
+    await settle()
+    assert executor.stats()["lanes"][SELENIUM_LANE]["completed"] == 4
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_manual_priority_runs_first():
+    """Test manual scrapes overtake queued scheduled ones"""
+    runner = FakeRunner()
+    executor = ScrapeExecutor({SELENIUM_LANE: 1, HTTP_LANE: 1}, max_queue=10, runner=runner)
+
+    await executor.submit("sg-toto")
+    await settle()  # occupies the only slot
+    await executor.submit("sg-4d")
+    await executor.submit("jp-takarakuji", priority=PRIORITY_MANUAL)
+
+    runner.release.set()
+    await settle()
+    assert runner.order == ["sg-toto", "jp-takarakuji", "sg-4d"]
+    await executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_and_full_queue():
+    """Test pending slugs are not re-queued and a full lane pushes back"""
+    runner = FakeRunner()
+    executor = ScrapeExecutor({SELENIUM_LANE: 1, HTTP_LANE: 1}, max_queue=1, runner=runner)
+
+    await executor.submit("sg-toto")
+    await settle()
+    assert not await executor.submit("sg-toto")
+
+    await executor.submit("sg-4d", wait=False)
+    with pytest.raises(ExecutorBusy):
+        await executor.submit("jp-takarakuji", wait=False)
+
+    runner.release.set()
+    await settle()
+    assert executor.stats()["lanes"][SELENIUM_LANE]["queued"] == 0
+    await executor.stop()
@@ -0,0 +1,61 @@
+import pytest
+import asia_scraper.scrapers.base.base_scraper as base_module
+from bs4 import BeautifulSoup
+from asia_scraper.database.fingerprints import fingerprint
+from asia_scraper.scrapers import get_scraper_by_slug
+from asia_scraper.scrapers.base.base_scraper import PageUnchanged
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper
+
+PAGE = """
+<html>
+  <div class="ad">{ad}</div>
+  <table class="lottery-results"><tr><td>KR-650</td></tr></table>
+</html>
+"""
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """Keep fingerprints in a dict instead of scraper_config"""
+    saved = {}
+    monkeypatch.setattr(base_module, "load_fingerprint", saved.get)
+    monkeypatch.setattr(base_module, "store_fingerprint", saved.__setitem__)
+    return saved
+
+
+def test_registry_sets_slug():
+    """Test scrapers built from the registry know their slug"""
+    scraper = get_scraper_by_slug("in-kerala-lottery")
+    assert scraper.slug == "in-kerala-lottery"
+
+
+def test_fingerprint_ignores_content_outside_selector():
+    """Test only the declared fragment contributes to the fingerprint"""
+    scraper = IndiaKeralaLotteryScraper()
+    first = BeautifulSoup(PAGE.format(ad="one"), "lxml")
+    second = BeautifulSoup(PAGE.format(ad="two"), "lxml")
+    assert scraper.page_fingerprint(first) == scraper.page_fingerprint(second)
+    assert scraper.page_fingerprint(first) != fingerprint(str(first))
+
+
+@pytest.mark.asyncio
+async def test_unchanged_fragment_short_circuits(stored):
+    """Test a saved fingerprint skips the next identical page"""
+    scraper = IndiaKeralaLotteryScraper()
+    scraper.slug = "in-kerala-lottery"
+
+    scraper.check_fingerprint(BeautifulSoup(PAGE.format(ad="one"), "lxml"))
+    assert stored == {}  # not persisted until saved
+
+    await scraper.mark_success()
+    assert "in-kerala-lottery" in stored
+
+    with pytest.raises(PageUnchanged):
+        scraper.check_fingerprint(BeautifulSoup(PAGE.format(ad="two"), "lxml"))
+
+
+def test_no_slug_skips_check(stored):
+    """Test scrapers without a slug never short-circuit"""
+    scraper = IndiaKeralaLotteryScraper()
+    scraper.check_fingerprint(BeautifulSoup(PAGE.format(ad="one"), "lxml"))
+    assert scraper._pending_fingerprint is None
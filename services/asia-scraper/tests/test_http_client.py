@@ -0,0 +1,56 @@
+import asyncio
+import httpx
+import pytest
+from asia_scraper.utils.http_client import HttpClientManager
+
+
+def make_manager(handler, max_per_host=2):
+    manager = HttpClientManager(
+        max_connections=10,
+        max_per_host=max_per_host,
+        keepalive_expiry=5,
+        timeout=5,
+        http2=False,
+    )
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_client():
+    """Test every fetch goes through the same pooled client"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.host)
+        return httpx.Response(200, text="<html></html>")
+
+    manager = make_manager(handler)
+    client = manager.client
+
+    await manager.get("https://www.keralalotteryresult.net/")
+    await manager.get("https://www.keralalotteryresult.net/archive")
+
+    assert manager.client is client
+    assert seen == ["www.keralalotteryresult.net"] * 2
+    await manager.close()
+    assert manager._client is None
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_is_bounded():
+    """Test no more than max_per_host requests hit one host at once"""
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200)
+
+    manager = make_manager(handler, max_per_host=2)
+    await asyncio.gather(*[manager.get(f"https://news.sanook.com/lotto/{i}") for i in range(6)])
+
+    assert active["peak"] == 2
+    await manager.close()
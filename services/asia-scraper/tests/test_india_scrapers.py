@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from src.scrapers.countries.india import IndiaKeralaLotteryScraper, IndiaSikkimLotteryScraper
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper, IndiaSikkimLotteryScraper
 
 
 @pytest.mark.asyncio
@@ -18,7 +18,7 @@ async def test_kerala_scraper_validation():
     """Test Kerala scraper validation logic"""
     scraper = IndiaKeralaLotteryScraper()
     
-    from src.scrapers.base.base_scraper import ScrapedResult
+    from asia_scraper.scrapers.base.base_scraper import ScrapedResult
     
     # Valid result
     valid_result = ScrapedResult(
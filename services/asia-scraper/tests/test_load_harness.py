@@ -0,0 +1,92 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import create_engine, text
+from benchmarks.load import (
+    LoopLagMonitor,
+    QueryCounter,
+    StubFailure,
+    StubScraper,
+    TimedRunner,
+    current_slug,
+    distribution,
+    fake_lotteries,
+    percentile,
+)
+from asia_scraper.utils.offload import run_db
+
+
+def test_percentiles_use_nearest_rank():
+    """Test p50/p99 pick observed values"""
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+    assert distribution([3.0, 1.0, 2.0]) == {"p50": 2.0, "p99": 3.0, "max": 3.0}
+
+
+def test_fake_lotteries_have_unique_slugs():
+    """Test generated configs look like config/countries.py entries"""
+    configs = fake_lotteries(3)
+
+    assert [c["slug"] for c in configs] == ["load-00001", "load-00002", "load-00003"]
+    assert all(len(c["schedule"].split()) == 5 for c in configs)
+
+
+@pytest.mark.asyncio
+async def test_stub_scraper_yields_valid_draws():
+    """Test stub scrapes stream the configured number of valid draws"""
+    StubScraper.draws, StubScraper.latency_ms, StubScraper.error_rate = 5, 1.0, 0.0
+
+    results = await StubScraper().execute()
+
+    assert len(results) == 5
+    assert len({r.draw_date for r in results}) == 5
+
+    StubScraper.error_rate = 1.0
+    try:
+        with pytest.raises(StubFailure):
+            await StubScraper().execute()
+    finally:
+        StubScraper.error_rate = 0.0
+
+
+@pytest.mark.asyncio
+async def test_statements_are_attributed_to_the_running_scrape():
+    """Test statements issued on DB threads count against the scrape that issued them"""
+    engine = create_engine("sqlite://")
+    counter = QueryCounter()
+    counter.install(engine)
+
+    def query():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    async def scrape(slug):
+        await run_db(query)
+        await run_db(query)
+
+    runner = TimedRunner(scrape)
+    await asyncio.gather(asyncio.create_task(runner("a")), asyncio.create_task(runner("b")))
+    query()
+    counter.remove(engine)
+
+    assert counter.per_job == {"a": 2, "b": 2}
+    assert counter.by_verb["SELECT"] == 4
+    assert counter.unattributed == 1
+    assert current_slug.get() is None
+    assert set(runner.finished_at) == {"a", "b"}
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_sees_blocking_calls():
+    """Test blocking the event loop shows up as lag"""
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert max(monitor.samples_ms) >= 50
@@ -0,0 +1,81 @@
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+import asia_scraper.database.lottery_cache as cache_module
+from asia_scraper.database.lottery_cache import LotteryCache
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+def install_fake_db(monkeypatch, rows):
+    """Replace get_db with a session that counts queries"""
+    calls = {"count": 0}
+
+    class FakeSession:
+        def query(self, *columns):
+            calls["count"] += 1
+            return FakeQuery(rows)
+
+    @contextmanager
+    def fake_get_db():
+        yield FakeSession()
+
+    monkeypatch.setattr(cache_module, "get_db", fake_get_db)
+    return calls
+
+
+def test_lookups_hit_database_once_within_ttl(monkeypatch):
+    """Test repeated lookups are served from memory"""
+    lottery_id = uuid.uuid4()
+    calls = install_fake_db(monkeypatch, [
+        SimpleNamespace(id=lottery_id, slug="sg-toto", isActive=True),
+        SimpleNamespace(id=uuid.uuid4(), slug="sg-4d", isActive=False),
+    ])
+    cache = LotteryCache(ttl_seconds=300)
+
+    assert cache.get("sg-toto").id == lottery_id
+    assert cache.get("sg-4d").isActive is False
+    assert cache.get("unknown") is None
+    assert len(cache.all()) == 2
+    assert calls["count"] == 1
+
+
+def test_invalidate_forces_reload(monkeypatch):
+    """Test invalidate and an expired TTL both trigger a reload"""
+    calls = install_fake_db(monkeypatch, [
+        SimpleNamespace(id=uuid.uuid4(), slug="hk-mark-six", isActive=True),
+    ])
+    cache = LotteryCache(ttl_seconds=300)
+
+    cache.get("hk-mark-six")
+    cache.invalidate()
+    cache.get("hk-mark-six")
+    assert calls["count"] == 2
+
+    expired = LotteryCache(ttl_seconds=0)
+    expired.get("hk-mark-six")
+    expired.get("hk-mark-six")
+    assert calls["count"] == 4
+
+
+def test_unknown_slug_reloads_at_most_once_per_window(monkeypatch):
+    """Test a lottery added after the last load is found without waiting out the TTL"""
+    rows = [SimpleNamespace(id=uuid.uuid4(), slug="sg-toto", isActive=True)]
+    calls = install_fake_db(monkeypatch, rows)
+    cache = LotteryCache(ttl_seconds=300, miss_refresh_seconds=0)
+
+    assert cache.get("jp-loto7") is None
+    rows.append(SimpleNamespace(id=uuid.uuid4(), slug="jp-loto7", isActive=True))
+    assert cache.get("jp-loto7") is not None
+
+    throttled = LotteryCache(ttl_seconds=300, miss_refresh_seconds=60)
+    count = calls["count"]
+    for _ in range(3):
+        throttled.get("unknown")
+    assert calls["count"] == count + 1
@@ -0,0 +1,80 @@
+import asyncio
+import time
+import pytest
+from asia_scraper.utils import metrics
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+from asia_scraper.utils.metrics import CallbackGauge
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test buckets are cumulative and end with +Inf, sum and count"""
+    registry = CollectorRegistry()
+    histogram = Histogram("fetch_seconds", "Fetch time", ("host",), buckets=(0.1, 1.0), registry=registry)
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.labels("a.example").observe(value)
+
+    text = generate_latest(registry).decode()
+
+    assert '# TYPE fetch_seconds histogram' in text
+    assert 'fetch_seconds_bucket{host="a.example",le="0.1"} 1.0' in text
+    assert 'fetch_seconds_bucket{host="a.example",le="1.0"} 3.0' in text
+    assert 'fetch_seconds_bucket{host="a.example",le="+Inf"} 4.0' in text
+    assert 'fetch_seconds_sum{host="a.example"} 4.05' in text
+    assert 'fetch_seconds_count{host="a.example"} 4.0' in text
+
+
+def test_label_values_are_escaped_and_checked():
+    """Test quotes in label values are escaped and label arity is enforced"""
+    registry = CollectorRegistry()
+    counter = Counter("errors_total", "Errors", ("error",), registry=registry)
+    counter.labels('Bad "thing"').inc()
+
+    assert 'errors_total{error="Bad \\"thing\\""} 1.0' in generate_latest(registry).decode()
+    with pytest.raises(ValueError):
+        counter.labels()
+
+
+def test_broken_callback_gauge_is_skipped():
+    """Test a failing gauge source does not break the rest of the output"""
+    registry = CollectorRegistry()
+    CallbackGauge("broken", "Broken", (), lambda: 1 / 0, registry=registry)
+    CallbackGauge("pool", "Pool", ("state",), lambda: [(("idle",), 2)], registry=registry)
+
+    text = generate_latest(registry).decode()
+
+    assert 'pool{state="idle"} 2.0' in text
+    assert "# TYPE broken gauge" in text
+
+
+def test_record_job_books_stages_rows_and_failures():
+    """Test a finished job feeds duration, stage, row and failure metrics"""
+    breakdown = {"stages": {"fetch": 1200.0, "save": 30.0}}
+    before = metrics.sample("scraper_results_inserted_total", slug="metrics-test")
+
+    metrics.record_job("metrics-test", "success", 1.5, breakdown, inserted=3, skipped=2)
+    metrics.record_job("metrics-test", "failed", 0.2, None, error=TimeoutError("slow"))
+
+    assert metrics.sample("scraper_results_inserted_total", slug="metrics-test") == before + 3
+    assert metrics.sample("scraper_results_skipped_total", slug="metrics-test") >= 2
+    assert metrics.sample("scraper_stage_duration_seconds_count", slug="metrics-test", stage="fetch") >= 1
+    assert metrics.sample("scraper_job_failures_total", slug="metrics-test", error="TimeoutError") >= 1
+    assert 'scraper_job_duration_seconds_count{slug="metrics-test",status="failed"}' in metrics.render()
+
+
+def lag_stalls() -> float:
+    """Lag probes above 50 ms"""
+    under = metrics.sample("event_loop_lag_probe_seconds_bucket", le=str(0.05))
+    return metrics.sample("event_loop_lag_probe_seconds_count") - under
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_probe_sees_blocking_calls():
+    """Test blocking the event loop shows up in the lag probes"""
+    stalls = lag_stalls()
+    probe = asyncio.create_task(metrics.sample_loop_lag(interval=0.01))
+    await asyncio.sleep(0)
+    time.sleep(0.1)
+    await asyncio.sleep(0.02)
+    probe.cancel()
+
+    assert lag_stalls() == stalls + 1
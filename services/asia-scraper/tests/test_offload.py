@@ -0,0 +1,36 @@
+import contextvars
+import threading
+import pytest
+from asia_scraper.utils import offload
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_leave_the_event_loop():
+    """Test Selenium and DB work run on their own named threads"""
+    loop_thread = threading.current_thread().name
+
+    selenium_thread = await offload.run_selenium(lambda: threading.current_thread().name)
+    db_thread = await offload.run_db(lambda: threading.current_thread().name)
+
+    assert selenium_thread.startswith("selenium") and selenium_thread != loop_thread
+    assert db_thread.startswith("db")
+
+
+@pytest.mark.asyncio
+async def test_context_and_arguments_are_passed():
+    """Test context variables and kwargs reach the worker thread"""
+    request_id.set("job-42")
+
+    def work(a, b=0):
+        return request_id.get(), a + b
+
+    assert await offload.run_db(work, 1, b=2) == ("job-42", 3)
+
+
+def test_stats_reports_pools():
+    """Test worker counts are exposed for /health"""
+    stats = offload.stats()
+    assert set(stats) == {"selenium", "db"}
+    assert stats["db"]["workers"] >= 1
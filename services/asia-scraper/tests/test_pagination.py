@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import Column, DateTime, Integer, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from asia_scraper.database.pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_page
+
+Base = declarative_base()
+
+
+class Job(Base):
+    __tablename__ = "job"
+
+    id = Column(Integer, primary_key=True)
+    createdAt = Column(DateTime, nullable=False)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    start = datetime(2024, 1, 1)
+    # Pairs of jobs share a timestamp, so id has to break the tie
+    session.add_all(Job(id=i, createdAt=start + timedelta(minutes=i // 2)) for i in range(1, 12))
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_pages_cover_every_row_once_newest_first(db):
+    """Test following next_cursor visits each row once, including timestamp ties"""
+    keys = (Job.createdAt, Job.id)
+    seen, cursor = [], None
+    while True:
+        rows, cursor = keyset_page(db.query(Job), keys, cursor, limit=4)
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            break
+
+    assert seen == list(range(11, 0, -1))
+
+
+def test_last_full_page_has_no_cursor(db):
+    """Test a page that ends exactly on the last row does not promise another"""
+    rows, cursor = keyset_page(db.query(Job).filter(Job.id <= 4), (Job.createdAt, Job.id), limit=4)
+
+    assert [row.id for row in rows] == [4, 3, 2, 1]
+    assert cursor is None
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    """Test cursors decode to typed values and malformed ones raise InvalidCursor"""
+    cursor = encode_cursor(datetime(2024, 1, 1, 12, 30), 7)
+
+    assert decode_cursor(cursor, (datetime, int)) == (datetime(2024, 1, 1, 12, 30), 7)
+    for bad in ("not-base64!", encode_cursor(1), encode_cursor("yesterday", 7)):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(bad, (datetime, int))
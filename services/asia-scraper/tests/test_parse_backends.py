@@ -0,0 +1,74 @@
+import pytest
+from datetime import date
+from pathlib import Path
+from asia_scraper.scrapers.base.parse_backends import ParseTarget, first, parse_document, text
+from asia_scraper.scrapers.countries.hong_kong import HongKongMarkSixScraper
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper
+from asia_scraper.scrapers.countries.thailand import ThailandGovernmentLotteryScraper
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+FAST_BACKENDS = ["lxml", "iterparse"]
+
+
+def load(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+async def test_kerala_rows_from_fast_backends(backend):
+    """Test the Kerala parser reads every row from the targeted table"""
+    scraper = IndiaKeralaLotteryScraper()
+    page = parse_document(load("in-kerala-lottery.html"), backend, scraper.parse_targets)
+
+    results = [r async for r in scraper.parse_html(page)]
+
+    assert len(results) == 28
+    assert results[0].draw_date == date(2026, 1, 1)
+    assert len(results[0].winning_numbers) == 6
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+async def test_thailand_and_mark_six_from_fast_backends(backend):
+    """Test multi-target pages hand the parser each target"""
+    thailand = ThailandGovernmentLotteryScraper()
+    page = parse_document(load("th-government-lottery.html"), backend, thailand.parse_targets)
+    [prize] = [r async for r in thailand.parse_html(page)]
+    assert prize.winning_numbers == [8, 4, 5, 1, 0, 2]
+
+    mark_six = HongKongMarkSixScraper()
+    page = parse_document(load("hk-mark-six.html"), backend, mark_six.parse_targets)
+    [draw] = [r async for r in mark_six.parse_dynamic_content(page, None)]
+    assert draw.winning_numbers == [3, 11, 19, 27, 38, 44]
+    assert draw.bonus_numbers == [8]
+    assert draw.draw_number == "26/012"
+    assert draw.draw_date == date(2026, 1, 15)
+
+
+def test_iterparse_keeps_nested_target_content():
+    """Test elements inside a target survive while unrelated ones are cleared"""
+    markup = '<div class="ad"><p>ad</p></div><div class="result"><div class="ball">7</div></div>'
+    result = ParseTarget("div", "result")
+
+    page = parse_document(markup, "iterparse", (result,))
+
+    assert text(first(page, result)) == "7"
+
+
+def test_fast_backends_fingerprint_only_targets():
+    """Test content outside the targets does not change the fingerprint"""
+    scraper = IndiaKeralaLotteryScraper()
+    markup = load("in-kerala-lottery.html")
+    changed = markup.replace("Headline 1 ", "Breaking 1 ")
+
+    assert scraper.page_fingerprint(scraper.parse_page(markup)) == \
+        scraper.page_fingerprint(scraper.parse_page(changed))
+
+
+def test_unknown_backend_and_missing_targets():
+    """Test misconfigured backends fail loudly"""
+    with pytest.raises(ValueError):
+        parse_document("<p></p>", "regex")
+    with pytest.raises(ValueError):
+        parse_document("<p></p>", "lxml")
@@ -0,0 +1,88 @@
+import pytest
+from datetime import date, timedelta
+from asia_scraper.database.writer import WriteSummary
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper
+from asia_scraper.services.pipeline import write_stream
+
+
+async def draws(count, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("parse error")
+        yield ScrapedResult(draw_date=date(2020, 1, 1) + timedelta(days=i), winning_numbers=[i + 1])
+
+
+def to_row(result):
+    return {"lotteryId": 1, "drawDate": result.draw_date}
+
+
+@pytest.mark.asyncio
+async def test_rows_are_written_in_batches():
+    """Test rows reach the writer in fixed-size batches plus a final partial one"""
+    batches = []
+
+    def write_batch(rows):
+        batches.append(len(rows))
+        return WriteSummary(inserted=len(rows))
+
+    summary = await write_stream(draws(25), to_row, write_batch, batch_size=10, queue_size=5)
+
+    assert batches == [10, 10, 5]
+    assert summary.inserted == 25
+
+
+@pytest.mark.asyncio
+async def test_parsing_pauses_while_the_writer_is_behind():
+    """Test the bounded queue keeps the parser at most one queue ahead of the writer"""
+    produced = 0
+
+    async def counting():
+        nonlocal produced
+        async for result in draws(50):
+            produced += 1
+            yield result
+
+    written = 0
+    lead = []
+
+    def write_batch(rows):
+        nonlocal written
+        written += len(rows)
+        lead.append(produced - written)
+        return WriteSummary(inserted=len(rows))
+
+    await write_stream(counting(), to_row, write_batch, batch_size=5, queue_size=5)
+
+    # Queue (5) plus the row blocked on put and the one being parsed
+    assert max(lead) <= 7
+
+
+@pytest.mark.asyncio
+async def test_parse_error_keeps_committed_batches_and_propagates():
+    """Test a failing parser cancels the writer but earlier batches stay written"""
+    written = []
+
+    def write_batch(rows):
+        written.extend(rows)
+        return WriteSummary(inserted=len(rows))
+
+    with pytest.raises(RuntimeError):
+        await write_stream(draws(30, fail_at=12), to_row, write_batch, batch_size=5)
+
+    # Only whole batches are written, never the partial tail
+    assert len(written) in (0, 5, 10)
+
+
+@pytest.mark.asyncio
+async def test_parser_yields_draws_incrementally():
+    """Test Kerala parse_html is an async generator that streams rows"""
+    rows = "".join(f"<tr><td>0{i}-01-2026</td><td>{i} {i + 10}</td><td>x</td></tr>" for i in range(1, 4))
+    scraper = IndiaKeralaLotteryScraper()
+    page = scraper.parse_page(f"<table class='lottery-results'><tr><th>h</th></tr>{rows}</table>")
+
+    parsed = scraper.parse_html(page)
+    first = await parsed.__anext__()
+
+    assert first.winning_numbers == [1, 11]
+    assert len([r async for r in parsed]) == 2
@@ -0,0 +1,93 @@
+from datetime import date
+import pytest
+from selenium.common.exceptions import TimeoutException
+from asia_scraper.scrapers.base import selenium_scraper
+from asia_scraper.scrapers.base.base_scraper import ScrapedResult
+from asia_scraper.scrapers.base.readiness import ReadyWhen, element_ready, network_idle, wait_until_ready
+from asia_scraper.scrapers.countries.japan import JapanTakarakujiScraper
+
+PAGE = '<div class="result-numbers"><span class="number">7</span></div>'
+released = []
+
+
+class ReadyDriver:
+    """Answers the readiness script with a fixed outcome"""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = []
+        self.title = "Results"
+        self.page_source = PAGE
+
+    def get(self, url):
+        self.calls.append("get")
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def execute_async_script(self, script, condition, timeout_ms):
+        self.calls.append(("wait", condition, timeout_ms))
+        return self.outcome
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class ReleaseCheckingScraper(JapanTakarakujiScraper):
+    """Records whether the driver was back in the pool when parsing started"""
+
+    async def parse_dynamic_content(self, soup, driver):
+        self.driver_at_parse = driver
+        self.released_at_parse = list(released)
+        yield ScrapedResult(draw_date=date(2024, 1, 1), winning_numbers=[7])
+
+
+def test_conditions_describe_elements_and_quiet_periods():
+    """Test element and network-idle conditions serialize for the page script"""
+    assert element_ready(("css selector", "div.ball"), count=6).spec() == {
+        "path": [["css selector", "div.ball"]], "count": 6, "quiet_ms": 0,
+    }
+    assert network_idle(250) == ReadyWhen(quiet_ms=250)
+
+
+def test_wait_times_out_when_results_never_render():
+    """Test a condition the page never meets raises rather than returning an empty page"""
+    driver = ReadyDriver({"ready": False, "waited_ms": 2000})
+
+    with pytest.raises(TimeoutException):
+        wait_until_ready(driver, network_idle(), timeout=2)
+    assert driver.script_timeout > 2
+
+
+@pytest.mark.asyncio
+async def test_driver_is_released_before_parsing(monkeypatch):
+    """Test the declared condition is awaited and the driver is back in the pool before parse"""
+    driver = ReadyDriver({"ready": True, "waited_ms": 35})
+    released.clear()
+    monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: driver)
+    monkeypatch.setattr(selenium_scraper.driver_pool, "release", lambda driver, discard=False: released.append(driver))
+    scraper = ReleaseCheckingScraper()
+
+    results = await scraper.scrape()
+
+    assert len(results) == 1
+    assert scraper.released_at_parse == [driver] and scraper.driver_at_parse is None
+    wait = driver.calls[1]
+    assert wait[1]["path"] == [["css selector", "div.result-numbers span.number"]]
+    assert scraper.timings.breakdown()["pages"]["pages"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_driver_is_discarded(monkeypatch):
+    """Test a driver whose page never became ready goes back to the pool as broken"""
+    driver = ReadyDriver({"ready": False, "waited_ms": 30000})
+    releases = []
+    monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: driver)
+    monkeypatch.setattr(
+        selenium_scraper.driver_pool, "release",
+        lambda driver, discard=False: releases.append((driver, discard)),
+    )
+
+    with pytest.raises(TimeoutException):
+        await JapanTakarakujiScraper().scrape()
+    assert releases == [(driver, True)]
@@ -0,0 +1,109 @@
+import httpx
+import pytest
+import asia_scraper.scrapers.base.bs4_scraper as bs4_module
+from asia_scraper.scrapers.base.base_scraper import PageUnchanged
+from asia_scraper.scrapers.countries.india import IndiaKeralaLotteryScraper
+from asia_scraper.utils.http_client import HttpClientManager
+from asia_scraper.utils.response_cache import CacheEntry, DiskCacheStore, ResponseCache
+
+PAGE = "<html><table class='lottery-results'></table></html>"
+
+
+@pytest.fixture
+def fake_site(monkeypatch, tmp_path):
+    """Serve one page with an ETag and record request headers"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=PAGE, headers={"ETag": '"v1"'})
+
+    manager = HttpClientManager(10, 2, 5, 5, http2=False)
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    cache = ResponseCache(DiskCacheStore(str(tmp_path)))
+    monkeypatch.setattr(bs4_module, "http_client", manager)
+    monkeypatch.setattr(bs4_module, "response_cache", cache)
+    return requests, cache
+
+
+def test_conditional_headers():
+    """Test validators become conditional request headers"""
+    entry = CacheEntry(etag='"abc"', last_modified="Mon, 19 Jan 2026 10:00:00 GMT")
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 19 Jan 2026 10:00:00 GMT",
+    }
+    assert CacheEntry().conditional_headers() == {}
+
+
+@pytest.mark.asyncio
+async def test_not_modified_short_circuits(fake_site):
+    """Test a saved run's ETag turns the next fetch into a 304 skip"""
+    requests, cache = fake_site
+    scraper = IndiaKeralaLotteryScraper()
+
+    await scraper.fetch_html(scraper.url)
+    assert await cache.get(scraper.url) is None  # not persisted until saved
+
+    await scraper.mark_success()
+    assert (await cache.get(scraper.url)).etag == '"v1"'
+
+    with pytest.raises(PageUnchanged):
+        await scraper.fetch_html(scraper.url)
+    assert requests[-1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_identical_body_short_circuits(fake_site):
+    """Test a server ignoring validators is caught by the content hash"""
+    requests, cache = fake_site
+    scraper = IndiaKeralaLotteryScraper()
+
+    await scraper.fetch_html(scraper.url)
+    await scraper.mark_success()
+    await cache.set(scraper.url, CacheEntry(
+        etag=None, content_hash=(await cache.get(scraper.url)).content_hash
+    ))
+
+    with pytest.raises(PageUnchanged):
+        await scraper.fetch_html(scraper.url)
+    assert "If-None-Match" not in requests[-1].headers
+
+
+
+@pytest.mark.asyncio
+async def test_batch_member_that_failed_to_save_refetches(fake_site):
+    """Test validators are per member: a failed member is not handed the other's 304"""
+    requests, cache = fake_site
+    saved, failed = IndiaKeralaLotteryScraper(), IndiaKeralaLotteryScraper()
+    saved.slug, failed.slug = "in-kerala-lottery", "in-kerala-lottery-2"
+
+    first = await saved.fetch_batch([saved, failed])
+    assert first == {saved.slug: PAGE, failed.slug: PAGE}
+    await saved.mark_success()  # failed's save raised, so it never marks success
+
+    second = await saved.fetch_batch([saved, failed])
+    assert "If-None-Match" not in requests[-1].headers
+    assert isinstance(second[saved.slug], PageUnchanged)
+    assert second[failed.slug] == PAGE
+
+    await failed.mark_success()
+    third = await saved.fetch_batch([saved, failed])
+    assert requests[-1].headers["If-None-Match"] == '"v1"'
+    assert all(isinstance(markup, PageUnchanged) for markup in third.values())
+
+@pytest.mark.asyncio
+async def test_disk_store_does_file_io_off_the_event_loop(monkeypatch, tmp_path):
+    """Test disk reads and writes run on the DB pool, not the loop thread"""
+    import threading
+
+    store = DiskCacheStore(str(tmp_path))
+    threads = []
+    read = store._read
+    monkeypatch.setattr(store, "_read", lambda url: threads.append(threading.current_thread().name) or read(url))
+
+    await store.set("https://example.com/", CacheEntry(etag='"v1"'))
+    assert (await store.get("https://example.com/")).etag == '"v1"'
+    assert threads and threads[0].startswith("db")
@@ -0,0 +1,71 @@
+import uuid
+from datetime import date
+from sqlalchemy.dialects import postgresql
+from asia_scraper.database.writer import bulk_insert_results, build_insert
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeSession:
+    """Records executed statements; pretends every other row already exists"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        batch_size = len(stmt._multi_values[0])
+        return FakeResult([(uuid.uuid4(),) for _ in range(0, batch_size, 2)])
+
+
+def make_row(lottery_id, day):
+    return {
+        "lotteryId": lottery_id,
+        "drawDate": date(2026, 1, day),
+        "numbers": {"main": [1, 2, 3], "bonus": []},
+        "jackpot": None,
+        "currency": "SGD",
+        "winners": None,
+    }
+
+
+def test_build_insert_uses_on_conflict():
+    """Test the batch statement skips existing draws and returns ids"""
+    stmt = build_insert([make_row(uuid.uuid4(), 1), make_row(uuid.uuid4(), 2)])
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert 'ON CONFLICT ("lotteryId", "drawDate") DO NOTHING' in sql
+    assert "RETURNING result.id" in sql
+    assert sql.count("VALUES") == 1
+
+
+def test_bulk_insert_batches_and_counts():
+    """Test rows are chunked and inserted/skipped counts add up"""
+    lottery_id = uuid.uuid4()
+    db = FakeSession()
+
+    summary = bulk_insert_results(db, [make_row(lottery_id, d) for d in range(1, 6)], batch_size=2)
+
+    assert len(db.statements) == 3
+    assert summary.inserted == 3  # 1 + 1 + 1 from the fake session
+    assert summary.skipped == 2
+    assert summary.total == 5
+
+
+def test_bulk_insert_collapses_duplicates_in_input():
+    """Test the same draw twice in one page is only sent once"""
+    lottery_id = uuid.uuid4()
+    db = FakeSession()
+
+    summary = bulk_insert_results(db, [make_row(lottery_id, 1), make_row(lottery_id, 1)])
+
+    assert len(db.statements) == 1
+    assert len(db.statements[0]._multi_values[0]) == 1
+    assert summary.inserted == 1
+    assert summary.skipped == 1
@@ -1,5 +1,5 @@
 import pytest
-from src.services.scheduler import parse_cron_expression
+from asia_scraper.services.scheduler import parse_cron_expression
 
 
 def test_parse_cron_simple():
@@ -45,3 +45,41 @@ def test_parse_cron_invalid():
     
     with pytest.raises(ValueError):
         parse_cron_expression("0 0 * * * *")  # Too many parts
+
+
+def test_select_countries():
+    """Test SCRAPER_COUNTRIES style filtering of scheduled countries"""
+    from asia_scraper.config.countries import ASIAN_COUNTRIES, select_countries
+    
+    assert select_countries(ASIAN_COUNTRIES, "") == ASIAN_COUNTRIES
+    
+    selected = select_countries(ASIAN_COUNTRIES, "sg, jp")
+    assert [country.code for country in selected] == ["SG", "JP"]
+
+
+@pytest.mark.asyncio
+async def test_stale_jobs_pruned_once_the_store_is_loaded(monkeypatch):
+    """Test jobs from an old grouping go, and the prune waits for the scheduler to start"""
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+    from asia_scraper.services import scheduler as scheduler_module
+
+    scheduler = AsyncIOScheduler(timezone="UTC")
+    monkeypatch.setattr(scheduler_module, "scheduler", scheduler)
+    # As persisted by an earlier layout: toto and 4d ran alone, then with a third member,
+    # then under an id in config order; and another region's batch shares the store
+    for job_id in ("scraper_sg-toto", "scraper_sg-4d", "scraper_my-magnum-4d",
+                   "batch_sg-toto+sg-4d+sg-pools-extra", "batch_sg-toto+sg-4d", "batch_mx-melate+mx-chispazo"):
+        scheduler.add_job(print, "interval", hours=1, id=job_id)
+
+    scheduler_module.schedule_batch(["sg-toto", "sg-4d"], ["0 18 * * 1,4", "0 18 * * 3,6"])
+    scheduler_module.prune_stale_jobs([["sg-toto", "sg-4d"]], ["sg-toto", "sg-4d", "my-magnum-4d"])
+    # Not visible to prune until the store starts
+    assert scheduler.get_job("batch_sg-toto+sg-4d") and scheduler.get_job("batch_sg-toto+sg-4d+sg-pools-extra")
+
+    scheduler.start(paused=True)
+    try:
+        assert sorted(job.id for job in scheduler.get_jobs()) == [
+            "batch_mx-melate+mx-chispazo", "batch_sg-4d+sg-toto", "scraper_my-magnum-4d",
+        ]
+    finally:
+        scheduler.shutdown(wait=False)
@@ -1,5 +1,5 @@
 import pytest
-from src.scrapers import get_scraper_by_slug, get_all_scraper_slugs, SCRAPER_REGISTRY
+from asia_scraper.scrapers import get_scraper_by_slug, get_all_scraper_slugs, SCRAPER_REGISTRY
 
 
 def test_scraper_registry_completeness():
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from asia_scraper.database import session
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        # Existing databases: the drizzle tables and a scraper table from before new columns
+        conn.execute(text('CREATE TABLE lottery (id CHAR(32) PRIMARY KEY, name TEXT NOT NULL)'))
+        conn.execute(text('CREATE TABLE result (id CHAR(32) PRIMARY KEY)'))
+        conn.execute(text('CREATE TABLE scraper_job (id INTEGER PRIMARY KEY, status VARCHAR(20) NOT NULL)'))
+    monkeypatch.setattr(session, "engine", engine)
+    return engine
+
+
+def columns(engine, table):
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def test_missing_columns_only_added_to_scraper_tables(engine):
+    """Test scraper_job gains new columns while drizzle-owned lottery/result are left alone"""
+    session.add_missing_columns()
+
+    assert {"stageTimings", "bytesFetched", "errorMessage"} <= columns(engine, "scraper_job")
+    assert columns(engine, "lottery") == {"id", "name"}
+    assert columns(engine, "result") == {"id"}
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from src.scrapers.countries.singapore import SingaporeTOTOScraper, Singapore4DScraper
+from asia_scraper.scrapers.countries.singapore import SingaporeTOTOScraper, Singapore4DScraper
 
 
 @pytest.mark.asyncio
@@ -26,7 +26,7 @@ async def test_4d_scraper_initialization():
 @pytest.mark.asyncio
 async def test_toto_result_structure():
     """Test TOTO result has correct structure"""
-    from src.scrapers.base.base_scraper import ScrapedResult
+    from asia_scraper.scrapers.base.base_scraper import ScrapedResult
     
     # TOTO draws 6 numbers + 1 additional
     result = ScrapedResult(
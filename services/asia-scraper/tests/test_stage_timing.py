@@ -0,0 +1,78 @@
+import asyncio
+import time
+from datetime import date
+import pytest
+from asia_scraper.scrapers.base.base_scraper import BaseScraper, ScrapedResult
+from asia_scraper.utils.timing import FETCH, PARSE, SAVE, VALIDATE, StageTimer, stage_percentiles
+
+
+class SlowScraper(BaseScraper):
+    """Spends 20 ms fetching, then yields two draws"""
+
+    async def scrape(self):
+        return [r async for r in self.iter_results()]
+
+    async def iter_results(self):
+        with self.timings.stage(FETCH):
+            await asyncio.sleep(0.02)
+        yield ScrapedResult(draw_date=date(2024, 1, 1), winning_numbers=[1, 2, 3])
+        yield ScrapedResult(draw_date=date(2024, 1, 2), winning_numbers=[4, 4])
+
+
+def test_nested_stages_are_not_counted_twice():
+    """Test an inner stage's time is excluded from the enclosing stage"""
+    timer = StageTimer()
+    with timer.stage(SAVE):
+        time.sleep(0.01)
+        with timer.stage(FETCH):
+            time.sleep(0.03)
+
+    assert timer.stages_ms[FETCH] >= 30
+    assert 10 <= timer.stages_ms[SAVE] < timer.stages_ms[FETCH]
+
+
+def test_timed_iter_books_producer_time_only():
+    """Test only the producer's work counts, not what the consumer does per item"""
+    timer = StageTimer()
+
+    def parser():
+        for i in range(3):
+            time.sleep(0.005)
+            yield i
+
+    with timer.stage(SAVE):
+        for _ in timer.timed_iter(parser(), PARSE, count_as="parsed"):
+            time.sleep(0.01)
+
+    assert timer.rows == {"parsed": 3}
+    assert timer.stages_ms[PARSE] >= 15
+    assert timer.stages_ms[SAVE] >= 30
+    assert timer.stages_ms[PARSE] < timer.stages_ms[SAVE]
+
+
+@pytest.mark.asyncio
+async def test_stream_records_stage_breakdown():
+    """Test stream() splits fetch, parse and validate and counts rows"""
+    scraper = SlowScraper({"name": "slow"})
+
+    results = await scraper.execute()
+    breakdown = scraper.timings.breakdown()
+
+    assert len(results) == 1
+    assert breakdown["rows"] == {"parsed": 2, "valid": 1}
+    assert breakdown["stages"][FETCH] >= 20
+    assert breakdown["stages"][PARSE] < breakdown["stages"][FETCH]
+    assert VALIDATE in breakdown["stages"]
+
+
+def test_stage_percentiles_skip_jobs_without_timings():
+    """Test percentiles ignore old job rows and stages a job never reached"""
+    breakdowns = [None] + [{"stages": {"fetch": float(ms), "save": 1.0}} for ms in range(1, 101)]
+    breakdowns.append({"stages": {"fetch": 500.0}})
+
+    stats = stage_percentiles(breakdowns)
+
+    assert stats["jobs"] == 101
+    assert list(stats["stages"]) == ["fetch", "save"]
+    assert stats["stages"]["fetch"]["p50"] == 50.0
+    assert stats["stages"]["save"]["p99"] == 1.0
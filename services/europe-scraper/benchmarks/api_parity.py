@@ -0,0 +1,112 @@
+"""
+Check a lottery's JSON API path against its browser path, offline
+
+api_discovery keeps the rendered page and the JSON response it matched
+as a fixture pair (``benchmarks/fixtures/api/<slug>.html`` and
+``.json``). Both go through the scraper's own parse_results: the page via
+a FixtureDriver as a Selenium scrape would read it, the response via the
+slug's ApiSource as ApiScraper would. Any draw the two disagree on is
+listed and the run exits 1, so a lottery is switched to "type": "api"
+only once this passes.
+
+Usage:
+    python -m benchmarks.api_parity                 # every slug with a fixture pair
+    python -m benchmarks.api_parity uk-national-lottery
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from benchmarks.fixture_driver import FixtureDriver
+from benchmarks.harness import FIXTURES
+from europe_scraper.scrapers import SCRAPER_REGISTRY
+from europe_scraper.scrapers.base.api_source import ApiSource, load_api_source, read_draws
+from europe_scraper.scrapers.base.selenium_scraper import RenderedPage, SeleniumScraper
+
+API_FIXTURES = FIXTURES / "api"
+
+
+def _comparable(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Dates and amounts compare by their printed form
+    return [json.loads(json.dumps(result, default=str, sort_keys=True)) for result in results]
+
+
+def differences(page_results: Sequence[Dict], api_results: Sequence[Dict]) -> List[str]:
+    """
+    Where two parses of the same draws disagree
+
+    Returns:
+        One line per differing draw count or field, empty when identical
+    """
+    page_results, api_results = _comparable(page_results), _comparable(api_results)
+    problems = []
+    if len(page_results) != len(api_results):
+        problems.append(f"{len(page_results)} draws from the page, {len(api_results)} from the API")
+    for index, (page, api) in enumerate(zip(page_results, api_results)):
+        for key in sorted(set(page) | set(api)):
+            if page.get(key) != api.get(key):
+                problems.append(f"draw {index} {key}: page {page.get(key)!r}, api {api.get(key)!r}")
+    return problems
+
+
+def parity(scraper: SeleniumScraper, page_html: str, payload: Any, source: ApiSource) -> List[str]:
+    """
+    Parse one fixture pair both ways
+
+    Args:
+        scraper: The lottery's Selenium scraper
+        page_html: Rendered page
+        payload: Decoded API response recorded with it
+        source: The slug's API source
+
+    Returns:
+        differences() of the two parses
+    """
+    driver = FixtureDriver(page_html, scraper.url)
+    page = RenderedPage(scraper.url, scraper.extract_draws(driver))
+    api = RenderedPage(scraper.url, read_draws(payload, source, scraper.latest_draws))
+    return differences(list(scraper.parse_results(page)), list(scraper.parse_results(api)))
+
+
+def check(slug: str, fixtures: Path = API_FIXTURES, source: Optional[ApiSource] = None) -> List[str]:
+    """Compare both paths for slug on its fixture pair"""
+    source = source or load_api_source(slug)
+    if source is None:
+        return [f"no API source; run python -m europe_scraper.scrapers.base.api_discovery {slug}"]
+    page_path, payload_path = fixtures / f"{slug}.html", fixtures / f"{slug}.json"
+    if not page_path.exists() or not payload_path.exists():
+        return [f"no fixture pair in {fixtures}"]
+    scraper_class = SCRAPER_REGISTRY.get(slug)
+    if scraper_class is None or not issubclass(scraper_class, SeleniumScraper):
+        return ["not a Selenium scraper; only those have an API path"]
+    scraper = scraper_class(slug)
+    payload = json.loads(payload_path.read_text(encoding="utf-8"))
+    return parity(scraper, page_path.read_text(encoding="utf-8"), payload, source)
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compare API and browser parses on recorded fixture pairs")
+    parser.add_argument("slugs", nargs="*", help="Lottery slugs (default: every fixture pair)")
+    parser.add_argument("--fixtures", type=Path, default=API_FIXTURES)
+    args = parser.parse_args()
+
+    slugs = args.slugs or sorted(
+        path.stem for path in args.fixtures.glob("*.json") if path.stem in SCRAPER_REGISTRY
+    )
+    if not slugs:
+        sys.exit(f"No fixture pairs in {args.fixtures}")
+    failed = False
+    for slug in slugs:
+        problems = check(slug, args.fixtures)
+        print(f"{slug}: {'differs' if problems else 'identical'}")
+        for problem in problems:
+            print(f"  {problem}")
+        failed = failed or bool(problems)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+WebDriver stand-in that serves a fixture page from lxml
+
+Supports find_element(s) by class name, id, tag name or XPath, ``.text``,
+get_attribute() and the bulk draw extraction script, so the draws
+SeleniumScraper.extract_draws() reads are taken from recorded HTML
+offline and parse_results runs on them as on a live page.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import lxml.html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from europe_scraper.scrapers.base.selenium_scraper import EXTRACT_DRAWS_SCRIPT
+
+
+def _xpath(by: str, value: str) -> str:
+    if by == By.CLASS_NAME:
+        return f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+    if by == By.ID:
+        return f".//*[@id='{value}']"
+    if by == By.TAG_NAME:
+        return f".//{value}"
+    if by == By.XPATH:
+        return value
+    raise NotImplementedError(f"Fixture driver does not support locator {by!r}")
+
+
+def _follow(roots: List, path: Sequence[Sequence[str]]) -> List:
+    for by, value in path:
+        roots = [found for root in roots for found in root.xpath(_xpath(by, value))]
+    return roots
+
+
+def _read(element, attribute: Optional[str]) -> Optional[str]:
+    if attribute:
+        return element.get(attribute)
+    return " ".join(element.text_content().split())
+
+
+class FixtureElement:
+    """WebElement stand-in wrapping an lxml element"""
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def text(self) -> str:
+        return " ".join(self._element.text_content().split())
+
+    def get_attribute(self, name: str):
+        return self._element.get(name)
+
+    def find_elements(self, by: str = By.ID, value: str = None) -> List["FixtureElement"]:
+        return [FixtureElement(el) for el in self._element.xpath(_xpath(by, value))]
+
+    def find_element(self, by: str = By.ID, value: str = None) -> "FixtureElement":
+        found = self._element.xpath(_xpath(by, value))
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return FixtureElement(found[0])
+
+
+class FixtureDriver(FixtureElement):
+    """WebDriver stand-in with a fixture page already loaded"""
+
+    def __init__(self, html: str, url: str = "fixture://"):
+        super().__init__(lxml.html.fromstring(html))
+        self.page_source = html
+        self.current_url = url
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+    def implicitly_wait(self, seconds: float) -> None:
+        pass
+
+    def execute_script(self, script: str, *args) -> List[Dict]:
+        """EXTRACT_DRAWS_SCRIPT evaluated in Python; no other script is supported"""
+        if script != EXTRACT_DRAWS_SCRIPT:
+            raise NotImplementedError("Fixture driver only runs EXTRACT_DRAWS_SCRIPT")
+        draw_path, fields, limit = args
+        draws = _follow([self._element], draw_path)[:limit]
+        rows = []
+        for draw in draws:
+            row = {}
+            for name, (path, many, attribute) in fields.items():
+                found = _follow([draw], path)
+                if many:
+                    row[name] = [_read(element, attribute) for element in found]
+                else:
+                    row[name] = _read(found[0], attribute) if found else None
+            rows.append(row)
+        return rows
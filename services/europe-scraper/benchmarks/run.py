@@ -0,0 +1,50 @@
+"""
+Offline benchmark of every implemented scraper in SCRAPER_REGISTRY
+
+Usage:
+    python -m benchmarks.run                  # report
+    python -m benchmarks.run --save           # write benchmarks/baselines.json
+    python -m benchmarks.run --compare        # exit 1 on regressions
+    python -m benchmarks.run uk-national-lottery --rounds 50
+
+Selenium scrapers parse the draws extracted from a FixtureDriver built
+from the recorded page, BS4 scrapers parse the page through parse_html(), and JSON fixtures are
+decoded and passed to parse_results() as-is. latest_draws is lifted so
+the whole fixture is parsed, as a backfill would. Nothing touches the
+network, Chrome or the database.
+"""
+
+import json
+from benchmarks.fixture_driver import FixtureDriver
+from benchmarks.harness import Measurement, fixture_for, main, measure
+from europe_scraper.scrapers import SCRAPER_REGISTRY, get_scraper_by_slug
+from europe_scraper.scrapers.base.selenium_scraper import RenderedPage, SeleniumScraper
+
+# Placeholder parsers that return no draws yet; they rejoin the default
+# run (and get baselines) once they parse something
+STUB_SCRAPERS = {"uk-thunderball"}
+
+
+def bench_scraper(slug: str, rounds: int) -> Measurement:
+    """Benchmark one scraper on its fixture (runs in a worker process)"""
+    scraper = get_scraper_by_slug(slug)
+    scraper.latest_draws = None
+    fixture = fixture_for(slug)
+    content = fixture.read_text(encoding="utf-8")
+
+    def load():
+        if fixture.suffix == ".json":
+            return json.loads(content)
+        if isinstance(scraper, SeleniumScraper):
+            driver = FixtureDriver(content, scraper.url)
+            return RenderedPage(scraper.url, scraper.extract_draws(driver))
+        return scraper.parse_html(content)
+
+    def parse() -> int:
+        return sum(1 for _ in scraper.parse_results(load()))
+
+    return measure(slug, fixture, parse, rounds)
+
+
+if __name__ == "__main__":
+    main([slug for slug in SCRAPER_REGISTRY if slug not in STUB_SCRAPERS], bench_scraper)
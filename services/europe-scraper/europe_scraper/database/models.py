@@ -1,7 +1,7 @@
 """Database models matching existing Drizzle schema"""
 
 import uuid
-from sqlalchemy import Column, Integer, String, Boolean, JSON, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Boolean, JSON, DateTime, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -43,6 +43,11 @@ class Result(Base):
     winners = Column(JSON)  # [{"tier": 1, "prize": 1000000, "count": 1}]
     createdAt = Column("createdAt", DateTime, server_default=func.now())
     
+    __table_args__ = (
+        # One row per draw; target of ON CONFLICT in the batched writer
+        Index("result_lottery_draw_unique", "lotteryId", "drawDate", unique=True),
+    )
+    
     def __repr__(self) -> str:
         return f"<Result lottery_id={self.lotteryId} date={self.drawDate}>"
 
@@ -53,14 +58,22 @@ class ScraperJob(Base):
     
     id = Column(Integer, primary_key=True)
     lotteryId = Column("lotteryId", UUID(as_uuid=True), ForeignKey("lottery.id"), nullable=False)
-    status = Column(String(20), nullable=False)  # pending, running, success, failed
+    status = Column(String(20), nullable=False)  # pending, running, success, unchanged, failed
     startedAt = Column("startedAt", DateTime)
     completedAt = Column("completedAt", DateTime)
     errorMessage = Column("errorMessage", Text)
     resultsCount = Column("resultsCount", Integer, default=0)
     executionTimeMs = Column("executionTimeMs", Integer)
+    stageTimings = Column("stageTimings", JSON)  # {"stages": {"fetch": ms, ...}, "rows": {...}, "bytesFetched": n}
+    bytesFetched = Column("bytesFetched", Integer)
     createdAt = Column("createdAt", DateTime, server_default=func.now())
     
+    __table_args__ = (
+        # Keyset pagination of /jobs, newest first, across and within lotteries
+        Index("scraper_job_created_id", "createdAt", "id"),
+        Index("scraper_job_lottery_created_id", "lotteryId", "createdAt", "id"),
+    )
+    
     def __repr__(self) -> str:
         return f"<ScraperJob {self.id}: {self.status}>"
 
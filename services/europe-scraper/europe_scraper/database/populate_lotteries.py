@@ -1,10 +1,12 @@
 """Initialize database with European lottery metadata"""
 
 from sqlalchemy.exc import IntegrityError
-from src.database.session import get_db
-from src.database.models import Lottery
-from src.config.countries import ALL_COUNTRIES
-from src.utils.logger import get_logger
+from europe_scraper.database.session import get_db
+from europe_scraper.database.models import Lottery
+from europe_scraper.database.lottery_cache import lottery_cache
+from europe_scraper.utils.api_cache import LOTTERIES, api_cache
+from europe_scraper.config.countries import ALL_COUNTRIES
+from europe_scraper.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -49,6 +51,11 @@ def populate_lotteries():
                     logger.info("Added new lottery", slug=slug)
         
         db.commit()
+        
+        # Scrapers in this process should see new or re-activated lotteries
+        lottery_cache.refresh()
+        api_cache.invalidate(LOTTERIES)
+        
         logger.info("Lottery population complete", 
                    added=added_count, 
                    updated=updated_count,
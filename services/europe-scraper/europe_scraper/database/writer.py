@@ -0,0 +1,90 @@
+"""
+Batched result writer
+
+Inserts scraped draws with one multi-row INSERT per batch instead of a
+duplicate lookup plus an INSERT per row. Existing draws are skipped by
+the unique index on result("lotteryId", "drawDate").
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from europe_scraper.database.models import Result
+
+# Rows per INSERT; at 7 bind parameters per row this stays well below
+# the 65535 parameter limit of the Postgres protocol.
+DEFAULT_BATCH_SIZE = 1000
+
+
+@dataclass
+class WriteSummary:
+    """Outcome of a batched result write"""
+    inserted: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.skipped
+
+
+def build_insert(rows: List[Dict[str, Any]]):
+    """Build INSERT ... ON CONFLICT DO NOTHING RETURNING id for a batch"""
+    return (
+        insert(Result)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Result.lotteryId, Result.drawDate])
+        .returning(Result.id)
+    )
+
+
+def bulk_insert_results(
+    db: Session,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    commit_batches: bool = False,
+) -> WriteSummary:
+    """
+    Insert result rows in batches, skipping draws that already exist
+
+    Args:
+        db: Database session (the caller commits, unless commit_batches)
+        rows: Dicts keyed by Result column names; each must carry
+            lotteryId and drawDate
+        batch_size: Maximum rows per INSERT statement
+        commit_batches: Commit after each batch, so the rows written stay
+            written if a later batch (or the row source) fails
+
+    Returns:
+        WriteSummary with inserted and skipped counts
+    """
+    summary = WriteSummary()
+    seen = set()
+    batch: List[Dict[str, Any]] = []
+
+    for row in rows:
+        key = (row["lotteryId"], row["drawDate"])
+        if key in seen:
+            # Same draw twice in one page - Postgres would skip it anyway
+            summary.skipped += 1
+            continue
+        seen.add(key)
+        batch.append(row)
+
+        if len(batch) >= batch_size:
+            _flush(db, batch, summary, commit_batches)
+            batch = []
+
+    if batch:
+        _flush(db, batch, summary, commit_batches)
+
+    return summary
+
+
+def _flush(db: Session, batch: List[Dict[str, Any]], summary: WriteSummary, commit: bool) -> None:
+    """Execute one batch (and commit it if asked) and fold RETURNING rows into the summary"""
+    inserted = len(db.execute(build_insert(batch)).fetchall())
+    if commit:
+        db.commit()
+    summary.inserted += inserted
+    summary.skipped += len(batch) - inserted
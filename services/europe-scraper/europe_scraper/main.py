@@ -0,0 +1,98 @@
+"""Main entry point for Europe lottery scraper"""
+
+import sys
+from europe_scraper.database.session import init_db
+from europe_scraper.database.lottery_cache import lottery_cache
+from europe_scraper.services.scheduler import prune_stale_jobs, start_scheduler, schedule_batch, schedule_scraper, stop_scheduler
+from europe_scraper.scrapers import SCRAPER_REGISTRY
+from europe_scraper.scrapers.base.batch import batch_groups
+from europe_scraper.config.countries import ALL_COUNTRIES, select_countries
+from europe_scraper.config.settings import settings
+from europe_scraper.utils.logger import get_logger
+from europe_scraper.api.main import app
+import uvicorn
+
+logger = get_logger(__name__)
+
+
+def init_database():
+    """Initialize database and create tables"""
+    logger.info("Initializing database")
+    init_db()
+    logger.info("Database initialized")
+    
+    # Warm the slug -> lottery cache before the first scrape fires
+    lottery_cache.refresh()
+
+
+def load_scrapers():
+    """Load and schedule all scrapers from config"""
+    logger.info("Loading scrapers")
+    
+    scheduled_count = 0
+    lotteries = [
+        lottery
+        for country in select_countries(ALL_COUNTRIES, settings.SCRAPER_COUNTRIES)
+        for lottery in country.lotteries
+    ]
+    # Lotteries read from the same page or site share one job and one fetch
+    batches = []
+    for group in batch_groups(lotteries, SCRAPER_REGISTRY):
+        schedules = {lottery['slug']: lottery['schedule'] for lottery in group}
+        
+        try:
+            if len(schedules) == 1:
+                [(slug, cron)] = schedules.items()
+                schedule_scraper(slug, cron)
+                loaded = [slug]
+            else:
+                loaded = schedule_batch(list(schedules), list(schedules.values()))
+                if len(loaded) > 1:
+                    batches.append(loaded)
+            for slug in loaded:
+                logger.info("Loaded scraper", slug=slug, cron=schedules[slug])
+            scheduled_count += len(loaded)
+        except Exception as e:
+            logger.error("Failed to load scraper", slugs=list(schedules), error=str(e))
+    
+    # Jobs persisted under an earlier grouping would otherwise keep firing
+    prune_stale_jobs(batches, [lottery['slug'] for lottery in lotteries])
+    
+    logger.info("Scrapers loaded", count=scheduled_count)
+
+
+def start_api_server():
+    """Start FastAPI server"""
+    logger.info("Starting API server", port=settings.API_PORT)
+    uvicorn.run(app, host="0.0.0.0", port=settings.API_PORT, log_level="info")
+
+
+def main():
+    """Main entry point"""
+    logger.info("=== Europe Lottery Scraper Starting ===")
+    
+    try:
+        # Initialize database
+        init_database()
+        
+        # Start scheduler
+        start_scheduler()
+        
+        # Load all scrapers
+        load_scrapers()
+        
+        # Start API server (blocking)
+        start_api_server()
+        
+    except KeyboardInterrupt:
+        logger.info("Shutting down...")
+        stop_scheduler()
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Fatal error", error=str(e), exc_info=True)
+        stop_scheduler()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 """Scraper registry for all European countries"""
 
-from src.scrapers.countries.uk import UKNationalLotteryScraper, UKThunderballScraper
-from src.scrapers.countries.spain import SpainPrimitivaScraper
+from europe_scraper.config.countries import get_lottery_config
+from europe_scraper.scrapers.base.api_scraper import api_variant
+from europe_scraper.scrapers.countries.uk import UKNationalLotteryScraper, UKThunderballScraper
+from europe_scraper.scrapers.countries.spain import SpainPrimitivaScraper
 
 # Scraper registry mapping slug -> scraper class
 SCRAPER_REGISTRY = {
@@ -32,9 +34,11 @@ SCRAPER_REGISTRY = {
 
 
 def get_scraper_by_slug(slug: str):
-    """Get scraper instance by slug"""
+    """Get scraper instance by slug; "type": "api" lotteries fetch from their recorded JSON API"""
     scraper_class = SCRAPER_REGISTRY.get(slug)
     if scraper_class:
+        if (get_lottery_config(slug) or {}).get("type") == "api":
+            scraper_class = api_variant(scraper_class)
         return scraper_class(slug)
     return None
 
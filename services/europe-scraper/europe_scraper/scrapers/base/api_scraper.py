@@ -0,0 +1,78 @@
+"""Direct JSON API fetch for Selenium scrapers whose page loads its draws over XHR"""
+
+import json
+from typing import Any, Dict, Sequence, Type
+from europe_scraper.scrapers.base.api_source import ApiSource, load_api_source, read_draws
+from europe_scraper.scrapers.base.base_scraper import BaseScraper
+from europe_scraper.scrapers.base.selenium_scraper import RenderedPage, SeleniumScraper
+from europe_scraper.utils.http_client import http_client
+
+
+class ApiScraper(SeleniumScraper):
+    """
+    Reads a Selenium scraper's draws from its JSON API instead of Chrome
+
+    Mixed in ahead of the lottery's own scraper class (see api_variant)
+    when its config says "type": "api". The ApiSource maps the response
+    onto the scraper's draw_fields, so scrape() returns the same
+    RenderedPage a page load would and parse_results runs unchanged.
+    Archive pages for backfill are still rendered in the browser.
+    """
+
+    def __init__(self, slug: str):
+        super().__init__(slug)
+        self.api_source: ApiSource = load_api_source(slug)
+        if self.api_source is None:
+            raise ValueError(f"No API source found for lottery slug: {slug}")
+
+    def fetch_json(self) -> Any:
+        """
+        Send the API request over the shared connection pool
+
+        Returns:
+            Decoded JSON response
+        """
+        source = self.api_source
+        try:
+            response = http_client.request(source.method, source.url, headers=source.headers, content=source.body)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.error("Failed to fetch API", url=source.url, error=str(e))
+            raise
+
+        self.timings.fetched(len(response.content))
+        return response.json()
+
+    def scrape(self) -> RenderedPage:
+        """
+        Fetch the draws from the lottery's JSON API
+
+        Returns:
+            Rendered page built from the response; its fragment is the draws
+            themselves, so unchanged results are fingerprinted as such
+        """
+        self.logger.info("Fetching API", url=self.api_source.url)
+        draws = read_draws(self.fetch_json(), self.api_source, self.latest_draws)
+        return RenderedPage(url=self.url, draws=draws, fragment=json.dumps(draws, sort_keys=True))
+
+    def fetch_batch(self, scrapers: Sequence[BaseScraper]) -> Dict[str, Any]:
+        """Fetch this lottery's API only; the page render is not shared"""
+        return BaseScraper.fetch_batch(self, scrapers)
+
+
+def api_variant(scraper_class: Type[SeleniumScraper]) -> Type[ApiScraper]:
+    """
+    The scraper class with its page load replaced by the API fetch
+
+    Args:
+        scraper_class: Selenium scraper whose draw_fields the API source maps to
+
+    Returns:
+        Subclass of ApiScraper and scraper_class
+
+    Raises:
+        TypeError: scraper_class does not read draws through draw_fields
+    """
+    if not issubclass(scraper_class, SeleniumScraper):
+        raise TypeError(f"{scraper_class.__name__} is not a Selenium scraper; only those have an API variant")
+    return type(f"Api{scraper_class.__name__}", (ApiScraper, scraper_class), {})
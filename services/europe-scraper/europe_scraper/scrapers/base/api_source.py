@@ -0,0 +1,204 @@
+"""
+JSON API sources for browser-rendered lotteries
+
+Many results pages are an empty shell that fills in the draws from an
+XHR/JSON endpoint. Once that endpoint is known (see api_discovery), the
+draws can be fetched with one plain HTTP request instead of a Chrome
+page load. An ApiSource records the request and where each draw field
+sits in the response, and lives next to the country configs as
+``europe_scraper/config/api_sources/<slug>.json``:
+
+    {
+      "slug": "us-powerball",
+      "url": "https://example.com/api/draws?game=powerball",
+      "method": "GET",
+      "headers": {"Accept": "application/json"},
+      "draws": "data.draws",
+      "fields": {
+        "date": {"path": "drawDate", "date_format": "%m/%d/%Y"},
+        "main": {"path": "numbers.0:5"},
+        "powerball": {"path": "numbers.5"}
+      }
+    }
+
+Paths are dotted keys from the response (``draws``) or from one draw
+(``fields``); a number indexes a list and ``start:end`` slices it, and a
+list of paths reads several keys into one list (e.g. ball1..ball5). Field
+values come out as text, as the browser would have shown them, so the
+scraper's own parser reads API draws unchanged; date_format renders ISO
+dates in the page's format.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+API_SOURCES = Path(__file__).resolve().parents[2] / "config" / "api_sources"
+
+# A dotted path, or several read into one list
+FieldPath = Union[str, List[str]]
+
+
+@dataclass(frozen=True)
+class ApiField:
+    """
+    Where one draw field sits in a draw object
+
+    Attributes:
+        path: Dotted path from the draw object, or a list of them
+        date_format: strftime format to render an ISO date value in
+    """
+    path: FieldPath
+    date_format: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ApiSource:
+    """
+    JSON request that returns a lottery's draws
+
+    Attributes:
+        slug: Lottery slug
+        url: Endpoint URL
+        method: HTTP method
+        headers: Request headers the endpoint needs
+        body: Request body for POST endpoints
+        draws: Dotted path to the list of draws ("" when the response is the list)
+        newest_first: False when the endpoint lists the oldest draw first
+        fields: Draw field name to its location
+        discovered_from: Results page the request was recorded on
+    """
+    slug: str
+    url: str
+    fields: Dict[str, ApiField]
+    method: str = "GET"
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+    draws: str = ""
+    newest_first: bool = True
+    discovered_from: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ApiSource":
+        fields = {name: ApiField(**spec) for name, spec in data["fields"].items()}
+        return cls(**{**data, "fields": fields})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def api_source_path(slug: str, directory: Path = API_SOURCES) -> Path:
+    return directory / f"{slug}.json"
+
+
+def load_api_source(slug: str, directory: Path = API_SOURCES) -> Optional[ApiSource]:
+    """The slug's API source, None when none was generated"""
+    path = api_source_path(slug, directory)
+    if not path.exists():
+        return None
+    return ApiSource.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def save_api_source(source: ApiSource, directory: Path = API_SOURCES) -> Path:
+    """Write source to its config file, returning the path"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = api_source_path(source.slug, directory)
+    path.write_text(json.dumps(source.to_dict(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return path
+
+
+def resolve(value: Any, path: str) -> Any:
+    """
+    Follow a dotted path into decoded JSON
+
+    Returns:
+        The value found, None when any step is missing
+    """
+    for step in path.split(".") if path else ():
+        if isinstance(value, dict):
+            value = value.get(step)
+        elif isinstance(value, list) and ":" in step:
+            start, _, end = step.partition(":")
+            value = value[int(start) if start else None:int(end) if end else None]
+        elif isinstance(value, list) and step.lstrip("-").isdigit():
+            index = int(step)
+            value = value[index] if -len(value) <= index < len(value) else None
+        else:
+            return None
+        if value is None:
+            return None
+    return value
+
+
+def as_text(value: Any) -> Optional[str]:
+    """A JSON scalar as the page would show it"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return str(value)
+
+
+def parse_iso(text: str) -> Optional[datetime]:
+    """datetime from an ISO 8601 date or timestamp, None if it is not one"""
+    try:
+        return datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _render(value: Any, date_format: Optional[str]) -> Optional[str]:
+    text = as_text(value)
+    if text is not None and date_format:
+        parsed = parse_iso(text)
+        if parsed is not None:
+            return parsed.strftime(date_format)
+    return text
+
+
+def read_field(draw: Dict[str, Any], spec: ApiField) -> Any:
+    """One field of a draw object: text, a list of texts, or None"""
+    if isinstance(spec.path, list):
+        values = [resolve(draw, path) for path in spec.path]
+        return [_render(value, spec.date_format) for value in values if value is not None]
+    value = resolve(draw, spec.path)
+    if isinstance(value, list):
+        return [_render(item, spec.date_format) for item in value]
+    return _render(value, spec.date_format)
+
+
+def read_draws(payload: Any, source: ApiSource, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Draw rows from a decoded API response
+
+    Args:
+        payload: Decoded JSON response
+        source: Where the draws and their fields sit
+        limit: Newest draws to read, None for all
+
+    Returns:
+        One dict per draw mapping field names to text (lists for list
+        fields, None when absent), newest first
+
+    Raises:
+        ValueError: source.draws does not lead to a list
+    """
+    draws = resolve(payload, source.draws)
+    if not isinstance(draws, list):
+        raise ValueError(f"API response for {source.slug} has no draw list at {source.draws!r}")
+    if not source.newest_first:
+        draws = draws[::-1]
+    if limit is not None:
+        draws = draws[:limit]
+    return [
+        {name: read_field(draw, spec) for name, spec in source.fields.items()}
+        for draw in draws
+        if isinstance(draw, dict)
+    ]
+
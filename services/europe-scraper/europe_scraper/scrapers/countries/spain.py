@@ -1,23 +1,24 @@
 """Example scraper for Spain lotteries"""
 
-from typing import Dict, List
+from typing import Dict, Iterator
 from bs4 import BeautifulSoup
-from src.scrapers.base.bs4_scraper import BS4Scraper
-from src.utils.helpers import parse_european_date, extract_numbers
+from europe_scraper.scrapers.base.bs4_scraper import BS4Scraper
+from europe_scraper.utils.helpers import parse_european_date, extract_numbers
 
 
 class SpainPrimitivaScraper(BS4Scraper):
     """Scraper for La Primitiva (Spain)"""
 
-    def parse_results(self, soup: BeautifulSoup) -> List[Dict]:
+    fingerprint_selector = "div.resultado"
+    latest_draws = 10
+
+    def parse_results(self, soup: BeautifulSoup) -> Iterator[Dict]:
         """Parse La Primitiva results"""
-        results = []
-        
         try:
             # Example parsing logic (adjust based on actual HTML)
             result_rows = soup.find_all("div", class_="resultado")
             
-            for row in result_rows[:10]:  # Get last 10 draws
+            for row in result_rows[:self.latest_draws]:
                 try:
                     # Extract date
                     date_elem = row.find("span", class_="fecha")
@@ -36,7 +37,7 @@ class SpainPrimitivaScraper(BS4Scraper):
                         complement = [int(number_texts[6])] if len(number_texts) > 6 else []
                         reintegro = [int(number_texts[7])] if len(number_texts) > 7 else []
                     
-                    results.append({
+                    yield {
                         "draw_date": draw_date,
                         "numbers": {
                             "main": sorted(main_numbers),
@@ -44,7 +45,7 @@ class SpainPrimitivaScraper(BS4Scraper):
                             "reintegro": reintegro
                         },
                         "currency": "EUR"
-                    })
+                    }
                     
                 except Exception as e:
                     self.logger.warning("Failed to parse result row", error=str(e))
@@ -53,5 +54,3 @@ class SpainPrimitivaScraper(BS4Scraper):
         except Exception as e:
             self.logger.error("Failed to parse La Primitiva results", error=str(e))
             raise
-        
-        return results
@@ -0,0 +1,77 @@
+"""Example scraper implementations for UK lotteries"""
+
+from typing import Dict, List, Iterator
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from europe_scraper.scrapers.base.readiness import element_ready
+from europe_scraper.scrapers.base.selenium_scraper import Field, RenderedPage, SeleniumScraper
+from europe_scraper.utils.helpers import parse_european_date, extract_numbers
+
+
+class UKNationalLotteryScraper(SeleniumScraper):
+    """Scraper for UK National Lottery"""
+
+    fingerprint_selector = ".draw-result"
+    archive_url_template = "https://www.national-lottery.co.uk/results/lotto/draw-history?from={start}&to={end}"
+    draw_path = ((By.CLASS_NAME, "draw-result"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "draw-date")),
+        "balls": Field((By.CLASS_NAME, "balls"), (By.CLASS_NAME, "ball"), many=True),
+        "jackpot": Field((By.CLASS_NAME, "jackpot")),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "draw-result"), (By.CLASS_NAME, "balls"), (By.CLASS_NAME, "ball"))
+
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
+        """Parse UK National Lottery results"""
+        try:
+            for draw in page.draws:
+                try:
+                    draw_date = parse_european_date(draw["date"])
+                    
+                    if not draw_date or not draw["balls"]:
+                        continue
+                    
+                    balls = [int(ball) for ball in draw["balls"]]
+                    main_numbers = balls[:6]
+                    bonus_number = balls[6:7]
+                    jackpot = draw["jackpot"]
+                    
+                    yield {
+                        "draw_date": draw_date,
+                        "numbers": {
+                            "main": sorted(main_numbers),
+                            "bonus": bonus_number
+                        },
+                        "jackpot": jackpot,
+                        "currency": "GBP"
+                    }
+                    
+                except Exception as e:
+                    self.logger.warning("Failed to parse result element", error=str(e))
+                    continue
+            
+        except Exception as e:
+            self.logger.error("Failed to parse results", error=str(e))
+            raise
+
+
+class UKThunderballScraper(SeleniumScraper):
+    """Scraper for UK Thunderball"""
+
+    def parse_results(self, page: RenderedPage) -> List[Dict]:
+        """Parse UK Thunderball results"""
+        results = []
+        
+        try:
+            # Similar implementation to National Lottery
+            # Adjust selectors based on actual HTML structure
+            self.logger.info("Parsing Thunderball results")
+            
+            # Placeholder implementation
+            # TODO: Implement actual parsing logic
+            
+        except Exception as e:
+            self.logger.error("Failed to parse Thunderball results", error=str(e))
+            raise
+        
+        return results
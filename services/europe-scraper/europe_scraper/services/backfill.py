@@ -0,0 +1,250 @@
+"""
+Historical backfill over a scraper's archive pages
+
+Usage:
+    python -m europe_scraper.services.backfill uk-national-lottery --start 2015-01-01 --end 2024-12-31
+
+Monthly archive pages are fetched concurrently under the shared rate
+limit, and parsed draws are written in large ON CONFLICT batches.
+Finished months are checkpointed in scraper_config under
+``backfill:<slug>`` so an interrupted run resumes where it stopped.
+"""
+
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from sqlalchemy.dialects.postgresql import insert
+from europe_scraper.config.settings import settings
+from europe_scraper.database.lottery_cache import lottery_cache
+from europe_scraper.database.models import ScraperConfig
+from europe_scraper.database.session import get_db
+from europe_scraper.database.writer import bulk_insert_results
+from europe_scraper.scrapers import get_scraper_by_slug
+from europe_scraper.utils.logger import get_logger
+from europe_scraper.utils.rate_limit import RateLimiter
+
+logger = get_logger(__name__)
+
+# Shared by every backfill in the process so parallel runs stay polite
+rate_limiter = RateLimiter(settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_PERIOD)
+
+_active: set = set()
+_active_lock = threading.Lock()
+
+
+class BackfillError(Exception):
+    """Backfill cannot run for this slug"""
+
+
+def _key(slug: str) -> str:
+    return f"backfill:{slug}"
+
+
+def load_checkpoint(slug: str) -> Optional[Dict]:
+    """
+    Get the saved backfill progress for a slug
+
+    Args:
+        slug: Lottery slug
+
+    Returns:
+        Checkpoint dict or None if no backfill has run
+    """
+    db = get_db()
+    try:
+        row = db.query(ScraperConfig.value).filter_by(key=_key(slug)).first()
+    finally:
+        db.close()
+    return dict(row.value) if row else None
+
+
+def save_checkpoint(slug: str, checkpoint: Dict) -> None:
+    """
+    Upsert backfill progress for a slug
+
+    Args:
+        slug: Lottery slug
+        checkpoint: Progress to store
+    """
+    checkpoint = {**checkpoint, "updatedAt": datetime.utcnow().isoformat()}
+    stmt = insert(ScraperConfig).values(
+        key=_key(slug),
+        value=checkpoint,
+        description=f"Backfill progress for {slug}",
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ScraperConfig.key],
+        set_={"value": stmt.excluded.value, "updatedAt": datetime.utcnow()},
+    )
+
+    db = get_db()
+    try:
+        db.execute(stmt)
+        db.commit()
+    finally:
+        db.close()
+
+
+def is_running(slug: str) -> bool:
+    """Whether a backfill for slug is running in this process"""
+    return slug in _active
+
+
+def fetch_window(slug: str, url: str) -> List[Dict]:
+    """
+    Fetch and parse one archive page with a fresh scraper instance
+
+    Args:
+        slug: Lottery slug
+        url: Archive page URL
+
+    Returns:
+        Every draw parsed from the page
+    """
+    scraper = get_scraper_by_slug(slug)
+    scraper.latest_draws = None
+    try:
+        rate_limiter.wait()
+        raw_data = scraper.fetch_archive_page(url)
+        # Drain the parser while the page (or driver) is still held
+        return list(scraper.parse_results(raw_data))
+    finally:
+        scraper.cleanup()
+
+
+def run_backfill(
+    slug: str,
+    start: date,
+    end: date,
+    restart: bool = False,
+    concurrency: Optional[int] = None,
+) -> Dict:
+    """
+    Backfill draws for a slug between two dates
+
+    Args:
+        slug: Lottery slug
+        start: First draw date
+        end: Last draw date
+        restart: Ignore an existing checkpoint for the same range
+        concurrency: Archive pages fetched at once (default: from settings)
+
+    Returns:
+        Final checkpoint dict
+    """
+    scraper = get_scraper_by_slug(slug)
+    if not scraper:
+        raise BackfillError(f"No scraper found for slug: {slug}")
+    if not scraper.archive_url_template:
+        raise BackfillError(f"Scraper {slug} has no archive pages")
+
+    lottery = lottery_cache.get(slug)
+    if not lottery:
+        raise BackfillError(f"Lottery not found: {slug}")
+
+    with _active_lock:
+        if slug in _active:
+            raise BackfillError(f"Backfill already running for {slug}")
+        _active.add(slug)
+
+    try:
+        return _run(scraper, lottery.id, start, end, restart, concurrency or settings.BACKFILL_CONCURRENCY)
+    finally:
+        with _active_lock:
+            _active.discard(slug)
+
+
+def _run(scraper, lottery_id, start: date, end: date, restart: bool, concurrency: int) -> Dict:
+    """Fetch pending months, write draws in batches and checkpoint after each write"""
+    slug = scraper.slug
+    log = logger.bind(slug=slug)
+
+    checkpoint = load_checkpoint(slug)
+    same_range = checkpoint and checkpoint["start"] == start.isoformat() and checkpoint["end"] == end.isoformat()
+    if restart or not same_range:
+        checkpoint = {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "completed": [],
+            "failed": [],
+            "inserted": 0,
+            "skipped": 0,
+        }
+    checkpoint["status"] = "running"
+    checkpoint["failed"] = []
+
+    done = set(checkpoint["completed"])
+    pending = [(key, url) for key, url in scraper.archive_pages(start, end) if key not in done]
+    log.info("Starting backfill", pages=len(pending), resumed=len(done))
+    save_checkpoint(slug, checkpoint)
+
+    rows: List[Dict] = []
+    finished: List[str] = []
+
+    def flush() -> None:
+        db = get_db()
+        try:
+            summary = bulk_insert_results(db, rows, batch_size=settings.BACKFILL_BATCH_SIZE)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        checkpoint["inserted"] += summary.inserted
+        checkpoint["skipped"] += summary.skipped
+        checkpoint["completed"] = sorted(set(checkpoint["completed"]) | set(finished))
+        save_checkpoint(slug, checkpoint)
+        log.info("Backfill batch written", inserted=summary.inserted, skipped=summary.skipped,
+                 pages_done=len(checkpoint["completed"]))
+        rows.clear()
+        finished.clear()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"backfill-{slug}") as pool:
+        futures = {pool.submit(fetch_window, slug, url): key for key, url in pending}
+
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                log.error("Archive page failed", window=key, error=str(e))
+                checkpoint["failed"].append(key)
+                continue
+
+            rows.extend(scraper.result_rows(results, lottery_id))
+            finished.append(key)
+            if len(rows) >= settings.BACKFILL_BATCH_SIZE:
+                flush()
+
+    if rows or finished:
+        flush()
+
+    checkpoint["status"] = "partial" if checkpoint["failed"] else "complete"
+    save_checkpoint(slug, checkpoint)
+    log.info("Backfill finished", status=checkpoint["status"],
+             inserted=checkpoint["inserted"], failed=len(checkpoint["failed"]))
+    return checkpoint
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Backfill historical draws for a lottery")
+    parser.add_argument("slug", help="Lottery slug, e.g. uk-national-lottery")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="First draw date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="Last draw date (YYYY-MM-DD)")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress for this range")
+    parser.add_argument("--concurrency", type=int, default=None, help="Archive pages fetched at once")
+    args = parser.parse_args()
+
+    lottery_cache.refresh()
+    result = run_backfill(args.slug, args.start, args.end, restart=args.restart, concurrency=args.concurrency)
+    print(f"{args.slug}: {result['status']}, {result['inserted']} inserted, "
+          f"{result['skipped']} skipped, {len(result['failed'])} pages failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Prometheus metrics
+
+Served in the Prometheus text format at /metrics via prometheus_client,
+from this module's own registry. Counters and histograms are updated on
+the hot path. Gauges whose source already keeps the number (executor
+queues, DB and driver pools) are CallbackGauges read only when /metrics
+is scraped, so they cost nothing between scrapes.
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+FETCH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+registry = CollectorRegistry()
+
+
+class CallbackGauge(Collector):
+    """Gauge read from its source at scrape time"""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str],
+        collect: Callable[[], Iterable[Tuple[Sequence, float]]],
+        registry: CollectorRegistry = registry,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._source = collect
+        registry.register(self)
+
+    def describe(self) -> Iterator[GaugeMetricFamily]:
+        # Lets the registry check the name without reading the source
+        yield GaugeMetricFamily(self.name, self.help, labels=self.labels)
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        family = GaugeMetricFamily(self.name, self.help, labels=self.labels)
+        try:
+            values = list(self._source())
+        except Exception:
+            # A broken source must not take the whole endpoint down
+            values = []
+        for labelvalues, value in values:
+            family.add_metric([str(label) for label in labelvalues], value)
+        yield family
+
+
+JOB_DURATION = Histogram(
+    "scraper_job_duration_seconds", "Scrape job wall time", ("slug", "status"),
+    buckets=DURATION_BUCKETS, registry=registry,
+)
+STAGE_DURATION = Histogram(
+    "scraper_stage_duration_seconds", "Time per scrape stage", ("slug", "stage"),
+    buckets=DURATION_BUCKETS, registry=registry,
+)
+RESULTS_INSERTED = Counter(
+    "scraper_results_inserted_total", "Draws written to the result table", ("slug",), registry=registry
+)
+RESULTS_SKIPPED = Counter(
+    "scraper_results_skipped_total", "Draws skipped as already stored", ("slug",), registry=registry
+)
+JOB_FAILURES = Counter(
+    "scraper_job_failures_total", "Failed scrapes by exception class", ("slug", "error"), registry=registry
+)
+PAGE_BYTES = Counter(
+    "scraper_page_bytes_total", "Bytes transferred by browser page loads", ("slug",), registry=registry
+)
+PAGE_LOAD = Histogram(
+    "scraper_page_load_seconds", "Time driver.get() blocked per scrape", ("slug",),
+    buckets=FETCH_BUCKETS, registry=registry,
+)
+JOBS_RUNNING = Gauge("scraper_jobs_running", "Scrapes in progress", registry=registry)
+HTTP_FETCH_DURATION = Histogram(
+    "http_fetch_duration_seconds", "HTTP fetch latency per host", ("host",),
+    buckets=FETCH_BUCKETS, registry=registry,
+)
+HTTP_FETCH_BYTES = Counter(
+    "http_fetch_bytes_total", "Response body bytes fetched per host", ("host",), registry=registry
+)
+LOOP_LAG = Gauge("event_loop_lag_seconds", "Delay of the last event-loop wake-up probe", registry=registry)
+# Every probe, so stalls between two scrapes of /metrics are not lost
+LOOP_LAG_PROBES = Histogram(
+    "event_loop_lag_probe_seconds", "Delay of each event-loop wake-up probe",
+    buckets=LAG_BUCKETS, registry=registry,
+)
+
+
+def record_job(
+    slug: str,
+    status: str,
+    duration_s: float,
+    breakdown: Optional[Dict] = None,
+    inserted: int = 0,
+    skipped: int = 0,
+    error: Optional[BaseException] = None,
+) -> None:
+    """
+    Record a finished scrape job
+
+    Args:
+        slug: Lottery slug
+        status: Final job status (success, unchanged, failed)
+        duration_s: Job wall time in seconds
+        breakdown: StageTimer.breakdown() of the run, if any
+        inserted: Draws written
+        skipped: Draws already stored
+        error: Exception that failed the job
+    """
+    JOB_DURATION.labels(slug, status).observe(duration_s)
+    for stage, ms in (breakdown or {}).get("stages", {}).items():
+        STAGE_DURATION.labels(slug, stage).observe(ms / 1000)
+    pages = (breakdown or {}).get("pages")
+    if pages:
+        PAGE_LOAD.labels(slug).observe(pages["load_ms"] / 1000)
+        PAGE_BYTES.labels(slug).inc(pages.get("bytes", 0))
+    if inserted:
+        RESULTS_INSERTED.labels(slug).inc(inserted)
+    if skipped:
+        RESULTS_SKIPPED.labels(slug).inc(skipped)
+    if error is not None:
+        JOB_FAILURES.labels(slug, type(error).__name__).inc()
+
+
+def record_fetch(host: str, duration_s: float, nbytes: int) -> None:
+    """Record one HTTP fetch"""
+    HTTP_FETCH_DURATION.labels(host).observe(duration_s)
+    HTTP_FETCH_BYTES.labels(host).inc(nbytes)
+
+
+async def sample_loop_lag(interval: float = 1.0) -> None:
+    """Probe event-loop responsiveness forever: how late does a sleep wake up?"""
+    while True:
+        started = time.monotonic()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.monotonic() - started - interval)
+        LOOP_LAG.set(lag)
+        LOOP_LAG_PROBES.observe(lag)
+
+
+def sample(name: str, **labels: str) -> float:
+    """Current value of one exposed sample, 0 if it has not been recorded"""
+    return registry.get_sample_value(name, labels) or 0
+
+
+def render() -> str:
+    """The /metrics response body"""
+    return generate_latest(registry).decode()
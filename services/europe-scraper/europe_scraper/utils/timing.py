@@ -0,0 +1,148 @@
+"""
+Per-stage scrape timings
+
+A StageTimer adds up wall time per stage of one scrape (fetch,
+fingerprint, parse, validate, save), plus bytes fetched, row counts and
+the weight of pages a browser loaded.
+Stages nest exclusively: time spent in an inner stage is not counted
+again in the outer one, so a page fetched lazily while the parser is
+iterated shows up as fetch, not parse. The breakdown is stored as JSON
+on the job row.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
+
+FETCH = "fetch"
+FINGERPRINT = "fingerprint"
+PARSE = "parse"
+VALIDATE = "validate"
+SAVE = "save"
+
+STAGES = (FETCH, FINGERPRINT, PARSE, VALIDATE, SAVE)
+
+
+class StageTimer:
+    """Accumulates per-stage wall time, bytes fetched and row counts for one scrape"""
+
+    def __init__(self):
+        self.stages_ms: Dict[str, float] = {}
+        self.rows: Dict[str, int] = {}
+        self.bytes_fetched = 0
+        self.pages: Dict[str, float] = {}
+        self._stack: List[List[float]] = []  # [started, ms spent in nested stages]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as stage name, excluding nested stages"""
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = (time.perf_counter() - frame[0]) * 1000
+            self.add(name, elapsed - frame[1])
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def add(self, name: str, ms: float) -> None:
+        """Add time measured elsewhere (e.g. on a worker thread) to a stage"""
+        self.stages_ms[name] = self.stages_ms.get(name, 0.0) + ms
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.rows[name] = self.rows.get(name, 0) + n
+
+    def fetched(self, nbytes: int) -> None:
+        self.bytes_fetched += nbytes
+
+    def loaded_page(self, load_ms: float, weight: Optional[Dict[str, int]] = None) -> None:
+        """Count a browser page load: time driver.get() blocked, and page_weight() if known"""
+        self.pages["pages"] = self.pages.get("pages", 0) + 1
+        self.pages["load_ms"] = self.pages.get("load_ms", 0.0) + load_ms
+        for key, value in (weight or {}).items():
+            self.pages[key] = self.pages.get(key, 0) + value
+
+    def timed_iter(self, iterable: Iterable, name: str, count_as: Optional[str] = None) -> Iterator:
+        """Yield from iterable, timing only the work done to produce each item"""
+        iterator = iter(iterable)
+        try:
+            while True:
+                with self.stage(name):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                if count_as:
+                    self.count(count_as)
+                yield item
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    async def timed_aiter(self, aiterable: AsyncIterable, name: str, count_as: Optional[str] = None) -> AsyncIterator:
+        """Async version of timed_iter"""
+        iterator = aiterable.__aiter__()
+        try:
+            while True:
+                with self.stage(name):
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                if count_as:
+                    self.count(count_as)
+                yield item
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
+    def breakdown(self) -> Dict:
+        """JSON-ready summary for the job row"""
+        breakdown = {
+            "stages": {name: round(ms, 1) for name, ms in self.stages_ms.items()},
+            "rows": dict(self.rows),
+            "bytesFetched": self.bytes_fetched,
+        }
+        if self.pages:
+            breakdown["pages"] = {key: round(value, 1) for key, value in self.pages.items()}
+        return breakdown
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def stage_percentiles(breakdowns: Iterable[Optional[Dict]], pcts: Sequence[int] = (50, 95, 99)) -> Dict[str, Dict]:
+    """
+    Per-stage percentiles over many job breakdowns
+
+    Jobs without a breakdown (older rows) are ignored; a stage a job did
+    not reach does not count as zero.
+    """
+    samples: Dict[str, List[float]] = {}
+    jobs = 0
+    for breakdown in breakdowns:
+        if not breakdown:
+            continue
+        jobs += 1
+        for name, ms in breakdown.get("stages", {}).items():
+            samples.setdefault(name, []).append(ms)
+
+    return {
+        "jobs": jobs,
+        "stages": {
+            name: {f"p{pct}": round(percentile(values, pct), 1) for pct in pcts}
+            for name, values in sorted(samples.items(), key=lambda item: _stage_order(item[0]))
+        },
+    }
+
+
+def _stage_order(name: str) -> int:
+    return STAGES.index(name) if name in STAGES else len(STAGES)
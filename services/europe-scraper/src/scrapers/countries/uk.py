@@ -1,87 +0,0 @@
-"""Example scraper implementations for UK lotteries"""
-
-from typing import Dict, List
-from datetime import datetime
-from selenium.webdriver.common.by import By
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.utils.helpers import parse_european_date, extract_numbers
-
-
-class UKNationalLotteryScraper(SeleniumScraper):
-    """Scraper for UK National Lottery"""
-
-    def parse_results(self, driver) -> List[Dict]:
-        """Parse UK National Lottery results"""
-        results = []
-        
-        try:
-            # Wait for results to load
-            self.wait_for_element(By.CLASS_NAME, "results", timeout=10)
-            
-            # Example parsing logic (will need to be adjusted based on actual HTML structure)
-            result_elements = driver.find_elements(By.CLASS_NAME, "draw-result")
-            
-            for element in result_elements[:5]:  # Get last 5 draws
-                try:
-                    # Extract draw date
-                    date_text = element.find_element(By.CLASS_NAME, "draw-date").text
-                    draw_date = parse_european_date(date_text)
-                    
-                    if not draw_date:
-                        continue
-                    
-                    # Extract numbers
-                    balls_container = element.find_element(By.CLASS_NAME, "balls")
-                    ball_elements = balls_container.find_elements(By.CLASS_NAME, "ball")
-                    main_numbers = [int(ball.text) for ball in ball_elements[:6]]
-                    bonus_number = [int(ball_elements[6].text)] if len(ball_elements) > 6 else []
-                    
-                    # Extract jackpot if available
-                    jackpot = None
-                    try:
-                        jackpot_element = element.find_element(By.CLASS_NAME, "jackpot")
-                        jackpot = jackpot_element.text
-                    except:
-                        pass
-                    
-                    results.append({
-                        "draw_date": draw_date,
-                        "numbers": {
-                            "main": sorted(main_numbers),
-                            "bonus": bonus_number
-                        },
-                        "jackpot": jackpot,
-                        "currency": "GBP"
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning("Failed to parse result element", error=str(e))
-                    continue
-            
-        except Exception as e:
-            self.logger.error("Failed to parse results", error=str(e))
-            raise
-        
-        return results
-
-
-class UKThunderballScraper(SeleniumScraper):
-    """Scraper for UK Thunderball"""
-
-    def parse_results(self, driver) -> List[Dict]:
-        """Parse UK Thunderball results"""
-        results = []
-        
-        try:
-            # Similar implementation to National Lottery
-            # Adjust selectors based on actual HTML structure
-            self.logger.info("Parsing Thunderball results")
-            
-            # Placeholder implementation
-            # TODO: Implement actual parsing logic
-            
-        except Exception as e:
-            self.logger.error("Failed to parse Thunderball results", error=str(e))
-            raise
-        
-        return results
@@ -1,7 +1,7 @@
 """Basic test suite for Europe lottery scraper"""
 
 import pytest
-from src.utils.helpers import (
+from europe_scraper.utils.helpers import (
     parse_european_date,
     parse_european_number,
     parse_currency,
@@ -60,7 +60,7 @@ class TestConfig:
     
     def test_lottery_config_loading(self):
         """Test that lottery configurations load correctly"""
-        from src.config.countries import ALL_COUNTRIES, get_lottery_config
+        from europe_scraper.config.countries import ALL_COUNTRIES, get_lottery_config
         
         assert len(ALL_COUNTRIES) > 0
         
@@ -71,5 +71,182 @@ class TestConfig:
         assert uk_lottery["country_code"] == "GB"
 
 
+class TestBenchmarks:
+    """Test the offline benchmark suite"""
+    
+    def test_every_registered_scraper_has_a_fixture(self):
+        """Test the benchmark suite covers the whole registry"""
+        from benchmarks.harness import fixture_for
+        from europe_scraper.scrapers import SCRAPER_REGISTRY
+        
+        assert [slug for slug in SCRAPER_REGISTRY if not fixture_for(slug)] == []
+
+
+
+@pytest.mark.unit
+class TestParsers:
+    """Test country parsers on recorded fixture pages"""
+    
+    def test_primitiva_streams_draws_from_fixture(self):
+        """Test La Primitiva yields draws one at a time, newest first, up to latest_draws"""
+        from datetime import datetime
+        from typing import Iterator
+        from benchmarks.harness import fixture_for
+        from europe_scraper.scrapers import get_scraper_by_slug
+        
+        scraper = get_scraper_by_slug("es-primitiva")
+        soup = scraper.parse_html(fixture_for("es-primitiva").read_text(encoding="utf-8"))
+        
+        results = scraper.parse_results(soup)
+        
+        assert isinstance(results, Iterator)
+        assert next(results) == {
+            "draw_date": datetime(2025, 12, 31),
+            "numbers": {"main": [2, 8, 14, 28, 32, 35], "complement": [42], "reintegro": [8]},
+            "currency": "EUR",
+        }
+        assert len(list(results)) == scraper.latest_draws - 1
+    
+    def test_national_lottery_splits_bonus_ball(self):
+        """Test the seventh UK ball becomes the bonus and the jackpot is kept as shown"""
+        from europe_scraper.scrapers import get_scraper_by_slug
+        from europe_scraper.scrapers.base.selenium_scraper import RenderedPage
+        
+        scraper = get_scraper_by_slug("uk-national-lottery")
+        draws = [
+            {"date": "31/12/2025", "balls": ["49", "5", "24", "28", "32", "1", "51"], "jackpot": "£2,000,000"},
+            {"date": "not a date", "balls": ["1"], "jackpot": None},
+        ]
+        
+        results = list(scraper.parse_results(RenderedPage(scraper.url, draws)))
+        
+        assert len(results) == 1
+        assert results[0]["numbers"] == {"main": [1, 5, 24, 28, 32, 49], "bonus": [51]}
+        assert results[0]["jackpot"] == "£2,000,000" and results[0]["currency"] == "GBP"
+    
+    def test_national_lottery_archive_page_reads_every_draw(self):
+        """Test a UK draw-history page parses past the latest-draws cap"""
+        from datetime import date, datetime
+        from benchmarks.fixture_driver import FixtureDriver
+        from benchmarks.harness import fixture_for
+        from europe_scraper.scrapers import get_scraper_by_slug
+        from europe_scraper.scrapers.base.selenium_scraper import RenderedPage
+        
+        scraper = get_scraper_by_slug("uk-national-lottery")
+        (key, url), = scraper.archive_pages(date(2025, 1, 1), date(2025, 1, 31))
+        assert key == "2025-01" and "from=2025-01-01&to=2025-01-31" in url
+        
+        # As backfill.fetch_window does before fetching an archive page
+        scraper.latest_draws = None
+        driver = FixtureDriver(fixture_for("uk-national-lottery").read_text(encoding="utf-8"), url)
+        results = list(scraper.parse_results(RenderedPage(url, scraper.extract_draws(driver))))
+        
+        assert len(results) == 120
+        assert results[0]["draw_date"] == datetime(2025, 12, 31)
+        assert results[-1]["draw_date"] == datetime(2025, 1, 8)
+
+
+@pytest.mark.unit
+class TestExtraction:
+    """Test bulk DOM extraction for Selenium parsers"""
+    
+    def test_parser_reads_page_in_one_round_trip(self):
+        """Test a parser issues one execute_script call and no per-element lookups"""
+        from benchmarks.fixture_driver import FixtureDriver
+        from benchmarks.harness import fixture_for
+        from europe_scraper.scrapers import get_scraper_by_slug
+        from europe_scraper.scrapers.base.selenium_scraper import RenderedPage
+        
+        class CountingDriver(FixtureDriver):
+            scripts = 0
+            
+            def execute_script(self, script, *args):
+                self.scripts += 1
+                return super().execute_script(script, *args)
+            
+            def find_elements(self, by=None, value=None):
+                raise AssertionError(f"per-element lookup {by}={value}")
+        
+        scraper = get_scraper_by_slug("uk-national-lottery")
+        driver = CountingDriver(fixture_for("uk-national-lottery").read_text(encoding="utf-8"))
+        
+        results = list(scraper.parse_results(RenderedPage(scraper.url, scraper.extract_draws(driver))))
+        
+        assert driver.scripts == 1
+        assert len(results) == scraper.latest_draws
+        assert results[0]["numbers"] == {"main": [1, 5, 24, 28, 32, 49], "bonus": [51]}
+
+
+@pytest.mark.unit
+class TestReadiness:
+    """Test event-driven readiness waits"""
+    
+    class ReadyDriver:
+        """Answers the readiness script with a fixed outcome and serves one draw"""
+        
+        def __init__(self, outcome):
+            self.outcome = outcome
+            self.waited_for = None
+        
+        def get(self, url):
+            pass
+        
+        def set_script_timeout(self, seconds):
+            self.script_timeout = seconds
+        
+        def execute_async_script(self, script, condition, timeout_ms):
+            self.waited_for = condition
+            return self.outcome
+        
+        def execute_script(self, script, *args):
+            if "drawPath" in script:
+                return [{"date": "31/12/2025", "balls": ["1", "5", "24", "28", "32", "49", "51"], "jackpot": None}]
+            return None
+        
+        @property
+        def page_source(self):
+            return "<html></html>"
+    
+    def _pool(self, monkeypatch, driver):
+        from europe_scraper.scrapers.base import selenium_scraper
+        
+        released = []
+        monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: driver)
+        monkeypatch.setattr(
+            selenium_scraper.driver_pool, "release",
+            lambda driver, discard=False: released.append((driver, discard)),
+        )
+        return released
+    
+    def test_driver_is_released_once_results_are_ready(self, monkeypatch):
+        """Test a scrape waits on the declared condition and hands the driver back before parsing"""
+        from selenium.webdriver.common.by import By
+        from europe_scraper.scrapers import get_scraper_by_slug
+        
+        driver = self.ReadyDriver({"ready": True, "waited_ms": 40})
+        released = self._pool(monkeypatch, driver)
+        scraper = get_scraper_by_slug("uk-national-lottery")
+        
+        page = scraper.scrape()
+        
+        assert released == [(driver, False)] and scraper.driver is None
+        assert driver.waited_for["path"] == [
+            [By.CLASS_NAME, "draw-result"], [By.CLASS_NAME, "balls"], [By.CLASS_NAME, "ball"],
+        ]
+        assert [r["numbers"]["bonus"] for r in scraper.parse_results(page)] == [[51]]
+    
+    def test_results_that_never_render_fail_the_scrape(self, monkeypatch):
+        """Test a timed-out wait raises instead of parsing an empty page, and discards the driver"""
+        from selenium.common.exceptions import TimeoutException
+        from europe_scraper.scrapers import get_scraper_by_slug
+        
+        driver = self.ReadyDriver({"ready": False, "waited_ms": 30000})
+        released = self._pool(monkeypatch, driver)
+        scraper = get_scraper_by_slug("uk-national-lottery")
+        
+        with pytest.raises(TimeoutException):
+            scraper.scrape()
+        assert released == [(driver, True)]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,46 @@
+"""
+Offline benchmark of every scraper in SCRAPER_REGISTRY
+
+Usage:
+    python -m benchmarks.run                  # report
+    python -m benchmarks.run --save           # write benchmarks/baselines.json
+    python -m benchmarks.run --compare        # exit 1 on regressions
+    python -m benchmarks.run us-powerball --rounds 50
+
+Selenium scrapers parse the draws extracted from a FixtureDriver built
+from the recorded page, BS4 scrapers parse the page through parse_html(), and JSON fixtures are
+decoded and passed to parse_results() as-is. latest_draws is lifted so
+the whole fixture is parsed, as a backfill would. Nothing touches the
+network, Chrome or the database.
+"""
+
+import json
+from benchmarks.fixture_driver import FixtureDriver
+from benchmarks.harness import Measurement, fixture_for, main, measure
+from northamerica_scraper.scrapers import SCRAPER_REGISTRY, get_scraper_by_slug
+from northamerica_scraper.scrapers.base.selenium_scraper import RenderedPage, SeleniumScraper
+
+
+def bench_scraper(slug: str, rounds: int) -> Measurement:
+    """Benchmark one scraper on its fixture (runs in a worker process)"""
+    scraper = get_scraper_by_slug(slug)
+    scraper.latest_draws = None
+    fixture = fixture_for(slug)
+    content = fixture.read_text(encoding="utf-8")
+
+    def load():
+        if fixture.suffix == ".json":
+            return json.loads(content)
+        if isinstance(scraper, SeleniumScraper):
+            driver = FixtureDriver(content, scraper.url)
+            return RenderedPage(scraper.url, scraper.extract_draws(driver))
+        return scraper.parse_html(content)
+
+    def parse() -> int:
+        return sum(1 for _ in scraper.parse_results(load()))
+
+    return measure(slug, fixture, parse, rounds)
+
+
+if __name__ == "__main__":
+    main(SCRAPER_REGISTRY, bench_scraper)
@@ -0,0 +1,480 @@
+"""FastAPI application for North America lottery scraper"""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
+from fastapi.middleware.cors import CORSMiddleware
+from typing import Dict, List, Optional
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.config.countries import get_all_lottery_slugs, get_lottery_config, filter_lotteries, ALL_COUNTRIES
+from northamerica_scraper.services.orchestrator import run_scraper
+from northamerica_scraper.services import backfill
+from northamerica_scraper.services.scheduler import get_scheduled_jobs
+from northamerica_scraper.scrapers import get_scraper_by_slug
+from northamerica_scraper.scrapers.base.selenium_scraper import driver_pool
+from northamerica_scraper.utils.http_client import http_client
+from sqlalchemy import func
+from northamerica_scraper.database.session import engine, get_db
+from northamerica_scraper.database.models import Lottery, Result, ScraperJob
+from northamerica_scraper.database.lottery_cache import lottery_cache
+from northamerica_scraper.database.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursor, keyset_page
+from northamerica_scraper.utils import metrics
+from northamerica_scraper.utils.api_cache import LOTTERIES, SCHEDULE, SCRAPERS, Expiring, cached_response, seconds_until
+from northamerica_scraper.utils.logger import get_logger
+from northamerica_scraper.utils.timing import stage_percentiles
+
+logger = get_logger(__name__)
+
+# Create FastAPI app
+app = FastAPI(
+    title="North America Lottery Scraper API",
+    description="RESTful API for North American lottery scraping service",
+    version="1.0.0",
+)
+
+# Add CORS middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.API_ALLOWED_ORIGINS.split(","),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+metrics.CallbackGauge(
+    "scraper_queue_depth", "Scheduled scrapes waiting for a worker thread", (),
+    lambda: [((), _scrape_backlog())],
+)
+metrics.CallbackGauge(
+    "db_pool_checked_out", "Database connections checked out of the pool", (),
+    lambda: [((), engine.pool.checkedout())],
+)
+metrics.CallbackGauge(
+    "chrome_driver_pool", "Pooled Chrome drivers by state", ("state",),
+    lambda: [((state,), driver_pool.stats()[state]) for state in ("in_use", "idle", "max_size")],
+)
+
+_loop = None
+_loop_lag_task = None
+
+
+def _scrape_backlog() -> int:
+    """Scrapes queued on the event loop's default executor, where APScheduler runs sync jobs"""
+    executor = getattr(_loop, "_default_executor", None)
+    return executor._work_queue.qsize() if executor else 0
+
+
+@app.on_event("startup")
+async def start_loop_lag_probe() -> None:
+    """Sample event-loop lag for /metrics"""
+    global _loop, _loop_lag_task
+    _loop = asyncio.get_running_loop()
+    _loop_lag_task = asyncio.create_task(metrics.sample_loop_lag())
+
+
+@app.on_event("shutdown")
+async def stop_loop_lag_probe() -> None:
+    """Stop the event-loop lag probe"""
+    if _loop_lag_task is not None:
+        _loop_lag_task.cancel()
+
+
+@app.on_event("startup")
+def start_http_client() -> None:
+    """Open the shared HTTP connection pool"""
+    http_client.start()
+
+
+@app.on_event("shutdown")
+def close_pools() -> None:
+    """Close pooled HTTP connections and quit pooled Chrome drivers"""
+    http_client.close()
+    driver_pool.close()
+
+
+@app.get("/")
+def root() -> Dict:
+    """Service information"""
+    return {
+        "service": "North America Lottery Scraper",
+        "version": "1.0.0",
+        "region": "North America",
+        "countries": len(ALL_COUNTRIES),
+        "lotteries": len(get_all_lottery_slugs()),
+    }
+
+
+@app.get("/health")
+def health_check() -> Dict:
+    """Health check endpoint"""
+    db = get_db()
+    try:
+        # Test database connection
+        db.execute("SELECT 1")
+        db_status = "healthy"
+    except Exception as e:
+        logger.error("Database health check failed", error=str(e))
+        db_status = "unhealthy"
+    finally:
+        db.close()
+    
+    return {
+        "status": "healthy" if db_status == "healthy" else "degraded",
+        "database": db_status,
+        "api": "healthy",
+        "driver_pool": driver_pool.stats(),
+    }
+
+
+@app.get("/scrapers")
+def list_scrapers(
+    request: Request,
+    country: Optional[str] = None,
+    type: Optional[str] = None,
+    timezone: Optional[str] = None,
+) -> Response:
+    """List available scrapers, optionally filtered by country code, type or timezone"""
+    def build() -> List[Dict]:
+        countries = [country] if country else None
+        return [
+            {
+                "slug": config["slug"],
+                "name": config["name"],
+                "country": config["country_name"],
+                "url": config["url"],
+                "type": config["type"],
+                "schedule": config["schedule"],
+            }
+            for config in filter_lotteries(countries=countries, lottery_type=type, timezone=timezone)
+        ]
+    
+    return cached_response(request, [SCRAPERS], build)
+
+
+@app.get("/scrapers/{slug}")
+def get_scraper(slug: str) -> Dict:
+    """Get scraper details by slug"""
+    config = get_lottery_config(slug)
+    if not config:
+        raise HTTPException(status_code=404, detail=f"Scraper not found: {slug}")
+    
+    return dict(config)
+
+
+@app.post("/scrapers/{slug}/run")
+def trigger_scraper(slug: str) -> Dict:
+    """Manually trigger a scraper"""
+    config = get_lottery_config(slug)
+    if not config:
+        raise HTTPException(status_code=404, detail=f"Scraper not found: {slug}")
+    if not lottery_cache.get(slug):
+        raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+    
+    logger.info("Manual scraper trigger", slug=slug)
+    result = run_scraper(slug)
+    return result
+
+
+@app.post("/scrapers/{slug}/backfill", status_code=202)
+def start_backfill(
+    slug: str,
+    start: date,
+    background_tasks: BackgroundTasks,
+    end: Optional[date] = None,
+    restart: bool = False,
+) -> Dict:
+    """Backfill historical draws from archive pages in the background"""
+    scraper = get_scraper_by_slug(slug)
+    if not scraper:
+        raise HTTPException(status_code=404, detail=f"Scraper not found: {slug}")
+    if not scraper.archive_url_template:
+        raise HTTPException(status_code=400, detail=f"Scraper {slug} has no archive pages")
+    if not lottery_cache.get(slug):
+        raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+    if backfill.is_running(slug):
+        raise HTTPException(status_code=409, detail=f"Backfill already running for {slug}")
+    
+    end = end or date.today()
+    logger.info("Backfill requested", slug=slug, start=start.isoformat(), end=end.isoformat())
+    background_tasks.add_task(backfill.run_backfill, slug, start, end, restart)
+    return {"status": "accepted", "slug": slug, "start": start.isoformat(), "end": end.isoformat()}
+
+
+@app.get("/scrapers/{slug}/backfill")
+def get_backfill(slug: str) -> Dict:
+    """Get backfill progress for a scraper"""
+    checkpoint = backfill.load_checkpoint(slug)
+    if not checkpoint:
+        raise HTTPException(status_code=404, detail=f"No backfill for {slug}")
+    return {**checkpoint, "running": backfill.is_running(slug)}
+
+
+@app.get("/metrics")
+def get_metrics() -> Response:
+    """Prometheus metrics"""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/jobs")
+def list_jobs(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    slug: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict:
+    """
+    List scraper jobs, newest first
+    
+    Pages are keyset-paginated on (createdAt, id): pass the returned
+    next_cursor back as cursor to get the next page. since/until bound
+    createdAt (until is exclusive).
+    """
+    db = get_db()
+    try:
+        query = db.query(ScraperJob)
+        if slug:
+            lottery = lottery_cache.get(slug)
+            if not lottery:
+                raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+            query = query.filter(ScraperJob.lotteryId == lottery.id)
+        if status:
+            query = query.filter(ScraperJob.status == status)
+        if since:
+            query = query.filter(ScraperJob.createdAt >= since)
+        if until:
+            query = query.filter(ScraperJob.createdAt < until)
+        
+        try:
+            jobs, next_cursor = keyset_page(query, (ScraperJob.createdAt, ScraperJob.id), cursor, limit)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return {
+            "count": len(jobs),
+            "jobs": [
+                {
+                    "id": job.id,
+                    "lottery_id": str(job.lotteryId),
+                    "status": job.status,
+                    "created_at": job.createdAt.isoformat() if job.createdAt else None,
+                    "started_at": job.startedAt.isoformat() if job.startedAt else None,
+                    "completed_at": job.completedAt.isoformat() if job.completedAt else None,
+                    "results_count": job.resultsCount,
+                    "execution_time_ms": job.executionTimeMs,
+                    "error_message": job.errorMessage,
+                }
+                for job in jobs
+            ],
+            "next_cursor": next_cursor,
+        }
+    finally:
+        db.close()
+
+
+@app.get("/results")
+def list_results(
+    slug: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict:
+    """
+    List a lottery's draws, newest first
+    
+    Pages are keyset-paginated on drawDate within the lottery, served by
+    the result (lotteryId, drawDate) unique index: pass the returned
+    next_cursor back as cursor to get the next page. since/until bound
+    drawDate (until is exclusive).
+    """
+    lottery = lottery_cache.get(slug)
+    if not lottery:
+        raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+    
+    db = get_db()
+    try:
+        query = db.query(Result).filter(Result.lotteryId == lottery.id)
+        if since:
+            query = query.filter(Result.drawDate >= since)
+        if until:
+            query = query.filter(Result.drawDate < until)
+        
+        try:
+            results, next_cursor = keyset_page(query, (Result.drawDate,), cursor, limit)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return {
+            "slug": slug,
+            "count": len(results),
+            "results": [
+                {
+                    "id": str(result.id),
+                    "draw_date": result.drawDate.isoformat(),
+                    "numbers": result.numbers,
+                    "jackpot": result.jackpot,
+                    "currency": result.currency,
+                    "winners": result.winners,
+                }
+                for result in results
+            ],
+            "next_cursor": next_cursor,
+        }
+    finally:
+        db.close()
+
+
+@app.get("/jobs/stats")
+def get_job_stats(hours: int = 24) -> Dict:
+    """Per-lottery job counts and the share of runs skipped as unchanged"""
+    since = datetime.utcnow() - timedelta(hours=hours)
+    db = get_db()
+    try:
+        rows = (
+            db.query(Lottery.slug, ScraperJob.status, func.count(ScraperJob.id))
+            .join(Lottery, Lottery.id == ScraperJob.lotteryId)
+            .filter(ScraperJob.createdAt >= since)
+            .group_by(Lottery.slug, ScraperJob.status)
+            .all()
+        )
+    finally:
+        db.close()
+
+    stats: Dict[str, Dict] = {}
+    for slug, status, count in rows:
+        entry = stats.setdefault(slug, {"total": 0, "by_status": {}})
+        entry["by_status"][status] = count
+        entry["total"] += count
+
+    for entry in stats.values():
+        entry["skip_ratio"] = round(entry["by_status"].get("unchanged", 0) / entry["total"], 3)
+
+    total = sum(entry["total"] for entry in stats.values())
+    unchanged = sum(entry["by_status"].get("unchanged", 0) for entry in stats.values())
+
+    return {
+        "since": since.isoformat(),
+        "total": total,
+        "skip_ratio": round(unchanged / total, 3) if total else 0.0,
+        "lotteries": stats,
+    }
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: int, window: int = 200) -> Dict:
+    """Get job details by ID, with stage percentiles over its lottery's last `window` jobs"""
+    db = get_db()
+    try:
+        row = (
+            db.query(ScraperJob, Lottery.slug)
+            .join(Lottery, Lottery.id == ScraperJob.lotteryId)
+            .filter(ScraperJob.id == job_id)
+            .first()
+        )
+        if not row:
+            raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+        job, slug = row
+
+        # Clamped like /jobs page sizes, so one request cannot read every job's timings
+        window = max(1, min(window, MAX_PAGE_SIZE))
+        recent = (
+            db.query(ScraperJob.stageTimings)
+            .filter(ScraperJob.lotteryId == job.lotteryId, ScraperJob.stageTimings.isnot(None))
+            .order_by(ScraperJob.createdAt.desc(), ScraperJob.id.desc())
+            .limit(window)
+            .all()
+        )
+        
+        return {
+            "id": job.id,
+            "lottery_id": str(job.lotteryId),
+            "slug": slug,
+            "status": job.status,
+            "started_at": job.startedAt.isoformat() if job.startedAt else None,
+            "completed_at": job.completedAt.isoformat() if job.completedAt else None,
+            "results_count": job.resultsCount,
+            "execution_time_ms": job.executionTimeMs,
+            "bytes_fetched": job.bytesFetched,
+            "stage_timings": job.stageTimings,
+            "error_message": job.errorMessage,
+            "slug_percentiles": stage_percentiles(timings for (timings,) in recent),
+        }
+    finally:
+        db.close()
+
+
+@app.get("/schedule")
+def get_schedule(request: Request) -> Response:
+    """View scheduled jobs"""
+    def build() -> Expiring:
+        jobs = get_scheduled_jobs()
+        return Expiring(
+            [
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
+                    "trigger": str(job.trigger),
+                }
+                for job in jobs
+            ],
+            # The listing changes when the first of these jobs fires
+            max_age=seconds_until(job.next_run_time for job in jobs),
+        )
+    
+    return cached_response(request, [SCHEDULE], build)
+
+
+@app.get("/lotteries")
+def list_lotteries(request: Request) -> Response:
+    """List all North American lotteries"""
+    def build() -> List[Dict]:
+        db = get_db()
+        try:
+            lotteries = db.query(Lottery).filter(Lottery.region == "North America").all()
+            return [
+                {
+                    "id": str(lottery.id),
+                    "name": lottery.name,
+                    "slug": lottery.slug,
+                    "country": lottery.country,
+                    "region": lottery.region,
+                    "is_active": lottery.isActive,
+                    "official_link": lottery.officialLink,
+                }
+                for lottery in lotteries
+            ]
+        finally:
+            db.close()
+    
+    return cached_response(request, [LOTTERIES], build)
+
+
+@app.get("/lotteries/{slug}")
+def get_lottery(request: Request, slug: str) -> Response:
+    """Get lottery details by slug"""
+    def build() -> Dict:
+        db = get_db()
+        try:
+            lottery = db.query(Lottery).filter(Lottery.slug == slug).first()
+            if not lottery:
+                raise HTTPException(status_code=404, detail=f"Lottery not found: {slug}")
+            
+            return {
+                "id": str(lottery.id),
+                "name": lottery.name,
+                "slug": lottery.slug,
+                "country": lottery.country,
+                "region": lottery.region,
+                "is_active": lottery.isActive,
+                "official_link": lottery.officialLink,
+                "description": lottery.description,
+                "frequency": lottery.frequency,
+            }
+        finally:
+            db.close()
+    
+    return cached_response(request, [LOTTERIES], build)
@@ -1,6 +1,7 @@
 """North American countries lottery configuration"""
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 
 class CountryConfig:
@@ -432,27 +433,94 @@ NORTHAMERICA_COUNTRIES = [
 ALL_COUNTRIES = NORTHAMERICA_COUNTRIES
 
 
+def _build_lottery_index(countries: List[CountryConfig]) -> Mapping[str, Mapping]:
+    """Merge each lottery with its country fields, keyed by slug"""
+    index = {}
+    for country in countries:
+        for lottery in country.lotteries:
+            if lottery["slug"] in index:
+                raise ValueError(f"Duplicate lottery slug: {lottery['slug']}")
+            index[lottery["slug"]] = MappingProxyType({
+                **lottery,
+                "country_code": country.code,
+                "country_name": country.name,
+                "timezone": country.timezone,
+            })
+    return MappingProxyType(index)
+
+
+def _build_facet(index: Mapping[str, Mapping], field: str) -> Mapping[str, Tuple[str, ...]]:
+    """Group slugs by one config field, preserving config order"""
+    facet: Dict[str, List[str]] = {}
+    for slug, config in index.items():
+        facet.setdefault(config.get(field), []).append(slug)
+    return MappingProxyType({value: tuple(slugs) for value, slugs in facet.items()})
+
+
+# Read-only indexes built once at import
+COUNTRY_INDEX: Mapping[str, CountryConfig] = MappingProxyType({c.code: c for c in ALL_COUNTRIES})
+LOTTERY_INDEX = _build_lottery_index(ALL_COUNTRIES)
+SLUGS_BY_COUNTRY = _build_facet(LOTTERY_INDEX, "country_code")
+SLUGS_BY_TYPE = _build_facet(LOTTERY_INDEX, "type")
+SLUGS_BY_TIMEZONE = _build_facet(LOTTERY_INDEX, "timezone")
+
+
 def get_country_by_code(code: str) -> CountryConfig | None:
     """Get country config by ISO code"""
-    for country in ALL_COUNTRIES:
-        if country.code == code:
-            return country
-    return None
+    return COUNTRY_INDEX.get(code)
 
 
 def get_all_lottery_slugs() -> List[str]:
     """Get all lottery slugs"""
-    slugs = []
-    for country in ALL_COUNTRIES:
-        for lottery in country.lotteries:
-            slugs.append(lottery["slug"])
-    return slugs
+    return list(LOTTERY_INDEX)
 
 
-def get_lottery_config(slug: str) -> Dict | None:
-    """Get lottery configuration by slug"""
-    for country in ALL_COUNTRIES:
-        for lottery in country.lotteries:
-            if lottery["slug"] == slug:
-                return {**lottery, "country_code": country.code, "country_name": country.name}
-    return None
+def get_lottery_config(slug: str) -> Mapping | None:
+    """Get lottery configuration by slug (read-only, shared between callers)"""
+    return LOTTERY_INDEX.get(slug)
+
+
+def filter_lotteries(
+    countries: Optional[Iterable[str]] = None,
+    lottery_type: Optional[str] = None,
+    timezone: Optional[str] = None,
+) -> List[Mapping]:
+    """
+    List lottery configs matching every given facet
+    
+    Args:
+        countries: Country codes to include (None = all)
+        lottery_type: Scraper type such as "selenium" or "bs4"
+        timezone: Country timezone such as "Europe/London"
+    
+    Returns:
+        Matching lottery configs in config order
+    """
+    slugs = None
+    if countries is not None:
+        slugs = {slug for code in countries for slug in SLUGS_BY_COUNTRY.get(code.upper(), ())}
+    for facet, value in ((SLUGS_BY_TYPE, lottery_type), (SLUGS_BY_TIMEZONE, timezone)):
+        if value is not None:
+            matches = set(facet.get(value, ()))
+            slugs = matches if slugs is None else slugs & matches
+    
+    if slugs is None:
+        return list(LOTTERY_INDEX.values())
+    return [config for slug, config in LOTTERY_INDEX.items() if slug in slugs]
+
+
+def select_countries(countries: List[CountryConfig], codes: str) -> List[CountryConfig]:
+    """
+    Restrict countries to a comma-separated list of codes
+    
+    Args:
+        countries: Country configs to filter
+        codes: Codes such as "US,CA"; empty keeps every country
+    
+    Returns:
+        Matching country configs in their original order
+    """
+    wanted = {code.strip().upper() for code in codes.split(",") if code.strip()}
+    if not wanted:
+        return list(countries)
+    return [country for country in countries if country.code in wanted]
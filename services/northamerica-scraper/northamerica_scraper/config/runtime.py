@@ -0,0 +1,13 @@
+"""
+Resources handed in by a process hosting several regions
+
+The multi-region runner (services/runner) sets these before importing
+the rest of the package, and the modules owning each resource reuse the
+one given instead of building their own. They stay None when the
+service runs on its own.
+"""
+
+engine = None  # database.session
+scheduler = None  # services.scheduler
+http_client = None  # utils.http_client
+driver_pool = None  # scrapers.base.selenium_scraper
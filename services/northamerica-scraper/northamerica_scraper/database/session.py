@@ -0,0 +1,80 @@
+"""Database session management"""
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker, Session
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.config import runtime
+from northamerica_scraper.database.models import Base
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Create engine, unless a multi-region runner shares one
+engine = runtime.engine or create_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW
+)
+
+# Create session factory
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_db() -> Session:
+    """Get database session"""
+    db = SessionLocal()
+    try:
+        return db
+    finally:
+        db.close()
+
+
+def init_db() -> None:
+    """Initialize database and create tables"""
+    try:
+        Base.metadata.create_all(bind=engine)
+        add_missing_columns()
+        add_missing_indexes()
+        logger.info("Database tables created successfully")
+    except Exception as e:
+        logger.error("Failed to create database tables", error=str(e))
+        raise
+
+
+def add_missing_columns() -> None:
+    """
+    Add nullable model columns missing from scraper tables that already exist
+
+    create_all() only creates missing tables, so columns added to a model
+    later (e.g. scraper_job timings) would otherwise never reach an
+    existing database.
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            # lottery and result columns belong to the drizzle migrations
+            if not table.name.startswith("scraper_") or not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'))
+                logger.info("Added column", table=table.name, column=column.name)
+
+
+def add_missing_indexes() -> None:
+    """
+    Create scraper table indexes missing from tables that already exist
+
+    Like columns, indexes added to a model later (e.g. the scraper_job
+    pagination indexes) are only created by create_all() with their table.
+    """
+    for table in Base.metadata.sorted_tables:
+        # lottery and result indexes belong to the drizzle migrations
+        if not table.name.startswith("scraper_"):
+            continue
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
@@ -1,8 +1,10 @@
 """Scraper registry for North America lotteries"""
 
-from src.scrapers.countries.usa import PowerballScraper, MegaMillionsScraper
-from src.scrapers.countries.canada import Lotto649Scraper, LottoMaxScraper
-from src.scrapers.countries.mexico import MelateScraper, ChispazoScraper
+from northamerica_scraper.config.countries import get_lottery_config
+from northamerica_scraper.scrapers.base.api_scraper import api_variant
+from northamerica_scraper.scrapers.countries.usa import PowerballScraper, MegaMillionsScraper
+from northamerica_scraper.scrapers.countries.canada import Lotto649Scraper, LottoMaxScraper
+from northamerica_scraper.scrapers.countries.mexico import MelateScraper, ChispazoScraper
 
 # Registry mapping slug to scraper class
 SCRAPER_REGISTRY = {
@@ -27,6 +29,9 @@ def get_scraper_by_slug(slug: str):
     """
     Get scraper instance by lottery slug
     
+    Lotteries configured with "type": "api" fetch their draws from the
+    JSON API recorded by api_discovery instead of rendering the page.
+    
     Args:
         slug: Lottery slug (e.g., 'us-powerball')
     
@@ -35,5 +40,7 @@ def get_scraper_by_slug(slug: str):
     """
     scraper_class = SCRAPER_REGISTRY.get(slug)
     if scraper_class:
+        if (get_lottery_config(slug) or {}).get("type") == "api":
+            scraper_class = api_variant(scraper_class)
         return scraper_class(slug)
     return None
@@ -0,0 +1,458 @@
+"""
+Discover the JSON API behind a rendered results page
+
+Loads a lottery's configured page once in Chrome with performance
+logging on, collects every JSON response the page fetched, and looks for
+the one carrying the draws. When the scraper declares draw_fields, the
+draws it reads off the rendered page are the answer key: each field is
+located in the JSON by value (numbers, slices of number lists, ISO dates
+in the page's format). Otherwise dates and number lists are guessed.
+
+The best match is written as the slug's ApiSource (see api_source), and
+the page and response it came from are kept as a fixture pair, so both
+paths can be compared offline before the lottery is switched over:
+
+    python -m northamerica_scraper.scrapers.base.api_discovery us-powerball
+    python -m benchmarks.api_parity us-powerball
+    # then "type": "api" in the country config
+
+Request cookies are never written; endpoints that need a session are not
+candidates for a plain HTTP fetch anyway.
+"""
+
+import argparse
+import base64
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from northamerica_scraper.scrapers.base.api_source import (
+    ApiField, ApiSource, as_text, parse_iso, read_draws, save_api_source,
+)
+from northamerica_scraper.scrapers.base.browser_profile import DEFAULT_BLOCKED_URLS, block_resources, lean_options
+from northamerica_scraper.scrapers.base.readiness import network_idle, wait_until_ready
+
+# Formats a page may show an ISO date in
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d.%m.%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%A, %B %d, %Y",
+    "%a, %b %d, %Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%A %d %B %Y",
+    "%a %d %b %Y",
+)
+
+# Browser and session headers a replayed request must not carry
+DROPPED_HEADERS = {"cookie", "user-agent", "accept-encoding", "accept-language", "content-length", "host", "connection"}
+
+# Nesting searched for draw lists and, inside one draw, for fields
+MAX_DEPTH = 6
+
+# A field location: dotted path, or a tuple of paths read into one list; plus date format
+Location = Tuple[Any, Optional[str]]
+
+
+@dataclass
+class Exchange:
+    """One JSON request the page made, and its decoded response"""
+    url: str
+    method: str
+    headers: Dict[str, str]
+    body: Optional[str]
+    status: int
+    payload: Any
+    size: int
+
+
+@dataclass
+class Candidate:
+    """
+    A draw list found in a response, with the fields located in it
+
+    Attributes:
+        exchange: Request and response the list came from
+        draws: Dotted path to the list
+        fields: Field name to location
+        newest_first: Whether the list runs in page order
+        matched: Page draws the fields reproduce exactly
+        expected: Page draws compared (0 when the fields were guessed)
+    """
+    exchange: Exchange
+    draws: str
+    fields: Dict[str, ApiField]
+    newest_first: bool
+    matched: int
+    expected: int
+
+    def score(self) -> Tuple[int, int, int]:
+        return self.matched, len(self.fields), -self.exchange.size
+
+    def source(self, slug: str, page_url: str) -> ApiSource:
+        """The candidate as the slug's API source"""
+        return ApiSource(
+            slug=slug,
+            url=self.exchange.url,
+            method=self.exchange.method,
+            headers=self.exchange.headers,
+            body=self.exchange.body,
+            draws=self.draws,
+            newest_first=self.newest_first,
+            fields=self.fields,
+            discovered_from=page_url,
+        )
+
+
+def performance_logging(options: Options) -> Options:
+    """Have Chrome log DevTools network events, read back with driver.get_log("performance")"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def request_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Headers worth replaying: no cookies, browser defaults, sec-* or HTTP/2 pseudo-headers"""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in DROPPED_HEADERS and not name.lower().startswith(("sec-", ":"))
+    }
+
+
+def _is_json(params: Dict[str, Any]) -> bool:
+    mime_type = params.get("response", {}).get("mimeType", "")
+    return "json" in mime_type or params.get("type") in ("XHR", "Fetch")
+
+
+def json_exchanges(driver: webdriver.Chrome) -> List[Exchange]:
+    """
+    JSON responses the loaded page fetched, from the performance log
+
+    Bodies are read over DevTools, so call this before navigating away.
+    Responses that are not JSON or whose body is gone are skipped.
+    """
+    requests: Dict[str, Dict[str, Any]] = {}
+    responses: Dict[str, Dict[str, Any]] = {}
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message.get("method") == "Network.requestWillBeSent":
+            # Redirects reuse the request id; the last one is what answered
+            requests[params["requestId"]] = params["request"]
+        elif message.get("method") == "Network.responseReceived" and _is_json(params):
+            responses[params["requestId"]] = params["response"]
+
+    exchanges = []
+    for request_id, response in responses.items():
+        request = requests.get(request_id)
+        if request is None or request.get("method") not in ("GET", "POST"):
+            continue
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException:
+            continue
+        text = body.get("body", "")
+        if body.get("base64Encoded"):
+            text = base64.b64decode(text).decode("utf-8", "replace")
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        exchanges.append(Exchange(
+            url=request["url"],
+            method=request["method"],
+            headers=request_headers(request.get("headers", {})),
+            body=request.get("postData"),
+            status=int(response.get("status") or 0),
+            payload=payload,
+            size=len(text.encode("utf-8")),
+        ))
+    return exchanges
+
+
+def _join(prefix: str, step: Any) -> str:
+    return f"{prefix}.{step}" if prefix else str(step)
+
+
+def draw_lists(value: Any, path: str = "", depth: int = 0) -> Iterator[Tuple[str, List[Dict]]]:
+    """Every list of objects in a response, with its dotted path"""
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(value, list):
+        if any(isinstance(item, dict) for item in value):
+            yield path, value
+        for index, item in enumerate(value[:3]):
+            yield from draw_lists(item, _join(path, index), depth + 1)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from draw_lists(item, _join(path, key), depth + 1)
+
+
+def _scalar(value: Any) -> bool:
+    return value is not None and not isinstance(value, (dict, list))
+
+
+def leaves(draw: Any, path: str = "", depth: int = 0) -> Iterator[Tuple[str, Any]]:
+    """Scalars and scalar lists in a draw object, list elements included, with their paths"""
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(draw, dict):
+        for key, value in draw.items():
+            yield from leaves(value, _join(path, key), depth + 1)
+    elif isinstance(draw, list):
+        if draw and all(_scalar(item) for item in draw):
+            yield path, draw
+        for index, item in enumerate(draw):
+            yield from leaves(item, _join(path, index), depth + 1)
+    elif _scalar(draw):
+        yield path, draw
+
+
+def _number(value: Any) -> Optional[int]:
+    text = as_text(value)
+    return int(text) if text and text.isdigit() else None
+
+
+def _same(value: Any, expected: str) -> bool:
+    if as_text(value) == expected:
+        return True
+    number = _number(value)
+    return number is not None and number == _number(expected)
+
+
+def _scalar_locations(draw: Dict, expected: str) -> List[Location]:
+    found = []
+    for path, value in leaves(draw):
+        if isinstance(value, list):
+            continue
+        if _same(value, expected):
+            found.append((path, None))
+            continue
+        when = parse_iso(value) if isinstance(value, str) and "-" in value else None
+        if when is not None:
+            found.extend((path, fmt) for fmt in DATE_FORMATS if when.strftime(fmt) == expected)
+    return found
+
+
+def _list_locations(draw: Dict, expected: List[str]) -> List[Location]:
+    numbers = [_number(text) for text in expected]
+    if None in numbers or not numbers:
+        return []
+    size = len(numbers)
+    found = []
+    siblings: Dict[str, List[Tuple[str, Optional[int]]]] = {}
+    for path, value in leaves(draw):
+        if isinstance(value, list):
+            values = [_number(item) for item in value]
+            if None in values:
+                continue
+            if len(values) == size:
+                # Pages often show the balls sorted; the parser sorts them anyway
+                if values == numbers or sorted(values) == sorted(numbers):
+                    found.append((path, None))
+                continue
+            for start in range(len(values) - size + 1):
+                if values[start:start + size] == numbers:
+                    found.append((f"{path}.{start}:{start + size}", None))
+        else:
+            parent = path.rpartition(".")[0]
+            siblings.setdefault(parent, []).append((path, _number(value)))
+    # Separate keys in a row, e.g. ball1..ball5
+    for children in siblings.values():
+        for start in range(len(children) - size + 1):
+            window = children[start:start + size]
+            if [number for _, number in window] == numbers:
+                found.append((tuple(path for path, _ in window), None))
+    return found
+
+
+def locate(draw: Dict, expected: Any) -> List[Location]:
+    """Every place in draw that reads back as the page's expected field value"""
+    if expected is None or expected == []:
+        return []
+    if isinstance(expected, list):
+        return _list_locations(draw, expected)
+    return _scalar_locations(draw, expected)
+
+
+def _api_field(location: Location) -> ApiField:
+    path, date_format = location
+    return ApiField(path=list(path) if isinstance(path, tuple) else path, date_format=date_format)
+
+
+def match_fields(
+    items: Sequence[Dict], expected: Sequence[Dict[str, Any]], newest_first: bool,
+) -> Dict[str, ApiField]:
+    """
+    Locate each page field consistently across the draws
+
+    The page's draws are lined up with the list's, from its start or, for
+    oldest-first lists, its end; a field's location must read back every
+    lined-up draw, and the first such location in the JSON wins.
+    """
+    ordered = list(items) if newest_first else list(items)[::-1]
+    pairs = [(draw, page) for draw, page in zip(ordered, expected) if isinstance(draw, dict)]
+    fields = {}
+    for name in expected[0] if expected else ():
+        common: Optional[List[Location]] = None
+        for draw, page in pairs:
+            if page.get(name) in (None, []):
+                continue
+            found = locate(draw, page[name])
+            common = found if common is None else [location for location in common if location in found]
+            if not common:
+                break
+        if common:
+            fields[name] = _api_field(common[0])
+    return fields
+
+
+def guess_fields(draw: Dict) -> Dict[str, ApiField]:
+    """Without page draws to match: the first ISO date, longest number list and draw number"""
+    fields = {}
+    longest = 1
+    for path, value in leaves(draw):
+        if isinstance(value, list):
+            if len(value) > longest and all(_number(item) is not None for item in value):
+                fields["main"], longest = ApiField(path), len(value)
+        elif "date" not in fields and isinstance(value, str) and "-" in value and parse_iso(value):
+            fields["date"] = ApiField(path)
+        elif "draw_number" not in fields and _number(value) is not None:
+            key = path.rpartition(".")[2].lower()
+            if "draw" in key and any(part in key for part in ("no", "num", "id")):
+                fields["draw_number"] = ApiField(path)
+    return fields
+
+
+def candidates(exchanges: Sequence[Exchange], expected: Optional[Sequence[Dict[str, Any]]] = None) -> List[Candidate]:
+    """
+    Draw lists in the responses, best first
+
+    Args:
+        exchanges: JSON responses of the page
+        expected: Draws the browser path read off the same page, if any
+
+    Returns:
+        Candidates that located at least one field (with expected) or a
+        date and number list (without)
+    """
+    found = []
+    for exchange in exchanges:
+        for path, items in draw_lists(exchange.payload):
+            if expected:
+                for newest_first in (True, False):
+                    fields = match_fields(items, expected, newest_first)
+                    if not fields:
+                        continue
+                    source = ApiSource(slug="", url=exchange.url, fields=fields, draws=path, newest_first=newest_first)
+                    rows = read_draws(exchange.payload, source, len(expected))
+                    matched = sum(
+                        all(row.get(name) == page.get(name) for name in fields)
+                        for row, page in zip(rows, expected)
+                    )
+                    found.append(Candidate(exchange, path, fields, newest_first, matched, len(expected)))
+            else:
+                first = next((item for item in items if isinstance(item, dict)), {})
+                fields = guess_fields(first)
+                if "date" in fields and "main" in fields:
+                    found.append(Candidate(exchange, path, fields, True, 0, 0))
+    return sorted(found, key=Candidate.score, reverse=True)
+
+
+def capture(
+    url: str,
+    draws_from: Optional[Callable[[webdriver.Chrome], List[Dict]]] = None,
+    timeout: float = 30,
+    headless: bool = True,
+) -> Tuple[List[Exchange], Optional[List[Dict]], str]:
+    """
+    Load url once and record its JSON traffic
+
+    Args:
+        url: Results page
+        draws_from: Callable reading the page's draws from the driver, if any
+        timeout: Seconds to wait for the page to go quiet
+        headless: Run Chrome without a window
+
+    Returns:
+        (JSON exchanges, draws read off the page or None, page source)
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    performance_logging(lean_options(options))
+
+    driver = webdriver.Chrome(options=options)
+    try:
+        block_resources(driver, DEFAULT_BLOCKED_URLS)
+        driver.get(url)
+        # Late XHRs are what we are after, so wait for the network, not an element
+        wait_until_ready(driver, network_idle(quiet_ms=1000), timeout)
+        expected = draws_from(driver) if draws_from else None
+        return json_exchanges(driver), expected, driver.page_source
+    finally:
+        driver.quit()
+
+
+def write_fixtures(slug: str, page_source: str, payload: Any, directory: Path) -> Tuple[Path, Path]:
+    """Keep the page and the response it was matched against, for benchmarks.api_parity"""
+    directory.mkdir(parents=True, exist_ok=True)
+    page = directory / f"{slug}.html"
+    response = directory / f"{slug}.json"
+    page.write_text(page_source, encoding="utf-8")
+    response.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return page, response
+
+
+def main() -> None:
+    """Command line entry point"""
+    from northamerica_scraper.scrapers import get_scraper_by_slug
+
+    parser = argparse.ArgumentParser(description="Find the JSON API behind a lottery page and write its API source")
+    parser.add_argument("slug")
+    parser.add_argument("--dry-run", action="store_true", help="Report candidates without writing anything")
+    parser.add_argument("--fixtures", type=Path, default=Path("benchmarks/fixtures/api"))
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    scraper = get_scraper_by_slug(args.slug)
+    if scraper is None:
+        sys.exit(f"No scraper registered for {args.slug}")
+
+    # Scrapers with declarative fields give the values to look for
+    draws_from = scraper.extract_draws if getattr(scraper, "draw_fields", None) else None
+    exchanges, expected, page_source = capture(scraper.url, draws_from, args.timeout, not args.headed)
+    ranked = candidates(exchanges, expected)
+
+    print(f"{len(exchanges)} JSON responses, {len(expected or [])} draws on the page")
+    for candidate in ranked[:10]:
+        matched = f"{candidate.matched}/{candidate.expected}" if candidate.expected else "guessed"
+        print(
+            f"{matched:>8}  {candidate.exchange.method:<4} {candidate.exchange.url[:90]}"
+            f"  [{candidate.draws or '.'}] {', '.join(candidate.fields)}"
+        )
+    if not ranked:
+        sys.exit("No JSON response carried the draws; keep the browser scraper")
+
+    best = ranked[0]
+    if args.dry_run:
+        return
+    source_path = save_api_source(best.source(args.slug, scraper.url))
+    page, response = write_fixtures(args.slug, page_source, best.exchange.payload, args.fixtures)
+    print(f"Wrote {source_path}, fixtures {page} and {response}")
+    print(f"Check both paths agree: python -m benchmarks.api_parity {args.slug} --fixtures {args.fixtures}")
+
+
+if __name__ == "__main__":
+    main()
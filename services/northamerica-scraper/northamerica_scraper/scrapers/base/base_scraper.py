@@ -0,0 +1,371 @@
+"""Base scraper class for all lottery scrapers"""
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session
+from northamerica_scraper.database.session import get_db
+from northamerica_scraper.database.models import ScraperJob
+from northamerica_scraper.database.lottery_cache import lottery_cache
+from northamerica_scraper.database.fingerprints import load_fingerprint, store_fingerprint
+from northamerica_scraper.database.writer import WriteSummary, bulk_insert_results
+from northamerica_scraper.utils import metrics
+from northamerica_scraper.utils.logger import get_logger
+from northamerica_scraper.utils.timing import FETCH, FINGERPRINT, PARSE, SAVE, VALIDATE, StageTimer
+from northamerica_scraper.config.countries import get_lottery_config
+
+logger = get_logger(__name__)
+
+
+class PageUnchanged(Exception):
+    """Source page is identical to the last successful scrape"""
+
+
+class BaseScraper(ABC):
+    """Abstract base class for lottery scrapers"""
+
+    # CSS selector for the part of the page parse_results reads
+    fingerprint_selector: Optional[str] = None
+
+    # Draws read from the latest-results page; None reads every draw on the page
+    latest_draws: Optional[int] = 5
+
+    # Archive page URL with {start}/{end} ISO dates; None means no backfill support
+    archive_url_template: Optional[str] = None
+
+    # Scrapers of one type with the same key are fetched together when due at
+    # the same time (see batch); None keys on the page URL
+    batch_key: Optional[str] = None
+
+    def __init__(self, slug: str):
+        self.slug = slug
+        self.config = get_lottery_config(slug)
+        if not self.config:
+            raise ValueError(f"No configuration found for lottery slug: {slug}")
+        
+        self.url = self.config["url"]
+        self.name = self.config["name"]
+        self.logger = logger.bind(slug=slug)
+        self._pending_fingerprint: Optional[str] = None
+        self.timings = StageTimer()
+        self.batch = None
+
+    @abstractmethod
+    def scrape(self) -> List[Dict]:
+        """
+        Scrape lottery results from the website
+        
+        Returns:
+            List of result dictionaries
+        """
+        pass
+
+    @abstractmethod
+    def parse_results(self, raw_data: any) -> Iterable[Dict]:
+        """
+        Parse raw scraped data into structured results
+        
+        Implement as a generator so draws stream into the batched writer
+        instead of being collected into a list first.
+        
+        Args:
+            raw_data: Raw data from scraping
+        
+        Yields:
+            Parsed result dictionaries
+        """
+        pass
+
+    def fetch_archive_page(self, url: str) -> any:
+        """
+        Fetch one archive page for backfill
+        
+        Args:
+            url: Archive page URL
+        
+        Returns:
+            Raw data accepted by parse_results
+        """
+        raise NotImplementedError("Subclasses must implement fetch_archive_page")
+
+    def archive_pages(self, start: date, end: date) -> Iterator[Tuple[str, str]]:
+        """
+        Split a date range into monthly archive pages
+        
+        Args:
+            start: First draw date to backfill
+            end: Last draw date to backfill
+        
+        Yields:
+            (window key such as "2024-01", archive URL) pairs
+        """
+        if not self.archive_url_template:
+            raise NotImplementedError(f"No archive pages configured for {self.slug}")
+        
+        window = start
+        while window <= end:
+            next_month = (window.replace(day=1) + timedelta(days=32)).replace(day=1)
+            window_end = min(next_month - timedelta(days=1), end)
+            url = self.archive_url_template.format(
+                start=window.isoformat(),
+                end=window_end.isoformat(),
+            )
+            yield window.strftime("%Y-%m"), url
+            window = next_month
+
+    def fetch_batch(self, scrapers: Sequence["BaseScraper"]) -> Dict[str, Any]:
+        """
+        Fetch for the members of a batch this scraper is first to run in
+        
+        The default fetches only this scraper's page; members left out of
+        the result fetch their own when their turn comes.
+        
+        Args:
+            scrapers: Every member of the batch, this one included
+        
+        Returns:
+            Raw data by slug, or the exception fetching it raised
+        """
+        return {self.slug: self.scrape()}
+
+    def cleanup(self) -> None:
+        """Release resources held for a single page; no-op by default"""
+        pass
+
+    def page_fingerprint(self, raw_data: any) -> Optional[str]:
+        """
+        Fingerprint the content parse_results depends on
+        
+        Args:
+            raw_data: Raw data from scraping
+        
+        Returns:
+            Fingerprint, or None to always parse
+        """
+        return None
+
+    def check_fingerprint(self, raw_data: any) -> None:
+        """
+        Raise PageUnchanged if the page matches the last saved scrape
+        
+        Args:
+            raw_data: Raw data from scraping
+        """
+        value = self.page_fingerprint(raw_data)
+        if value is None:
+            return
+        
+        if value == load_fingerprint(self.slug):
+            self.logger.info("Page fingerprint unchanged")
+            raise PageUnchanged(self.slug)
+        self._pending_fingerprint = value
+
+    def mark_success(self) -> None:
+        """Hook called once results are saved; subclasses persist fetch state here"""
+        if self._pending_fingerprint:
+            store_fingerprint(self.slug, self._pending_fingerprint)
+            self._pending_fingerprint = None
+
+    def result_rows(self, results: Iterable[Dict], lottery_id) -> Iterator[Dict]:
+        """
+        Map parsed results to Result rows, skipping malformed ones
+        
+        Args:
+            results: Parsed result dictionaries
+            lottery_id: Lottery the results belong to
+        
+        Yields:
+            Row dictionaries for bulk_insert_results
+        """
+        for result in results:
+            try:
+                yield {
+                    "lotteryId": lottery_id,
+                    "drawDate": result["draw_date"],
+                    "numbers": result["numbers"],
+                    "jackpot": result.get("jackpot"),
+                    "currency": result.get("currency", "EUR"),
+                    "winners": result.get("winners")
+                }
+            except Exception as e:
+                self.logger.error("Failed to prepare result", 
+                                error=str(e), 
+                                result=result)
+
+    def save_results(self, results: Iterable[Dict], db: Session) -> WriteSummary:
+        """
+        Save results to database with deduplication
+        
+        Rows are consumed as parse_results yields them and go out as
+        batched multi-row INSERTs; draws already stored are skipped by
+        ON CONFLICT on ("lotteryId", "drawDate"). Each batch is committed
+        as it is written, so the first rows land before parsing ends and
+        a failing batch rolls back only itself.
+        
+        Args:
+            results: Result dictionaries (any iterable, typically a generator)
+            db: Database session
+        
+        Returns:
+            WriteSummary with inserted and skipped counts
+        """
+        # Get lottery ID
+        lottery = lottery_cache.get(self.slug)
+        if not lottery:
+            self.logger.error("Lottery not found in database", slug=self.slug)
+            return WriteSummary()
+        
+        # Time spent pulling rows through result_rows (and the parser behind
+        # it) is booked to validate/parse, leaving save with the DB time
+        rows = self.timings.timed_iter(self.result_rows(results, lottery.id), VALIDATE, count_as="valid")
+        
+        try:
+            summary = bulk_insert_results(db, rows, commit_batches=True)
+            self.logger.info("Saved results to database", 
+                           count=summary.inserted, 
+                           skipped=summary.skipped)
+        except Exception as e:
+            db.rollback()
+            self.logger.error("Failed to commit results", error=str(e))
+            raise
+        
+        return summary
+
+    def record_timings(self, job: ScraperJob) -> None:
+        """
+        Copy this run's stage breakdown onto its job row
+        
+        Args:
+            job: Job row being finished (the caller commits)
+        """
+        job.stageTimings = self.timings.breakdown()
+        job.bytesFetched = self.timings.bytes_fetched
+
+    def run(self) -> Dict:
+        """
+        Run the complete scraping process
+        
+        Returns:
+            Dict with execution summary
+        """
+        start_time = datetime.now()
+        self.timings = StageTimer()
+        db = get_db()
+        
+        # Get lottery for job tracking
+        lottery = lottery_cache.get(self.slug)
+        job_id = None
+        metrics.JOBS_RUNNING.inc()
+        
+        try:
+            # Create job record
+            if lottery:
+                job = ScraperJob(
+                    lotteryId=lottery.id,
+                    status="running",
+                    startedAt=start_time
+                )
+                db.add(job)
+                db.commit()
+                job_id = job.id
+            
+            self.logger.info("Starting scrape", job_id=job_id)
+            
+            # Scrape results
+            with self.timings.stage(FETCH):
+                raw_results = self.batch.fetch(self) if self.batch else self.scrape()
+            with self.timings.stage(FINGERPRINT):
+                self.check_fingerprint(raw_results)
+            
+            # Parse and save; draws stream from the parser into the writer
+            parsed = self.timings.timed_iter(self.parse_results(raw_results), PARSE, count_as="parsed")
+            with self.timings.stage(SAVE):
+                summary = self.save_results(parsed, db)
+            saved_count = summary.inserted
+            self.timings.rows.update(inserted=summary.inserted, skipped=summary.skipped)
+            self.mark_success()
+            
+            # Update job status
+            if job_id:
+                job = db.query(ScraperJob).filter(ScraperJob.id == job_id).first()
+                if job:
+                    job.status = "success"
+                    job.completedAt = datetime.now()
+                    job.resultsCount = saved_count
+                    job.executionTimeMs = int((datetime.now() - start_time).total_seconds() * 1000)
+                    self.record_timings(job)
+                    db.commit()
+            
+            self.logger.info("Scrape completed successfully", 
+                           results_count=summary.total,
+                           saved_count=saved_count)
+            metrics.record_job(
+                self.slug, "success", (datetime.now() - start_time).total_seconds(),
+                self.timings.breakdown(), inserted=saved_count, skipped=summary.skipped
+            )
+            
+            return {
+                "status": "success",
+                "slug": self.slug,
+                "results_found": summary.total,
+                "results_saved": saved_count,
+                "results_skipped": summary.skipped,
+                "execution_time_ms": int((datetime.now() - start_time).total_seconds() * 1000),
+                "stage_timings": self.timings.breakdown()
+            }
+            
+        except PageUnchanged:
+            # Nothing new at the source: no parse, no DB writes
+            self.logger.info("Source unchanged, skipping parse", job_id=job_id)
+            
+            if job_id:
+                job = db.query(ScraperJob).filter(ScraperJob.id == job_id).first()
+                if job:
+                    job.status = "unchanged"
+                    job.completedAt = datetime.now()
+                    job.resultsCount = 0
+                    job.executionTimeMs = int((datetime.now() - start_time).total_seconds() * 1000)
+                    self.record_timings(job)
+                    db.commit()
+            metrics.record_job(
+                self.slug, "unchanged", (datetime.now() - start_time).total_seconds(), self.timings.breakdown()
+            )
+            
+            return {
+                "status": "unchanged",
+                "slug": self.slug,
+                "results_found": 0,
+                "results_saved": 0,
+                "execution_time_ms": int((datetime.now() - start_time).total_seconds() * 1000)
+            }
+            
+        except Exception as e:
+            self.logger.error("Scrape failed", error=str(e), exc_info=True)
+            
+            # Update job status to failed
+            if job_id:
+                try:
+                    job = db.query(ScraperJob).filter(ScraperJob.id == job_id).first()
+                    if job:
+                        job.status = "failed"
+                        job.completedAt = datetime.now()
+                        job.errorMessage = str(e)
+                        job.executionTimeMs = int((datetime.now() - start_time).total_seconds() * 1000)
+                        self.record_timings(job)
+                        db.commit()
+                except Exception as db_error:
+                    self.logger.error("Failed to update job status", error=str(db_error))
+            metrics.record_job(
+                self.slug, "failed", (datetime.now() - start_time).total_seconds(),
+                self.timings.breakdown(), error=e
+            )
+            
+            return {
+                "status": "failed",
+                "slug": self.slug,
+                "error": str(e),
+                "execution_time_ms": int((datetime.now() - start_time).total_seconds() * 1000)
+            }
+        finally:
+            metrics.JOBS_RUNNING.dec()
+            db.close()
@@ -0,0 +1,104 @@
+"""
+Same-source batching: one fetch serving several lottery scrapers
+
+Some operators publish several games on one results page (Pronósticos
+lists Melate and Chispazo together), or on pages of one site best read
+in one browser session. Scrapers of the same type whose batch_key (by
+default the page URL) matches are scheduled as one job and, when due
+together, run as a FetchBatch: the first member's fetch stage fetches
+for all of them and the rest parse what it read. Parsing, fingerprints,
+saves, job records and metrics stay per slug.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def source_key(lottery: Dict, scraper_class: Optional[type]) -> Optional[Tuple[str, str]]:
+    """
+    What a lottery's scraper fetches, as a grouping key
+
+    Args:
+        lottery: Lottery config
+        scraper_class: Its registered scraper class, None if unimplemented
+
+    Returns:
+        (scraper type, batch_key or URL), None for lotteries without a scraper
+    """
+    if scraper_class is None:
+        return None
+    return lottery.get("type", ""), scraper_class.batch_key or lottery["url"]
+
+
+def batch_groups(lotteries: Iterable[Dict], registry: Dict[str, type]) -> List[List[Dict]]:
+    """
+    Group lottery configs whose scrapers share a source
+
+    Args:
+        lotteries: Lottery configs in schedule order
+        registry: Slug to scraper class
+
+    Returns:
+        Groups in order of their first member; lotteries sharing nothing
+        (or without a scraper) are groups of one
+    """
+    groups: Dict[Any, List[Dict]] = {}
+    for lottery in lotteries:
+        key = source_key(lottery, registry.get(lottery["slug"])) or lottery["slug"]
+        groups.setdefault(key, []).append(lottery)
+    return list(groups.values())
+
+
+class FetchBatch:
+    """
+    Scrapers due together on one source, fetched once
+
+    Members run one after another through their own run(). The first to
+    reach its fetch stage calls fetch_batch() for everyone, so that job
+    carries the fetch time and bytes; the others are handed their share.
+    A fetch error handed out fails only the members it applies to.
+    """
+
+    def __init__(self, scrapers: Sequence):
+        self.scrapers = list(scrapers)
+        self._fetched: Optional[Dict[str, Any]] = None
+        for scraper in self.scrapers:
+            scraper.batch = self
+
+    def fetch(self, scraper) -> Any:
+        """
+        Raw data for one member, fetching for all members on the first call
+
+        Args:
+            scraper: Batch member in its fetch stage
+
+        Returns:
+            What the member's own scrape() would have returned
+        """
+        if self._fetched is None:
+            self._fetched = scraper.fetch_batch(self.scrapers)
+        elif scraper.slug in self._fetched:
+            scraper.logger.info("Using batch fetch", batch=[member.slug for member in self.scrapers])
+
+        if scraper.slug not in self._fetched:
+            return scraper.scrape()
+        fetched = self._fetched.pop(scraper.slug)
+        if isinstance(fetched, Exception):
+            raise fetched
+        return fetched
+
+    def run(self) -> List[Dict]:
+        """
+        Run every member
+
+        Returns:
+            Each member's run() summary, in order
+        """
+        logger.info("Running batch", slugs=[scraper.slug for scraper in self.scrapers])
+        try:
+            return [scraper.run() for scraper in self.scrapers]
+        finally:
+            for scraper in self.scrapers:
+                scraper.batch = None
@@ -0,0 +1,212 @@
+"""BeautifulSoup4-based scraper for simple HTML parsing"""
+
+import httpx
+from bs4 import BeautifulSoup
+from typing import Any, Dict, Iterator, Optional, Sequence
+from northamerica_scraper.database.fingerprints import fingerprint
+from northamerica_scraper.scrapers.base.base_scraper import BaseScraper, PageUnchanged
+from northamerica_scraper.utils.http_client import http_client
+from northamerica_scraper.utils.response_cache import CacheEntry, content_hash, response_cache
+from northamerica_scraper.utils.timing import PARSE
+
+
+class BS4Scraper(BaseScraper):
+    """Base scraper using BeautifulSoup4 for HTML parsing"""
+
+    def __init__(self, slug: str):
+        super().__init__(slug)
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        # Validators from this run, persisted only after results are saved
+        self._pending_cache: Dict[str, CacheEntry] = {}
+
+    def cache_key(self, url: str) -> str:
+        """
+        Conditional cache key for a URL
+        
+        Batch members share a page but save separately, so each keeps its
+        own validators: one member's successful save must not turn the
+        next fetch into a 304 for a member whose save failed.
+        """
+        return f"{self.slug}:{url}"
+
+    def fetch_html(self) -> str:
+        """
+        Fetch HTML content from URL over the shared connection pool
+        
+        Sends the validators from the last successful fetch and raises
+        PageUnchanged on 304 Not Modified or an identical body.
+        
+        Returns:
+            HTML content as string
+        """
+        cached = response_cache.get(self.cache_key(self.url))
+        return self._accept(self._request(cached), cached)
+
+    def _request(self, cached: Optional[CacheEntry]) -> httpx.Response:
+        """
+        GET this scraper's URL, conditional on cached validators
+        
+        Args:
+            cached: Validators to send, None for a plain GET
+        
+        Returns:
+            The 200 response; PageUnchanged is raised on 304
+        """
+        headers = {**self.headers, **cached.conditional_headers()} if cached else self.headers
+        
+        try:
+            response = http_client.get(self.url, headers=headers)
+            if response.status_code == 304:
+                self.logger.info("Page not modified", url=self.url)
+                raise PageUnchanged(self.url)
+            response.raise_for_status()
+        except PageUnchanged:
+            raise
+        except Exception as e:
+            self.logger.error("Failed to fetch HTML", error=str(e))
+            raise
+        
+        self.timings.fetched(len(response.content))
+        return response
+
+    def _accept(self, response: httpx.Response, cached: Optional[CacheEntry]) -> str:
+        """
+        Markup of a fetched page, unless it is what this scraper last saved
+        
+        Args:
+            response: 200 response for this scraper's URL
+            cached: Validators this scraper last saved
+        
+        Returns:
+            HTML content as string; PageUnchanged is raised on an identical body
+        """
+        entry = CacheEntry(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash(response.content),
+        )
+        if cached and cached.content_hash == entry.content_hash:
+            # Server ignored the validators but the body is the same
+            response_cache.set(self.cache_key(self.url), entry)
+            self.logger.info("Page content unchanged", url=self.url)
+            raise PageUnchanged(self.url)
+        
+        self._pending_cache[self.cache_key(self.url)] = entry
+        return response.text
+
+    def mark_success(self) -> None:
+        """Remember validators for pages whose results were saved"""
+        super().mark_success()
+        for key, entry in self._pending_cache.items():
+            response_cache.set(key, entry)
+        self._pending_cache.clear()
+
+    def page_fingerprint(self, soup: BeautifulSoup) -> Optional[str]:
+        """
+        Fingerprint the selected fragment, or the whole page without a selector
+        
+        Args:
+            soup: BeautifulSoup object
+        
+        Returns:
+            Fingerprint string
+        """
+        if self.fingerprint_selector:
+            content = "".join(str(el) for el in soup.select(self.fingerprint_selector))
+        else:
+            content = str(soup)
+        return fingerprint(content)
+
+    def parse_html(self, html: str) -> BeautifulSoup:
+        """
+        Parse HTML content with BeautifulSoup
+        
+        Args:
+            html: HTML content
+        
+        Returns:
+            BeautifulSoup object
+        """
+        return BeautifulSoup(html, "lxml")
+
+    def scrape(self) -> BeautifulSoup:
+        """
+        Scrape the lottery website
+        
+        Returns:
+            BeautifulSoup object
+        """
+        self.logger.info("Fetching HTML", url=self.url)
+        html = self.fetch_html()
+        with self.timings.stage(PARSE):
+            return self.parse_html(html)
+
+    def fetch_batch(self, scrapers: Sequence[BaseScraper]) -> Dict[str, Any]:
+        """
+        Fetch and parse this page once for every batch member on its URL
+        
+        The request is conditional only when every member saved the same
+        version, so a 304 or fetch error applies to all of them alike.
+        Each member checks the body against its own saved hash and keeps
+        its own validators. Members on other URLs fetch their own.
+        
+        Args:
+            scrapers: Every member of the batch, this one included
+        
+        Returns:
+            The shared BeautifulSoup (or exception) by slug
+        """
+        members = [scraper for scraper in scrapers if isinstance(scraper, BS4Scraper) and scraper.url == self.url]
+        cached = {member.slug: response_cache.get(member.cache_key(member.url)) for member in members}
+        versions = list(cached.values())
+        shared = versions[0] if all(version == versions[0] for version in versions) else None
+        self.logger.info("Fetching HTML", url=self.url)
+        try:
+            response = self._request(shared)
+        except Exception as e:
+            return {member.slug: e for member in members}
+        
+        fetched: Dict[str, Any] = {}
+        soup = None
+        for member in members:
+            try:
+                html = member._accept(response, cached[member.slug])
+            except PageUnchanged as e:
+                fetched[member.slug] = e
+                continue
+            if soup is None:
+                with self.timings.stage(PARSE):
+                    soup = self.parse_html(html)
+            fetched[member.slug] = soup
+        return fetched
+
+    def fetch_archive_page(self, url: str) -> BeautifulSoup:
+        """
+        Fetch an archive page for backfill, bypassing the conditional cache
+        
+        Args:
+            url: Archive page URL
+        
+        Returns:
+            BeautifulSoup object
+        """
+        response = http_client.get(url, headers=self.headers)
+        response.raise_for_status()
+        return self.parse_html(response.text)
+
+    def parse_results(self, soup: BeautifulSoup) -> Iterator[Dict]:
+        """
+        Parse results from BeautifulSoup object
+        Override this method in subclasses
+        
+        Args:
+            soup: BeautifulSoup object
+        
+        Yields:
+            Result dictionaries
+        """
+        raise NotImplementedError("Subclasses must implement parse_results method")
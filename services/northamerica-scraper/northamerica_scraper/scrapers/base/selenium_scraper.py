@@ -0,0 +1,403 @@
+"""Selenium-based scraper for JavaScript-heavy websites"""
+
+from dataclasses import dataclass
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from northamerica_scraper.database.fingerprints import fingerprint
+from northamerica_scraper.scrapers.base.base_scraper import BaseScraper
+from northamerica_scraper.scrapers.base.browser_profile import (
+    block_resources, blocked_patterns, lean_options, page_weight, timed_get,
+)
+from northamerica_scraper.scrapers.base.driver_pool import DriverPool
+from northamerica_scraper.scrapers.base.readiness import (
+    LOCATE_JS, Locator, ReadyWhen, element_ready, network_idle, wait_until_ready,
+)
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.config import runtime
+from northamerica_scraper.utils.cassette import page_url, record_page
+
+
+def create_driver() -> webdriver.Chrome:
+    """
+    Create Chrome WebDriver with options
+    
+    Returns:
+        Chrome WebDriver instance
+    """
+    chrome_options = Options()
+    
+    if settings.SELENIUM_HEADLESS:
+        chrome_options.add_argument("--headless=new")
+    
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument(
+        "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    
+    # No images, extensions or background traffic; get() returns at DOMContentLoaded
+    lean_options(chrome_options)
+    
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.set_page_load_timeout(settings.SELENIUM_TIMEOUT)
+    
+    return driver
+
+
+# Reads every draw in one WebDriver round trip. Arguments: the locator
+# path to the draw elements, {name: [path, many, attribute]} per field,
+# and the maximum number of draws (null for all). Text is whitespace-
+# normalized like WebElement.text on a single line.
+EXTRACT_DRAWS_SCRIPT = LOCATE_JS + """
+const [drawPath, fields, limit] = arguments;
+const read = (el, attribute) => attribute
+  ? el.getAttribute(attribute)
+  : (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim();
+let draws = follow([document], drawPath);
+if (limit !== null && limit !== undefined) draws = draws.slice(0, limit);
+return draws.map(draw => {
+  const row = {};
+  for (const [name, [path, many, attribute]] of Object.entries(fields)) {
+    const found = follow([draw], path);
+    row[name] = many ? found.map(el => read(el, attribute)) : (found.length ? read(found[0], attribute) : null);
+  }
+  return row;
+});
+"""
+
+
+class Field:
+    """
+    Value read from each draw element by SeleniumScraper.extract_draws
+    
+    Args:
+        *path: Locators applied in turn, starting from the draw element
+        many: Read every match into a list instead of the first (None if absent)
+        attribute: Read this attribute instead of the element text
+    """
+
+    def __init__(self, *path: Locator, many: bool = False, attribute: Optional[str] = None):
+        self.path = path
+        self.many = many
+        self.attribute = attribute
+
+    def spec(self) -> List:
+        """Argument form for EXTRACT_DRAWS_SCRIPT"""
+        return [[list(locator) for locator in self.path], self.many, self.attribute]
+
+
+@dataclass
+class RenderedPage:
+    """
+    What a scrape read from the browser before releasing it
+    
+    Attributes:
+        url: Page URL
+        draws: extract_draws() rows
+        fragment: outerHTML of the fingerprint_selector matches, None without a selector
+    """
+    url: str
+    draws: List[Dict[str, Any]]
+    fragment: Optional[str] = None
+
+
+# Warm drivers shared by every Selenium scraper in the process
+driver_pool = runtime.driver_pool or DriverPool(
+    create_driver,
+    max_size=settings.MAX_CONCURRENT_SCRAPERS,
+    max_uses=settings.DRIVER_MAX_USES,
+)
+
+
+class SeleniumScraper(BaseScraper):
+    """
+    Base scraper using Selenium for JavaScript-heavy sites
+    
+    A scrape loads the page on a pooled driver, waits until ready_when
+    holds, reads the draws and fingerprint fragment in one go and releases
+    the driver. parse_results() then works on the RenderedPage alone.
+    """
+
+    # Declarative extraction for extract_draws(): locators from the page to
+    # each draw element, and the fields read relative to it
+    draw_path: Tuple[Locator, ...] = ()
+    draw_fields: Dict[str, Field] = {}
+
+    # What marks the results as rendered (see readiness); defaults to a draw
+    # element being present, or to network idle without draw_path
+    ready_when: Optional[ReadyWhen] = None
+
+    # Network.setBlockedURLs tuning on top of DEFAULT_BLOCKED_URLS (see browser_profile)
+    block_urls: Tuple[str, ...] = ()
+    allow_urls: Tuple[str, ...] = ()
+
+    def __init__(self, slug: str):
+        super().__init__(slug)
+        self.driver = None
+
+    def setup_driver(self) -> webdriver.Chrome:
+        """
+        Setup a standalone Chrome WebDriver (not pooled)
+        
+        Returns:
+            Chrome WebDriver instance
+        """
+        return create_driver()
+
+    def wait_for_element(self, by: By, value: str, timeout: int = None) -> any:
+        """
+        Wait for element to be present
+        
+        Args:
+            by: By locator strategy
+            value: Locator value
+            timeout: Timeout in seconds (default: from settings)
+        
+        Returns:
+            WebElement
+        """
+        if timeout is None:
+            timeout = settings.SELENIUM_TIMEOUT
+        
+        wait = WebDriverWait(self.driver, timeout)
+        return wait.until(EC.presence_of_element_located((by, value)))
+
+    def readiness(self) -> ReadyWhen:
+        """
+        Condition marking this scraper's results as ready
+        
+        Returns:
+            ready_when, else a draw element being present, else network idle
+        """
+        if self.ready_when is not None:
+            return self.ready_when
+        if self.draw_path:
+            return element_ready(*self.draw_path)
+        return network_idle()
+
+    def scrape(self) -> RenderedPage:
+        """
+        Scrape the lottery website using Selenium
+        
+        Returns:
+            Rendered page, read once the results are ready
+        """
+        return self.render(self.url)
+
+    def fetch_archive_page(self, url: str) -> RenderedPage:
+        """
+        Load an archive page for backfill on a pooled driver
+        
+        Args:
+            url: Archive page URL
+        
+        Returns:
+            Rendered page, read once the results are ready
+        """
+        return self.render(url)
+
+    def render(self, url: str) -> RenderedPage:
+        """
+        Load url, wait until the results are ready, read them and release the driver
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Rendered page
+        
+        Raises:
+            TimeoutException: The results did not render within SELENIUM_TIMEOUT
+        """
+        broken = False
+        try:
+            self.driver = driver_pool.checkout()
+            self.logger.info("Loading page", url=url)
+            self.load_page(url)
+            
+            waited_ms = wait_until_ready(self.driver, self.readiness(), settings.SELENIUM_TIMEOUT)
+            self.logger.debug("Results ready", url=url, waited_ms=waited_ms)
+            
+            page = self.capture(self.driver, url)
+            record_page(url, self.driver)
+            return page
+            
+        except Exception as e:
+            self.logger.error("Failed to load page", url=url, error=str(e))
+            # A driver that crashed or timed out is not trusted with the next page
+            broken = isinstance(e, WebDriverException)
+            raise
+        finally:
+            self.cleanup(discard=broken)
+
+    def fetch_batch(self, scrapers: Sequence[BaseScraper]) -> Dict[str, Any]:
+        """
+        Render every Selenium member's page on one driver checkout
+        
+        Each distinct URL is loaded once, blocking only what all members on
+        it block; each member then waits for its own readiness condition
+        and captures its draws from the same DOM. A page that fails to load
+        fails the members on it, a member whose results never render only
+        that member.
+        
+        Args:
+            scrapers: Every member of the batch, this one included
+        
+        Returns:
+            RenderedPage (or exception) by slug
+        """
+        members = [scraper for scraper in scrapers if isinstance(scraper, SeleniumScraper)]
+        pages: Dict[str, Any] = {}
+        broken = False
+        try:
+            self.driver = driver_pool.checkout()
+            for url in dict.fromkeys(member.url for member in members):
+                on_page = [member for member in members if member.url == url]
+                patterns = [blocked_patterns(member.block_urls, member.allow_urls) for member in on_page]
+                blocked = [pattern for pattern in patterns[0] if all(pattern in other for other in patterns)]
+                try:
+                    self.logger.info("Loading page", url=url, batch=[member.slug for member in on_page])
+                    self.load_page(url, blocked)
+                except Exception as e:
+                    self.logger.error("Failed to load page", url=url, error=str(e))
+                    pages.update((member.slug, e) for member in on_page)
+                    broken = broken or isinstance(e, WebDriverException)
+                    continue
+                
+                for member in on_page:
+                    try:
+                        waited_ms = wait_until_ready(self.driver, member.readiness(), settings.SELENIUM_TIMEOUT)
+                        member.logger.debug("Results ready", url=url, waited_ms=waited_ms)
+                        pages[member.slug] = member.capture(self.driver, url)
+                    except Exception as e:
+                        member.logger.error("Failed to read page", url=url, error=str(e))
+                        pages[member.slug] = e
+                        broken = broken or isinstance(e, WebDriverException)
+                record_page(url, self.driver)
+        finally:
+            self.cleanup(discard=broken)
+        return pages
+
+    def load_page(self, url: str, blocked: Optional[Sequence[str]] = None) -> None:
+        """
+        Load url on the checked-out driver with this site's resource blocking
+        
+        The time driver.get() blocked and the page weight go into the stage timings.
+        
+        Args:
+            url: Page URL (replaced by the stand-in's when replaying)
+            blocked: URL patterns to block instead of this scraper's own
+        """
+        if blocked is None:
+            blocked = blocked_patterns(self.block_urls, self.allow_urls)
+        block_resources(self.driver, blocked)
+        load_ms = timed_get(self.driver, page_url(url))
+        weight = page_weight(self.driver)
+        self.timings.loaded_page(load_ms, weight)
+        self.logger.debug("Page loaded", url=url, load_ms=round(load_ms), **(weight or {}))
+
+    def capture(self, driver: webdriver.Chrome, url: str) -> RenderedPage:
+        """
+        Read everything parsing and fingerprinting need from a ready page
+        
+        Args:
+            driver: Selenium WebDriver with the results rendered
+            url: Page URL
+        
+        Returns:
+            Rendered page
+        """
+        fragment = None
+        if self.fingerprint_selector:
+            fragment = driver.execute_script(
+                "return Array.from(document.querySelectorAll(arguments[0]))"
+                ".map(el => el.outerHTML).join('');",
+                self.fingerprint_selector,
+            ) or ""
+        return RenderedPage(url=url, draws=self.extract_draws(driver), fragment=fragment)
+
+    def page_fingerprint(self, page: RenderedPage) -> Optional[str]:
+        """
+        Fingerprint the rendered fragment matched by fingerprint_selector
+        
+        Live pages carry tokens and timestamps, so without a selector (or
+        when the fragment did not render) the page is always parsed.
+        
+        Args:
+            page: Rendered page
+        
+        Returns:
+            Fingerprint string or None
+        """
+        if not page.fragment:
+            return None
+        return fingerprint(page.fragment)
+
+    def extract_draws(self, driver: webdriver.Chrome) -> List[Dict[str, Any]]:
+        """
+        Read draw_fields from every draw element in a single execute_script call
+        
+        find_element(s) and .text each cost a WebDriver round trip, so
+        walking draws, balls and jackpots element by element takes hundreds
+        of them per page. Here the browser walks the DOM and returns one
+        JSON list, and parse_results only converts strings.
+        
+        Args:
+            driver: Selenium WebDriver with loaded page
+        
+        Returns:
+            One dict per draw (up to latest_draws) mapping field names to text,
+            a list of texts for many-fields, or None when absent
+        """
+        fields = {name: field.spec() for name, field in self.draw_fields.items()}
+        draw_path = [list(locator) for locator in self.draw_path]
+        return driver.execute_script(EXTRACT_DRAWS_SCRIPT, draw_path, fields, self.latest_draws) or []
+
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
+        """
+        Parse results from a rendered page
+        Override this method in subclasses
+        
+        Args:
+            page: Rendered page; the driver is already released
+        
+        Yields:
+            Result dictionaries
+        """
+        raise NotImplementedError("Subclasses must implement parse_results method")
+
+    def cleanup(self, discard: bool = False) -> None:
+        """
+        Return Selenium driver to the pool
+        
+        Args:
+            discard: Quit the driver instead; it crashed or timed out
+        """
+        if self.driver:
+            try:
+                driver_pool.release(self.driver, discard=discard)
+                self.logger.debug("Selenium driver released")
+            except Exception as e:
+                self.logger.warning("Error releasing driver", error=str(e))
+            finally:
+                self.driver = None
+
+    def run(self) -> Dict:
+        """
+        Run scraper with automatic cleanup
+        
+        Returns:
+            Dict with execution summary
+        """
+        try:
+            return super().run()
+        finally:
+            self.cleanup()
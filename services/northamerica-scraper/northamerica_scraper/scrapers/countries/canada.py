@@ -1,12 +1,11 @@
 """Canadian lottery scrapers"""
 
-from typing import List, Dict
+from typing import Dict, Iterator
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.utils.logger import get_logger
+from northamerica_scraper.scrapers.base.readiness import element_ready
+from northamerica_scraper.scrapers.base.selenium_scraper import Field, RenderedPage, SeleniumScraper
+from northamerica_scraper.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -14,7 +13,15 @@ logger = get_logger(__name__)
 class Lotto649Scraper(SeleniumScraper):
     """Scraper for Canadian Lotto 6/49"""
     
-    def parse_results(self, driver) -> List[Dict]:
+    fingerprint_selector = ".draw-container"
+    draw_path = ((By.CLASS_NAME, "draw-container"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "draw-date")),
+        "numbers": Field((By.CLASS_NAME, "ball-number"), many=True),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "draw-container"), (By.CLASS_NAME, "ball-number"))
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
         """
         Parse Lotto 6/49 results from OLG website
         
@@ -23,52 +30,37 @@ class Lotto649Scraper(SeleniumScraper):
         - 1 bonus number (1-49)
         - Draw date
         """
-        results = []
+        count = 0
         
         try:
-            # Wait for results section
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "lotto-results"))
-            )
-            
-            # Find recent draws
-            draw_containers = driver.find_elements(By.CLASS_NAME, "draw-container")[:5]
-            
-            for container in draw_containers:
+            # Recent draws
+            for draw in page.draws:
                 try:
-                    # Extract date
-                    date_elem = container.find_element(By.CLASS_NAME, "draw-date")
-                    draw_date = self._parse_date(date_elem.text)
+                    draw_date = self._parse_date(draw["date"])
                     
-                    # Extract main numbers
-                    main_numbers = []
-                    number_elements = container.find_elements(By.CLASS_NAME, "ball-number")
-                    for i, num_elem in enumerate(number_elements):
-                        num = int(num_elem.text)
-                        if i < 6:  # First 6 are main numbers
-                            main_numbers.append(num)
-                        else:  # 7th is bonus
-                            bonus_number = num
+                    # First 6 are main numbers, 7th is bonus
+                    numbers = [int(n) for n in draw["numbers"]]
+                    main_numbers = numbers[:6]
+                    bonus_number = numbers[6]
                     
-                    results.append({
+                    yield {
                         "draw_date": draw_date,
                         "numbers": {
                             "main": sorted(main_numbers),
                             "bonus": [bonus_number]
                         },
                         "currency": "CAD"
-                    })
+                    }
+                    count += 1
                     
                 except Exception as e:
                     logger.error("Failed to parse Lotto 6/49 result", error=str(e))
                     continue
             
-            logger.info("Parsed Lotto 6/49 results", count=len(results))
-            return results
+            logger.info("Parsed Lotto 6/49 results", count=count)
             
         except Exception as e:
             logger.error("Failed to parse Lotto 6/49 results", error=str(e))
-            return []
     
     def _parse_date(self, date_text: str) -> datetime:
         """Parse Canadian date formats"""
@@ -91,7 +83,16 @@ class Lotto649Scraper(SeleniumScraper):
 class LottoMaxScraper(SeleniumScraper):
     """Scraper for Canadian Lotto Max"""
     
-    def parse_results(self, driver) -> List[Dict]:
+    fingerprint_selector = ".max-draw"
+    draw_path = ((By.CLASS_NAME, "max-draw"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "date")),
+        "numbers": Field((By.CLASS_NAME, "number-ball"), many=True),
+        "jackpot": Field((By.CLASS_NAME, "jackpot")),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "max-draw"), (By.CLASS_NAME, "number-ball"))
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
         """
         Parse Lotto Max results from OLG website
         
@@ -100,36 +101,17 @@ class LottoMaxScraper(SeleniumScraper):
         - Draw date
         - Jackpot amount
         """
-        results = []
+        count = 0
         
         try:
-            # Wait for results
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "max-results"))
-            )
-            
-            # Find recent draws
-            draws = driver.find_elements(By.CLASS_NAME, "max-draw")[:5]
-            
-            for draw in draws:
+            # Recent draws
+            for draw in page.draws:
                 try:
-                    # Extract date
-                    date_text = draw.find_element(By.CLASS_NAME, "date").text
-                    draw_date = self._parse_date(date_text)
-                    
-                    # Extract numbers (7 main numbers)
-                    main_numbers = []
-                    balls = draw.find_elements(By.CLASS_NAME, "number-ball")
-                    for ball in balls[:7]:
-                        main_numbers.append(int(ball.text))
+                    draw_date = self._parse_date(draw["date"])
                     
-                    # Extract jackpot if available
-                    jackpot = None
-                    try:
-                        jackpot_elem = draw.find_element(By.CLASS_NAME, "jackpot")
-                        jackpot = jackpot_elem.text.strip()
-                    except:
-                        pass
+                    # 7 main numbers
+                    main_numbers = [int(n) for n in draw["numbers"][:7]]
+                    jackpot = draw["jackpot"]
                     
                     result = {
                         "draw_date": draw_date,
@@ -142,18 +124,17 @@ class LottoMaxScraper(SeleniumScraper):
                     if jackpot:
                         result["jackpot"] = jackpot
                     
-                    results.append(result)
+                    yield result
+                    count += 1
                     
                 except Exception as e:
                     logger.error("Failed to parse Lotto Max result", error=str(e))
                     continue
             
-            logger.info("Parsed Lotto Max results", count=len(results))
-            return results
+            logger.info("Parsed Lotto Max results", count=count)
             
         except Exception as e:
             logger.error("Failed to parse Lotto Max results", error=str(e))
-            return []
     
     def _parse_date(self, date_text: str) -> datetime:
         """Parse Canadian date formats"""
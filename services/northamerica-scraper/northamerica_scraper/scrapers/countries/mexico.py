@@ -1,12 +1,11 @@
 """Mexican lottery scrapers"""
 
-from typing import List, Dict
+from typing import Dict, Iterator
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from src.scrapers.base.selenium_scraper import SeleniumScraper
-from src.utils.logger import get_logger
+from northamerica_scraper.scrapers.base.readiness import element_ready
+from northamerica_scraper.scrapers.base.selenium_scraper import Field, RenderedPage, SeleniumScraper
+from northamerica_scraper.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
@@ -14,7 +13,15 @@ logger = get_logger(__name__)
 class MelateScraper(SeleniumScraper):
     """Scraper for Mexican Melate lottery"""
     
-    def parse_results(self, driver) -> List[Dict]:
+    fingerprint_selector = "#melate-results"
+    draw_path = ((By.ID, "melate-results"), (By.CLASS_NAME, "sorteo"))
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "fecha")),
+        "numbers": Field((By.CLASS_NAME, "numero"), many=True),
+    }
+    ready_when = element_ready((By.ID, "melate-results"), (By.CLASS_NAME, "sorteo"), (By.CLASS_NAME, "numero"))
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
         """
         Parse Melate results from Pronósticos website
         
@@ -23,29 +30,14 @@ class MelateScraper(SeleniumScraper):
         - 1 additional number
         - Draw date
         """
-        results = []
+        count = 0
         
         try:
-            # Wait for results to load
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "resultados"))
-            )
-            
-            # Find Melate results
-            melate_section = driver.find_element(By.ID, "melate-results")
-            draw_items = melate_section.find_elements(By.CLASS_NAME, "sorteo")[:5]
-            
-            for item in draw_items:
+            # Recent Melate draws
+            for draw in page.draws:
                 try:
-                    # Extract date
-                    date_elem = item.find_element(By.CLASS_NAME, "fecha")
-                    draw_date = self._parse_spanish_date(date_elem.text)
-                    
-                    # Extract numbers
-                    numbers = []
-                    balls = item.find_elements(By.CLASS_NAME, "numero")
-                    for ball in balls:
-                        numbers.append(int(ball.text))
+                    draw_date = self._parse_spanish_date(draw["date"])
+                    numbers = [int(n) for n in draw["numbers"]]
                     
                     # First 6 are main, 7th is additional
                     main_numbers = numbers[:6] if len(numbers) >= 6 else numbers
@@ -62,18 +54,17 @@ class MelateScraper(SeleniumScraper):
                     if additional:
                         result["numbers"]["bonus"] = additional
                     
-                    results.append(result)
+                    yield result
+                    count += 1
                     
                 except Exception as e:
                     logger.error("Failed to parse Melate result", error=str(e))
                     continue
             
-            logger.info("Parsed Melate results", count=len(results))
-            return results
+            logger.info("Parsed Melate results", count=count)
             
         except Exception as e:
             logger.error("Failed to parse Melate results", error=str(e))
-            return []
     
     def _parse_spanish_date(self, date_text: str) -> datetime:
         """Parse Spanish date formats"""
@@ -109,7 +100,16 @@ class MelateScraper(SeleniumScraper):
 class ChispazoScraper(SeleniumScraper):
     """Scraper for Mexican Chispazo lottery"""
     
-    def parse_results(self, driver) -> List[Dict]:
+    fingerprint_selector = ".chispazo-draw"
+    draw_path = ((By.CLASS_NAME, "chispazo-draw"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "fecha-hora")),
+        "numbers": Field((By.CLASS_NAME, "bola"), many=True),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "chispazo-draw"), (By.CLASS_NAME, "bola"))
+    latest_draws = 10  # two draws a day
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
         """
         Parse Chispazo results (daily lottery)
         
@@ -117,47 +117,32 @@ class ChispazoScraper(SeleniumScraper):
         - 5 numbers
         - Draw date and time
         """
-        results = []
+        count = 0
         
         try:
-            # Wait for results
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "chispazo-results"))
-            )
-            
-            # Find draws
-            draws = driver.find_elements(By.CLASS_NAME, "chispazo-draw")[:10]
-            
-            for draw in draws:
+            # Recent draws
+            for draw in page.draws:
                 try:
-                    # Extract date
-                    date_elem = draw.find_element(By.CLASS_NAME, "fecha-hora")
-                    draw_date = self._parse_spanish_date(date_elem.text)
+                    draw_date = self._parse_spanish_date(draw["date"])
+                    numbers = [int(n) for n in draw["numbers"]]
                     
-                    # Extract numbers
-                    numbers = []
-                    balls = draw.find_elements(By.CLASS_NAME, "bola")
-                    for ball in balls:
-                        numbers.append(int(ball.text))
-                    
-                    results.append({
+                    yield {
                         "draw_date": draw_date,
                         "numbers": {
                             "main": sorted(numbers)
                         },
                         "currency": "MXN"
-                    })
+                    }
+                    count += 1
                     
                 except Exception as e:
                     logger.error("Failed to parse Chispazo result", error=str(e))
                     continue
             
-            logger.info("Parsed Chispazo results", count=len(results))
-            return results
+            logger.info("Parsed Chispazo results", count=count)
             
         except Exception as e:
             logger.error("Failed to parse Chispazo results", error=str(e))
-            return []
     
     def _parse_spanish_date(self, date_text: str) -> datetime:
         """Parse Spanish date/time formats"""
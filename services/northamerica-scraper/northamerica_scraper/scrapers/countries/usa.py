@@ -0,0 +1,158 @@
+"""United States lottery scrapers"""
+
+from typing import Dict, Iterator
+from datetime import datetime
+from selenium.webdriver.common.by import By
+from northamerica_scraper.scrapers.base.readiness import element_ready
+from northamerica_scraper.scrapers.base.selenium_scraper import Field, RenderedPage, SeleniumScraper
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class PowerballScraper(SeleniumScraper):
+    """Scraper for US Powerball lottery"""
+    
+    fingerprint_selector = ".game-result"
+    archive_url_template = "https://www.powerball.com/previous-results?gc=powerball&sd={start}&ed={end}"
+    draw_path = ((By.CLASS_NAME, "game-result"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "draw-date")),
+        "main": Field((By.CLASS_NAME, "white-ball"), many=True),
+        "powerball": Field((By.CLASS_NAME, "red-ball")),
+        "jackpot": Field((By.CLASS_NAME, "jackpot-amount")),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "game-result"), (By.CLASS_NAME, "red-ball"))
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
+        """
+        Parse Powerball results from the page
+        
+        Format expected:
+        - 5 main numbers (1-69)
+        - 1 Powerball number (1-26)
+        - Draw date
+        - Jackpot amount
+        """
+        count = 0
+        
+        try:
+            # Latest draws, or all of them when backfilling
+            for draw in page.draws:
+                try:
+                    draw_date = self._parse_date(draw["date"])
+                    main_numbers = [int(n) for n in draw["main"]]
+                    powerball = int(draw["powerball"])
+                    jackpot = draw["jackpot"] if draw["jackpot"] is not None else "Unknown"
+                    
+                    yield {
+                        "draw_date": draw_date,
+                        "numbers": {
+                            "main": sorted(main_numbers),
+                            "bonus": [powerball]
+                        },
+                        "jackpot": jackpot,
+                        "currency": "USD"
+                    }
+                    count += 1
+                    
+                except Exception as e:
+                    logger.error("Failed to parse Powerball result", error=str(e))
+                    continue
+            
+            logger.info("Parsed Powerball results", count=count)
+            
+        except Exception as e:
+            logger.error("Failed to parse Powerball results", error=str(e))
+    
+    def _parse_date(self, date_text: str) -> datetime:
+        """Parse date from various formats"""
+        # Try common formats
+        formats = [
+            "%m/%d/%Y",
+            "%B %d, %Y",
+            "%b %d, %Y",
+        ]
+        
+        for fmt in formats:
+            try:
+                return datetime.strptime(date_text.strip(), fmt)
+            except ValueError:
+                continue
+        
+        # Fallback to current date if parsing fails
+        logger.warning("Could not parse date, using current date", date_text=date_text)
+        return datetime.now()
+
+
+class MegaMillionsScraper(SeleniumScraper):
+    """Scraper for US Mega Millions lottery"""
+    
+    fingerprint_selector = ".draw-item"
+    archive_url_template = "https://www.megamillions.com/Winning-Numbers/Previous-Drawings.aspx?startDate={start}&endDate={end}"
+    draw_path = ((By.CLASS_NAME, "draw-item"),)
+    draw_fields = {
+        "date": Field((By.CLASS_NAME, "draw-date")),
+        "main": Field((By.CLASS_NAME, "number-white"), many=True),
+        "mega_ball": Field((By.CLASS_NAME, "number-gold")),
+        "jackpot": Field((By.CLASS_NAME, "jackpot-text")),
+    }
+    ready_when = element_ready((By.CLASS_NAME, "draw-item"), (By.CLASS_NAME, "number-gold"))
+    
+    def parse_results(self, page: RenderedPage) -> Iterator[Dict]:
+        """
+        Parse Mega Millions results from the page
+        
+        Format expected:
+        - 5 main numbers (1-70)
+        - 1 Mega Ball number (1-25)
+        - Draw date
+        - Jackpot amount
+        """
+        count = 0
+        
+        try:
+            # Latest draws, or all of them when backfilling
+            for draw in page.draws:
+                try:
+                    draw_date = self._parse_date(draw["date"])
+                    main_numbers = [int(n) for n in draw["main"]]
+                    mega_ball_num = int(draw["mega_ball"])
+                    jackpot = draw["jackpot"] if draw["jackpot"] is not None else "Unknown"
+                    
+                    yield {
+                        "draw_date": draw_date,
+                        "numbers": {
+                            "main": sorted(main_numbers),
+                            "bonus": [mega_ball_num]
+                        },
+                        "jackpot": jackpot,
+                        "currency": "USD"
+                    }
+                    count += 1
+                    
+                except Exception as e:
+                    logger.error("Failed to parse Mega Millions result", error=str(e))
+                    continue
+            
+            logger.info("Parsed Mega Millions results", count=count)
+            
+        except Exception as e:
+            logger.error("Failed to parse Mega Millions results", error=str(e))
+    
+    def _parse_date(self, date_text: str) -> datetime:
+        """Parse date from various formats"""
+        formats = [
+            "%m/%d/%Y",
+            "%B %d, %Y",
+            "%b %d, %Y",
+        ]
+        
+        for fmt in formats:
+            try:
+                return datetime.strptime(date_text.strip(), fmt)
+            except ValueError:
+                continue
+        
+        logger.warning("Could not parse date, using current date", date_text=date_text)
+        return datetime.now()
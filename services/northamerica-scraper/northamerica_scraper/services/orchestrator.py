@@ -0,0 +1,75 @@
+"""Scraper orchestration logic"""
+
+from typing import List
+from northamerica_scraper.scrapers import get_scraper_by_slug
+from northamerica_scraper.scrapers.base.batch import FetchBatch
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def run_scraper(slug: str) -> dict:
+    """
+    Execute a scraper by its slug
+    
+    Args:
+        slug: Lottery slug
+    
+    Returns:
+        Dict with execution summary
+    """
+    logger.info("Running scraper", slug=slug)
+    
+    try:
+        scraper = get_scraper_by_slug(slug)
+        if not scraper:
+            error_msg = f"No scraper found for slug: {slug}"
+            logger.error(error_msg)
+            return {"status": "failed", "error": error_msg}
+        
+        result = scraper.run()
+        return result
+        
+    except Exception as e:
+        logger.error("Scraper execution failed", slug=slug, error=str(e), exc_info=True)
+        return {
+            "status": "failed",
+            "slug": slug,
+            "error": str(e)
+        }
+
+
+def run_batch(slugs: List[str]) -> List[dict]:
+    """
+    Execute scrapers sharing a source, fetching it once
+    
+    Each slug still gets its own job record and summary.
+    
+    Args:
+        slugs: Lottery slugs from one batch_groups() group
+    
+    Returns:
+        Execution summaries in slug order
+    """
+    if len(slugs) == 1:
+        return [run_scraper(slugs[0])]
+    
+    summaries = {}
+    scrapers = []
+    for slug in slugs:
+        try:
+            scraper = get_scraper_by_slug(slug)
+        except Exception as e:
+            logger.error("Scraper execution failed", slug=slug, error=str(e), exc_info=True)
+            summaries[slug] = {"status": "failed", "slug": slug, "error": str(e)}
+            continue
+        if not scraper:
+            error_msg = f"No scraper found for slug: {slug}"
+            logger.error(error_msg)
+            summaries[slug] = {"status": "failed", "error": error_msg}
+            continue
+        scrapers.append(scraper)
+    
+    for scraper, result in zip(scrapers, FetchBatch(scrapers).run()):
+        summaries[scraper.slug] = result
+    return [summaries[slug] for slug in slugs]
@@ -0,0 +1,243 @@
+"""APScheduler integration for CRON-based job scheduling"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+from apscheduler.events import (
+    EVENT_ALL_JOBS_REMOVED,
+    EVENT_JOB_ADDED,
+    EVENT_JOB_MODIFIED,
+    EVENT_JOB_REMOVED,
+    EVENT_SCHEDULER_SHUTDOWN,
+    EVENT_SCHEDULER_START,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.triggers.combining import OrTrigger
+from apscheduler.triggers.cron import CronTrigger
+from northamerica_scraper.database.session import engine
+from northamerica_scraper.config import runtime
+from northamerica_scraper.utils.api_cache import SCHEDULE, api_cache
+from northamerica_scraper.utils.logger import get_logger
+from northamerica_scraper.services.orchestrator import run_batch, run_scraper
+
+logger = get_logger(__name__)
+
+# Configure job store on the application engine instead of a second pool
+jobstores = {
+    'default': SQLAlchemyJobStore(engine=engine)
+}
+
+# Cron fields are whole minutes, so a batch firing is matched to the member
+# schedules that fired within the minute before it started
+DUE_WINDOW = timedelta(seconds=59)
+
+# Create scheduler, unless a multi-region runner shares one
+scheduler = runtime.scheduler or AsyncIOScheduler(
+    jobstores=jobstores,
+    timezone='UTC'
+)
+
+# Cached /schedule responses go stale when jobs change; runs moving
+# next_run_time forward are covered by the entries' expiry instead
+scheduler.add_listener(
+    lambda event: api_cache.invalidate(SCHEDULE),
+    EVENT_JOB_ADDED | EVENT_JOB_REMOVED | EVENT_JOB_MODIFIED | EVENT_ALL_JOBS_REMOVED
+    | EVENT_SCHEDULER_START | EVENT_SCHEDULER_SHUTDOWN,
+)
+
+
+def parse_cron_expression(cron_expr: str) -> dict:
+    """
+    Parse cron expression to APScheduler kwargs
+    Example: '0 16 * * *' -> {'hour': 16, 'minute': 0}
+    """
+    parts = cron_expr.split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression: {cron_expr}")
+    
+    minute, hour, day, month, day_of_week = parts
+    
+    kwargs = {}
+    if minute != '*':
+        kwargs['minute'] = minute
+    if hour != '*':
+        kwargs['hour'] = hour
+    if day != '*':
+        kwargs['day'] = day
+    if month != '*':
+        kwargs['month'] = month
+    if day_of_week != '*':
+        kwargs['day_of_week'] = day_of_week
+    
+    return kwargs
+
+
+def schedule_scraper(slug: str, cron_expr: str) -> None:
+    """Add scraper job to scheduler"""
+    try:
+        cron_kwargs = parse_cron_expression(cron_expr)
+        trigger = CronTrigger(**cron_kwargs, timezone='UTC')
+        
+        scheduler.add_job(
+            run_scraper,
+            trigger=trigger,
+            args=[slug],
+            id=f'scraper_{slug}',
+            replace_existing=True,
+            max_instances=1
+        )
+        
+        logger.info("Scheduled scraper", slug=slug, cron=cron_expr)
+        
+    except Exception as e:
+        logger.error("Failed to schedule scraper", slug=slug, error=str(e))
+        raise
+
+
+def is_due(cron_expr: str, now: Optional[datetime] = None) -> bool:
+    """
+    Whether a cron schedule fired within DUE_WINDOW of now
+    
+    Args:
+        cron_expr: Lottery schedule
+        now: Time to check (default: current UTC time)
+    
+    Returns:
+        True if the schedule has a fire time in (now - DUE_WINDOW, now]
+    """
+    now = now or datetime.now(timezone.utc)
+    trigger = CronTrigger(**parse_cron_expression(cron_expr), timezone='UTC')
+    fire_time = trigger.get_next_fire_time(None, now - DUE_WINDOW)
+    return fire_time is not None and fire_time <= now
+
+
+def run_due_scrapers(slugs: List[str], cron_exprs: List[str]) -> List[dict]:
+    """
+    Batch job entry point: run the members whose own schedule fired
+    
+    Args:
+        slugs: Batch members
+        cron_exprs: Their schedules, in the same order
+    
+    Returns:
+        Execution summaries of the members run
+    """
+    due = [slug for slug, cron_expr in zip(slugs, cron_exprs) if is_due(cron_expr)]
+    if not due:
+        logger.warning("Batch fired with no member due", slugs=slugs)
+        return []
+    return run_batch(due)
+
+
+def batch_job_id(slugs: Iterable[str]) -> str:
+    """Job id of a batch, from its sorted members so a reordered config keeps the id"""
+    return f'batch_{"+".join(sorted(slugs))}'
+
+
+def schedule_batch(slugs: List[str], cron_exprs: List[str]) -> List[str]:
+    """
+    Add one job for scrapers sharing a source
+    
+    The job fires on any member's schedule and runs the members due then
+    as one batch. Members' own scraper_{slug} jobs are removed; a member
+    whose schedule does not parse is left out.
+    
+    Args:
+        slugs: Lottery slugs from one batch_groups() group
+        cron_exprs: Their schedules, in the same order
+    
+    Returns:
+        Slugs scheduled
+    """
+    members, triggers = {}, []
+    for slug, cron_expr in zip(slugs, cron_exprs):
+        try:
+            triggers.append(CronTrigger(**parse_cron_expression(cron_expr), timezone='UTC'))
+            members[slug] = cron_expr
+        except ValueError as e:
+            logger.error("Failed to schedule scraper", slug=slug, error=str(e))
+    if len(members) < 2:
+        for slug, cron_expr in members.items():
+            schedule_scraper(slug, cron_expr)
+        return list(members)
+    
+    try:
+        scheduler.add_job(
+            run_due_scrapers,
+            trigger=OrTrigger(triggers),
+            args=[list(members), list(members.values())],
+            id=batch_job_id(members),
+            replace_existing=True,
+            max_instances=1
+        )
+        for slug in members:
+            if scheduler.get_job(f'scraper_{slug}'):
+                remove_scraper_job(slug)
+        
+        logger.info("Scheduled scraper batch", slugs=list(members), crons=list(members.values()))
+        return list(members)
+        
+    except Exception as e:
+        logger.error("Failed to schedule scraper batch", slugs=list(members), error=str(e))
+        raise
+
+
+def prune_stale_jobs(batches: List[List[str]], slugs: Iterable[str]) -> None:
+    """
+    Remove jobs an earlier batch layout left in the job store
+    
+    Drops batch_* jobs with a member among slugs whose id is not that of
+    one of batches (e.g. an id from an older member order), and scraper_{slug} jobs of slugs that are now batched,
+    so a regrouped lottery is not run twice. Jobs of lotteries other
+    regions or country subsets load are left alone. Persisted jobs are
+    only visible once the scheduler has started, so before that the prune
+    waits for the start.
+    
+    Args:
+        batches: Member slugs of every batch job scheduled by this load
+        slugs: Every lottery this load covers
+    """
+    if not scheduler.running:
+        slugs = set(slugs)
+        scheduler.add_listener(lambda event: prune_stale_jobs(batches, slugs), EVENT_SCHEDULER_START)
+        return
+    
+    covered = set(slugs)
+    current = {batch_job_id(members) for members in batches}
+    batched = set().union(*batches)
+    for job in scheduler.get_jobs():
+        kind, _, key = job.id.partition('_')
+        stale_batch = kind == 'batch' and covered.intersection(key.split('+')) and job.id not in current
+        if stale_batch or (kind == 'scraper' and key in batched):
+            scheduler.remove_job(job.id)
+            logger.info("Removed stale job", job_id=job.id)
+
+
+def remove_scraper_job(slug: str) -> None:
+    """Remove scraper job from scheduler"""
+    job_id = f'scraper_{slug}'
+    try:
+        scheduler.remove_job(job_id)
+        logger.info("Removed scraper job", slug=slug)
+    except Exception as e:
+        logger.warning("Failed to remove job", slug=slug, error=str(e))
+
+
+def start_scheduler() -> None:
+    """Start the APScheduler"""
+    if not scheduler.running:
+        scheduler.start()
+        logger.info("Scheduler started")
+
+
+def stop_scheduler() -> None:
+    """Stop the APScheduler"""
+    if scheduler.running:
+        scheduler.shutdown(wait=True)
+        logger.info("Scheduler stopped")
+
+
+def get_scheduled_jobs() -> list:
+    """Get this service's scheduled jobs; a shared scheduler also holds other regions'"""
+    package = __name__.partition('.')[0]
+    return [job for job in scheduler.get_jobs() if job.func_ref.startswith(f'{package}.')]
@@ -0,0 +1,241 @@
+"""
+Read-through cache for API responses
+
+Hot read endpoints (lotteries, scrapers, schedule) are polled constantly
+by the frontend and monitors while the data behind them changes rarely.
+Their rendered JSON bodies are kept in an in-process LRU with a TTL and
+served with an ETag, so a repeat poll costs a dict lookup, or just a 304.
+
+Each entry is tagged with what it was built from (LOTTERIES, SCRAPERS,
+SCHEDULE) and remembers the tag generations it was built at;
+invalidate(tag) bumps the generation, which retires every entry built
+from it. With settings.API_CACHE_BACKEND = "redis" the generations live
+in Redis, so a populate_lotteries run in another process, or another
+API worker, invalidates this process's entries too. Bodies always stay
+in process memory.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LOTTERIES = "lotteries"
+SCRAPERS = "scrapers"
+SCHEDULE = "schedule"
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """One rendered response body"""
+    body: bytes
+    etag: str
+    expires_at: float
+    generations: Dict[str, int]
+
+
+@dataclass(frozen=True)
+class Expiring:
+    """Content known to go stale after max_age seconds, sooner than the TTL"""
+    content: Any
+    max_age: Optional[float]
+
+
+def seconds_until(times: Iterable[Optional[datetime]]) -> Optional[float]:
+    """Seconds until the earliest of times (e.g. job next_run_time), None if there are none"""
+    now = datetime.now(timezone.utc)
+    remaining = [
+        (when if when.tzinfo else when.replace(tzinfo=timezone.utc)) - now
+        for when in times
+        if when is not None
+    ]
+    return min(delta.total_seconds() for delta in remaining) if remaining else None
+
+
+class LocalGenerations:
+    """Tag generations for this process only"""
+
+    def __init__(self):
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def current(self, tags: Sequence[str]) -> Dict[str, int]:
+        return {tag: self._generations.get(tag, 0) for tag in tags}
+
+    def bump(self, tags: Sequence[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+
+
+class RedisGenerations:
+    """Tag generations shared by every process using ``<prefix><tag>`` counters"""
+
+    def __init__(self, url: str, prefix: str = "api-cache:generation:"):
+        import redis
+
+        self._redis = redis.from_url(url, socket_timeout=0.5)
+        self._prefix = prefix
+
+    def current(self, tags: Sequence[str]) -> Dict[str, int]:
+        values = self._redis.mget([self._prefix + tag for tag in tags])
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    def bump(self, tags: Sequence[str]) -> None:
+        pipe = self._redis.pipeline()
+        for tag in tags:
+            pipe.incr(self._prefix + tag)
+        pipe.execute()
+
+
+class ApiCache:
+    """LRU + TTL cache of response bodies, invalidated by tag"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, generations=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generations = generations or LocalGenerations()
+        self._entries: "OrderedDict[str, CachedBody]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self, tags: Sequence[str]) -> Optional[Dict[str, int]]:
+        """Tag generations, or None when the shared store is unreachable"""
+        try:
+            return self.generations.current(tags)
+        except Exception as e:
+            logger.warning("API cache generation read failed", error=str(e))
+            return None
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        """The live entry for key, if any"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+        if self.snapshot(list(entry.generations)) != entry.generations:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        generations: Optional[Dict[str, int]],
+        body: bytes,
+        max_age: Optional[float] = None,
+    ) -> CachedBody:
+        """
+        Store a rendered body
+
+        Args:
+            key: Cache key (path and query string)
+            generations: snapshot() of the body's tags, taken before it was built,
+                so an invalidation while building retires it
+            body: Response body
+            max_age: Seconds the body is known to stay valid, if less than the TTL
+
+        Returns:
+            The entry; not kept when generations is None
+        """
+        ttl = self.ttl_seconds if max_age is None else max(0.0, min(max_age, self.ttl_seconds))
+        entry = CachedBody(
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+            expires_at=time.monotonic() + ttl,
+            generations=generations or {},
+        )
+        if generations is None or ttl <= 0:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, *tags: str) -> None:
+        """Retire every entry built from any of tags, in all processes sharing the generations"""
+        try:
+            self.generations.bump(tags)
+        except Exception as e:
+            logger.warning("API cache invalidation failed", tags=tags, error=str(e))
+        # Entries of this process go either way
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if set(tags) & set(entry.generations)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(
+    request: Request,
+    tags: Sequence[str],
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve build()'s JSON from the cache, or build, cache and serve it
+
+    Answers 304 when the client's If-None-Match already has the body.
+    Exceptions from build (e.g. a 404 HTTPException) propagate uncached.
+
+    Args:
+        request: Incoming request; path and query string form the cache key
+        tags: What build() reads, for invalidation
+        build: Produces the response content, or Expiring(content, seconds)
+            when it is known to go stale before the TTL
+    """
+    key = request.url.path + ("?" + request.url.query if request.url.query else "")
+    entry = api_cache.get(key)
+    status = "hit"
+    if entry is None:
+        status = "miss"
+        generations = api_cache.snapshot(tags)
+        content, max_age = build(), None
+        if isinstance(content, Expiring):
+            content, max_age = content.content, content.max_age
+        body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+        entry = api_cache.put(key, generations, body, max_age)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache", "X-Cache": status}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+def create_api_cache() -> ApiCache:
+    """Build the cache selected by settings.API_CACHE_BACKEND"""
+    generations = None
+    if settings.API_CACHE_BACKEND == "redis":
+        generations = RedisGenerations(settings.REDIS_URL)
+    return ApiCache(settings.API_CACHE_MAX_ENTRIES, settings.API_CACHE_TTL_SECONDS, generations)
+
+
+api_cache = create_api_cache()
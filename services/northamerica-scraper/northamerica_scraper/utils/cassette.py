@@ -0,0 +1,320 @@
+"""
+Record/replay transport for network-free scraper runs
+
+With HTTP_CASSETTE_MODE=record, every response fetched through the
+shared httpx client, and every page Selenium renders, is saved to a
+cassette directory as one gzipped JSON file per URL. With
+HTTP_CASSETTE_MODE=replay, the httpx client serves those recordings
+from memory, and Selenium loads them from a local stand-in server:
+
+    python -m northamerica_scraper.utils.cassette serve --port 8765
+
+Replay can add latency (HTTP_REPLAY_LATENCY_MS, +/-50% jitter) and fail
+a share of requests (HTTP_REPLAY_ERROR_RATE), so the orchestrator,
+scheduler and DB writer can be load-tested end to end on a laptop.
+"""
+
+import argparse
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, urlsplit
+import httpx
+from northamerica_scraper.config.settings import settings
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+# Hop-by-hop and encoding headers no longer true once the body is stored decoded
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(httpx.TransportError):
+    """No recording exists for a replayed request"""
+
+
+class InjectedFault(httpx.ConnectError):
+    """Replay deliberately failed this request"""
+
+
+@dataclass
+class Recording:
+    """One recorded response"""
+    method: str
+    url: str
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    recorded_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        return next((value for key, value in self.headers if key.lower() == name), None)
+
+    def to_json(self) -> Dict:
+        return {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "recorded_at": self.recorded_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "Recording":
+        return cls(
+            method=data["method"],
+            url=data["url"],
+            status=data["status"],
+            headers=[tuple(pair) for pair in data["headers"]],
+            body=base64.b64decode(data["body"]),
+            recorded_at=data["recorded_at"],
+        )
+
+
+class CassetteStore:
+    """Recordings as ``<sha256(method url)>.json.gz`` files, indexed in memory on first read"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._entries: Optional[Dict[str, Recording]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Recording]:
+        with self._lock:
+            if self._entries is None:
+                entries = {}
+                if self.directory.exists():
+                    for path in self.directory.glob("*.json.gz"):
+                        with gzip.open(path, "rt", encoding="utf-8") as f:
+                            entries[path.name[:-len(".json.gz")]] = Recording.from_json(json.load(f))
+                self._entries = entries
+            return self._entries
+
+    def get(self, method: str, url: str) -> Optional[Recording]:
+        return self._load().get(self.key(method, url))
+
+    def put(self, recording: Recording) -> None:
+        """Write a recording (replacing any earlier one for the same request)"""
+        key = self.key(recording.method, recording.url)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json.gz"
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(recording.to_json(), f)
+        tmp.replace(path)
+        self._load()[key] = recording
+
+    def urls(self) -> List[str]:
+        return sorted(recording.url for recording in self._load().values())
+
+
+class Faults:
+    """Latency and error injection for replayed requests"""
+
+    def __init__(self, latency_ms: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def delay(self) -> float:
+        """Seconds to wait before answering"""
+        if not self.latency_ms:
+            return 0.0
+        return self.latency_ms / 1000 * self._random.uniform(0.5, 1.5)
+
+    def fail(self) -> bool:
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx transport that records through a real transport or replays from a store
+
+    Works for both httpx.Client and httpx.AsyncClient. In replay mode a
+    matching If-None-Match gets 304, like the origin would.
+    """
+
+    def __init__(self, mode: str, store: CassetteStore, faults: Faults, inner=None):
+        if mode == RECORD and inner is None:
+            raise ValueError("Record mode needs a real transport to record from")
+        self.mode = mode
+        self.store = store
+        self.faults = faults
+        self.inner = inner
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        if self.faults.fail():
+            raise InjectedFault(f"Injected failure for {request.url}", request=request)
+
+        recording = self.store.get(request.method, str(request.url))
+        if recording is None:
+            raise CassetteMiss(f"No recording for {request.method} {request.url}", request=request)
+
+        etag = recording.header("etag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=[("etag", etag)], request=request)
+        return httpx.Response(recording.status, headers=recording.headers, content=recording.body, request=request)
+
+    def _record(self, request: httpx.Request, response: httpx.Response, body: bytes) -> httpx.Response:
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS]
+        self.store.put(Recording(request.method, str(request.url), response.status_code, headers, body))
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == REPLAY:
+            time.sleep(self.faults.delay())
+            return self._replay(request)
+
+        response = self.inner.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return self._record(request, response, body)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.mode == REPLAY:
+            await asyncio.sleep(self.faults.delay())
+            return self._replay(request)
+
+        response = await self.inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, body)
+
+    def close(self) -> None:
+        if self.inner is not None:
+            self.inner.close()
+
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+store = CassetteStore(settings.HTTP_CASSETTE_DIR)
+faults = Faults(settings.HTTP_REPLAY_LATENCY_MS, settings.HTTP_REPLAY_ERROR_RATE, settings.HTTP_REPLAY_SEED)
+
+
+def cassette_transport(http2: bool, limits: httpx.Limits, asynchronous: bool) -> Optional[CassetteTransport]:
+    """
+    Transport for the shared HTTP client, or None when cassettes are off
+
+    Args:
+        http2: Negotiate HTTP/2 when recording
+        limits: Connection pool limits for the recording transport
+        asynchronous: Build for httpx.AsyncClient instead of httpx.Client
+
+    Returns:
+        CassetteTransport or None
+    """
+    mode = settings.HTTP_CASSETTE_MODE
+    if mode == OFF:
+        return None
+    if mode not in (RECORD, REPLAY):
+        raise ValueError(f"Unknown HTTP_CASSETTE_MODE: {mode}")
+
+    inner = None
+    if mode == RECORD:
+        transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+        inner = transport_class(http2=http2, limits=limits)
+    return CassetteTransport(mode, store, faults, inner)
+
+
+def page_url(url: str) -> str:
+    """URL Selenium should load: the replay stand-in in replay mode, else url itself"""
+    if settings.HTTP_CASSETTE_MODE == REPLAY:
+        return f"{settings.HTTP_REPLAY_SERVER.rstrip('/')}/replay?url={quote(url, safe='')}"
+    return url
+
+
+def record_page(url: str, driver) -> None:
+    """Save the DOM a Selenium driver has rendered for url, when recording"""
+    if settings.HTTP_CASSETTE_MODE == RECORD:
+        body = driver.page_source.encode("utf-8")
+        store.put(Recording("GET", url, 200, [("content-type", "text/html; charset=utf-8")], body))
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serves ``/replay?url=<original url>`` from the cassette store"""
+
+    def do_GET(self) -> None:
+        url = parse_qs(urlsplit(self.path).query).get("url", [None])[0]
+        time.sleep(faults.delay())
+
+        if faults.fail():
+            self.send_error(503, "Injected failure")
+            return
+
+        recording = store.get("GET", url) if url else None
+        if recording is None:
+            self.send_error(404, f"No recording for {url}")
+            return
+
+        self.send_response(recording.status)
+        for name, value in recording.headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(recording.body)))
+        self.end_headers()
+        self.wfile.write(recording.body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Run the replay stand-in until interrupted"""
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    print(f"Replaying {len(store.urls())} recordings from {store.directory} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Inspect or serve recorded scraper traffic")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Serve recordings to Selenium")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    commands.add_parser("list", help="List recorded URLs")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.host, args.port)
+    else:
+        for url in store.urls():
+            print(url)
+
+
+if __name__ == "__main__":
+    main()
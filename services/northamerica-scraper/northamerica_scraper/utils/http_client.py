@@ -0,0 +1,115 @@
+"""Shared HTTP client for BS4 scrapers"""
+
+import threading
+import time
+from typing import Dict
+import httpx
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.config import runtime
+from northamerica_scraper.utils import metrics
+from northamerica_scraper.utils.cassette import cassette_transport
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpClientManager:
+    """
+    Owns the process-wide httpx client and its per-host limits
+    
+    Scrapers run synchronously on scheduler worker threads, so this wraps
+    a thread-safe httpx.Client. All fetches share its keep-alive (and
+    HTTP/2) connections instead of opening a new connection per request.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_per_host: int,
+        keepalive_expiry: float,
+        timeout: float,
+        http2: bool,
+    ):
+        self.max_per_host = max_per_host
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = timeout
+        self._http2 = http2
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    def start(self) -> None:
+        """Create the client (called on FastAPI startup)"""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=self._http2,
+                    limits=self._limits,
+                    timeout=self._timeout,
+                    follow_redirects=True,
+                    transport=cassette_transport(self._http2, self._limits, asynchronous=False),
+                )
+                logger.info("HTTP client started", http2=self._http2, cassette=settings.HTTP_CASSETTE_MODE)
+
+    def close(self) -> None:
+        """Close pooled connections (called on FastAPI shutdown)"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+                logger.info("HTTP client closed")
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET a URL through the shared pool
+        
+        Args:
+            url: URL to fetch
+            **kwargs: Passed through to httpx.Client.request
+        
+        Returns:
+            httpx.Response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared pool (e.g. a POST to a JSON API)
+        
+        Args:
+            method: HTTP method
+            url: URL to fetch
+            **kwargs: Passed through to httpx.Client.request
+        
+        Returns:
+            httpx.Response
+        """
+        # Scrapers run outside the API (CLI, tests) start it lazily
+        if self._client is None:
+            self.start()
+        
+        host = httpx.URL(url).host
+        with self._slot(host):
+            started = time.perf_counter()
+            response = self._client.request(method, url, **kwargs)
+        metrics.record_fetch(host, time.perf_counter() - started, len(response.content))
+        return response
+
+http_client = runtime.http_client or HttpClientManager(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    timeout=settings.HTTP_TIMEOUT,
+    http2=settings.HTTP2_ENABLED,
+)
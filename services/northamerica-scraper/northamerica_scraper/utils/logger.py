@@ -2,7 +2,7 @@
 
 import sys
 import structlog
-from src.config.settings import settings
+from northamerica_scraper.config.settings import settings
 
 
 def get_logger(name: str):
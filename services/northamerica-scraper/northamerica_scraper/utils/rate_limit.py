@@ -0,0 +1,24 @@
+"""Thread-safe request rate limiting"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Spaces calls evenly so at most `requests` start per `period` seconds"""
+
+    def __init__(self, requests: int, period: float):
+        self.interval = period / requests
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the caller may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,120 @@
+"""
+Conditional GET cache for result pages
+
+Stores the ETag, Last-Modified and a content hash per URL so repeat
+fetches can send If-None-Match / If-Modified-Since and skip parsing when
+the page has not changed. Entries live in Redis, on local disk, or
+nowhere, depending on settings.HTTP_CACHE_BACKEND.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict
+from northamerica_scraper.config.settings import settings
+from northamerica_scraper.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Validators remembered for one URL"""
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def content_hash(body: bytes) -> str:
+    """Stable fingerprint of a response body"""
+    return hashlib.sha256(body).hexdigest()
+
+
+class RedisCacheStore:
+    """Entries as JSON strings under ``<prefix><url>``"""
+
+    def __init__(self, url: str, prefix: str = "http-cache:"):
+        import redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+
+    def get(self, url: str) -> CacheEntry | None:
+        raw = self._redis.get(self._prefix + url)
+        return CacheEntry(**json.loads(raw)) if raw else None
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        self._redis.set(self._prefix + url, json.dumps(asdict(entry)))
+
+
+class DiskCacheStore:
+    """One small JSON file per URL under ``directory``"""
+
+    def __init__(self, directory: str):
+        self._directory = Path(directory)
+
+    def _path(self, url: str) -> Path:
+        return self._directory / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> CacheEntry | None:
+        path = self._path(url)
+        if not path.exists():
+            return None
+        return CacheEntry(**json.loads(path.read_text()))
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path(url).write_text(json.dumps(asdict(entry)))
+
+
+class NullCacheStore:
+    """Disables conditional requests"""
+
+    def get(self, url: str) -> CacheEntry | None:
+        return None
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        pass
+
+
+class ResponseCache:
+    """Front for a cache store; a failing store never fails a scrape"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def get(self, url: str) -> CacheEntry | None:
+        try:
+            return self.store.get(url)
+        except Exception as e:
+            logger.warning("Response cache read failed", url=url, error=str(e))
+            return None
+
+    def set(self, url: str, entry: CacheEntry) -> None:
+        try:
+            self.store.set(url, entry)
+        except Exception as e:
+            logger.warning("Response cache write failed", url=url, error=str(e))
+
+
+def create_response_cache() -> ResponseCache:
+    """Build the cache selected by settings.HTTP_CACHE_BACKEND"""
+    backend = settings.HTTP_CACHE_BACKEND
+    if backend == "redis":
+        return ResponseCache(RedisCacheStore(settings.REDIS_URL))
+    if backend == "disk":
+        return ResponseCache(DiskCacheStore(settings.HTTP_CACHE_DIR))
+    return ResponseCache(NullCacheStore())
+
+
+response_cache = create_response_cache()
@@ -1,39 +0,0 @@
-"""Database session management"""
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from src.config.settings import settings
-from src.database.models import Base
-from src.utils.logger import get_logger
-
-logger = get_logger(__name__)
-
-# Create engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def get_db() -> Session:
-    """Get database session"""
-    db = SessionLocal()
-    try:
-        return db
-    finally:
-        db.close()
-
-
-def init_db() -> None:
-    """Initialize database and create tables"""
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error("Failed to create database tables", error=str(e))
-        raise
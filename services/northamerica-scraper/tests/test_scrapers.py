@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from src.utils.validators import validate_result_data, validate_currency, validate_number_range
+from northamerica_scraper.utils.validators import validate_result_data, validate_currency, validate_number_range
 
 
 class TestValidators:
@@ -58,14 +58,14 @@ class TestScraperConfig:
     
     def test_lottery_slugs(self):
         """Test all lottery slugs are unique"""
-        from src.config.countries import get_all_lottery_slugs
+        from northamerica_scraper.config.countries import get_all_lottery_slugs
         
         slugs = get_all_lottery_slugs()
         assert len(slugs) == len(set(slugs)), "Duplicate lottery slugs found"
     
     def test_get_lottery_config(self):
         """Test getting lottery config by slug"""
-        from src.config.countries import get_lottery_config
+        from northamerica_scraper.config.countries import get_lottery_config
         
         # Test existing lottery
         config = get_lottery_config("us-powerball")
@@ -77,9 +77,24 @@ class TestScraperConfig:
         config = get_lottery_config("invalid-slug")
         assert config is None
     
+    def test_filter_lotteries_facets(self):
+        """Test filtering lotteries by country, type and timezone"""
+        from northamerica_scraper.config.countries import get_lottery_config, filter_lotteries
+        
+        us = filter_lotteries(countries=["us"])
+        assert us and all(config["country_code"] == "US" for config in us)
+        
+        bs4_us = filter_lotteries(countries=["US"], lottery_type="bs4")
+        assert all(config["type"] == "bs4" for config in bs4_us)
+        assert {c["slug"] for c in bs4_us} <= {c["slug"] for c in us}
+        
+        powerball = get_lottery_config("us-powerball")
+        assert powerball in filter_lotteries(timezone=powerball["timezone"])
+        assert filter_lotteries(lottery_type="unknown") == []
+    
     def test_cron_schedules(self):
         """Test all lotteries have valid CRON schedules"""
-        from src.config.countries import ALL_COUNTRIES
+        from northamerica_scraper.config.countries import ALL_COUNTRIES
         
         for country in ALL_COUNTRIES:
             for lottery in country.lotteries:
@@ -87,3 +102,573 @@ class TestScraperConfig:
                 # Basic CRON validation (5 parts)
                 parts = lottery["schedule"].split()
                 assert len(parts) == 5, f"Invalid CRON for {lottery['slug']}"
+
+
+@pytest.mark.unit
+class TestBackfill:
+    """Test backfill page planning and pacing"""
+    
+    def test_archive_pages_are_monthly(self):
+        """Test a date range splits into one archive page per month"""
+        from datetime import date
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        
+        scraper = get_scraper_by_slug("us-powerball")
+        pages = list(scraper.archive_pages(date(2024, 1, 15), date(2024, 3, 10)))
+        
+        assert [key for key, _ in pages] == ["2024-01", "2024-02", "2024-03"]
+        assert "sd=2024-01-15&ed=2024-01-31" in pages[0][1]
+        assert "sd=2024-02-01&ed=2024-02-29" in pages[1][1]
+        assert "sd=2024-03-01&ed=2024-03-10" in pages[2][1]
+    
+    def test_mega_millions_archive_page_reads_every_draw(self):
+        """Test a Mega Millions archive page parses past the latest-draws cap"""
+        from datetime import date, datetime
+        from benchmarks.fixture_driver import FixtureDriver
+        from benchmarks.harness import fixture_for
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        from northamerica_scraper.scrapers.base.selenium_scraper import RenderedPage
+        
+        scraper = get_scraper_by_slug("us-megamillions")
+        (key, url), = scraper.archive_pages(date(2025, 1, 1), date(2025, 1, 31))
+        assert key == "2025-01" and "startDate=2025-01-01&endDate=2025-01-31" in url
+        
+        # As backfill.fetch_window does before fetching an archive page
+        scraper.latest_draws = None
+        driver = FixtureDriver(fixture_for("us-megamillions").read_text(encoding="utf-8"), url)
+        results = list(scraper.parse_results(RenderedPage(url, scraper.extract_draws(driver))))
+        
+        assert len(results) == 120
+        assert results[0]["draw_date"] == datetime(2025, 12, 31)
+        assert results[-1]["draw_date"] == datetime(2025, 1, 8)
+    
+    def test_rate_limiter_spaces_requests(self, monkeypatch):
+        """Test requests beyond the first are delayed by the interval"""
+        import northamerica_scraper.utils.rate_limit as rate_limit
+        
+        sleeps = []
+        monkeypatch.setattr(rate_limit.time, "sleep", sleeps.append)
+        monkeypatch.setattr(rate_limit.time, "monotonic", lambda: 100.0)
+        
+        limiter = rate_limit.RateLimiter(requests=2, period=1)
+        for _ in range(3):
+            limiter.wait()
+        
+        assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.unit
+class TestBenchmarks:
+    """Test the offline benchmark suite"""
+    
+    def test_every_registered_scraper_has_a_fixture(self):
+        """Test the benchmark suite covers the whole registry"""
+        from benchmarks.harness import fixture_for
+        from northamerica_scraper.scrapers import SCRAPER_REGISTRY
+        
+        assert [slug for slug in SCRAPER_REGISTRY if not fixture_for(slug)] == []
+    
+    def test_selenium_parser_runs_on_fixture_driver(self):
+        """Test a Selenium parser reads every draw from a recorded page offline"""
+        from benchmarks.run import bench_scraper
+        
+        result = bench_scraper("us-powerball", rounds=1)
+        
+        assert result.rows == 120
+        assert result.rows_per_sec > 0
+
+
+@pytest.mark.unit
+class TestCassette:
+    """Test the record/replay HTTP transport"""
+    
+    URL = "https://www.powerball.com/previous-results"
+    
+    def test_sync_client_replays_recording(self, tmp_path):
+        """Test a response recorded through httpx.Client replays from a fresh store"""
+        import httpx
+        from northamerica_scraper.utils.cassette import RECORD, REPLAY, CassetteStore, CassetteTransport, Faults
+        
+        origin = httpx.MockTransport(lambda request: httpx.Response(200, json={"draws": [1, 2]}))
+        with httpx.Client(transport=CassetteTransport(RECORD, CassetteStore(tmp_path), Faults(), origin)) as client:
+            recorded = client.get(self.URL)
+        
+        replay = CassetteTransport(REPLAY, CassetteStore(tmp_path), Faults())
+        with httpx.Client(transport=replay) as client:
+            assert client.get(self.URL).json() == recorded.json() == {"draws": [1, 2]}
+    
+    def test_selenium_loads_go_to_the_stand_in_when_replaying(self, monkeypatch):
+        """Test page URLs are only rewritten in replay mode"""
+        from northamerica_scraper.utils import cassette
+        
+        monkeypatch.setattr(cassette.settings, "HTTP_REPLAY_SERVER", "http://127.0.0.1:8765")
+        assert cassette.page_url(self.URL) == self.URL
+        
+        monkeypatch.setattr(cassette.settings, "HTTP_CASSETTE_MODE", cassette.REPLAY)
+        assert cassette.page_url(self.URL) == (
+            "http://127.0.0.1:8765/replay?url=https%3A%2F%2Fwww.powerball.com%2Fprevious-results"
+        )
+
+
+@pytest.mark.unit
+class TestStageTimings:
+    """Test per-stage timing of scrape runs"""
+    
+    def test_save_time_excludes_parse_and_validate(self, monkeypatch):
+        """Test rows pulled through the writer book their parse time to parse, not save"""
+        import time
+        from types import SimpleNamespace
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        from northamerica_scraper.scrapers.base import base_scraper
+        from northamerica_scraper.database.writer import WriteSummary
+        from northamerica_scraper.utils.timing import PARSE, SAVE, VALIDATE
+        
+        def parser():
+            for day in range(1, 4):
+                time.sleep(0.01)
+                yield {"draw_date": f"2024-01-0{day}", "numbers": {"main": [day]}}
+        
+        def slow_insert(db, rows, **kwargs):
+            rows = list(rows)
+            time.sleep(0.02)
+            return WriteSummary(inserted=len(rows))
+        
+        monkeypatch.setattr(base_scraper.lottery_cache, "get", lambda slug: SimpleNamespace(id=1))
+        monkeypatch.setattr(base_scraper, "bulk_insert_results", slow_insert)
+        
+        scraper = get_scraper_by_slug("us-powerball")
+        db = SimpleNamespace(commit=lambda: None, rollback=lambda: None)
+        with scraper.timings.stage(SAVE):
+            summary = scraper.save_results(scraper.timings.timed_iter(parser(), PARSE, count_as="parsed"), db)
+        
+        stages = scraper.timings.stages_ms
+        assert summary.inserted == 3
+        assert scraper.timings.rows == {"parsed": 3, "valid": 3}
+        assert stages[PARSE] >= 30
+        assert 20 <= stages[SAVE] < stages[PARSE]
+        assert VALIDATE in stages
+
+
+@pytest.mark.unit
+class TestResultWriter:
+    """Test the batched result writer"""
+    
+    def test_batches_written_before_a_failure_stay_committed(self):
+        """Test each batch is committed as it is written when the scrape asks for it"""
+        from datetime import date
+        from types import SimpleNamespace
+        from northamerica_scraper.database.writer import bulk_insert_results
+        
+        class Session:
+            def __init__(self):
+                self.pending = self.committed = 0
+            
+            def execute(self, stmt):
+                count = len(stmt._multi_values[0])
+                self.pending += count
+                return SimpleNamespace(fetchall=lambda: [None] * count)
+            
+            def commit(self):
+                self.committed += self.pending
+                self.pending = 0
+        
+        def rows():
+            for day in range(1, 6):
+                yield {"lotteryId": 1, "drawDate": date(2024, 1, day)}
+            raise RuntimeError("parser failed")
+        
+        db = Session()
+        with pytest.raises(RuntimeError):
+            bulk_insert_results(db, rows(), batch_size=2, commit_batches=True)
+        assert db.committed == 4
+
+
+@pytest.mark.unit
+class TestBrowserProfile:
+    """Test the lean Chrome profile and resource blocking"""
+    
+    def test_page_load_blocks_resources_and_reports_weight(self):
+        """Test a load sets the site's blocked URLs first and records its cost"""
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        
+        class CdpDriver:
+            def __init__(self):
+                self.calls = []
+            
+            def execute_cdp_cmd(self, cmd, params):
+                self.calls.append(cmd)
+                if cmd == "Network.setBlockedURLs":
+                    self.blocked = params["urls"]
+            
+            def get(self, url):
+                self.calls.append("get")
+            
+            def execute_script(self, script, *args):
+                return {"bytes": 2048, "requests": 4}
+        
+        scraper = get_scraper_by_slug("us-powerball")
+        scraper.allow_urls = ("*.css*",)
+        scraper.driver = CdpDriver()
+        
+        scraper.load_page(scraper.url)
+        
+        assert scraper.driver.calls == ["Network.enable", "Network.setBlockedURLs", "get"]
+        assert "*.css*" not in scraper.driver.blocked and "*.png*" in scraper.driver.blocked
+        pages = scraper.timings.breakdown()["pages"]
+        assert pages["pages"] == 1 and pages["bytes"] == 2048 and pages["requests"] == 4
+
+
+@pytest.mark.unit
+class TestMetrics:
+    """Test the /metrics exposition"""
+    
+    def test_scrape_run_feeds_job_metrics(self, monkeypatch):
+        """Test a failed run counts its exception class and job duration"""
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        from northamerica_scraper.scrapers.base import base_scraper
+        from northamerica_scraper.utils import metrics
+        
+        def broken_scrape():
+            raise ConnectionError("site down")
+        
+        monkeypatch.setattr(base_scraper.lottery_cache, "get", lambda slug: None)
+        scraper = get_scraper_by_slug("us-powerball")
+        monkeypatch.setattr(scraper, "scrape", broken_scrape)
+        failures = metrics.sample("scraper_job_failures_total", slug="us-powerball", error="ConnectionError")
+        
+        summary = scraper.run()
+        
+        assert summary["status"] == "failed"
+        assert metrics.sample("scraper_job_failures_total", slug="us-powerball", error="ConnectionError") == failures + 1
+        assert metrics.sample("scraper_jobs_running") == 0
+        assert 'scraper_job_duration_seconds_count{slug="us-powerball",status="failed"}' in metrics.render()
+    
+    def test_histogram_text_format(self):
+        """Test histogram buckets are cumulative with +Inf, sum and count"""
+        from prometheus_client import CollectorRegistry, Histogram, generate_latest
+        
+        registry = CollectorRegistry()
+        histogram = Histogram("fetch_seconds", "Fetch time", ("host",), buckets=(0.1, 1.0), registry=registry)
+        for value in (0.05, 0.5, 3.0):
+            histogram.labels("a.example").observe(value)
+        text = generate_latest(registry).decode()
+        
+        assert 'fetch_seconds_bucket{host="a.example",le="1.0"} 2.0' in text
+        assert 'fetch_seconds_bucket{host="a.example",le="+Inf"} 3.0' in text
+        assert 'fetch_seconds_count{host="a.example"} 3.0' in text
+    
+    def test_callback_gauge_reads_source_at_scrape_time(self):
+        """Test pool gauges are read when /metrics is rendered and a broken source is skipped"""
+        from prometheus_client import CollectorRegistry, generate_latest
+        from northamerica_scraper.utils.metrics import CallbackGauge
+        
+        registry = CollectorRegistry()
+        pool = {"idle": 1}
+        CallbackGauge("pool", "Pool", ("state",), lambda: [(("idle",), pool["idle"])], registry=registry)
+        CallbackGauge("broken", "Broken", (), lambda: 1 / 0, registry=registry)
+        pool["idle"] = 3
+        text = generate_latest(registry).decode()
+        
+        assert 'pool{state="idle"} 3.0' in text
+        assert "# TYPE broken gauge" in text
+
+
+@pytest.mark.unit
+class TestPagination:
+    """Test keyset pagination of list endpoints"""
+    
+    def test_job_listing_is_index_backed(self):
+        """Test scraper_job has indexes matching the /jobs sort keys"""
+        from northamerica_scraper.database.models import ScraperJob
+        
+        indexes = {index.name: [c.name for c in index.columns] for index in ScraperJob.__table__.indexes}
+        
+        assert indexes["scraper_job_created_id"] == ["createdAt", "id"]
+        assert indexes["scraper_job_lottery_created_id"] == ["lotteryId", "createdAt", "id"]
+    
+    def test_cursor_round_trip(self):
+        """Test cursors decode to the sort key they were built from"""
+        from northamerica_scraper.database.pagination import InvalidCursor, decode_cursor, encode_cursor
+        
+        cursor = encode_cursor(datetime(2024, 3, 1, 9, 0), 42)
+        
+        assert decode_cursor(cursor, (datetime, int)) == (datetime(2024, 3, 1, 9, 0), 42)
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, (datetime,))
+
+
+@pytest.mark.unit
+class TestApiCache:
+    """Test the read-through API response cache"""
+    
+    def test_schedule_listing_expires_with_first_run(self):
+        """Test cached bodies are retired by invalidation and by their own max_age"""
+        from datetime import timedelta, timezone
+        from northamerica_scraper.utils.api_cache import LOTTERIES, SCHEDULE, ApiCache, seconds_until
+        
+        cache = ApiCache(max_entries=8, ttl_seconds=60)
+        cache.put("/lotteries", cache.snapshot([LOTTERIES]), b"[]")
+        due = seconds_until([datetime.now(timezone.utc) - timedelta(seconds=1)])
+        cache.put("/schedule", cache.snapshot([SCHEDULE]), b"[]", due)
+        
+        assert cache.get("/lotteries").body == b"[]"
+        assert cache.get("/schedule") is None
+        
+        cache.invalidate(LOTTERIES)
+        assert cache.get("/lotteries") is None
+
+
+@pytest.mark.unit
+class TestExtraction:
+    """Test bulk DOM extraction for Selenium parsers"""
+    
+    def test_parser_reads_page_in_one_round_trip(self):
+        """Test a parser issues one execute_script call and no per-element lookups"""
+        from benchmarks.fixture_driver import FixtureDriver
+        from benchmarks.harness import fixture_for
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        from northamerica_scraper.scrapers.base.selenium_scraper import RenderedPage
+        
+        class CountingDriver(FixtureDriver):
+            scripts = 0
+            
+            def execute_script(self, script, *args):
+                self.scripts += 1
+                return super().execute_script(script, *args)
+            
+            def find_elements(self, by=None, value=None):
+                raise AssertionError(f"per-element lookup {by}={value}")
+        
+        scraper = get_scraper_by_slug("mx-melate")
+        driver = CountingDriver(fixture_for("mx-melate").read_text(encoding="utf-8"))
+        
+        results = list(scraper.parse_results(RenderedPage(scraper.url, scraper.extract_draws(driver))))
+        
+        assert driver.scripts == 1
+        assert len(results) == scraper.latest_draws
+        assert len(results[0]["numbers"]["main"]) == 6
+
+
+@pytest.mark.unit
+class TestReadiness:
+    """Test event-driven readiness waits"""
+    
+    class ReadyDriver:
+        """Answers the readiness script with a fixed outcome and serves one draw"""
+        
+        def __init__(self, outcome):
+            self.outcome = outcome
+            self.waited_for = None
+        
+        def get(self, url):
+            pass
+        
+        def set_script_timeout(self, seconds):
+            self.script_timeout = seconds
+        
+        def execute_async_script(self, script, condition, timeout_ms):
+            self.waited_for = condition
+            return self.outcome
+        
+        def execute_script(self, script, *args):
+            if "drawPath" in script:
+                return [{"date": "Jan 6, 2024", "main": ["1", "2", "3", "4", "5"], "powerball": "6", "jackpot": None}]
+            return None
+        
+        @property
+        def page_source(self):
+            return "<html></html>"
+    
+    def _pool(self, monkeypatch, driver):
+        from northamerica_scraper.scrapers.base import selenium_scraper
+        
+        released = []
+        monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: driver)
+        monkeypatch.setattr(
+            selenium_scraper.driver_pool, "release",
+            lambda driver, discard=False: released.append((driver, discard)),
+        )
+        return released
+    
+    def test_driver_is_released_once_results_are_ready(self, monkeypatch):
+        """Test a scrape waits on the declared condition and hands the driver back before parsing"""
+        from selenium.webdriver.common.by import By
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        
+        driver = self.ReadyDriver({"ready": True, "waited_ms": 40})
+        released = self._pool(monkeypatch, driver)
+        scraper = get_scraper_by_slug("us-powerball")
+        
+        page = scraper.scrape()
+        
+        assert released == [(driver, False)] and scraper.driver is None
+        assert driver.waited_for["path"] == [[By.CLASS_NAME, "game-result"], [By.CLASS_NAME, "red-ball"]]
+        assert [r["numbers"]["bonus"] for r in scraper.parse_results(page)] == [[6]]
+    
+    def test_results_that_never_render_fail_the_scrape(self, monkeypatch):
+        """Test a timed-out wait raises instead of parsing an empty page, and discards the driver"""
+        from selenium.common.exceptions import TimeoutException
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        
+        driver = self.ReadyDriver({"ready": False, "waited_ms": 30000})
+        released = self._pool(monkeypatch, driver)
+        scraper = get_scraper_by_slug("ca-lotto649")
+        
+        with pytest.raises(TimeoutException):
+            scraper.scrape()
+        assert released == [(driver, True)]
+
+
+@pytest.mark.unit
+class TestApiDiscovery:
+    """Test switching Selenium scrapers to their JSON API"""
+    
+    DRAWS = [
+        {"date": "01/06/2024", "main": ["3", "11", "28", "41", "67"], "powerball": "9", "jackpot": "$50 Million"},
+        {"date": "01/03/2024", "main": ["5", "12", "30", "44", "62"], "powerball": "21", "jackpot": "$40 Million"},
+    ]
+    
+    def _payload(self):
+        # Oldest first, ISO timestamps and all six balls in one list, as such APIs often are
+        return {"data": {"draws": [
+            {"id": 1, "drawDate": "2024-01-03T00:00:00Z", "balls": [5, 12, 30, 44, 62, 21], "jackpot": "$40 Million"},
+            {"id": 2, "drawDate": "2024-01-06T00:00:00Z", "balls": [3, 11, 28, 41, 67, 9], "jackpot": "$50 Million"},
+        ]}}
+    
+    def test_discovered_source_reproduces_page_draws(self):
+        """Test the recorded response is mapped onto the scraper's draw fields"""
+        from northamerica_scraper.scrapers.base.api_discovery import Exchange, candidates
+        
+        exchange = Exchange("https://example.com/api/draws", "GET", {}, None, 200, self._payload(), 400)
+        best = candidates([exchange], self.DRAWS)[0]
+        
+        assert (best.draws, best.newest_first, best.matched) == ("data.draws", False, 2)
+        assert best.fields["date"].date_format == "%m/%d/%Y"
+        assert best.fields["main"].path == "balls.0:5"
+        assert best.fields["powerball"].path == "balls.5"
+    
+    def test_api_variant_parses_like_the_page(self, monkeypatch):
+        """Test an API scrape skips the browser and yields the page's results"""
+        import httpx
+        from northamerica_scraper.scrapers.base import api_scraper, selenium_scraper
+        from northamerica_scraper.scrapers.base.api_discovery import Exchange, candidates
+        from northamerica_scraper.scrapers.base.selenium_scraper import RenderedPage
+        from northamerica_scraper.scrapers.countries.usa import PowerballScraper
+        
+        exchange = Exchange("https://example.com/api/draws", "GET", {}, None, 200, self._payload(), 400)
+        source = candidates([exchange], self.DRAWS)[0].source("us-powerball", "https://www.powerball.com/")
+        monkeypatch.setattr(api_scraper, "load_api_source", lambda slug: source)
+        monkeypatch.setattr(
+            api_scraper.http_client, "request",
+            lambda method, url, **kwargs: httpx.Response(200, json=self._payload(), request=httpx.Request(method, url)),
+        )
+        monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: pytest.fail("browser used"))
+        
+        scraper = api_scraper.api_variant(PowerballScraper)("us-powerball")
+        page = scraper.scrape()
+        
+        browser = PowerballScraper("us-powerball").parse_results(RenderedPage(scraper.url, self.DRAWS))
+        assert list(scraper.parse_results(page)) == list(browser)
+        assert scraper.page_fingerprint(page) is not None
+
+
+@pytest.mark.unit
+class TestBatching:
+    """Test one fetch serving several lotteries on the same page"""
+    
+    class SharedPageDriver:
+        """Serves Pronósticos' Melate and Chispazo draws from one page"""
+        
+        def __init__(self):
+            self.loads = []
+        
+        def execute_cdp_cmd(self, cmd, params):
+            pass
+        
+        def get(self, url):
+            self.loads.append(url)
+        
+        def set_script_timeout(self, seconds):
+            pass
+        
+        def execute_async_script(self, script, condition, timeout_ms):
+            return {"ready": True, "waited_ms": 0}
+        
+        def execute_script(self, script, *args):
+            if "drawPath" in script:
+                melate = args[0][0] == ["id", "melate-results"]
+                return [{"date": "06/01/2024", "numbers": ["1", "2", "3", "4", "5", "6"] if melate else ["7", "8", "9"]}]
+            return None
+    
+    def test_shared_page_is_loaded_once_for_every_member(self, monkeypatch):
+        """Test batch members get their own draws from a single checkout and page load"""
+        from northamerica_scraper.scrapers import get_scraper_by_slug
+        from northamerica_scraper.scrapers.base import selenium_scraper
+        from northamerica_scraper.scrapers.base.batch import FetchBatch
+        
+        driver = self.SharedPageDriver()
+        checkouts, released = [], []
+        monkeypatch.setattr(selenium_scraper.driver_pool, "checkout", lambda: checkouts.append(driver) or driver)
+        monkeypatch.setattr(selenium_scraper.driver_pool, "release", lambda driver, discard=False: released.append(driver))
+        melate, chispazo = get_scraper_by_slug("mx-melate"), get_scraper_by_slug("mx-chispazo")
+        
+        batch = FetchBatch([melate, chispazo])
+        pages = [batch.fetch(melate), batch.fetch(chispazo)]
+        
+        assert driver.loads == ["https://www.pronosticos.gob.mx/"]
+        assert len(checkouts) == 1 and released == [driver]
+        assert [len(page.draws[0]["numbers"]) for page in pages] == [6, 3]
+    
+    def test_member_that_failed_to_save_refetches(self, monkeypatch, tmp_path):
+        """Test validators are per member: a failed member is not handed the other's 304"""
+        import httpx
+        from northamerica_scraper.scrapers.base import bs4_scraper
+        from northamerica_scraper.utils.response_cache import DiskCacheStore, ResponseCache
+        
+        class Page(bs4_scraper.BS4Scraper):
+            def parse_results(self, soup):
+                return []
+        
+        sent = []
+        
+        def get(url, headers):
+            sent.append(headers)
+            request = httpx.Request("GET", url)
+            if headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, request=request)
+            return httpx.Response(200, text="<p>draws</p>", headers={"ETag": '"v1"'}, request=request)
+        
+        monkeypatch.setattr(bs4_scraper.http_client, "get", get)
+        monkeypatch.setattr(bs4_scraper, "response_cache", ResponseCache(DiskCacheStore(str(tmp_path))))
+        saved, failed = Page("us-powerball"), Page("us-megamillions")
+        failed.url = saved.url
+        
+        assert all(soup.p for soup in saved.fetch_batch([saved, failed]).values())
+        saved.mark_success()  # failed's save raised, so it never marks success
+        
+        second = saved.fetch_batch([saved, failed])
+        assert "If-None-Match" not in sent[-1]
+        assert isinstance(second["us-powerball"], bs4_scraper.PageUnchanged)
+        assert second["us-megamillions"].p.text == "draws"
+        
+        failed.mark_success()
+        third = saved.fetch_batch([saved, failed])
+        assert sent[-1]["If-None-Match"] == '"v1"'
+        assert all(isinstance(soup, bs4_scraper.PageUnchanged) for soup in third.values())
+    
+    def test_batch_job_runs_members_due_now(self):
+        """Test lotteries on one page are grouped and a firing picks only the schedules due"""
+        from datetime import datetime, timezone
+        from northamerica_scraper.config.countries import ALL_COUNTRIES
+        from northamerica_scraper.scrapers import SCRAPER_REGISTRY
+        from northamerica_scraper.scrapers.base.batch import batch_groups
+        from northamerica_scraper.services.scheduler import is_due
+        
+        lotteries = [lottery for country in ALL_COUNTRIES for lottery in country.lotteries]
+        groups = [[lottery["slug"] for lottery in group] for group in batch_groups(lotteries, SCRAPER_REGISTRY)]
+        
+        assert ["mx-melate", "mx-chispazo"] in groups
+        assert ["ca-lotto649"] in groups and ["do-leidsa-quiniela"] in groups
+        fired = datetime(2024, 1, 2, 3, 3, 0, 500, tzinfo=timezone.utc)
+        assert is_due("3 3 * * *", fired) and is_due("3 3 * * 1", fired)
+        assert not is_due("3 3 * * 2", fired) and not is_due("4 3 * * *", fired)
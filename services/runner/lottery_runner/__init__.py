@@ -0,0 +1,2 @@
+"""Runs several regional lottery scrapers in one process"""
+__version__ = "1.0.0"
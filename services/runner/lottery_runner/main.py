@@ -0,0 +1,195 @@
+"""
+Multi-region runner
+
+Hosts any subset of the Asia, Europe and North America scrapers in one
+process. The first region loaded builds the database engine, scheduler
+and Chrome driver pool, and every later region reuses them through its
+config.runtime module, so the process holds one connection pool, one job
+store and at most MAX_CONCURRENT_SCRAPERS browsers however many regions
+it runs. Europe and North America also share one HTTP client; Asia's is
+async and stays its own. Each region's API is mounted under /<region>.
+
+Usage:
+    python -m lottery_runner.main --regions europe,northamerica
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Dict, Hashable, List, Optional
+import structlog
+import uvicorn
+from fastapi import FastAPI
+
+logger = structlog.get_logger(__name__)
+
+# Region name -> its service package
+REGIONS = {
+    "asia": "asia_scraper",
+    "europe": "europe_scraper",
+    "northamerica": "northamerica_scraper",
+}
+
+# Shared resource -> module of a region package that owns it
+SHARED = {
+    "engine": "database.session",
+    "scheduler": "services.scheduler",
+    "driver_pool": "scrapers.base.selenium_scraper",
+    "http_client": "utils.http_client",
+}
+
+# Regions whose HTTP client is async and cannot take a sync one, or lend theirs
+ASYNC_HTTP_REGIONS = {"asia"}
+
+
+def select_regions(selected: Optional[str]) -> List[str]:
+    """
+    Region names from a comma-separated list
+
+    Args:
+        selected: e.g. "europe,northamerica"; empty or None selects all
+
+    Returns:
+        Known region names in the order given, without duplicates
+
+    Raises:
+        ValueError: if a name is not one of REGIONS
+    """
+    if not selected:
+        return list(REGIONS)
+    regions = [name.strip().lower() for name in selected.split(",") if name.strip()]
+    unknown = [name for name in regions if name not in REGIONS]
+    if unknown:
+        raise ValueError(f"Unknown regions: {', '.join(unknown)} (choose from {', '.join(REGIONS)})")
+    return list(dict.fromkeys(regions))
+
+
+def _share_key(resource: str, region: str) -> Hashable:
+    """Regions with equal keys for a resource share it"""
+    if resource == "http_client":
+        return resource, region in ASYNC_HTTP_REGIONS
+    return resource
+
+
+def load_regions(regions: List[str]) -> Dict[str, ModuleType]:
+    """
+    Import each region's main module, handing it the resources built so far
+
+    Must run before anything else imports the region packages: their
+    modules read config.runtime once, at import.
+
+    Args:
+        regions: Names from select_regions()
+
+    Returns:
+        Region name -> its <package>.main module
+    """
+    shared: Dict[Hashable, object] = {}
+    mains = {}
+    for region in regions:
+        package = REGIONS[region]
+        runtime = importlib.import_module(f"{package}.config.runtime")
+        for resource in SHARED:
+            setattr(runtime, resource, shared.get(_share_key(resource, region)))
+
+        mains[region] = importlib.import_module(f"{package}.main")
+        for resource, module in SHARED.items():
+            owner = importlib.import_module(f"{package}.{module}")
+            shared.setdefault(_share_key(resource, region), getattr(owner, resource))
+        logger.info("Loaded region", region=region, package=package)
+    return mains
+
+
+def build_app(mains: Dict[str, ModuleType]) -> FastAPI:
+    """
+    One API mounting each region's app under /<region>
+
+    Mounted apps' startup and shutdown handlers are not run by the server,
+    so this app runs them, and starts the shared scheduler once every
+    region's handlers (e.g. Asia's scrape executor) are up.
+    """
+    apps = {region: main.app for region, main in mains.items()}
+    first = REGIONS[next(iter(mains))]
+    scheduler = importlib.import_module(f"{first}.services.scheduler").scheduler
+
+    app = FastAPI(
+        title="Lottery Scraper Runner",
+        description="Regional lottery scrapers sharing one scheduler and pools",
+        version="1.0.0",
+    )
+    for region, region_app in apps.items():
+        app.mount(f"/{region}", region_app)
+
+    async def run_handlers(handlers) -> None:
+        for handler in handlers:
+            if asyncio.iscoroutinefunction(handler):
+                await handler()
+            else:
+                handler()
+
+    @app.on_event("startup")
+    async def start_regions():
+        """Start every region's API, then the shared scheduler"""
+        for region_app in apps.values():
+            await run_handlers(region_app.router.on_startup)
+        if not scheduler.running:
+            scheduler.start()
+        logger.info("Runner started", regions=list(apps))
+
+    @app.on_event("shutdown")
+    async def stop_regions():
+        """Stop the shared scheduler, then every region's API"""
+        if scheduler.running:
+            scheduler.shutdown(wait=True)
+        for region_app in apps.values():
+            await run_handlers(region_app.router.on_shutdown)
+
+    @app.get("/")
+    async def root():
+        """Regions hosted and the shared scheduler's state"""
+        return {
+            "regions": list(apps),
+            "scheduler_running": scheduler.running,
+            "scheduled_jobs": len(scheduler.get_jobs()),
+        }
+
+    return app
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run regional lottery scrapers in one process")
+    parser.add_argument(
+        "--regions",
+        default=os.getenv("SCRAPER_REGIONS"),
+        help=f"comma-separated subset of {','.join(REGIONS)} (default: SCRAPER_REGIONS, else all)",
+    )
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    args = parser.parse_args()
+    try:
+        regions = select_regions(args.regions)
+    except ValueError as e:
+        parser.error(str(e))
+
+    logger.info("=== Lottery Scraper Runner Starting ===", regions=regions)
+    mains = load_regions(regions)
+    try:
+        for main_module in mains.values():
+            main_module.init_database()
+            main_module.load_scrapers()
+
+        uvicorn.run(build_app(mains), host="0.0.0.0", port=args.port, log_level="info")
+
+    except KeyboardInterrupt:
+        logger.info("Shutting down...")
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Fatal error", error=str(e), exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Tests for the multi-region runner"""
+
+import pytest
+from fastapi.routing import Mount
+from lottery_runner.main import build_app, load_regions, select_regions
+
+
+@pytest.fixture(scope="module")
+def mains():
+    # Region modules read their shared resources once, at import
+    return load_regions(["europe", "northamerica", "asia"])
+
+
+def test_select_regions_defaults_to_all():
+    assert select_regions(None) == ["asia", "europe", "northamerica"]
+    assert select_regions("") == ["asia", "europe", "northamerica"]
+
+
+def test_select_regions_keeps_a_subset_in_order():
+    assert select_regions(" NorthAmerica,europe,northamerica ") == ["northamerica", "europe"]
+
+
+def test_select_regions_rejects_unknown_names():
+    with pytest.raises(ValueError, match="oceania"):
+        select_regions("europe,oceania")
+
+
+def test_regions_share_one_engine_scheduler_and_driver_pool(mains):
+    from asia_scraper.database import session as asia_session
+    from asia_scraper.scrapers.base import selenium_scraper as asia_selenium
+    from asia_scraper.services import scheduler as asia_scheduler
+    from europe_scraper.database import session as europe_session
+    from europe_scraper.scrapers.base import selenium_scraper as europe_selenium
+    from europe_scraper.services import scheduler as europe_scheduler
+    from northamerica_scraper.database import session as northamerica_session
+    from northamerica_scraper.scrapers.base import selenium_scraper as northamerica_selenium
+    from northamerica_scraper.services import scheduler as northamerica_scheduler
+
+    assert northamerica_session.engine is europe_session.engine
+    assert asia_session.engine is europe_session.engine
+    assert northamerica_scheduler.scheduler is europe_scheduler.scheduler
+    assert asia_scheduler.scheduler is europe_scheduler.scheduler
+    assert northamerica_selenium.driver_pool is europe_selenium.driver_pool
+    assert asia_selenium.driver_pool is europe_selenium.driver_pool
+
+
+def test_only_sync_regions_share_the_http_client(mains):
+    from asia_scraper.utils import http_client as asia_http
+    from europe_scraper.utils import http_client as europe_http
+    from northamerica_scraper.utils import http_client as northamerica_http
+
+    assert northamerica_http.http_client is europe_http.http_client
+    assert asia_http.http_client is not europe_http.http_client
+
+
+def test_each_region_lists_only_its_own_jobs(mains):
+    from asia_scraper.services import scheduler as asia_scheduler
+    from europe_scraper.services import scheduler as europe_scheduler
+    from northamerica_scraper.services import scheduler as northamerica_scheduler
+
+    # Not started, so the jobs stay pending in memory
+    asia_scheduler.schedule_scraper("sg-toto", "0 10 * * *")
+    europe_scheduler.schedule_scraper("uk-lotto", "0 20 * * 3,6")
+    try:
+        assert [job.id for job in asia_scheduler.get_scheduled_jobs()] == ["scraper_sg-toto"]
+        assert [job.id for job in europe_scheduler.get_scheduled_jobs()] == ["scraper_uk-lotto"]
+        assert northamerica_scheduler.get_scheduled_jobs() == []
+    finally:
+        asia_scheduler.scheduler.remove_all_jobs()
+
+
+def test_app_mounts_each_region(mains):
+    app = build_app(mains)
+
+    mounts = {route.path: route.app for route in app.routes if isinstance(route, Mount)}
+    assert mounts == {
+        "/europe": mains["europe"].app,
+        "/northamerica": mains["northamerica"].app,
+        "/asia": mains["asia"].app,
+    }
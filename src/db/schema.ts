@@ -7,6 +7,7 @@ import {
   uuid,
   integer,
   primaryKey,
+  uniqueIndex,
 } from "drizzle-orm/pg-core";
 import { type AdapterAccount } from "next-auth/adapters";
 
@@ -85,18 +86,28 @@ export const lotteries = pgTable("lottery", {
   updatedAt: timestamp("updatedAt").defaultNow(),
 });
 
-export const results = pgTable("result", {
-  id: uuid("id").defaultRandom().primaryKey(),
-  lotteryId: uuid("lotteryId")
-    .references(() => lotteries.id)
-    .notNull(),
-  drawDate: timestamp("drawDate", { mode: "date" }).notNull(),
-  numbers: jsonb("numbers").notNull(), // e.g. { main: [1, 2, 3], bonus: [4] }
-  jackpot: text("jackpot"), // e.g. "$100 Million"
-  currency: text("currency").default("USD"),
-  winners: jsonb("winners"), // e.g. [{ tier: 1, prize: 1000000, count: 1 }]
-  createdAt: timestamp("createdAt").defaultNow(),
-});
+export const results = pgTable(
+  "result",
+  {
+    id: uuid("id").defaultRandom().primaryKey(),
+    lotteryId: uuid("lotteryId")
+      .references(() => lotteries.id)
+      .notNull(),
+    drawDate: timestamp("drawDate", { mode: "date" }).notNull(),
+    numbers: jsonb("numbers").notNull(), // e.g. { main: [1, 2, 3], bonus: [4] }
+    jackpot: text("jackpot"), // e.g. "$100 Million"
+    currency: text("currency").default("USD"),
+    winners: jsonb("winners"), // e.g. [{ tier: 1, prize: 1000000, count: 1 }]
+    createdAt: timestamp("createdAt").defaultNow(),
+  },
+  (result) => ({
+    // One row per draw; the Python scrapers insert with ON CONFLICT on it
+    lotteryDrawUnique: uniqueIndex("result_lottery_draw_unique").on(
+      result.lotteryId,
+      result.drawDate,
+    ),
+  }),
+);
 
 export const subscriptions = pgTable("subscription", {
   id: uuid("id").defaultRandom().primaryKey(),